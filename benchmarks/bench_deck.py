@@ -0,0 +1,70 @@
+"""
+Micro-benchmark des pioches : ancien deck sur liste contre deck sur deque
+
+Usage: python benchmarks/bench_deck.py
+"""
+
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core.enums import CardType
+from src.cards.card import Card
+from src.cards.deck import Deck
+
+
+class ListDeck:
+    """Reproduction de l'ancien Deck : pioche par pop(0) et ajout au dessus par insert(0)"""
+
+    def __init__(self, cards):
+        self.cards = list(cards)
+
+    def draw_card(self):
+        if self.cards:
+            return self.cards.pop(0)
+        return None
+
+    def add_to_top(self, card):
+        self.cards.insert(0, card)
+
+
+def make_cards(count):
+    """Crée des cartes factices"""
+    return [Card(id=f"card_{i}", name=f"Carte {i}", card_type=CardType.ALLY, cost=1,
+                 description="", effects=[]) for i in range(count)]
+
+
+def draws_per_second(deck_class, size, min_duration=0.3):
+    """Mesure le nombre de pioches par seconde en vidant puis reconstituant le deck"""
+    cards = make_cards(size)
+    deck = deck_class(cards)
+    draws = 0
+    start = time.perf_counter()
+    while True:
+        drawn = []
+        card = deck.draw_card()
+        while card is not None:
+            drawn.append(card)
+            card = deck.draw_card()
+        for card in drawn:
+            deck.add_to_top(card)
+        draws += size
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_duration:
+            return draws / elapsed
+
+
+def main():
+    """Affiche le tableau comparatif"""
+    print(f"{'Taille':>8} | {'liste (pioches/s)':>18} | {'deque (pioches/s)':>18} | {'gain':>6}")
+    print("-" * 60)
+    for size in (30, 300, 3000):
+        before = draws_per_second(ListDeck, size)
+        after = draws_per_second(Deck, size)
+        print(f"{size:>8} | {before:>18,.0f} | {after:>18,.0f} | x{after / before:>4.1f}")
+
+
+if __name__ == "__main__":
+    main()
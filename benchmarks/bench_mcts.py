@@ -0,0 +1,78 @@
+"""
+Benchmark de l'adversaire MCTS : nœuds par seconde et taux de victoire contre la politique aléatoire
+
+Jafar contre Crochet par défaut : Maléfique ne peut pas gagner avec le plateau
+actuel (pas de play_card dans la Forêt, et move_item n'y apporte rien), ses
+parties finissent toutes nulles.
+
+Usage: python benchmarks/bench_mcts.py [--games 20] [--iterations 200] [--time-budget 0.1] [--workers 0]
+"""
+
+import sys
+import os
+import argparse
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.simulation import HeadlessEngine, MCTSPolicy, SearchStats, create_policy
+from src.simulation.mcts import victory_ratio
+
+
+def main():
+    """Joue des parties MCTS contre aléatoire en alternant les sièges"""
+    parser = argparse.ArgumentParser(description="Benchmark MCTS contre aléatoire")
+    parser.add_argument("--games", type=int, default=20)
+    parser.add_argument("--villains", nargs=2, default=["jafar", "captain_hook"])
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--time-budget", type=float, default=None, help="Secondes par décision")
+    parser.add_argument("--rollout-turns", type=int, default=4)
+    parser.add_argument("--workers", type=int, default=0)
+    parser.add_argument("--max-turns", type=int, default=60)
+    args = parser.parse_args()
+
+    engine = HeadlessEngine()
+    total = SearchStats()
+    wins = losses = draws = 0
+    progress = {"MCTS": 0.0, "aléatoire": 0.0}
+    start = time.perf_counter()
+
+    for index in range(args.games):
+        game = engine.build_game(args.villains, game_id=f"bench_{index}", seed=index)
+        mcts_player = game.players[index % 2]  # Alterne le siège et le méchant joués par MCTS
+        mcts = MCTSPolicy(game.derive_rng(mcts_player.id, "policy"), engine, iterations=args.iterations,
+                          time_budget=args.time_budget, rollout_turns=args.rollout_turns,
+                          workers=args.workers)
+        policies = {
+            player.id: mcts if player is mcts_player
+            else create_policy("random", game.derive_rng(player.id, "policy"))
+            for player in game.players
+        }
+
+        winner = engine.play_game(game, policies, args.max_turns)
+        mcts.close()
+        wins += winner is mcts_player
+        draws += winner is None
+        losses += winner is not None and winner is not mcts_player
+        # Progrès vers la victoire en fin de partie, utile quand les parties finissent nulles
+        for player in game.players:
+            ratio = victory_ratio(engine.victory_manager.get_victory_progress(player))
+            progress["MCTS" if player is mcts_player else "aléatoire"] += ratio / args.games
+
+        for name in ("decisions", "iterations", "nodes", "elapsed", "reused"):
+            setattr(total, name, getattr(total, name) + getattr(mcts.stats, name))
+        outcome = "nul" if winner is None else ("MCTS" if winner is mcts_player else "aléatoire")
+        print(f"  Partie {index}: {mcts_player.villain_type.value} (MCTS) -> {outcome} en {game.turn_number} tours")
+
+    elapsed = time.perf_counter() - start
+    decided = args.games - draws
+    print("-" * 60)
+    print(f"Recherche : {total}, {total.reused} arbres réutilisés")
+    print(f"Victoires MCTS : {wins}/{args.games}, aléatoire : {losses}/{args.games} ({draws} nuls) - "
+          f"{(wins / decided * 100) if decided else 0:.0f}% des parties décidées")
+    print(f"Progrès moyen en fin de partie : MCTS {progress['MCTS']:.0%}, aléatoire {progress['aléatoire']:.0%}")
+    print(f"Durée : {elapsed:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
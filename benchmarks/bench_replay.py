@@ -0,0 +1,57 @@
+"""
+Benchmark des replays : taille par partie, écriture d'une archive et relecture en flux
+
+Usage: python benchmarks/bench_replay.py [--games 200] [--archive /tmp/parties.vra]
+"""
+
+import sys
+import os
+import argparse
+import tempfile
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.simulation import BatchSimulator, HeadlessEngine, ReplayPlayer, ReplayWriter, iter_replays
+
+
+def main():
+    """Enregistre des parties dans une archive puis les rejoue toutes en vérifiant le résultat"""
+    parser = argparse.ArgumentParser(description="Benchmark des replays")
+    parser.add_argument("--games", type=int, default=200)
+    parser.add_argument("--villains", nargs=2, default=["maleficent", "jafar"])
+    parser.add_argument("--policies", nargs="+", default=["greedy", "random"])
+    parser.add_argument("--max-turns", type=int, default=200)
+    parser.add_argument("--archive", default=os.path.join(tempfile.gettempdir(), "bench_replays.vra"))
+    args = parser.parse_args()
+
+    engine = HeadlessEngine(log_events=False)
+    simulator = BatchSimulator(villains=args.villains, policies=args.policies, workers=0,
+                               max_turns=args.max_turns, record=True)
+
+    start = time.perf_counter()
+    with open(args.archive, "wb") as stream:
+        writer = ReplayWriter(stream, engine.replay_codec)
+        sizes = [writer.write(result.replay) for result in simulator.run(args.games)]
+    record_time = time.perf_counter() - start
+
+    # Relecture en flux : un seul replay en mémoire à la fois
+    player = ReplayPlayer(engine)
+    moves = Counter()
+    start = time.perf_counter()
+    with open(args.archive, "rb") as stream:
+        for replay in iter_replays(stream, engine.replay_codec):
+            player.play(replay)
+            moves.update(move.action_type.value for move in replay.moves if move.kind == "action")
+    replay_time = time.perf_counter() - start
+
+    print(f"Archive : {args.archive} ({os.path.getsize(args.archive)} octets)")
+    print(f"Taille par partie : {sum(sizes) / len(sizes):.0f} octets en moyenne, {max(sizes)} au plus")
+    print(f"Enregistrement : {args.games / record_time:.1f} parties/s - "
+          f"relecture vérifiée : {args.games / replay_time:.1f} parties/s")
+    print("Actions jouées : " + ", ".join(f"{name} {count}" for name, count in moves.most_common()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmark du mode réparti : débit total selon le nombre de processus de travail
+
+Les clients tournent dans des processus séparés (run_load) pour ne pas prendre
+de temps au routeur. Le débit ne peut croître qu'avec le nombre de cœurs :
+au-delà, les processus se partagent les mêmes cœurs.
+
+Usage: python benchmarks/bench_sharding.py [--max-workers 4] [--client-processes 2] [--actions 20000]
+"""
+
+import sys
+import os
+import argparse
+import asyncio
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.server import GameServer, ShardRouter
+from src.server.load_test import run_load
+
+
+def client_process(port, clients, games, actions, seed):
+    """Charge d'un processus client ; retourne le nombre de coups joués"""
+    result = asyncio.run(run_load("127.0.0.1", port, clients, games, actions, seed, sync=True))
+    return result["actions"]
+
+
+async def measure(server, pool, args):
+    """Coups par seconde de tous les processus clients contre un serveur"""
+    await server.start("127.0.0.1", 0)
+    loop = asyncio.get_running_loop()
+    per_process = args.actions // args.client_processes
+    start = time.perf_counter()
+    played = await asyncio.gather(*(
+        loop.run_in_executor(pool, client_process, server.port, args.clients, args.games, per_process, seed)
+        for seed in range(args.client_processes)
+    ))
+    elapsed = time.perf_counter() - start
+    await server.stop()
+    return sum(played) / elapsed
+
+
+def main():
+    """Affiche le tableau débit / processus"""
+    parser = argparse.ArgumentParser(description="Benchmark du mode réparti")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--client-processes", type=int, default=2)
+    parser.add_argument("--clients", type=int, default=25, help="Connexions par processus client")
+    parser.add_argument("--games", type=int, default=250, help="Parties par processus client")
+    parser.add_argument("--actions", type=int, default=20000, help="Coups joués au total")
+    args = parser.parse_args()
+
+    print(f"{os.cpu_count()} cœurs, {args.client_processes} processus clients, {args.actions} coups")
+    print(f"{'Serveur':>24} | {'coups/s':>9} | {'accélération':>12}")
+    print("-" * 52)
+    with ProcessPoolExecutor(args.client_processes) as pool:
+        baseline = asyncio.run(measure(GameServer(), pool, args))
+        print(f"{'GameServer (1 processus)':>24} | {baseline:>9,.0f} | {'x1.00':>12}")
+        for workers in range(1, args.max_workers + 1):
+            rate = asyncio.run(measure(ShardRouter(workers), pool, args))
+            print(f"{f'ShardRouter ({workers})':>24} | {rate:>9,.0f} | {f'x{rate / baseline:.2f}':>12}")
+
+
+if __name__ == "__main__":
+    main()
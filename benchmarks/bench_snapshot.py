@@ -0,0 +1,61 @@
+"""
+Micro-benchmark des copies de partie : copy.deepcopy contre clone() et snapshot()/restore()
+
+Usage: python benchmarks/bench_snapshot.py
+"""
+
+import sys
+import os
+import copy
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core.enums import GameState
+from src.simulation import HeadlessEngine, create_policy
+
+
+def mid_game(turns=10, seed=7):
+    """Joue quelques tours pour obtenir une partie en cours avec des cartes en jeu"""
+    engine = HeadlessEngine()
+    game = engine.build_game(["captain_hook", "jafar"], seed=seed)
+    policies = {p.id: create_policy("random", game.derive_rng(p.id, "policy")) for p in game.players}
+    engine.play_game(game, policies, max_turns=turns)
+    game.state = GameState.IN_PROGRESS
+    return game
+
+
+def per_second(operation, min_duration=0.5):
+    """Mesure le nombre d'exécutions par seconde d'une opération"""
+    count = 0
+    start = time.perf_counter()
+    while True:
+        for _ in range(50):
+            operation()
+        count += 50
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_duration:
+            return count / elapsed
+
+
+def main():
+    """Affiche le tableau comparatif"""
+    game = mid_game()
+    snapshot = game.snapshot()
+
+    results = [
+        ("copy.deepcopy(game)", per_second(lambda: copy.deepcopy(game))),
+        ("game.clone()", per_second(game.clone)),
+        ("game.snapshot()", per_second(game.snapshot)),
+        ("game.restore(snapshot)", per_second(lambda: game.restore(snapshot))),
+    ]
+
+    baseline = results[0][1]
+    print(f"{'Opération':>24} | {'copies/s':>12} | {'gain':>7}")
+    print("-" * 50)
+    for name, rate in results:
+        print(f"{name:>24} | {rate:>12,.0f} | x{rate / baseline:>5.1f}")
+
+
+if __name__ == "__main__":
+    main()
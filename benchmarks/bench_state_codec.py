@@ -0,0 +1,88 @@
+"""
+Benchmark de la sérialisation d'état : aller-retour de 1 000 parties en cours
+
+Compare le codec binaire (avec et sans générateurs), le JSON de StateCodec et
+l'instantané pickle de la persistance (dump_snapshot / load_snapshot).
+
+Usage: python benchmarks/bench_state_codec.py [--states 1000]
+"""
+
+import sys
+import os
+import argparse
+import json
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core.enums import GameState
+from src.simulation import HeadlessEngine, StateCodec, create_policy
+from src.simulation.persistence import dump_snapshot, load_snapshot
+
+
+def mid_games(engine, count, villains, seed=11):
+    """Parties en cours (copies prises tous les quelques tours de plusieurs parties)"""
+    games = []
+    game_seed = seed
+    while len(games) < count:
+        game = engine.build_game(villains, game_id=f"bench_{game_seed}", seed=game_seed)
+        policies = {p.id: create_policy("random", game.derive_rng(p.id, "policy")) for p in game.players}
+        for _ in range(10):
+            engine.play_game(game, policies, max_turns=game.turn_number + 3, resume=game.turn_number > 1)
+            if game.state != GameState.IN_PROGRESS:
+                game.state = GameState.IN_PROGRESS
+            games.append(game.clone())
+        game_seed += 1
+    return games[:count]
+
+
+def round_trip(name, games, encode, decode):
+    """Encode puis décode tous les états ; affiche débit et taille moyenne"""
+    start = time.perf_counter()
+    payloads = [encode(game) for game in games]
+    encoded = time.perf_counter() - start
+    start = time.perf_counter()
+    for game, payload in zip(games, payloads):
+        decode(game, payload)
+    decoded = time.perf_counter() - start
+    size = sum(len(payload) for payload in payloads) / len(payloads)
+    print(f"{name:>28} | {len(games) / encoded:>10,.0f} | {len(games) / decoded:>10,.0f} | {size:>9,.0f}")
+
+
+def main():
+    """Affiche le tableau comparatif"""
+    parser = argparse.ArgumentParser(description="Benchmark de la sérialisation d'état")
+    parser.add_argument("--states", type=int, default=1000)
+    parser.add_argument("--villains", nargs="+", default=["maleficent", "jafar"])
+    args = parser.parse_args()
+
+    engine = HeadlessEngine(log_events=False)
+    games = mid_games(engine, args.states, args.villains)
+    codec = engine.state_codec
+    light = StateCodec(codec.definitions, rng=False)
+    cards = engine.card_manager
+
+    print(f"{args.states} états, {' contre '.join(args.villains)}")
+    print(f"{'Encodage':>28} | {'écritures/s':>10} | {'lectures/s':>10} | {'octets':>9}")
+    print("-" * 68)
+    round_trip("pickle (dump_snapshot)", games, dump_snapshot,
+               lambda game, data: load_snapshot(data, game, cards))
+    round_trip("StateCodec binaire", games, codec.encode, lambda game, data: codec.decode(data, game))
+    round_trip("StateCodec binaire sans rng", games, light.encode, lambda game, data: light.decode(data, game))
+    round_trip("StateCodec JSON", games,
+               lambda game: json.dumps(codec.to_json(game), separators=(",", ":")),
+               lambda game, text: codec.from_json(json.loads(text), game))
+    round_trip("StateCodec JSON sans rng", games,
+               lambda game: json.dumps(light.to_json(game), separators=(",", ":")),
+               lambda game, text: light.from_json(json.loads(text), game))
+
+    # Vérification : chaque état relu redonne le même état complet
+    for game in games[:50]:
+        for payload in (codec.encode(game), codec.to_json(game)):
+            copy = codec.load(payload, engine)
+            assert copy.get_game_state(full=True) == game.get_game_state(full=True)
+    print("Aller-retour vérifié sur 50 états")
+
+
+if __name__ == "__main__":
+    main()
@@ -65,12 +65,17 @@ def main():
         print("🔄 Chargement des modules...")
         from src.interface.console import ConsoleInterface
         from src.core.game import Game
+        from src.core.catalog import load_catalog
         
         print("✅ Modules chargés avec succès")
+        
+        # Chargement des cartes et plateaux depuis le catalogue précompilé
+        interface = ConsoleInterface()
+        catalog = load_catalog(interface.card_manager, interface.board_manager, get_resource_path("data"))
+        print("✅ Catalogue " + ("compilé" if catalog.rebuilt else "chargé") + f": {len(interface.card_manager.cards_cache)} cartes")
         print()
         
         # Lancement du jeu
-        interface = ConsoleInterface()
         interface.run()
         
     except ImportError as e:
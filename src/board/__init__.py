@@ -1,4 +1,5 @@
 """Init file pour le module board"""
 
 from .location import Location, Action
+from .board import BoardTemplate, BoardState, BoardLocation, LocationTemplate
 from .board_manager import BoardManager
\ No newline at end of file
@@ -0,0 +1,199 @@
+"""
+Plateaux de partie - Modèles immuables partagés et état propre à chaque partie
+"""
+
+from dataclasses import dataclass, replace
+from typing import Callable, List, Optional, Sequence, Tuple
+from .location import Action, Location, LocationBehavior
+
+
+@dataclass(frozen=True)
+class LocationTemplate:
+    """Description immuable d'un lieu : nom, position et actions"""
+    id: str
+    name: str
+    position: int
+    actions: Tuple[Action, ...] = ()
+    description: str = ""
+    image_path: Optional[str] = None
+
+    def __post_init__(self):
+        """Validation après initialisation"""
+        if not (0 <= self.position <= 3):
+            raise ValueError("La position d'un lieu doit être entre 0 et 3")
+
+        if len(self.actions) > 4:
+            raise ValueError("Un lieu ne peut pas avoir plus de 4 actions")
+
+    @classmethod
+    def from_location(cls, location: Location) -> "LocationTemplate":
+        """Crée le modèle d'un lieu existant (son état est ignoré)"""
+        return cls(location.id, location.name, location.position, tuple(location.actions),
+                   location.description, location.image_path)
+
+
+@dataclass(frozen=True)
+class BoardTemplate:
+    """
+    Plateau d'un méchant tel que chargé depuis les données, partagé par toutes les parties
+    """
+    name: str
+    locations: Tuple[LocationTemplate, ...]
+
+    @classmethod
+    def from_locations(cls, name: str, locations: Sequence[Location]) -> "BoardTemplate":
+        """Crée un modèle à partir d'une liste de lieux triés par position"""
+        return cls(name, tuple(LocationTemplate.from_location(location) for location in locations))
+
+    def instantiate(self) -> List["BoardLocation"]:
+        """
+        Crée le plateau d'une nouvelle partie
+
+        Seul un BoardState vide est alloué : les lieux sont des vues sur le
+        modèle partagé, rien n'est copié.
+        """
+        state = BoardState(len(self.locations))
+        return [BoardLocation(template, state, index) for index, template in enumerate(self.locations)]
+
+    def __len__(self) -> int:
+        """Nombre de lieux du plateau"""
+        return len(self.locations)
+
+
+class BoardState:
+    """
+    Partie mutable d'un plateau dans une partie : héros, objets et verrous par lieu
+    """
+
+    __slots__ = ("heroes", "items", "locks", "listeners")
+
+    def __init__(self, size: int = 4):
+        """Initialise un plateau vide de size lieux"""
+        self.heroes: List[List[str]] = [[] for _ in range(size)]
+        self.items: List[List[str]] = [[] for _ in range(size)]
+        self.locks = bytearray(size)  # 1 = lieu verrouillé
+        self.listeners: List[List[Callable]] = [[] for _ in range(size)]
+
+    def copy(self) -> "BoardState":
+        """Copie indépendante de l'état"""
+        state = BoardState.__new__(BoardState)
+        state.heroes = [list(heroes) for heroes in self.heroes]
+        state.items = [list(items) for items in self.items]
+        state.locks = bytearray(self.locks)
+        state.listeners = [[] for _ in self.listeners]  # Les observateurs ne suivent pas la copie
+        return state
+
+    def __repr__(self) -> str:
+        """Représentation pour le debug"""
+        return f"BoardState(heroes={self.heroes}, items={self.items}, locks={list(self.locks)})"
+
+
+class BoardLocation(LocationBehavior):
+    """
+    Lieu d'un plateau de partie : lit sa description dans le modèle partagé et
+    son état dans le BoardState de la partie
+    """
+
+    __slots__ = ("template", "state", "index")
+
+    def __init__(self, template: LocationTemplate, state: BoardState, index: int):
+        """Crée la vue du lieu index d'un plateau"""
+        self.template = template
+        self.state = state
+        self.index = index
+
+    # === Description (modèle partagé) ===
+
+    @property
+    def id(self) -> str:
+        return self.template.id
+
+    @property
+    def name(self) -> str:
+        return self.template.name
+
+    @property
+    def position(self) -> int:
+        return self.template.position
+
+    @property
+    def actions(self) -> Tuple[Action, ...]:
+        return self.template.actions
+
+    @property
+    def description(self) -> str:
+        return self.template.description
+
+    @property
+    def image_path(self) -> Optional[str]:
+        return self.template.image_path
+
+    # === État (propre à la partie) ===
+
+    @property
+    def heroes_present(self) -> List[str]:
+        """IDs des héros présents"""
+        return self.state.heroes[self.index]
+
+    @property
+    def items_present(self) -> List[str]:
+        """IDs des objets présents"""
+        return self.state.items[self.index]
+
+    @property
+    def locked(self) -> bool:
+        """Vrai si le lieu est verrouillé"""
+        return bool(self.state.locks[self.index])
+
+    @locked.setter
+    def locked(self, value: bool) -> None:
+        self.state.locks[self.index] = 1 if value else 0
+
+    @property
+    def listeners(self) -> List[Callable]:
+        """Observateurs des changements de ce lieu"""
+        return self.state.listeners[self.index]
+
+    def __repr__(self) -> str:
+        """Représentation pour le debug"""
+        return f"BoardLocation(id='{self.id}', name='{self.name}', pos={self.position})"
+
+
+# État d'un lieu figé : (héros, objets, verrouillé)
+LocationSnapshot = Tuple[Tuple[str, ...], Tuple[str, ...], bool]
+
+
+def snapshot_board(locations: Sequence[LocationBehavior]) -> Tuple[LocationSnapshot, ...]:
+    """Fige l'état mutable d'un plateau (Location ou BoardLocation)"""
+    return tuple(
+        (tuple(location.heroes_present), tuple(location.items_present), location.locked)
+        for location in locations
+    )
+
+
+def restore_board(locations: Sequence[LocationBehavior], snapshot: Tuple[LocationSnapshot, ...]) -> None:
+    """
+    Remet un plateau dans un état figé, sur place
+
+    Les observateurs ne sont pas prévenus : le suivi de victoire du joueur doit
+    être reconstruit (voir Player.restore).
+    """
+    for location, (heroes, items, locked) in zip(locations, snapshot):
+        location.heroes_present[:] = heroes
+        location.items_present[:] = items
+        location.locked = locked
+
+
+def clone_board(locations: Sequence[LocationBehavior]) -> List[LocationBehavior]:
+    """Copie indépendante d'un plateau, qui partage les modèles et les actions"""
+    if locations and all(isinstance(location, BoardLocation) for location in locations):
+        states = {id(location.state): location.state for location in locations}
+        copies = {key: state.copy() for key, state in states.items()}
+        return [BoardLocation(location.template, copies[id(location.state)], location.index)
+                for location in locations]
+
+    return [
+        replace(location, heroes_present=list(location.heroes_present),
+                items_present=list(location.items_present), listeners=[])
+        for location in locations
+    ]
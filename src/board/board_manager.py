@@ -5,6 +5,7 @@ Board Manager - Gestionnaire des plateaux de méchants
 import json
 import os
 from typing import Dict, List, Optional
+from .board import BoardLocation, BoardTemplate
 from .location import Location, Action
 from ..core.enums import ActionType, VillainType
 
@@ -17,7 +18,8 @@ class BoardManager:
     def __init__(self, data_path: str = "data/boards"):
         """Initialise le gestionnaire avec le chemin vers les données"""
         self.data_path = data_path
-        self.boards_cache: Dict[str, List[Location]] = {}
+        # Modèles immuables par méchant : chaque partie n'alloue que son état
+        self.templates_cache: Dict[str, BoardTemplate] = {}
     
     def load_action_from_dict(self, action_data: dict) -> Action:
         """Crée une action à partir d'un dictionnaire"""
@@ -69,16 +71,22 @@ class BoardManager:
             print(f"Erreur lors du chargement du plateau depuis {filepath}: {e}")
             return []
     
-    def load_villain_board(self, villain_name: str) -> List[Location]:
-        """Charge le plateau d'un méchant spécifique"""
-        if villain_name in self.boards_cache:
-            return self.boards_cache[villain_name]
+    def load_villain_template(self, villain_name: str) -> Optional[BoardTemplate]:
+        """Charge (une seule fois) le modèle de plateau d'un méchant, ou None s'il n'existe pas"""
+        if villain_name in self.templates_cache:
+            return self.templates_cache[villain_name]
         
         filepath = os.path.join(self.data_path, f"{villain_name}_board.json")
         locations = self.load_board_from_file(filepath)
         
-        self.boards_cache[villain_name] = locations
-        return locations
+        template = BoardTemplate.from_locations(villain_name, locations) if locations else None
+        self.templates_cache[villain_name] = template
+        return template
+    
+    def load_villain_board(self, villain_name: str) -> List[BoardLocation]:
+        """Crée le plateau d'un méchant pour une nouvelle partie (état vide, propre à la partie)"""
+        template = self.load_villain_template(villain_name)
+        return template.instantiate() if template else []
     
     def create_sample_board(self, villain_name: str) -> List[Location]:
         """Crée un plateau d'exemple pour les tests"""
@@ -385,8 +393,8 @@ class BoardManager:
     
     def clear_cache(self) -> None:
         """Vide le cache des plateaux"""
-        self.boards_cache.clear()
+        self.templates_cache.clear()
     
     def __str__(self) -> str:
         """Représentation textuelle du gestionnaire"""
-        return f"BoardManager({len(self.boards_cache)} plateaux en cache)"
\ No newline at end of file
+        return f"BoardManager({len(self.templates_cache)} plateaux en cache)"
\ No newline at end of file
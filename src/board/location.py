@@ -3,13 +3,13 @@ Classe Location - Représente un lieu sur le plateau d'un méchant
 """
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional
 from ..core.enums import ActionType
 
 
-@dataclass
+@dataclass(frozen=True)
 class Action:
-    """Représente une action disponible sur un lieu"""
+    """Représente une action disponible sur un lieu (immuable, partagée entre les parties)"""
     action_type: ActionType
     value: Optional[int] = None  # Valeur pour gain_power par exemple
     description: str = ""
@@ -21,51 +21,57 @@ class Action:
         return self.action_type.value
 
 
-@dataclass
-class Location:
-    """
-    Classe représentant un lieu sur le plateau d'un méchant
+class LocationBehavior:
     """
-    id: str
-    name: str
-    position: int  # 0-3 pour les 4 lieux
-    actions: List[Action] = field(default_factory=list)
+    Règles communes à tous les lieux : Location (autonome) et BoardLocation (vue
+    sur l'état d'une partie). Les sous-classes fournissent actions,
+    heroes_present, items_present et listeners.
     
-    # État du lieu
-    heroes_present: List[str] = field(default_factory=list)  # IDs des héros présents
-    items_present: List[str] = field(default_factory=list)   # IDs des objets présents
-    
-    # Métadonnées
-    description: str = ""
-    image_path: Optional[str] = None
+    Les héros et objets doivent être placés et retirés par les méthodes
+    ci-dessous : elles préviennent les observateurs (suivi de victoire).
+    """
     
-    def __post_init__(self):
-        """Validation après initialisation"""
-        if not (0 <= self.position <= 3):
-            raise ValueError("La position d'un lieu doit être entre 0 et 3")
-        
-        if len(self.actions) > 4:
-            raise ValueError("Un lieu ne peut pas avoir plus de 4 actions")
+    __slots__ = ()
     
     def add_hero(self, hero_id: str) -> None:
         """Ajoute un héros sur ce lieu"""
         if hero_id not in self.heroes_present:
             self.heroes_present.append(hero_id)
+            self._notify("hero", hero_id, 1)
     
     def remove_hero(self, hero_id: str) -> None:
         """Retire un héros de ce lieu"""
         if hero_id in self.heroes_present:
             self.heroes_present.remove(hero_id)
+            self._notify("hero", hero_id, -1)
     
     def add_item(self, item_id: str) -> None:
         """Ajoute un objet sur ce lieu"""
         if item_id not in self.items_present:
             self.items_present.append(item_id)
+            self._notify("item", item_id, 1)
     
     def remove_item(self, item_id: str) -> None:
         """Retire un objet de ce lieu"""
         if item_id in self.items_present:
             self.items_present.remove(item_id)
+            self._notify("item", item_id, -1)
+    
+    # === Observateurs ===
+    
+    def add_listener(self, listener: Callable) -> None:
+        """Abonne listener(lieu, "hero"|"item", id, +1|-1) aux changements du lieu"""
+        self.listeners.append(listener)
+    
+    def remove_listener(self, listener: Callable) -> None:
+        """Désabonne un observateur"""
+        if listener in self.listeners:
+            self.listeners.remove(listener)
+    
+    def _notify(self, kind: str, object_id: str, delta: int) -> None:
+        """Prévient les observateurs d'un changement"""
+        for listener in self.listeners:
+            listener(self, kind, object_id, delta)
     
     def has_heroes(self) -> bool:
         """Vérifie s'il y a des héros présents"""
@@ -95,6 +101,36 @@ class Location:
         """Représentation textuelle du lieu"""
         heroes_info = f" (Héros: {len(self.heroes_present)})" if self.has_heroes() else ""
         return f"{self.name}{heroes_info}"
+
+
+@dataclass
+class Location(LocationBehavior):
+    """
+    Classe représentant un lieu sur le plateau d'un méchant
+    """
+    id: str
+    name: str
+    position: int  # 0-3 pour les 4 lieux
+    actions: List[Action] = field(default_factory=list)
+    
+    # État du lieu
+    heroes_present: List[str] = field(default_factory=list)  # IDs des héros présents
+    items_present: List[str] = field(default_factory=list)   # IDs des objets présents
+    
+    # Métadonnées
+    description: str = ""
+    image_path: Optional[str] = None
+    
+    locked: bool = False  # Un lieu verrouillé ne peut pas recevoir le méchant
+    listeners: List[Callable] = field(default_factory=list, repr=False, compare=False)
+    
+    def __post_init__(self):
+        """Validation après initialisation"""
+        if not (0 <= self.position <= 3):
+            raise ValueError("La position d'un lieu doit être entre 0 et 3")
+        
+        if len(self.actions) > 4:
+            raise ValueError("Un lieu ne peut pas avoir plus de 4 actions")
     
     def __repr__(self) -> str:
         """Représentation pour le debug"""
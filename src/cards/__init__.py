@@ -1,5 +1,6 @@
 """Init file pour le module cards"""
 
-from .card import Card, CardEffect
+from .card import Card, CardDefinition, CardEffect
 from .deck import Deck, Hand, DiscardPile
+from .effects import EffectContext, EffectOp, compile_effect, resolve_effects
 from .card_manager import CardManager
\ No newline at end of file
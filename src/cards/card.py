@@ -2,11 +2,16 @@
 Classe Card - Représente une carte dans Disney Villainous
 """
 
-from dataclasses import dataclass
-from typing import List, Dict, Any, Optional
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import List, Dict, Any, Mapping, Optional, Tuple
 from ..core.enums import CardType
 
 
+# Déclencheurs d'effets reconnus
+TRIGGERS = ("play", "activate", "discard", "passive")
+
+
 @dataclass
 class CardEffect:
     """Représente un effet d'une carte"""
@@ -14,35 +19,67 @@ class CardEffect:
     trigger: str  # "play", "activate", "discard", "passive"
     target: Optional[str] = None
     parameters: Optional[Dict[str, Any]] = None
+    
+    # Opération compilée au chargement (voir cards/effects.py)
+    op: Optional[Any] = field(default=None, repr=False, compare=False)
 
 
-@dataclass
-class Card:
+class CardDefinition:
     """
-    Classe représentant une carte du jeu
+    Définition immuable d'une carte, partagée par toutes les parties
+
+    Une définition est internée une seule fois par catalogue (CardManager) ;
+    les exemplaires joués dans une partie sont des Card légères qui la référencent.
     """
-    id: str
-    name: str
-    card_type: CardType
-    cost: int
-    description: str
-    effects: List[CardEffect]
-    
-    # Attributs spécifiques selon le type
-    strength: Optional[int] = None  # Pour les alliés et héros
-    location_restriction: Optional[str] = None  # Lieu spécifique requis
     
-    # Métadonnées
-    villain_set: Optional[str] = None  # À quel méchant appartient la carte
-    expansion: str = "base"
+    __slots__ = (
+        "id", "name", "card_type", "cost", "description", "effects",
+        "strength", "location_restriction", "villain_set", "expansion",
+        "index", "_effects_by_trigger"
+    )
     
-    def __post_init__(self):
-        """Validation des données après initialisation"""
-        if self.cost < 0:
+    def __init__(self, id: str, name: str, card_type: CardType, cost: int, description: str,
+                 effects: List[CardEffect], strength: Optional[int] = None,
+                 location_restriction: Optional[str] = None, villain_set: Optional[str] = None,
+                 expansion: str = "base", index: int = -1):
+        """Crée et valide la définition"""
+        if cost < 0:
             raise ValueError("Le coût d'une carte ne peut pas être négatif")
         
-        if self.strength is not None and self.strength < 0:
+        if strength is not None and strength < 0:
             raise ValueError("La force d'une carte ne peut pas être négative")
+        
+        effects = tuple(effects)
+        by_trigger: Dict[str, List[CardEffect]] = {}
+        for effect in effects:
+            by_trigger.setdefault(effect.trigger, []).append(effect)
+        
+        init = object.__setattr__
+        init(self, "id", id)
+        init(self, "name", name)
+        init(self, "card_type", card_type)
+        init(self, "cost", cost)
+        init(self, "description", description)
+        init(self, "effects", effects)
+        init(self, "strength", strength)
+        init(self, "location_restriction", location_restriction)
+        init(self, "villain_set", villain_set)
+        init(self, "expansion", expansion)
+        init(self, "index", index)  # Position dans le catalogue (-1 = hors catalogue)
+        # Index trigger -> effets, calculé une fois par définition
+        init(self, "_effects_by_trigger", MappingProxyType(
+            {trigger: tuple(effects) for trigger, effects in by_trigger.items()}
+        ))
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("Une définition de carte est immuable")
+    
+    def __reduce__(self):
+        """Support de pickle malgré l'immuabilité"""
+        return (CardDefinition, (
+            self.id, self.name, self.card_type, self.cost, self.description, list(self.effects),
+            self.strength, self.location_restriction, self.villain_set, self.expansion, self.index
+        ))
     
     def is_ally(self) -> bool:
         """Vérifie si la carte est un allié"""
@@ -54,7 +91,7 @@ class Card:
     
     def is_item(self) -> bool:
         """Vérifie si la carte est un objet"""
-        return self.card_type in [CardType.ITEM, CardType.ITEM_HERO]
+        return self.card_type in (CardType.ITEM, CardType.ITEM_HERO)
     
     def is_playable_at_location(self, location_name: str) -> bool:
         """Vérifie si la carte peut être jouée à un lieu donné"""
@@ -62,9 +99,18 @@ class Card:
             return True
         return self.location_restriction == location_name
     
-    def get_effects_by_trigger(self, trigger: str) -> List[CardEffect]:
+    @property
+    def effects_by_trigger(self) -> Mapping[str, Tuple[CardEffect, ...]]:
+        """Vue immuable trigger -> effets"""
+        return self._effects_by_trigger
+    
+    def get_effects_by_trigger(self, trigger: str) -> Tuple[CardEffect, ...]:
         """Retourne tous les effets déclenchés par un trigger donné"""
-        return [effect for effect in self.effects if effect.trigger == trigger]
+        return self._effects_by_trigger.get(trigger, ())
+    
+    def has_passive_effects(self) -> bool:
+        """Vérifie si la carte a des effets permanents"""
+        return "passive" in self._effects_by_trigger
     
     def __str__(self) -> str:
         """Représentation textuelle de la carte"""
@@ -72,4 +118,81 @@ class Card:
     
     def __repr__(self) -> str:
         """Représentation pour le debug"""
-        return f"Card(id='{self.id}', name='{self.name}', type='{self.card_type.value}', cost={self.cost})"
\ No newline at end of file
+        return f"CardDefinition(id='{self.id}', type='{self.card_type.value}', cost={self.cost})"
+
+
+def _delegate(name: str) -> property:
+    """Crée une propriété en lecture seule qui lit l'attribut de la définition"""
+    return property(lambda self: getattr(self.definition, name), doc=f"{name} (de la définition)")
+
+
+class Card:
+    """
+    Exemplaire d'une carte dans une partie
+    
+    Ne contient qu'une référence vers sa définition partagée et un numéro
+    d'exemplaire : créer les decks d'une partie ne copie aucune donnée de carte.
+    """
+    
+    __slots__ = ("definition", "copy_id")
+    
+    def __init__(self, definition: Optional[CardDefinition] = None, copy_id: int = 0, **fields):
+        """
+        Crée un exemplaire d'une définition
+        
+        Pour les cartes de test ou d'exemple, les champs de la définition peuvent
+        être passés directement : Card(id=..., name=..., ...).
+        """
+        self.definition = definition if definition is not None else CardDefinition(**fields)
+        self.copy_id = copy_id
+    
+    id = _delegate("id")
+    name = _delegate("name")
+    card_type = _delegate("card_type")
+    cost = _delegate("cost")
+    description = _delegate("description")
+    effects = _delegate("effects")
+    strength = _delegate("strength")
+    location_restriction = _delegate("location_restriction")
+    villain_set = _delegate("villain_set")
+    expansion = _delegate("expansion")
+    effects_by_trigger = _delegate("effects_by_trigger")
+    
+    @property
+    def uid(self) -> str:
+        """Identifiant unique de l'exemplaire dans la partie"""
+        return f"{self.definition.id}#{self.copy_id}"
+    
+    def is_ally(self) -> bool:
+        """Vérifie si la carte est un allié"""
+        return self.definition.card_type == CardType.ALLY
+    
+    def is_hero(self) -> bool:
+        """Vérifie si la carte est un héros"""
+        return self.definition.card_type == CardType.HERO
+    
+    def is_item(self) -> bool:
+        """Vérifie si la carte est un objet"""
+        return self.definition.is_item()
+    
+    def is_playable_at_location(self, location_name: str) -> bool:
+        """Vérifie si la carte peut être jouée à un lieu donné"""
+        return self.definition.is_playable_at_location(location_name)
+    
+    def get_effects_by_trigger(self, trigger: str) -> Tuple[CardEffect, ...]:
+        """Retourne tous les effets déclenchés par un trigger donné"""
+        return self.definition._effects_by_trigger.get(trigger, ())
+    
+    def has_passive_effects(self) -> bool:
+        """Vérifie si la carte a des effets permanents"""
+        return "passive" in self.definition._effects_by_trigger
+    
+    def __str__(self) -> str:
+        """Représentation textuelle de la carte"""
+        return str(self.definition)
+    
+    def __repr__(self) -> str:
+        """Représentation pour le debug"""
+        definition = self.definition
+        return (f"Card(id='{definition.id}', name='{definition.name}', "
+                f"type='{definition.card_type.value}', cost={definition.cost}, copy={self.copy_id})")
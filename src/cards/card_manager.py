@@ -4,9 +4,11 @@ Card Manager - Gestion centralisée des cartes
 
 import json
 import os
+import random
 from typing import Dict, List, Optional, Tuple
-from .card import Card, CardEffect
+from .card import Card, CardDefinition, CardEffect
 from .deck import Deck
+from .effects import compile_card_effects
 from ..core.enums import CardType
 
 
@@ -18,12 +20,17 @@ class CardManager:
     def __init__(self, data_path: str = "data/cards"):
         """Initialise le gestionnaire avec le chemin vers les données"""
         self.data_path = data_path
-        self.cards_cache: Dict[str, Card] = {}
-        self.villain_cards: Dict[str, List[Card]] = {}
-        self.fate_cards: Dict[str, List[Card]] = {}
+        # Catalogue des définitions internées : une seule instance par id de carte
+        self.cards_cache: Dict[str, CardDefinition] = {}
+        self.villain_cards: Dict[str, List[CardDefinition]] = {}
+        self.fate_cards: Dict[str, List[CardDefinition]] = {}
     
-    def load_card_from_dict(self, card_data: dict) -> Card:
-        """Crée une carte à partir d'un dictionnaire"""
+    def load_card_from_dict(self, card_data: dict) -> CardDefinition:
+        """Crée (ou retrouve) une définition de carte à partir d'un dictionnaire"""
+        cached = self.cards_cache.get(card_data["id"])
+        if cached is not None:
+            return cached
+        
         # Traite les effets
         effects = []
         for effect_data in card_data.get("effects", []):
@@ -35,8 +42,8 @@ class CardManager:
             )
             effects.append(effect)
         
-        # Crée la carte
-        card = Card(
+        # Crée la définition, internée avec sa position dans le catalogue
+        definition = CardDefinition(
             id=card_data["id"],
             name=card_data["name"],
             card_type=CardType(card_data["type"]),
@@ -46,12 +53,15 @@ class CardManager:
             strength=card_data.get("strength"),
             location_restriction=card_data.get("location_restriction"),
             villain_set=card_data.get("villain_set"),
-            expansion=card_data.get("expansion", "base")
+            expansion=card_data.get("expansion", "base"),
+            index=len(self.cards_cache)
         )
+        self.cards_cache[definition.id] = definition
         
-        return card
+        # Les effets sont compilés une fois ici, jamais au moment de jouer
+        return compile_card_effects(definition)
     
-    def load_cards_from_file(self, filepath: str) -> List[Card]:
+    def load_cards_from_file(self, filepath: str) -> List[CardDefinition]:
         """Charge les cartes depuis un fichier JSON"""
         if not os.path.exists(filepath):
             return []
@@ -60,20 +70,14 @@ class CardManager:
             with open(filepath, 'r', encoding='utf-8') as f:
                 data = json.load(f)
             
-            cards = []
-            for card_data in data.get("cards", []):
-                card = self.load_card_from_dict(card_data)
-                cards.append(card)
-                self.cards_cache[card.id] = card
-            
-            return cards
+            return [self.load_card_from_dict(card_data) for card_data in data.get("cards", [])]
         
         except (json.JSONDecodeError, KeyError, ValueError) as e:
             print(f"Erreur lors du chargement des cartes depuis {filepath}: {e}")
             return []
     
-    def load_villain_cards(self, villain_name: str) -> List[Card]:
-        """Charge les cartes d'un méchant spécifique"""
+    def load_villain_cards(self, villain_name: str) -> List[CardDefinition]:
+        """Charge les définitions des cartes d'un méchant spécifique"""
         if villain_name in self.villain_cards:
             return self.villain_cards[villain_name]
         
@@ -83,8 +87,8 @@ class CardManager:
         self.villain_cards[villain_name] = cards
         return cards
     
-    def load_fate_cards(self, villain_name: str) -> List[Card]:
-        """Charge les cartes Destin d'un méchant spécifique"""
+    def load_fate_cards(self, villain_name: str) -> List[CardDefinition]:
+        """Charge les définitions des cartes Destin d'un méchant spécifique"""
         if villain_name in self.fate_cards:
             return self.fate_cards[villain_name]
         
@@ -94,26 +98,34 @@ class CardManager:
         self.fate_cards[villain_name] = cards
         return cards
     
-    def create_villain_deck(self, villain_name: str) -> Deck:
-        """Crée un deck de méchant mélangé"""
-        cards = self.load_villain_cards(villain_name)
-        deck = Deck(list(cards))  # Copie des cartes
+    def create_villain_deck(self, villain_name: str, rng: Optional[random.Random] = None) -> Deck:
+        """Crée un deck de méchant mélangé (avec le générateur de la partie si fourni)"""
+        deck = Deck(self.instantiate(self.load_villain_cards(villain_name)), rng)
         deck.shuffle()
         return deck
     
-    def create_fate_deck(self, villain_name: str) -> Deck:
-        """Crée un deck Destin mélangé"""
-        cards = self.load_fate_cards(villain_name)
-        deck = Deck(list(cards))  # Copie des cartes
+    def create_fate_deck(self, villain_name: str, rng: Optional[random.Random] = None) -> Deck:
+        """Crée un deck Destin mélangé (avec le générateur de la partie si fourni)"""
+        deck = Deck(self.instantiate(self.load_fate_cards(villain_name)), rng)
         deck.shuffle()
         return deck
     
-    def get_card_by_id(self, card_id: str) -> Optional[Card]:
-        """Récupère une carte par son ID"""
+    @staticmethod
+    def instantiate(definitions: List[CardDefinition]) -> List[Card]:
+        """
+        Crée les exemplaires d'une partie à partir des définitions
+        
+        Chaque exemplaire ne porte qu'une référence et un numéro de copie : les
+        données de carte ne sont jamais dupliquées d'une partie à l'autre.
+        """
+        return [Card(definition, copy_id) for copy_id, definition in enumerate(definitions)]
+    
+    def get_card_by_id(self, card_id: str) -> Optional[CardDefinition]:
+        """Récupère une définition de carte par son ID"""
         return self.cards_cache.get(card_id)
     
     def create_sample_cards(self, villain_name: str) -> Tuple[List[Card], List[Card]]:
-        """Crée des cartes d'exemple pour les tests"""
+        """Crée des cartes d'exemple pour les tests (hors catalogue)"""
         # Cartes Méchant d'exemple
         villain_cards = [
             Card(
@@ -194,6 +206,9 @@ class CardManager:
             )
         ]
         
+        for card in villain_cards + fate_cards:
+            compile_card_effects(card)
+        
         return villain_cards, fate_cards
     
     def save_cards_to_file(self, cards: List[Card], filepath: str) -> bool:
@@ -3,18 +3,25 @@ Classe Deck - Gestion des paquets de cartes
 """
 
 import random
-from typing import List, Optional
+from collections import deque
+from itertools import islice
+from typing import Deque, Iterable, List, Optional
 from .card import Card
+from ..core.rng import copy_rng
 
 
 class Deck:
     """
     Classe pour gérer un paquet de cartes (deck, main, défausse)
+    
+    Les cartes sont stockées dans une deque : le dessus du paquet est à gauche,
+    le dessous à droite. Piocher et ajouter aux deux extrémités se fait en O(1).
     """
     
-    def __init__(self, cards: List[Card] = None):
-        """Initialise le deck avec une liste de cartes"""
-        self.cards: List[Card] = cards or []
+    def __init__(self, cards: Iterable[Card] = None, rng: Optional[random.Random] = None):
+        """Initialise le deck avec une liste de cartes et son générateur de mélange"""
+        self.cards: Deque[Card] = deque(cards or ())
+        self.rng = rng  # None = module random global
         self._original_cards: List[Card] = list(self.cards)  # Sauvegarde pour reset
     
     def add_card(self, card: Card) -> None:
@@ -31,7 +38,7 @@ class Deck:
     def draw_card(self) -> Optional[Card]:
         """Tire une carte du dessus du deck"""
         if self.cards:
-            return self.cards.pop(0)
+            return self.cards.popleft()
         return None
     
     def draw_cards(self, count: int) -> List[Card]:
@@ -47,11 +54,15 @@ class Deck:
     
     def peek_top(self, count: int = 1) -> List[Card]:
         """Regarde les cartes du dessus sans les retirer"""
-        return self.cards[:min(count, len(self.cards))]
+        return list(islice(self.cards, count))
     
     def shuffle(self) -> None:
         """Mélange le deck"""
-        random.shuffle(self.cards)
+        # L'accès indexé d'une deque est en O(n) au milieu : on mélange une liste
+        cards = list(self.cards)
+        (self.rng or random).shuffle(cards)
+        self.cards.clear()
+        self.cards.extend(cards)
     
     def add_to_bottom(self, card: Card) -> None:
         """Ajoute une carte en bas du deck"""
@@ -59,8 +70,35 @@ class Deck:
     
     def add_to_top(self, card: Card) -> None:
         """Ajoute une carte au dessus du deck"""
-        self.cards.insert(0, card)
+        self.cards.appendleft(card)
+    
+    def add_cards(self, cards: Iterable[Card]) -> None:
+        """Ajoute plusieurs cartes en bas du deck"""
+        self.cards.extend(cards)
     
+    def refill_from(self, discard) -> None:
+        """
+        Remet toute une défausse dans le deck puis mélange
+        
+        Coût linéaire en la taille de la défausse, payé une fois pour autant de
+        pioches : O(1) amorti par carte piochée.
+        """
+        self.cards.extend(discard)
+        discard.clear()
+        self.shuffle()
+    
+    def clear(self) -> None:
+        """Vide le deck"""
+        self.cards.clear()
+    
+    def copy(self) -> "Deck":
+        """Copie indépendante du deck (mêmes cartes, ordre et état du mélange)"""
+        deck = self.__class__.__new__(self.__class__)
+        deck.__dict__.update(self.__dict__)
+        deck.cards = deque(self.cards)
+        deck.rng = copy_rng(self.rng)
+        return deck
+
     def is_empty(self) -> bool:
         """Vérifie si le deck est vide"""
         return len(self.cards) == 0
@@ -71,7 +109,7 @@ class Deck:
     
     def reset(self) -> None:
         """Remet le deck à son état initial"""
-        self.cards = list(self._original_cards)
+        self.cards = deque(self._original_cards)
         self.shuffle()
     
     def find_card(self, card_id: str) -> Optional[Card]:
@@ -167,7 +205,7 @@ class DiscardPile(Deck):
     
     def add_card(self, card: Card) -> None:
         """Ajoute une carte au dessus de la défausse"""
-        self.add_to_top(card)
+        self.cards.appendleft(card)
     
     def peek_top_card(self) -> Optional[Card]:
         """Regarde la carte du dessus de la défausse"""
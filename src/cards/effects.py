@@ -0,0 +1,221 @@
+"""
+Compilateur d'effets - Transforme les CardEffect en opérations exécutables
+
+Les descriptions et paramètres des effets sont analysés une seule fois, au
+chargement des cartes. Jouer une carte exécute ensuite directement les
+opérations compilées, sans aucune analyse de texte.
+"""
+
+import re
+from typing import List, Optional, Tuple
+from .card import Card, CardEffect
+
+
+_NUMBER = re.compile(r"\d+")
+
+
+class EffectContext:
+    """Contexte d'exécution d'un effet : qui le subit, avec quelle carte, où"""
+
+    __slots__ = ("player", "card", "location", "game")
+
+    def __init__(self, player, card: Optional[Card] = None, location=None, game=None):
+        self.player = player
+        self.card = card
+        self.location = location
+        self.game = game
+
+
+class EffectOp:
+    """
+    Opération compilée de base : ne fait rien
+    """
+
+    __slots__ = ()
+
+    def apply(self, context: EffectContext) -> bool:
+        """Exécute l'opération, retourne True si elle a modifié le jeu"""
+        return False
+
+    def describe(self) -> str:
+        """Résumé lisible de l'opération"""
+        return ""
+
+    @property
+    def is_noop(self) -> bool:
+        """Vrai si l'opération n'a aucun effet mécanique"""
+        return True
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class GainPower(EffectOp):
+    """Le joueur gagne (ou perd, si négatif) du pouvoir"""
+
+    __slots__ = ("amount",)
+
+    def __init__(self, amount: int):
+        self.amount = amount
+
+    def apply(self, context: EffectContext) -> bool:
+        context.player.gain_power(self.amount)
+        return True
+
+    def describe(self) -> str:
+        return f"{self.amount:+d} pouvoir(s)"
+
+    @property
+    def is_noop(self) -> bool:
+        return self.amount == 0
+
+    def __repr__(self) -> str:
+        return f"GainPower({self.amount})"
+
+
+class DrawCards(EffectOp):
+    """Le joueur pioche des cartes de son deck Méchant"""
+
+    __slots__ = ("count",)
+
+    def __init__(self, count: int):
+        self.count = count
+
+    def apply(self, context: EffectContext) -> bool:
+        drawn = 0
+        for _ in range(self.count):
+            if context.player.draw_card() is None:
+                break
+            drawn += 1
+        return drawn > 0
+
+    def describe(self) -> str:
+        return f"+{self.count} carte(s) piochée(s)"
+
+    @property
+    def is_noop(self) -> bool:
+        return self.count == 0
+
+    def __repr__(self) -> str:
+        return f"DrawCards({self.count})"
+
+
+class OpSequence(EffectOp):
+    """Plusieurs opérations exécutées dans l'ordre"""
+
+    __slots__ = ("ops",)
+
+    def __init__(self, ops: Tuple[EffectOp, ...]):
+        self.ops = ops
+
+    def apply(self, context: EffectContext) -> bool:
+        changed = False
+        for op in self.ops:
+            changed = op.apply(context) or changed
+        return changed
+
+    def describe(self) -> str:
+        return ", ".join(op.describe() for op in self.ops)
+
+    @property
+    def is_noop(self) -> bool:
+        return all(op.is_noop for op in self.ops)
+
+    def __repr__(self) -> str:
+        return f"OpSequence({list(self.ops)!r})"
+
+
+# Opération partagée par tous les effets sans mécanique reconnue
+NOOP = EffectOp()
+
+# Paramètres explicites reconnus dans les données : clé -> fabrique d'opération
+_PARAMETER_OPS = {
+    "gain_power": GainPower,
+    "lose_power": lambda amount: GainPower(-amount),
+    "draw_cards": DrawCards,
+}
+
+
+def _first_number(text: str, default: int = 1) -> int:
+    """Retourne le premier entier d'un texte"""
+    match = _NUMBER.search(text)
+    return int(match.group()) if match else default
+
+
+def _compile_clause(clause: str) -> Optional[EffectOp]:
+    """Compile une proposition de description ("gagne 2 pouvoirs", "pioche une carte")"""
+    words = clause.split()
+    if not words:
+        return None
+
+    verb = words[0]
+    if verb == "pioche":
+        return DrawCards(_first_number(clause))
+    if verb == "gagne" and "pouvoir" in clause:
+        return GainPower(_first_number(clause))
+    if "perd" in words and "pouvoir" in clause:
+        return GainPower(-_first_number(clause))
+    return None
+
+
+def compile_effect(effect: CardEffect) -> EffectOp:
+    """Compile un effet en opération exécutable (les paramètres priment sur la description)"""
+    ops: List[EffectOp] = []
+
+    parameters = effect.parameters or {}
+    for key, factory in _PARAMETER_OPS.items():
+        if key in parameters:
+            ops.append(factory(int(parameters[key])))
+
+    if not ops:
+        description = effect.description.lower()
+        for clause in description.split(" et "):
+            op = _compile_clause(clause.strip())
+            if op is not None:
+                ops.append(op)
+
+    if not ops:
+        return NOOP
+    if len(ops) == 1:
+        return ops[0]
+    return OpSequence(tuple(ops))
+
+
+def compile_card_effects(card):
+    """Compile tous les effets d'une carte ou d'une définition (une seule fois) et la retourne"""
+    for effect in card.effects:
+        if effect.op is None:
+            effect.op = compile_effect(effect)
+    return card
+
+
+def resolve_effects(card: Card, trigger: str, context: EffectContext) -> List[Tuple[CardEffect, EffectOp]]:
+    """
+    Exécute les opérations compilées d'une carte pour un déclencheur
+
+    Retourne les couples (effet, opération) réellement exécutés, pour l'affichage.
+    """
+    applied = []
+    for effect in card.get_effects_by_trigger(trigger):
+        op = effect.op
+        if op is None:
+            # Carte créée hors du CardManager : compilée à la première utilisation
+            op = effect.op = compile_effect(effect)
+        if not op.is_noop:
+            op.apply(context)
+            applied.append((effect, op))
+    return applied
+
+
+def resolve_passive_effects(player, game=None) -> List[Tuple[CardEffect, EffectOp]]:
+    """
+    Résout les effets permanents des cartes en jeu d'un joueur (début de tour)
+
+    Seul l'index player.passive_cards est parcouru : le coût est proportionnel
+    au nombre de cartes à effet permanent, pas à tout ce qui est en jeu.
+    """
+    applied = []
+    location = player.get_current_location()
+    for card in list(player.passive_cards):
+        applied.extend(resolve_effects(card, "passive", EffectContext(player, card, location, game)))
+    return applied
@@ -0,0 +1,230 @@
+"""
+Catalogue précompilé - Regroupe toutes les cartes et tous les plateaux dans un seul fichier binaire
+
+Au premier lancement, les documents JSON de data/cards et data/boards sont
+analysés et validés une fois par les gestionnaires habituels, puis écrits dans
+data/.cache/catalog.bin. Les lancements suivants ne lisent plus que ce fichier,
+tant qu'aucune source n'a changé (date de modification, taille, puis empreinte).
+"""
+
+import hashlib
+import os
+import pickle
+from typing import Dict, List, Optional, Tuple
+from ..board.board import BoardTemplate, LocationTemplate
+from ..board.board_manager import BoardManager
+from ..board.location import Action
+from ..cards.card import CardDefinition, CardEffect
+from ..cards.card_manager import CardManager
+from ..cards.effects import compile_card_effects
+from .enums import ActionType, CardType
+
+
+# En-tête du fichier : à changer dès que la disposition du catalogue change
+CATALOG_MAGIC = b"DVCAT"
+CATALOG_VERSION = 1
+
+# Empreinte d'une source : (date de modification en ns, taille, sha256)
+SourceStamp = Tuple[int, int, str]
+
+
+def _file_hash(path: str) -> str:
+    """Calcule l'empreinte sha256 d'un fichier"""
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+class Catalog:
+    """
+    Compilateur et chargeur du catalogue binaire des cartes et plateaux
+
+    Le catalogue ne contient que des tuples de types simples ; les définitions
+    de cartes, effets compilés, lieux et actions sont reconstruits au chargement
+    sans repasser par l'analyse et la validation des JSON.
+    """
+
+    def __init__(self, data_root: str = "data", cache_path: Optional[str] = None):
+        """Initialise le catalogue pour un dossier de données"""
+        self.data_root = data_root
+        self.cache_path = cache_path or os.path.join(data_root, ".cache", "catalog.bin")
+        self.rebuilt = False  # Vrai si le dernier chargement a recompilé les JSON
+        self.refreshed = 0    # Sources touchées mais identiques, réenregistrées au dernier chargement
+
+    # === Sources ===
+
+    def source_files(self) -> List[str]:
+        """Retourne les chemins relatifs des documents JSON compilés dans le catalogue"""
+        sources = []
+        for folder in ("cards", "boards"):
+            path = os.path.join(self.data_root, folder)
+            if os.path.isdir(path):
+                sources.extend(f"{folder}/{name}" for name in sorted(os.listdir(path)) if name.endswith(".json"))
+        return sources
+
+    def _stamp(self, source: str, with_hash: bool = True) -> SourceStamp:
+        """Calcule l'empreinte d'une source"""
+        path = os.path.join(self.data_root, source)
+        stat = os.stat(path)
+        return stat.st_mtime_ns, stat.st_size, _file_hash(path) if with_hash else ""
+
+    def build_manifest(self) -> Dict[str, SourceStamp]:
+        """Empreintes de toutes les sources actuelles"""
+        return {source: self._stamp(source) for source in self.source_files()}
+
+    def is_fresh(self, manifest: Dict[str, SourceStamp],
+                 refreshed: Optional[Dict[str, SourceStamp]] = None) -> bool:
+        """
+        Vérifie qu'un manifeste correspond encore aux sources
+
+        La date et la taille suffisent le plus souvent ; l'empreinte n'est
+        recalculée que pour les fichiers touchés (copie, checkout git...).
+        Les sources touchées mais identiques sont ajoutées à refreshed avec
+        leur nouvelle date, pour ne plus les relire aux lancements suivants.
+        """
+        if set(manifest) != set(self.source_files()):
+            return False
+
+        for source, (mtime_ns, size, digest) in manifest.items():
+            current_mtime, current_size, _ = self._stamp(source, with_hash=False)
+            if (current_mtime, current_size) == (mtime_ns, size):
+                continue
+            if current_size != size or _file_hash(os.path.join(self.data_root, source)) != digest:
+                return False
+            if refreshed is not None:
+                refreshed[source] = (current_mtime, current_size, digest)
+        return True
+
+    # === Compilation ===
+
+    def compile(self) -> dict:
+        """Analyse les JSON avec les gestionnaires et produit le contenu du catalogue"""
+        card_manager = CardManager(os.path.join(self.data_root, "cards"))
+        board_manager = BoardManager(os.path.join(self.data_root, "boards"))
+
+        villain_decks = {}
+        fate_decks = {}
+        for source in self.source_files():
+            folder, filename = source.split("/")
+            if folder != "cards":
+                continue
+            if filename.endswith("_villain.json"):
+                name = filename[:-len("_villain.json")]
+                villain_decks[name] = [d.index for d in card_manager.load_villain_cards(name)]
+            elif filename.endswith("_fate.json"):
+                name = filename[:-len("_fate.json")]
+                fate_decks[name] = [d.index for d in card_manager.load_fate_cards(name)]
+
+        cards = [
+            (d.id, d.name, d.card_type.value, d.cost, d.description, d.strength,
+             d.location_restriction, d.villain_set, d.expansion,
+             tuple((e.description, e.trigger, e.target, e.parameters) for e in d.effects))
+            for d in sorted(card_manager.cards_cache.values(), key=lambda d: d.index)
+        ]
+
+        boards = {}
+        for name in board_manager.get_all_board_names():
+            boards[name] = [
+                (loc.id, loc.name, loc.position, loc.description, loc.image_path,
+                 tuple((a.action_type.value, a.value, a.description, a.blocked_by_heroes) for a in loc.actions))
+                for loc in board_manager.load_villain_template(name).locations
+            ]
+
+        return {"cards": cards, "villain_decks": villain_decks, "fate_decks": fate_decks, "boards": boards}
+
+    def write(self, manifest: Dict[str, SourceStamp], payload: dict) -> bool:
+        """Écrit le catalogue de façon atomique, retourne False si le dossier est en lecture seule"""
+        tmp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                f.write(CATALOG_MAGIC + bytes([CATALOG_VERSION]))
+                pickle.dump(manifest, f, protocol=pickle.HIGHEST_PROTOCOL)
+                pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.cache_path)
+            return True
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return False
+
+    # === Chargement ===
+
+    def _read_cached(self) -> Optional[dict]:
+        """Lit le catalogue s'il est à jour, ou None s'il est absent, illisible ou périmé"""
+        self.refreshed = 0
+        try:
+            f = open(self.cache_path, "rb")
+        except OSError:
+            return None
+
+        refreshed: Dict[str, SourceStamp] = {}
+        with f:
+            if f.read(len(CATALOG_MAGIC) + 1) != CATALOG_MAGIC + bytes([CATALOG_VERSION]):
+                return None
+            try:
+                # Le manifeste précède le contenu : un catalogue périmé n'est jamais décodé
+                manifest = pickle.load(f)
+                if not self.is_fresh(manifest, refreshed):
+                    return None
+                payload = pickle.load(f)
+            except Exception:
+                return None
+
+        if refreshed:
+            # Dates à jour dans le manifeste : les empreintes ne seront plus recalculées
+            manifest.update(refreshed)
+            self.write(manifest, payload)
+        self.refreshed = len(refreshed)
+        return payload
+
+    def load(self) -> dict:
+        """Retourne le contenu du catalogue, recompilé seulement si une source a changé"""
+        payload = self._read_cached()
+        self.rebuilt = payload is None
+        if payload is None:
+            payload = self.compile()
+            self.write(self.build_manifest(), payload)
+        return payload
+
+    def install(self, card_manager: CardManager, board_manager: BoardManager) -> None:
+        """Remplit les caches des gestionnaires à partir du catalogue"""
+        payload = self.load()
+
+        definitions = []
+        for index, (card_id, name, card_type, cost, description, strength,
+                    location_restriction, villain_set, expansion, effects) in enumerate(payload["cards"]):
+            definition = CardDefinition(
+                card_id, name, CardType(card_type), cost, description,
+                [CardEffect(*effect) for effect in effects],
+                strength, location_restriction, villain_set, expansion, index
+            )
+            definitions.append(compile_card_effects(definition))
+            card_manager.cards_cache[card_id] = definition
+
+        for name, indices in payload["villain_decks"].items():
+            card_manager.villain_cards[name] = [definitions[i] for i in indices]
+        for name, indices in payload["fate_decks"].items():
+            card_manager.fate_cards[name] = [definitions[i] for i in indices]
+
+        for name, locations in payload["boards"].items():
+            board_manager.templates_cache[name] = BoardTemplate(name, tuple(
+                LocationTemplate(
+                    location_id, location_name, position,
+                    tuple(Action(ActionType(action_type), value, action_description, blocked)
+                          for action_type, value, action_description, blocked in actions),
+                    location_description, image_path
+                )
+                for location_id, location_name, position, location_description, image_path, actions in locations
+            ))
+
+    def __str__(self) -> str:
+        """Représentation textuelle du catalogue"""
+        return f"Catalog({self.cache_path})"
+
+
+def load_catalog(card_manager: CardManager, board_manager: BoardManager,
+                 data_root: str = "data", cache_path: Optional[str] = None) -> Catalog:
+    """Charge le catalogue binaire dans les gestionnaires et le retourne"""
+    catalog = Catalog(data_root, cache_path)
+    catalog.install(card_manager, board_manager)
+    return catalog
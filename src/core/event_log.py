@@ -0,0 +1,152 @@
+"""
+Journal d'événements - Enregistrements typés dans un tampon circulaire de taille fixe
+
+Un événement est un tuple (code, tour, joueur, arguments) : rien n'est formaté
+au moment où il est enregistré. Le texte n'est produit qu'à l'affichage, à
+partir du gabarit du code. Le tampon garde les `capacity` derniers événements
+et peut être désactivé pour les simulations.
+"""
+
+from enum import IntEnum
+from typing import Any, Iterator, List, NamedTuple, Optional, Tuple
+
+
+class EventCode(IntEnum):
+    """Types d'événements du journal"""
+    MESSAGE = 0  # Texte libre (log_action)
+    PLAYER_JOINED = 1
+    PLAYER_LEFT = 2
+    GAME_STARTED = 3
+    GAME_WON = 4
+    GAME_DRAWN = 5
+    TURN_STARTED = 6
+    ACTION_PHASE = 7
+    MOVED = 8
+    ACTION = 9
+    FATE = 10
+
+
+# Gabarits d'affichage : {player} est le nom du joueur, {0}, {1}... les arguments
+EVENT_TEMPLATES = {
+    EventCode.MESSAGE: "{0}",
+    EventCode.PLAYER_JOINED: "{player} rejoint la partie avec {0}",
+    EventCode.PLAYER_LEFT: "{player} quitte la partie",
+    EventCode.GAME_STARTED: "La partie commence !",
+    EventCode.GAME_WON: "{player} ({0}) remporte la partie !",
+    EventCode.GAME_DRAWN: "Partie terminée sans vainqueur",
+    EventCode.TURN_STARTED: "Tour de {player} - Phase de déplacement",
+    EventCode.ACTION_PHASE: "{player} - Phase d'actions ({0} actions disponibles)",
+    EventCode.MOVED: "{player} se déplace de {0} vers {1}",
+    EventCode.ACTION: "{player} effectue l'action {0}",
+    EventCode.FATE: "{player} joue le Destin contre {0} : {1}",
+}
+
+
+class Event(NamedTuple):
+    """Événement enregistré, formaté seulement à la demande"""
+    code: EventCode
+    turn: int
+    player: Optional[str]
+    args: Tuple[Any, ...] = ()
+
+    def format(self) -> str:
+        """Texte de l'événement, préfixé par le tour"""
+        return f"Tour {self.turn}: " + EVENT_TEMPLATES[self.code].format(*self.args, player=self.player)
+
+    def __str__(self) -> str:
+        return self.format()
+
+
+class LazyMessage:
+    """Message formaté seulement quand il est lu (str()) ; une liste est jointe par des virgules"""
+
+    __slots__ = ("template", "args")
+
+    def __init__(self, template: str, *args):
+        self.template = template
+        self.args = args
+
+    def __str__(self) -> str:
+        if not self.args:
+            return self.template
+        args = [", ".join(map(str, arg)) if isinstance(arg, list) else arg for arg in self.args]
+        return self.template.format(*args)
+
+    def __repr__(self) -> str:
+        return f"LazyMessage({self.template!r})"
+
+
+class EventLog:
+    """
+    Tampon circulaire des derniers événements d'une partie
+
+    total compte tous les événements enregistrés depuis le début ; seuls les
+    `capacity` derniers sont conservés. Avec enabled à False, record() ne fait rien.
+    """
+
+    __slots__ = ("capacity", "enabled", "_buffer", "_start", "_end")
+
+    def __init__(self, capacity: int = 1024, enabled: bool = True):
+        """Initialise un journal vide (capacity 0 = désactivé)"""
+        self.capacity = max(0, capacity)
+        self.enabled = enabled and self.capacity > 0
+        self._buffer: List[Optional[Event]] = [None] * self.capacity
+        self._start = 0  # Numéro du plus ancien événement conservé
+        self._end = 0    # Numéro du prochain événement
+
+    def record(self, code: EventCode, turn: int, player: Optional[str] = None, *args) -> None:
+        """Enregistre un événement sans le formater"""
+        if not self.enabled or not self.capacity:
+            return
+        self._buffer[self._end % self.capacity] = Event(code, turn, player, args)
+        self._end += 1
+        if self._end - self._start > self.capacity:
+            self._start = self._end - self.capacity
+
+    @property
+    def total(self) -> int:
+        """Nombre d'événements enregistrés depuis le début, conservés ou non"""
+        return self._end
+
+    def truncate(self, total: int) -> None:
+        """Oublie les événements enregistrés après les `total` premiers (retour en arrière)"""
+        self._end = min(self._end, max(0, total))
+        self._start = min(self._start, self._end)
+
+    def recent(self, count: int) -> List[Event]:
+        """Les count derniers événements, du plus ancien au plus récent"""
+        start = max(self._start, self._end - count)
+        return [self._buffer[i % self.capacity] for i in range(start, self._end)]
+
+    def messages(self) -> List[str]:
+        """Textes de tous les événements conservés"""
+        return [event.format() for event in self]
+
+    def clear(self) -> None:
+        """Vide le journal"""
+        self._start = self._end = 0
+        self._buffer = [None] * self.capacity
+
+    def copy(self) -> "EventLog":
+        """Copie indépendante (les événements, immuables, sont partagés)"""
+        log = EventLog.__new__(EventLog)
+        log.capacity = self.capacity
+        log.enabled = self.enabled
+        log._buffer = list(self._buffer)
+        log._start = self._start
+        log._end = self._end
+        return log
+
+    def __iter__(self) -> Iterator[Event]:
+        """Événements conservés, du plus ancien au plus récent"""
+        for i in range(self._start, self._end):
+            yield self._buffer[i % self.capacity]
+
+    def __len__(self) -> int:
+        """Nombre d'événements conservés"""
+        return self._end - self._start
+
+    def __str__(self) -> str:
+        """Représentation textuelle du journal"""
+        state = "actif" if self.enabled else "désactivé"
+        return f"EventLog({len(self)}/{self.capacity}, {self.total} au total, {state})"
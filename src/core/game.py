@@ -2,12 +2,26 @@
 Classe Game - Gestionnaire principal du jeu Disney Villainous
 """
 
+import copy
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, NamedTuple, Optional, Any, Tuple
 import random
-from ..players.player import Player
+from ..players.player import Player, PlayerSnapshot
 from ..core.enums import GameState, TurnPhase, VillainType
+from ..core.rng import new_seed, derive_rng, copy_rng
 from ..cards.card import Card
+from .event_log import EventCode, EventLog
+
+
+class GameSnapshot(NamedTuple):
+    """État mutable d'une partie figé par Game.snapshot()"""
+    current_player_index: int
+    turn_number: int
+    state: GameState
+    winner_index: Optional[int]
+    rng_state: Any
+    log_size: int
+    players: Tuple[PlayerSnapshot, ...]
 
 
 @dataclass
@@ -26,13 +40,68 @@ class Game:
     max_players: int = 6
     min_players: int = 2
     
-    # Historique des actions
-    action_log: List[str] = field(default_factory=list)
+    # Journal des événements : les `log_capacity` derniers, 0 pour ne rien enregistrer
+    log_capacity: int = 1024
+    events: EventLog = field(init=False, repr=False, compare=False)
+    
+    # Aléatoire propre à la partie (None = graine tirée au hasard)
+    seed: Optional[int] = None
+    rng: random.Random = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Initialisation après création"""
+        if self.seed is None:
+            self.seed = new_seed()
+        self.rng = derive_rng(self.seed, "game")
+        self.events = EventLog(self.log_capacity)
+        
         if len(self.players) > 0:
-            random.shuffle(self.players)  # Ordre aléatoire des joueurs
+            self.rng.shuffle(self.players)  # Ordre aléatoire des joueurs
+    
+    def derive_rng(self, *labels) -> random.Random:
+        """Crée un sous-flux aléatoire de la partie (par joueur, par deck, ...)"""
+        return derive_rng(self.seed, *labels)
+    
+    # === Copie d'état ===
+    
+    def snapshot(self) -> GameSnapshot:
+        """
+        Fige l'état mutable de la partie pour un restore() ultérieur
+        
+        Seuls les compteurs, l'ordre des piles, le placement des héros et objets
+        et l'état des générateurs sont copiés ; cartes et plateaux sont partagés.
+        """
+        winner_index = None
+        if self.winner is not None:
+            winner_index = next(i for i, player in enumerate(self.players) if player is self.winner)
+        return GameSnapshot(
+            self.current_player_index, self.turn_number, self.state, winner_index,
+            self.rng.getstate(), self.events.total,
+            tuple(player.snapshot() for player in self.players)
+        )
+    
+    def restore(self, snapshot: GameSnapshot) -> None:
+        """Remet la partie dans un état figé par snapshot() (mêmes joueurs)"""
+        self.current_player_index = snapshot.current_player_index
+        self.turn_number = snapshot.turn_number
+        self.state = snapshot.state
+        if snapshot.rng_state is not None:
+            self.rng.setstate(snapshot.rng_state)
+        self.events.truncate(snapshot.log_size)  # Le journal ne fait que s'allonger
+        
+        for player, player_snapshot in zip(self.players, snapshot.players):
+            player.restore(player_snapshot)
+        self.winner = None if snapshot.winner_index is None else self.players[snapshot.winner_index]
+    
+    def clone(self) -> "Game":
+        """Copie indépendante de la partie, qui partage les données immuables"""
+        game = copy.copy(self)
+        game.players = [player.clone() for player in self.players]
+        if self.winner is not None:
+            game.winner = next(clone for clone, player in zip(game.players, self.players) if player is self.winner)
+        game.events = self.events.copy()
+        game.rng = copy_rng(self.rng)
+        return game
     
     # === Gestion des joueurs ===
     
@@ -57,7 +126,7 @@ class Game:
         )
         
         self.players.append(player)
-        self.log_action(f"{player_name} rejoint la partie avec {villain_type.value}")
+        self.log_event(EventCode.PLAYER_JOINED, player_name, villain_type.value)
         
         return True
     
@@ -69,7 +138,7 @@ class Game:
         for i, player in enumerate(self.players):
             if player.id == player_id:
                 self.players.pop(i)
-                self.log_action(f"{player.name} quitte la partie")
+                self.log_event(EventCode.PLAYER_LEFT, player.name)
                 return True
         return False
     
@@ -103,7 +172,7 @@ class Game:
         
         self.state = GameState.IN_PROGRESS
         self.current_player_index = 0
-        self.log_action("La partie commence !")
+        self.log_event(EventCode.GAME_STARTED)
         
         return True
     
@@ -113,9 +182,9 @@ class Game:
         self.winner = winner
         
         if winner:
-            self.log_action(f"{winner.name} ({winner.villain_type.value}) remporte la partie !")
+            self.log_event(EventCode.GAME_WON, winner.name, winner.villain_type.value)
         else:
-            self.log_action("Partie terminée sans vainqueur")
+            self.log_event(EventCode.GAME_DRAWN)
     
     def check_victory_conditions(self) -> Optional[Player]:
         """Vérifie les conditions de victoire de tous les joueurs"""
@@ -150,7 +219,7 @@ class Game:
         """Démarre le tour d'un joueur"""
         player.turn_phase = TurnPhase.MOVE
         # Le joueur doit bouger en premier
-        self.log_action(f"Tour de {player.name} - Phase de déplacement")
+        self.log_event(EventCode.TURN_STARTED, player.name)
     
     def start_action_phase(self, player: Player) -> None:
         """Démarre la phase d'actions"""
@@ -158,7 +227,7 @@ class Game:
         current_location = player.get_current_location()
         if current_location:
             player.actions_remaining = len(current_location.get_available_actions())
-            self.log_action(f"{player.name} - Phase d'actions ({player.actions_remaining} actions disponibles)")
+            self.log_event(EventCode.ACTION_PHASE, player.name, player.actions_remaining)
     
     # === Actions de jeu ===
     
@@ -173,7 +242,8 @@ class Game:
         old_location = player.get_current_location()
         if player.move_to_location(new_position):
             new_location = player.get_current_location()
-            self.log_action(f"{player.name} se déplace de {old_location.name if old_location else '?'} vers {new_location.name if new_location else '?'}")
+            self.log_event(EventCode.MOVED, player.name, old_location.name if old_location else '?',
+                           new_location.name if new_location else '?')
             
             # Passe à la phase d'actions
             self.start_action_phase(player)
@@ -208,7 +278,7 @@ class Game:
         
         if success:
             player.actions_remaining -= 1
-            self.log_action(f"{player.name} effectue l'action {action_type}")
+            self.log_event(EventCode.ACTION, player.name, action_type)
             
             # Fin du tour si plus d'actions
             if player.actions_remaining <= 0:
@@ -230,12 +300,7 @@ class Game:
             card_id = kwargs.get('card_id')
             if card_id:
                 # Trouve la carte dans la main
-                card = None
-                for c in player.hand:
-                    if c.id == card_id:
-                        card = c
-                        break
-                
+                card = player.hand.get(card_id)
                 if card:
                     return player.play_card(card, location.id)
         
@@ -243,11 +308,7 @@ class Game:
             card_ids = kwargs.get('card_ids', [])
             if card_ids:
                 for card_id in card_ids:
-                    card = None
-                    for c in player.hand:
-                        if c.id == card_id:
-                            card = c
-                            break
+                    card = player.hand.get(card_id)
                     if card:
                         player.discard_card(card)
                 return True
@@ -280,40 +341,80 @@ class Game:
             # Place la carte sur le plateau du joueur cible
             # TODO: Implémenter la logique de placement des héros
             
-            self.log_action(f"{acting_player.name} joue le Destin contre {target_player.name} : {card_to_play.name}")
+            self.log_event(EventCode.FATE, acting_player.name, target_player.name, card_to_play.name)
             return True
         
         return False
     
     # === Utilitaires ===
     
+    def log_event(self, code: EventCode, player_name: Optional[str] = None, *args) -> None:
+        """Enregistre un événement typé, formaté seulement à l'affichage"""
+        if self.events.enabled:
+            self.events.record(code, self.turn_number, player_name, *args)
+    
     def log_action(self, message: str) -> None:
-        """Ajoute une entrée au log d'actions"""
-        log_entry = f"Tour {self.turn_number}: {message}"
-        self.action_log.append(log_entry)
-        # TODO: Optionnel - afficher immédiatement
-    
-    def get_game_state(self) -> Dict[str, Any]:
-        """Retourne l'état complet du jeu"""
-        return {
+        """Ajoute un message libre au journal"""
+        self.log_event(EventCode.MESSAGE, None, message)
+    
+    @property
+    def action_log(self) -> List[str]:
+        """Textes des événements conservés, formatés à la lecture"""
+        return self.events.messages()
+    
+    def get_game_state(self, full: bool = False) -> Dict[str, Any]:
+        """
+        Retourne l'état complet du jeu
+        
+        Avec full, chaque joueur porte aussi sa phase, ses actions restantes, le
+        contenu de toutes ses zones (ids de cartes, dans l'ordre) et son plateau.
+        """
+        players = []
+        for p in self.players:
+            player_state = {
+                "id": p.id,
+                "name": p.name,
+                "villain": p.villain_type.value,
+                "power": p.power,
+                "hand_size": len(p.hand),
+                "location": p.current_location,
+                "has_won": p.has_won
+            }
+            if full:
+                player_state["turn_phase"] = p.turn_phase.value
+                player_state["actions_remaining"] = p.actions_remaining
+                player_state["zones"] = {
+                    "hand": [card.id for card in p.hand],
+                    "villain_deck": [card.id for card in p.villain_deck.cards],
+                    "fate_deck": [card.id for card in p.fate_deck.cards],
+                    "discard": [card.id for card in p.discard_pile],
+                    "fate_discard": [card.id for card in p.fate_discard],
+                    "allies": [card.id for card in p.allies_in_play],
+                    "items": [card.id for card in p.items_in_play],
+                    "conditions": [card.id for card in p.conditions_in_play]
+                }
+                player_state["board"] = [
+                    {
+                        "id": location.id,
+                        "heroes": list(location.heroes_present),
+                        "items": list(location.items_present),
+                        "locked": location.locked
+                    }
+                    for location in p.board_locations
+                ]
+            players.append(player_state)
+        
+        state = {
             "id": self.id,
             "state": self.state.value,
             "turn_number": self.turn_number,
             "current_player": self.current_player_index,
-            "players": [
-                {
-                    "id": p.id,
-                    "name": p.name,
-                    "villain": p.villain_type.value,
-                    "power": p.power,
-                    "hand_size": len(p.hand),
-                    "location": p.current_location,
-                    "has_won": p.has_won
-                }
-                for p in self.players
-            ],
+            "players": players,
             "winner": self.winner.id if self.winner else None
         }
+        if full:
+            state["seed"] = self.seed
+        return state
     
     def is_player_turn(self, player_id: str) -> bool:
         """Vérifie si c'est le tour du joueur spécifié"""
@@ -0,0 +1,264 @@
+"""
+Générateur de coups - Liste les coups légaux et entièrement paramétrés du joueur courant
+
+TurnManager.get_available_actions ne donne que des ActionType : l'appelant
+devait deviner les paramètres (card_id, card_ids, hero_id, target_player,
+target_location) et essayer perform_action pour savoir s'ils étaient acceptés.
+Le générateur applique les mêmes règles que les handlers du TurnManager et ne
+propose que des coups qui réussiront.
+
+Les listes de coups sont mises en cache par clé d'état : un tuple des seules
+données dont dépendent les coups de la phase en cours (lieu, héros et objets
+présents, pouvoir, main, cartes en jeu, paquets Destin adverses). La clé ne
+change que si l'une d'elles change ; elle survit à restore() et clone().
+"""
+
+from typing import Any, Dict, Hashable, List, NamedTuple, Optional, Tuple
+from ..players.player import Player
+from .enums import ActionType, TurnPhase
+from .event_log import LazyMessage
+from .game import Game
+from .turn_manager import ActionResult, TurnManager
+
+
+class Move(NamedTuple):
+    """
+    Coup d'un joueur, hashable et indépendant de la partie
+
+    kind vaut "move" (déplacement), "action" ou "end" (fin de tour). Les
+    paramètres sont triés par nom ; un joueur cible est désigné par son id.
+    """
+    kind: str
+    action_type: Optional[ActionType] = None
+    params: Tuple[Tuple[str, Any], ...] = ()
+
+    @classmethod
+    def position(cls, position: int) -> "Move":
+        """Déplacement vers une position"""
+        return cls("move", None, (("position", position),))
+
+    @classmethod
+    def action(cls, action_type: ActionType, kwargs: Optional[Dict[str, Any]] = None) -> "Move":
+        """Action avec les paramètres de TurnManager.perform_action"""
+        params = []
+        for name, value in sorted((kwargs or {}).items()):
+            if isinstance(value, Player):
+                value = value.id
+            elif isinstance(value, list):
+                value = tuple(value)
+            params.append((name, value))
+        return cls("action", action_type, tuple(params))
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Move":
+        """
+        Inverse de to_dict (coup reçu d'un client)
+
+        Un coup mal formé (pas un objet, paramètres qui ne sont pas un objet,
+        position non entière) lève ValueError.
+        """
+        if not isinstance(data, dict):
+            raise ValueError(f"Coup invalide : {data!r}")
+        kind = data.get("kind")
+        if kind not in ("move", "action", "end"):
+            raise ValueError(f"Type de coup inconnu : {kind!r}")
+        params = data.get("params") or {}
+        if not isinstance(params, dict):
+            raise ValueError(f"Paramètres de coup invalides : {params!r}")
+        if kind == "move":
+            position = params.get("position")
+            if not isinstance(position, int) or isinstance(position, bool):
+                raise ValueError(f"Position invalide : {position!r}")
+            return cls.position(position)
+        if kind == "end":
+            return END_TURN
+        for name, value in params.items():
+            if isinstance(value, dict) or (isinstance(value, list) and any(isinstance(v, (dict, list)) for v in value)):
+                raise ValueError(f"Paramètre {name} invalide : {value!r}")
+        return cls.action(ActionType(data.get("action")), params)
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """Valeur d'un paramètre"""
+        for key, value in self.params:
+            if key == name:
+                return value
+        return default
+
+    def kwargs(self, game: Game) -> Dict[str, Any]:
+        """Paramètres à passer à perform_action, joueur cible résolu dans la partie"""
+        kwargs = {}
+        for name, value in self.params:
+            if name == "target_player":
+                value = game.get_player_by_id(value)
+            elif isinstance(value, tuple):
+                value = list(value)
+            kwargs[name] = value
+        return kwargs
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Forme sérialisable en JSON (interface web)"""
+        return {
+            "kind": self.kind,
+            "action": self.action_type.value if self.action_type else None,
+            "params": {name: list(value) if isinstance(value, tuple) else value for name, value in self.params}
+        }
+
+    def __str__(self) -> str:
+        if self.kind == "action":
+            params = ", ".join(f"{name}={value}" for name, value in self.params)
+            return f"{self.action_type.value}({params})"
+        if self.kind == "move":
+            return f"move({self.get('position')})"
+        return "end"
+
+
+# Fin de tour choisie par le joueur
+END_TURN = Move("end")
+
+
+class MoveGenerator:
+    """
+    Énumère les coups légaux de la phase en cours, avec un cache par clé d'état
+    """
+
+    def __init__(self, turn_manager: Optional[TurnManager] = None, cache_size: int = 4096):
+        """Initialise le générateur ; le cache est vidé quand il dépasse cache_size entrées"""
+        self.turn_manager = turn_manager or TurnManager()
+        self.cache_size = cache_size
+        self._cache: Dict[Hashable, Tuple[Move, ...]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    # === Clé d'état ===
+
+    def state_key(self, game: Game, player: Player) -> Hashable:
+        """Tuple des données dont dépendent les coups du joueur dans sa phase actuelle"""
+        if player.turn_phase == TurnPhase.MOVE:
+            return (TurnPhase.MOVE, player.current_location,
+                    tuple(location.locked for location in player.board_locations))
+
+        location = player.get_current_location()
+        if player.turn_phase != TurnPhase.ACTIONS or player.actions_remaining <= 0 or location is None:
+            return (TurnPhase.END,)
+
+        return (
+            TurnPhase.ACTIONS, location.id,
+            tuple(location.heroes_present), tuple(location.items_present),
+            player.power, player.current_location, len(player.board_locations),
+            tuple(card.id for card in player.hand),
+            tuple(card.id for card in player.allies_in_play),
+            tuple(card.id for card in player.items_in_play),
+            tuple(other.id for other in game.players if other is not player and self._has_fate(other))
+        )
+
+    @staticmethod
+    def _has_fate(player: Player) -> bool:
+        """Vrai si le Destin peut être joué contre ce joueur (paquet ou défausse non vide)"""
+        return not player.fate_deck.is_empty() or bool(player.fate_discard)
+
+    # === Énumération ===
+
+    def legal_moves(self, game: Game, player: Optional[Player] = None) -> Tuple[Move, ...]:
+        """
+        Coups légaux du joueur (par défaut le joueur courant)
+
+        Phase de déplacement : un déplacement par position libre, ou la fin de
+        tour s'il n'y en a aucune. Phase d'actions : chaque action paramétrée
+        puis la fin de tour.
+        """
+        player = player or game.get_current_player()
+        key = self.state_key(game, player)
+        moves = self._cache.get(key)
+        if moves is not None:
+            self.hits += 1
+            return moves
+
+        self.misses += 1
+        moves = self._generate(game, player)
+        if len(self._cache) >= self.cache_size:
+            self._cache.clear()
+        self._cache[key] = moves
+        return moves
+
+    def _generate(self, game: Game, player: Player) -> Tuple[Move, ...]:
+        """Calcule les coups sans passer par le cache"""
+        if player.turn_phase == TurnPhase.MOVE:
+            positions = self.turn_manager.get_valid_move_positions(player)
+            return tuple(Move.position(position) for position in positions) or (END_TURN,)
+
+        moves: List[Move] = []
+        seen_types = set()
+        for action_type in self.turn_manager.get_available_actions(player):
+            if action_type not in seen_types:
+                seen_types.add(action_type)
+                moves.extend(self.action_moves(game, player, action_type))
+        moves.append(END_TURN)
+        return tuple(moves)
+
+    def action_moves(self, game: Game, player: Player, action_type: ActionType) -> List[Move]:
+        """Jeux de paramètres acceptés par le handler d'une action, sans doublon"""
+        location = player.get_current_location()
+        if location is None:
+            return []
+
+        if action_type == ActionType.GAIN_POWER:
+            action = location.get_action_by_type(ActionType.GAIN_POWER)
+            return [Move("action", action_type)] if action and action.value is not None else []
+
+        if action_type == ActionType.PLAY_CARD:
+            playable = {}
+            for card in player.hand:
+                if card.cost <= player.power and card.is_playable_at_location(location.id):
+                    playable.setdefault(card.id, card)
+            return [Move("action", action_type, (("card_id", card_id),)) for card_id in playable]
+
+        if action_type == ActionType.ACTIVATE:
+            targets = dict.fromkeys(card.id for card in player.allies_in_play + player.items_in_play)
+            return [Move("action", action_type, (("target_id", card_id),)) for card_id in targets]
+
+        if action_type == ActionType.DISCARD:
+            card_ids = dict.fromkeys(card.id for card in player.hand)
+            return [Move("action", action_type, (("card_ids", (card_id,)),)) for card_id in card_ids]
+
+        if action_type == ActionType.VANQUISH:
+            return [Move("action", action_type, (("hero_id", hero_id),)) for hero_id in location.heroes_present]
+
+        if action_type == ActionType.FATE:
+            return [
+                Move("action", action_type, (("target_player", other.id),))
+                for other in game.players
+                if other is not player and self._has_fate(other)
+            ]
+
+        if action_type in (ActionType.MOVE_ITEM, ActionType.MOVE_HERO):
+            name = "item_id" if action_type == ActionType.MOVE_ITEM else "hero_id"
+            objects = location.items_present if action_type == ActionType.MOVE_ITEM else location.heroes_present
+            return [
+                Move("action", action_type, ((name, object_id), ("target_location", index)))
+                for object_id in dict.fromkeys(objects)
+                for index in range(len(player.board_locations))
+                if index != player.current_location
+            ]
+
+        return []
+
+    # === Application ===
+
+    def apply(self, game: Game, move: Move, player: Optional[Player] = None) -> ActionResult:
+        """Joue un coup avec le TurnManager (la fin de tour passe le joueur en phase END)"""
+        player = player or game.get_current_player()
+        if move.kind == "move":
+            return self.turn_manager.move_player(player, move.get("position"))
+        if move.kind == "action":
+            return self.turn_manager.perform_action(player, move.action_type, **move.kwargs(game))
+
+        player.turn_phase = TurnPhase.END
+        return ActionResult(True, LazyMessage("{} termine son tour", player.name))
+
+    def clear_cache(self) -> None:
+        """Vide le cache"""
+        self._cache.clear()
+
+    def __str__(self) -> str:
+        """Représentation textuelle du générateur"""
+        return f"MoveGenerator({len(self._cache)} états en cache, {self.hits} hits, {self.misses} misses)"
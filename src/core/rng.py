@@ -0,0 +1,37 @@
+"""
+Générateurs aléatoires déterministes - Un flux par partie, dérivé en sous-flux
+"""
+
+import hashlib
+import os
+import random
+
+
+def new_seed() -> int:
+    """Tire une graine 64 bits depuis le système (sans toucher au module random global)"""
+    return int.from_bytes(os.urandom(8), "big")
+
+
+def derive_seed(seed: int, *labels) -> int:
+    """
+    Dérive une graine stable à partir d'une graine racine et d'étiquettes
+
+    Le hachage est indépendant du processus (contrairement à hash()), donc une
+    même graine donne les mêmes sous-flux dans tous les processus de travail.
+    """
+    data = repr((seed,) + tuple(str(label) for label in labels)).encode("utf-8")
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "big")
+
+
+def derive_rng(seed: int, *labels) -> random.Random:
+    """Crée un générateur indépendant pour le sous-flux désigné par les étiquettes"""
+    return random.Random(derive_seed(seed, *labels))
+
+
+def copy_rng(rng):
+    """Copie un générateur dans son état courant (None reste None)"""
+    if rng is None:
+        return None
+    clone = random.Random()
+    clone.setstate(rng.getstate())
+    return clone
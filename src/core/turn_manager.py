@@ -2,21 +2,30 @@
 Turn Manager - Gestionnaire des tours et actions
 """
 
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable, Union
 from ..core.enums import ActionType, TurnPhase
 from ..players.player import Player
 from ..cards.card import Card
+from ..cards.effects import EffectContext, resolve_effects, resolve_passive_effects
 from ..board.location import Location
+from .event_log import LazyMessage
 
 
 class ActionResult:
-    """Résultat d'une action exécutée"""
+    """Résultat d'une action exécutée (le message n'est formaté qu'à la lecture)"""
     
-    def __init__(self, success: bool, message: str = "", data: Any = None):
+    __slots__ = ("success", "_message", "data")
+    
+    def __init__(self, success: bool, message: Union[str, LazyMessage] = "", data: Any = None):
         self.success = success
-        self.message = message
+        self._message = message
         self.data = data
     
+    @property
+    def message(self) -> str:
+        """Texte du résultat"""
+        return str(self._message)
+    
     def __bool__(self) -> bool:
         return self.success
 
@@ -38,6 +47,28 @@ class TurnManager:
             ActionType.MOVE_ITEM: self._handle_move_item,
             ActionType.MOVE_HERO: self._handle_move_hero
         }
+        # Écouteurs appelés après chaque coup accepté (enregistrement des replays)
+        self.listeners: List[Callable[[Player, str, Optional[ActionType], Dict[str, Any]], None]] = []
+    
+    def add_listener(self, listener: Callable) -> None:
+        """
+        Abonne un écouteur aux coups acceptés
+
+        Il reçoit (joueur, type, action, paramètres) avec type "move" (paramètre
+        position), "action" (paramètres de perform_action) ou "end" (fin de tour).
+        """
+        self.listeners.append(listener)
+    
+    def remove_listener(self, listener: Callable) -> None:
+        """Désabonne un écouteur"""
+        if listener in self.listeners:
+            self.listeners.remove(listener)
+    
+    def _emit(self, player: Player, kind: str, action_type: Optional[ActionType] = None,
+              kwargs: Optional[Dict[str, Any]] = None) -> None:
+        """Signale un coup accepté aux écouteurs"""
+        for listener in self.listeners:
+            listener(player, kind, action_type, kwargs or {})
     
     def start_turn(self, player: Player) -> ActionResult:
         """Démarre le tour d'un joueur"""
@@ -47,7 +78,14 @@ class TurnManager:
         # Réinitialise les actions
         player.actions_remaining = 0
         
-        return ActionResult(True, f"Tour de {player.name} commencé - Phase de déplacement")
+        # Effets permanents des cartes en jeu
+        applied = resolve_passive_effects(player)
+        
+        return ActionResult(
+            True,
+            LazyMessage("Tour de {} commencé - Phase de déplacement", player.name),
+            {"effects": applied}
+        )
     
     def move_player(self, player: Player, new_position: int) -> ActionResult:
         """Déplace un joueur vers un nouveau lieu"""
@@ -55,7 +93,7 @@ class TurnManager:
             return ActionResult(False, "Ce n'est pas la phase de déplacement")
         
         if not player.can_move_to(new_position):
-            return ActionResult(False, f"Impossible de se déplacer vers la position {new_position}")
+            return ActionResult(False, LazyMessage("Impossible de se déplacer vers la position {}", new_position))
         
         old_location = player.get_current_location()
         old_name = old_location.name if old_location else "?"
@@ -71,9 +109,12 @@ class TurnManager:
                 available_actions = new_location.get_available_actions()
                 player.actions_remaining = len(available_actions)
             
+            if self.listeners:
+                self._emit(player, "move", None, {"position": new_position})
+            
             return ActionResult(
                 True, 
-                f"{player.name} se déplace de {old_name} vers {new_name}",
+                LazyMessage("{} se déplace de {} vers {}", player.name, old_name, new_name),
                 {"old_position": old_location.position if old_location else -1, 
                  "new_position": new_position,
                  "actions_available": player.actions_remaining}
@@ -95,12 +136,12 @@ class TurnManager:
             return ActionResult(False, "Aucun lieu actuel")
         
         if not current_location.can_perform_action(action_type):
-            return ActionResult(False, f"Action {action_type.value} non disponible ici")
+            return ActionResult(False, LazyMessage("Action {} non disponible ici", action_type.value))
         
         # Exécute l'action spécifique
         handler = self.action_handlers.get(action_type)
         if not handler:
-            return ActionResult(False, f"Action {action_type.value} non implémentée")
+            return ActionResult(False, LazyMessage("Action {} non implémentée", action_type.value))
         
         result = handler(player, current_location, **kwargs)
         
@@ -110,6 +151,9 @@ class TurnManager:
             # Fin du tour si plus d'actions
             if player.actions_remaining <= 0:
                 player.turn_phase = TurnPhase.END
+            
+            if self.listeners:
+                self._emit(player, "action", action_type, kwargs)
         
         return result
     
@@ -122,7 +166,10 @@ class TurnManager:
         player.turn_phase = TurnPhase.MOVE
         player.actions_remaining = 0
         
-        return ActionResult(True, f"Tour de {player.name} terminé")
+        if self.listeners:
+            self._emit(player, "end")
+        
+        return ActionResult(True, LazyMessage("Tour de {} terminé", player.name))
     
     def can_perform_action(self, player: Player, action_type: ActionType) -> bool:
         """Vérifie si une action peut être effectuée"""
@@ -178,7 +225,7 @@ class TurnManager:
         
         return ActionResult(
             True, 
-            f"{player.name} gagne {action.value} pouvoir(s) ({old_power} → {player.power})",
+            LazyMessage("{} gagne {} pouvoir(s) ({} → {})", player.name, action.value, old_power, player.power),
             {"power_gained": action.value, "total_power": player.power}
         )
     
@@ -189,24 +236,20 @@ class TurnManager:
             return ActionResult(False, "ID de carte manquant")
         
         # Trouve la carte dans la main
-        card = None
-        for c in player.hand:
-            if c.id == card_id:
-                card = c
-                break
-        
+        card = player.hand.get(card_id)
         if not card:
-            return ActionResult(False, f"Carte {card_id} non trouvée dans la main")
+            return ActionResult(False, LazyMessage("Carte {} non trouvée dans la main", card_id))
         
         if player.power < card.cost:
-            return ActionResult(False, f"Pas assez de pouvoir ({player.power} < {card.cost})")
+            return ActionResult(False, LazyMessage("Pas assez de pouvoir ({} < {})", player.power, card.cost))
         
-        # Joue la carte
+        # Joue la carte puis exécute ses effets compilés
         if player.play_card(card, location.id):
+            applied = resolve_effects(card, "play", EffectContext(player, card, location))
             return ActionResult(
                 True, 
-                f"{player.name} joue {card.name} (coût: {card.cost})",
-                {"card": card, "power_remaining": player.power}
+                LazyMessage("{} joue {} (coût: {})", player.name, card.name, card.cost),
+                {"card": card, "power_remaining": player.power, "effects": applied}
             )
         
         return ActionResult(False, "Impossible de jouer la carte")
@@ -221,24 +264,24 @@ class TurnManager:
         # Cherche dans les alliés en jeu
         for ally in player.allies_in_play:
             if ally.id == target_id:
-                # TODO: Implémenter les effets d'activation
+                applied = resolve_effects(ally, "activate", EffectContext(player, ally, location))
                 return ActionResult(
                     True, 
-                    f"{player.name} active {ally.name}",
-                    {"activated_card": ally}
+                    LazyMessage("{} active {}", player.name, ally.name),
+                    {"activated_card": ally, "effects": applied}
                 )
         
         # Cherche dans les objets en jeu
         for item in player.items_in_play:
             if item.id == target_id:
-                # TODO: Implémenter les effets d'activation
+                applied = resolve_effects(item, "activate", EffectContext(player, item, location))
                 return ActionResult(
                     True, 
-                    f"{player.name} active {item.name}",
-                    {"activated_card": item}
+                    LazyMessage("{} active {}", player.name, item.name),
+                    {"activated_card": item, "effects": applied}
                 )
         
-        return ActionResult(False, f"Aucune carte à activer avec l'ID {target_id}")
+        return ActionResult(False, LazyMessage("Aucune carte à activer avec l'ID {}", target_id))
     
     def _handle_discard(self, player: Player, location: Location, **kwargs) -> ActionResult:
         """Gère l'action de défausser des cartes"""
@@ -249,12 +292,7 @@ class TurnManager:
         
         discarded_cards = []
         for card_id in card_ids:
-            card = None
-            for c in player.hand:
-                if c.id == card_id:
-                    card = c
-                    break
-            
+            card = player.hand.get(card_id)
             if card and player.discard_card(card):
                 discarded_cards.append(card)
         
@@ -262,7 +300,7 @@ class TurnManager:
             card_names = [card.name for card in discarded_cards]
             return ActionResult(
                 True, 
-                f"{player.name} défausse {len(discarded_cards)} carte(s): {', '.join(card_names)}",
+                LazyMessage("{} défausse {} carte(s): {}", player.name, len(discarded_cards), card_names),
                 {"discarded_cards": discarded_cards}
             )
         
@@ -277,17 +315,18 @@ class TurnManager:
         
         # Vérifie que le héros est présent sur ce lieu
         if hero_id not in location.heroes_present:
-            return ActionResult(False, f"Héros {hero_id} non présent sur ce lieu")
+            return ActionResult(False, LazyMessage("Héros {} non présent sur ce lieu", hero_id))
         
         # TODO: Calculer la force nécessaire et vérifier
         total_strength = player.get_total_strength(location.id)
         
         # Pour l'instant, on suppose que le héros peut être vaincu
         location.remove_hero(hero_id)
+        player.record_defeat(hero_id, location.id)
         
         return ActionResult(
             True, 
-            f"{player.name} vainc le héros {hero_id}",
+            LazyMessage("{} vainc le héros {}", player.name, hero_id),
             {"vanquished_hero": hero_id, "strength_used": total_strength}
         )
     
@@ -298,6 +337,14 @@ class TurnManager:
         if not target_player:
             return ActionResult(False, "Joueur cible manquant")
         
+        # Lieu demandé vérifié avant toute pioche : un refus ne consomme pas de cartes
+        position = kwargs.get('fate_location')
+        if position is not None:
+            if isinstance(position, bool) or not isinstance(position, int):
+                return ActionResult(False, LazyMessage("Lieu du Destin invalide: {!r}", position))
+            if not 0 <= position < len(target_player.board_locations):
+                return ActionResult(False, LazyMessage("Lieu du Destin hors du plateau: {}", position))
+        
         # Pioche 2 cartes Destin
         cards_drawn = []
         for _ in range(2):
@@ -311,12 +358,23 @@ class TurnManager:
         # Pour l'instant, joue automatiquement la première carte
         card_to_play = cards_drawn[0]
         
-        # TODO: Implémenter le placement et les effets des cartes Destin
+        # Les effets de la carte Destin s'appliquent au joueur ciblé
+        applied = resolve_effects(card_to_play, "play", EffectContext(target_player, card_to_play))
+        
+        # Un héros est placé sur le plateau adverse, par défaut sur le lieu le moins gardé
+        hero_location = None
+        if card_to_play.is_hero() and target_player.board_locations:
+            if position is None:
+                position = min(range(len(target_player.board_locations)),
+                               key=lambda i: len(target_player.board_locations[i].heroes_present))
+            hero_location = target_player.board_locations[position]
+            hero_location.add_hero(card_to_play.id)
         
         return ActionResult(
             True, 
-            f"{player.name} joue le Destin contre {target_player.name}: {card_to_play.name}",
-            {"fate_card": card_to_play, "target": target_player}
+            LazyMessage("{} joue le Destin contre {}: {}", player.name, target_player.name, card_to_play.name),
+            {"fate_card": card_to_play, "target": target_player, "effects": applied,
+             "hero_location": hero_location.id if hero_location else None}
         )
     
     def _handle_move_item(self, player: Player, location: Location, **kwargs) -> ActionResult:
@@ -327,11 +385,18 @@ class TurnManager:
         if not item_id or target_location is None:
             return ActionResult(False, "ID d'objet ou lieu cible manquant")
         
-        # TODO: Implémenter le déplacement d'objets
+        if item_id not in location.items_present:
+            return ActionResult(False, LazyMessage("Objet {} non présent sur ce lieu", item_id))
+        
+        if not (0 <= target_location < len(player.board_locations)):
+            return ActionResult(False, LazyMessage("Lieu cible invalide: {}", target_location))
+        
+        location.remove_item(item_id)
+        player.board_locations[target_location].add_item(item_id)
         
         return ActionResult(
             True, 
-            f"{player.name} déplace un objet",
+            LazyMessage("{} déplace un objet", player.name),
             {"item_id": item_id, "target_location": target_location}
         )
     
@@ -343,11 +408,18 @@ class TurnManager:
         if not hero_id or target_location is None:
             return ActionResult(False, "ID de héros ou lieu cible manquant")
         
-        # TODO: Implémenter le déplacement de héros
+        if hero_id not in location.heroes_present:
+            return ActionResult(False, LazyMessage("Héros {} non présent sur ce lieu", hero_id))
+        
+        if not (0 <= target_location < len(player.board_locations)):
+            return ActionResult(False, LazyMessage("Lieu cible invalide: {}", target_location))
+        
+        location.remove_hero(hero_id)
+        player.board_locations[target_location].add_hero(hero_id)
         
         return ActionResult(
             True, 
-            f"{player.name} déplace un héros",
+            LazyMessage("{} déplace un héros", player.name),
             {"hero_id": hero_id, "target_location": target_location}
         )
     
@@ -3,19 +3,134 @@ Victory Conditions - Conditions de victoire spécifiques par méchant
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Sequence, Tuple
 from ..players.player import Player
 from ..core.enums import VillainType, CardType
 
 
+class VictoryTracker:
+    """
+    Compteurs de progrès d'un joueur, tenus à jour par les lieux de son plateau
+    
+    Chaque héros ou objet placé ou retiré est classé une seule fois par la
+    condition (clés "curse", "lamp"...) ; les vérifications de victoire ne
+    lisent plus que ces compteurs.
+    """
+    
+    __slots__ = ("condition", "board", "size", "anchors", "counts", "totals", "covered", "_indices")
+    
+    def __init__(self, condition: "VictoryCondition", board: List):
+        """Compte l'état actuel du plateau et s'abonne à ses lieux"""
+        self.condition = condition
+        self.board = board
+        self.size = len(board)
+        self.anchors: Dict[str, int] = condition.find_anchors(board)  # Lieux clés -> index
+        self.counts: List[Dict[str, int]] = [{} for _ in board]  # Par lieu : clé -> nombre
+        self.totals: Dict[str, int] = {}  # Clé -> nombre sur tout le plateau
+        self.covered: Dict[str, int] = {}  # Clé -> nombre de lieux où elle est présente
+        self._indices = {id(location): index for index, location in enumerate(board)}
+        
+        for index, location in enumerate(board):
+            for item_id in location.items_present:
+                self._update(index, condition.classify_item(item_id), 1)
+            for hero_id in location.heroes_present:
+                self._update(index, condition.classify_hero(hero_id), 1)
+            location.add_listener(self.on_change)
+    
+    def on_change(self, location, kind: str, object_id: str, delta: int) -> None:
+        """Observateur des lieux : met à jour les compteurs"""
+        index = self._indices.get(id(location))
+        if index is None:
+            return
+        classify = self.condition.classify_item if kind == "item" else self.condition.classify_hero
+        self._update(index, classify(object_id), delta)
+    
+    def _update(self, index: int, keys: Tuple[str, ...], delta: int) -> None:
+        """Ajoute delta aux compteurs des clés sur un lieu"""
+        for key in keys:
+            counts = self.counts[index]
+            before = counts.get(key, 0)
+            after = before + delta
+            counts[key] = after
+            self.totals[key] = self.totals.get(key, 0) + delta
+            if before == 0 and after > 0:
+                self.covered[key] = self.covered.get(key, 0) + 1
+            elif before > 0 and after == 0:
+                self.covered[key] -= 1
+    
+    def count(self, key: str, anchor: str) -> int:
+        """Nombre d'éléments d'une clé sur un lieu clé (0 si le lieu n'existe pas)"""
+        index = self.anchors.get(anchor)
+        return 0 if index is None else self.counts[index].get(key, 0)
+    
+    def total(self, key: str) -> int:
+        """Nombre d'éléments d'une clé sur tout le plateau"""
+        return self.totals.get(key, 0)
+    
+    def covered_locations(self, key: str) -> int:
+        """Nombre de lieux où la clé est présente"""
+        return self.covered.get(key, 0)
+    
+    def location_status(self, key: str) -> Dict[str, bool]:
+        """Présence de la clé lieu par lieu"""
+        return {location.name: self.counts[index].get(key, 0) > 0 for index, location in enumerate(self.board)}
+    
+    def is_stale(self, board: List) -> bool:
+        """Vrai si le plateau du joueur a été remplacé ou modifié depuis la construction"""
+        return board is not self.board or len(board) != self.size
+    
+    def detach(self) -> None:
+        """Se désabonne des lieux du plateau"""
+        for location in self.board:
+            location.remove_listener(self.on_change)
+
+
+def _find_location(board: Sequence, *needles: str, by_name: Optional[str] = None) -> Optional[int]:
+    """Index du premier lieu dont l'id (ou le nom) contient un des motifs"""
+    for index, location in enumerate(board):
+        location_id = location.id.lower()
+        if any(needle in location_id for needle in needles):
+            return index
+        if by_name and by_name in location.name.lower():
+            return index
+    return None
+
+
 class VictoryCondition(ABC):
     """
     Classe abstraite pour les conditions de victoire
+    
+    check_victory et get_progress parcourent tout le plateau. Une condition qui
+    sait classer les héros et objets (supports_tracking) fournit aussi
+    check_tracked et progress_tracked, qui ne lisent que les compteurs d'un
+    VictoryTracker.
     """
     
+    supports_tracking = False
+    
     def __init__(self, description: str):
         self.description = description
     
+    def classify_item(self, item_id: str) -> Tuple[str, ...]:
+        """Clés de compteur d'un objet"""
+        return ()
+    
+    def classify_hero(self, hero_id: str) -> Tuple[str, ...]:
+        """Clés de compteur d'un héros"""
+        return ()
+    
+    def find_anchors(self, board: Sequence) -> Dict[str, int]:
+        """Lieux clés de la condition : nom -> index dans le plateau"""
+        return {}
+    
+    def check_tracked(self, player: Player, tracker: VictoryTracker) -> bool:
+        """Vérifie la victoire à partir des compteurs"""
+        return self.check_victory(player)
+    
+    def progress_tracked(self, player: Player, tracker: VictoryTracker) -> Dict[str, Any]:
+        """Progrès à partir des compteurs"""
+        return self.get_progress(player)
+    
     @abstractmethod
     def check_victory(self, player: Player) -> bool:
         """Vérifie si la condition de victoire est remplie"""
@@ -36,9 +151,26 @@ class MaleficentVictory(VictoryCondition):
     Commencer son tour avec une Malédiction sur chacun des 4 lieux
     """
     
+    supports_tracking = True
+    
     def __init__(self):
         super().__init__("Commencer son tour avec une Malédiction sur chacun des 4 lieux")
     
+    def classify_item(self, item_id: str) -> Tuple[str, ...]:
+        return ("curse",) if item_id.startswith("maleficent_curse") else ()
+    
+    def check_tracked(self, player: Player, tracker: VictoryTracker) -> bool:
+        return tracker.size == 4 and tracker.covered_locations("curse") >= 4
+    
+    def progress_tracked(self, player: Player, tracker: VictoryTracker) -> Dict[str, Any]:
+        cursed_locations = tracker.covered_locations("curse")
+        return {
+            "cursed_locations": cursed_locations,
+            "total_locations": tracker.size,
+            "location_status": tracker.location_status("curse"),
+            "percentage": (cursed_locations / 4) * 100 if tracker.size else 0
+        }
+    
     def check_victory(self, player: Player) -> bool:
         """Vérifie si Maléfique a une malédiction sur chaque lieu"""
         if len(player.board_locations) != 4:
@@ -85,9 +217,35 @@ class JafarVictory(VictoryCondition):
     et avoir vaincu Aladdin
     """
     
+    supports_tracking = True
+    
     def __init__(self):
         super().__init__("Avoir la Lampe Magique à la Caverne aux Merveilles et avoir vaincu Aladdin")
     
+    def classify_item(self, item_id: str) -> Tuple[str, ...]:
+        return ("lamp",) if "magic_lamp" in item_id.lower() else ()
+    
+    def classify_hero(self, hero_id: str) -> Tuple[str, ...]:
+        return ("aladdin",) if "aladdin" in hero_id.lower() else ()
+    
+    def find_anchors(self, board: Sequence) -> Dict[str, int]:
+        index = _find_location(board, "cave_of_wonders")
+        return {} if index is None else {"cave": index}
+    
+    def check_tracked(self, player: Player, tracker: VictoryTracker) -> bool:
+        return tracker.count("lamp", "cave") > 0 and tracker.total("aladdin") == 0
+    
+    def progress_tracked(self, player: Player, tracker: VictoryTracker) -> Dict[str, Any]:
+        has_lamp = tracker.count("lamp", "cave") > 0
+        aladdin_defeated = tracker.total("aladdin") == 0
+        cave = tracker.anchors.get("cave")
+        return {
+            "has_magic_lamp": has_lamp,
+            "aladdin_defeated": aladdin_defeated,
+            "lamp_location": tracker.board[cave].name if cave is not None else "Inconnue",
+            "objectives_completed": sum([has_lamp, aladdin_defeated])
+        }
+    
     def check_victory(self, player: Player) -> bool:
         """Vérifie les conditions de victoire de Jafar"""
         # Trouve la Caverne aux Merveilles
@@ -150,9 +308,31 @@ class CaptainHookVictory(VictoryCondition):
     Vaincre Peter Pan au Jolly Roger
     """
     
+    supports_tracking = True
+    
     def __init__(self):
         super().__init__("Vaincre Peter Pan au Jolly Roger")
     
+    def classify_hero(self, hero_id: str) -> Tuple[str, ...]:
+        return ("peter_pan",) if "peter_pan" in hero_id.lower() else ()
+    
+    def find_anchors(self, board: Sequence) -> Dict[str, int]:
+        index = _find_location(board, "jolly_roger")
+        return {} if index is None else {"jolly_roger": index}
+    
+    def check_tracked(self, player: Player, tracker: VictoryTracker) -> bool:
+        return "jolly_roger" in tracker.anchors and tracker.count("peter_pan", "jolly_roger") == 0
+    
+    def progress_tracked(self, player: Player, tracker: VictoryTracker) -> Dict[str, Any]:
+        jolly_roger = tracker.anchors.get("jolly_roger")
+        peter_pan_present = tracker.count("peter_pan", "jolly_roger") > 0
+        return {
+            "jolly_roger_found": jolly_roger is not None,
+            "peter_pan_present": peter_pan_present,
+            "peter_pan_defeated": not peter_pan_present,
+            "location": tracker.board[jolly_roger].name if jolly_roger is not None else "Non trouvé"
+        }
+    
     def check_victory(self, player: Player) -> bool:
         """Vérifie si Peter Pan a été vaincu au Jolly Roger"""
         # Trouve le Jolly Roger
@@ -228,9 +408,26 @@ class QueenOfHeartsVictory(VictoryCondition):
     Avoir une Tête Tranchée dans les 4 lieux différents
     """
     
+    supports_tracking = True
+    
     def __init__(self):
         super().__init__("Avoir une Tête Tranchée dans chacun des 4 lieux")
     
+    def classify_item(self, item_id: str) -> Tuple[str, ...]:
+        return ("head",) if "severed_head" in item_id.lower() else ()
+    
+    def check_tracked(self, player: Player, tracker: VictoryTracker) -> bool:
+        return tracker.size == 4 and tracker.covered_locations("head") >= 4
+    
+    def progress_tracked(self, player: Player, tracker: VictoryTracker) -> Dict[str, Any]:
+        locations_with_heads = tracker.covered_locations("head")
+        return {
+            "locations_with_heads": locations_with_heads,
+            "total_locations": tracker.size,
+            "location_status": tracker.location_status("head"),
+            "percentage": (locations_with_heads / 4) * 100 if tracker.size else 0
+        }
+    
     def check_victory(self, player: Player) -> bool:
         """Vérifie si la Reine de Cœur a des têtes tranchées partout"""
         if len(player.board_locations) != 4:
@@ -275,9 +472,35 @@ class UrsulaVictory(VictoryCondition):
     Avoir le Trident et la Couronne au Palais d'Ursula
     """
     
+    supports_tracking = True
+    
     def __init__(self):
         super().__init__("Avoir le Trident et la Couronne au Palais d'Ursula")
     
+    def classify_item(self, item_id: str) -> Tuple[str, ...]:
+        item_id = item_id.lower()
+        return tuple(key for key in ("trident", "crown") if key in item_id)
+    
+    def find_anchors(self, board: Sequence) -> Dict[str, int]:
+        index = _find_location(board, "ursula_palace", by_name="palace")
+        return {} if index is None else {"palace": index}
+    
+    def check_tracked(self, player: Player, tracker: VictoryTracker) -> bool:
+        return tracker.count("trident", "palace") > 0 and tracker.count("crown", "palace") > 0
+    
+    def progress_tracked(self, player: Player, tracker: VictoryTracker) -> Dict[str, Any]:
+        has_trident = tracker.count("trident", "palace") > 0
+        has_crown = tracker.count("crown", "palace") > 0
+        palace = tracker.anchors.get("palace")
+        return {
+            "has_trident": has_trident,
+            "has_crown": has_crown,
+            "palace_found": palace is not None,
+            "palace_location": tracker.board[palace].name if palace is not None else "Non trouvé",
+            "items_collected": sum([has_trident, has_crown]),
+            "items_needed": 2
+        }
+    
     def check_victory(self, player: Player) -> bool:
         """Vérifie les conditions de victoire d'Ursula"""
         # Trouve le Palais d'Ursula
@@ -339,8 +562,15 @@ class VictoryManager:
     Gestionnaire centralisé des conditions de victoire
     """
     
-    def __init__(self):
-        """Initialise le gestionnaire avec toutes les conditions"""
+    def __init__(self, incremental: bool = True, verify: bool = False):
+        """
+        Initialise le gestionnaire avec toutes les conditions
+        
+        incremental lit les compteurs tenus à jour par les lieux ; verify refait
+        en plus le parcours complet et signale toute divergence.
+        """
+        self.incremental = incremental
+        self.verify = verify
         self.victory_conditions: Dict[VillainType, VictoryCondition] = {
             VillainType.MALEFICENT: MaleficentVictory(),
             VillainType.JAFAR: JafarVictory(),
@@ -350,11 +580,37 @@ class VictoryManager:
             VillainType.URSULA: UrsulaVictory()
         }
     
+    def get_tracker(self, player: Player, condition: VictoryCondition) -> VictoryTracker:
+        """Retourne le suivi du joueur, reconstruit si son plateau a changé"""
+        tracker = player.victory_tracker
+        if tracker is None or tracker.condition is not condition or tracker.is_stale(player.board_locations):
+            if tracker is not None:
+                tracker.detach()
+            tracker = VictoryTracker(condition, player.board_locations)
+            player.victory_tracker = tracker
+        return tracker
+    
+    def _uses_tracker(self, condition: VictoryCondition) -> bool:
+        """Vrai si la condition est évaluée par compteurs"""
+        return self.incremental and condition.supports_tracking
+    
+    def _verify(self, player: Player, what: str, tracked: Any, scanned: Any) -> None:
+        """Signale une divergence entre suivi incrémental et parcours complet"""
+        if tracked != scanned:
+            raise RuntimeError(
+                f"Suivi de victoire incohérent pour {player.name} ({what}): {tracked!r} != {scanned!r}"
+            )
+    
     def check_victory(self, player: Player) -> bool:
         """Vérifie si un joueur a gagné"""
         condition = self.victory_conditions.get(player.villain_type)
         if condition:
-            result = condition.check_victory(player)
+            if self._uses_tracker(condition):
+                result = condition.check_tracked(player, self.get_tracker(player, condition))
+                if self.verify:
+                    self._verify(player, "victoire", result, condition.check_victory(player))
+            else:
+                result = condition.check_victory(player)
             if result:
                 player.has_won = True
             return result
@@ -364,7 +620,12 @@ class VictoryManager:
         """Retourne le progrès vers la victoire"""
         condition = self.victory_conditions.get(player.villain_type)
         if condition:
-            progress = condition.get_progress(player)
+            if self._uses_tracker(condition):
+                progress = condition.progress_tracked(player, self.get_tracker(player, condition))
+                if self.verify:
+                    self._verify(player, "progrès", progress, condition.get_progress(player))
+            else:
+                progress = condition.get_progress(player)
             progress["description"] = condition.description
             progress["villain"] = player.villain_type.value
             return progress
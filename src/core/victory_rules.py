@@ -0,0 +1,312 @@
+"""
+Règles de victoire déclaratives - Compile les conditions de data/villains/*.json
+
+Chaque bloc victory_condition.requirements est compilé une seule fois en
+prédicats : les références des données ("magic_lamp", "aladdin",
+"cave_of_wonders") sont résolues en ids de cartes et de lieux au chargement,
+puis les vérifications ne font plus que des lectures de compteurs et de
+dictionnaires, sans .lower() ni recherche de sous-chaîne.
+"""
+
+import json
+import os
+import unicodedata
+from abc import ABC, abstractmethod
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+from ..cards.card import CardDefinition
+from ..players.player import Player
+from .enums import VillainType
+from .victory_conditions import VictoryCondition, VictoryManager, VictoryTracker
+
+
+def slugify(text: str) -> str:
+    """Transforme un nom en identifiant ("Peter Pan" -> "peter_pan")"""
+    ascii_text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
+    words = "".join(c if c.isalnum() else " " for c in ascii_text.lower()).split()
+    return "_".join(words)
+
+
+def location_matches(location_id: str, ref: str) -> bool:
+    """Vrai si l'id d'un lieu correspond à une référence ("jafar_cave_of_wonders" ~ "cave_of_wonders")"""
+    return location_id == ref or location_id.endswith("_" + ref)
+
+
+def find_location_index(board: Sequence, ref: str) -> Optional[int]:
+    """Index du lieu correspondant à une référence, ou None"""
+    for index, location in enumerate(board):
+        if location_matches(location.id, ref):
+            return index
+    return None
+
+
+class AliasTable:
+    """
+    Résout les références des données en ids de cartes
+
+    Une carte est connue par son id et par son nom en identifiant ; la condition
+    de victoire peut ajouter ses propres alias ("aliases": {"curse": [...]}).
+    """
+
+    def __init__(self, definitions: Iterable[CardDefinition], aliases: Optional[Dict[str, List[str]]] = None):
+        """Indexe les cartes d'un méchant"""
+        self.table: Dict[str, set] = {}
+        for definition in definitions:
+            self.table.setdefault(definition.id, set()).add(definition.id)
+            self.table.setdefault(slugify(definition.name), set()).add(definition.id)
+        for alias, card_ids in (aliases or {}).items():
+            self.table.setdefault(alias, set()).update(card_ids)
+
+    def resolve(self, ref: str) -> FrozenSet[str]:
+        """Ids des cartes désignées par une référence (ValueError si aucune)"""
+        card_ids = self.table.get(ref)
+        if not card_ids:
+            raise ValueError(f"Référence inconnue dans la condition de victoire: {ref}")
+        return frozenset(card_ids)
+
+
+# === Prédicats ===
+
+class Requirement(ABC):
+    """Prédicat compilé d'une condition de victoire"""
+
+    __slots__ = ("kind",)
+
+    def __init__(self, kind: str):
+        self.kind = kind
+
+    @abstractmethod
+    def check(self, player: Player, tracker: VictoryTracker) -> bool:
+        """Évalue le prédicat à partir des compteurs du joueur"""
+        pass
+
+    @abstractmethod
+    def scan(self, player: Player) -> bool:
+        """Évalue le prédicat en parcourant le plateau (mode de vérification)"""
+        pass
+
+    def fraction(self, player: Player, tracker: Optional[VictoryTracker] = None) -> float:
+        """Part accomplie du prédicat, entre 0 et 1 (par compteurs si tracker, sinon par parcours)"""
+        return float(self.check(player, tracker) if tracker is not None else self.scan(player))
+
+
+class ItemAtLocation(Requirement):
+    """Un des objets désignés est sur le lieu désigné"""
+
+    __slots__ = ("key", "location", "item_ids")
+
+    def __init__(self, key: str, location: str, item_ids: FrozenSet[str]):
+        super().__init__("item_at_location")
+        self.key = key
+        self.location = location
+        self.item_ids = item_ids
+
+    def check(self, player: Player, tracker: VictoryTracker) -> bool:
+        return tracker.count(self.key, self.location) > 0
+
+    def scan(self, player: Player) -> bool:
+        index = find_location_index(player.board_locations, self.location)
+        if index is None:
+            return False
+        return any(item_id in self.item_ids for item_id in player.board_locations[index].items_present)
+
+
+class ItemAtAllLocations(Requirement):
+    """Un des objets désignés est sur chaque lieu du plateau"""
+
+    __slots__ = ("key", "item_ids")
+
+    def __init__(self, key: str, item_ids: FrozenSet[str]):
+        super().__init__("item_at_all_locations")
+        self.key = key
+        self.item_ids = item_ids
+
+    def check(self, player: Player, tracker: VictoryTracker) -> bool:
+        return tracker.size > 0 and tracker.covered_locations(self.key) >= tracker.size
+
+    def scan(self, player: Player) -> bool:
+        board = player.board_locations
+        return bool(board) and all(
+            any(item_id in self.item_ids for item_id in location.items_present) for location in board
+        )
+
+    def fraction(self, player: Player, tracker: Optional[VictoryTracker] = None) -> float:
+        if tracker is not None:
+            return min(tracker.covered_locations(self.key) / tracker.size, 1.0) if tracker.size else 0.0
+        board = player.board_locations
+        covered = sum(any(item_id in self.item_ids for item_id in location.items_present) for location in board)
+        return covered / len(board) if board else 0.0
+
+
+class HeroDefeated(Requirement):
+    """Un des héros désignés a été vaincu"""
+
+    __slots__ = ("hero_ids",)
+
+    def __init__(self, hero_ids: FrozenSet[str]):
+        super().__init__("hero_defeated")
+        self.hero_ids = hero_ids
+
+    def check(self, player: Player, tracker: VictoryTracker) -> bool:
+        return self.scan(player)
+
+    def scan(self, player: Player) -> bool:
+        defeated = player.defeated_heroes
+        return any(hero_id in defeated for hero_id in self.hero_ids)
+
+
+class HeroDefeatedAtLocation(Requirement):
+    """Un des héros désignés a été vaincu sur le lieu désigné"""
+
+    __slots__ = ("location", "hero_ids")
+
+    def __init__(self, location: str, hero_ids: FrozenSet[str]):
+        super().__init__("hero_defeated_at_location")
+        self.location = location
+        self.hero_ids = hero_ids
+
+    def _defeated_at(self, player: Player, location_id: str) -> bool:
+        defeated = player.defeated_heroes
+        return any(location_id in defeated.get(hero_id, ()) for hero_id in self.hero_ids)
+
+    def check(self, player: Player, tracker: VictoryTracker) -> bool:
+        index = tracker.anchors.get(self.location)
+        return index is not None and self._defeated_at(player, tracker.board[index].id)
+
+    def scan(self, player: Player) -> bool:
+        index = find_location_index(player.board_locations, self.location)
+        return index is not None and self._defeated_at(player, player.board_locations[index].id)
+
+
+class DeclarativeVictory(VictoryCondition):
+    """
+    Condition de victoire décrite par les données : tous les prédicats doivent être vrais
+    """
+
+    supports_tracking = True
+
+    def __init__(self, description: str, requirements: Sequence[Requirement],
+                 item_keys: Dict[str, Tuple[str, ...]], locations: Sequence[str]):
+        super().__init__(description)
+        self.requirements = tuple(requirements)
+        self._item_keys = item_keys  # Id d'objet -> clés de compteur
+        self._locations = tuple(locations)  # Références des lieux clés
+
+    def classify_item(self, item_id: str) -> Tuple[str, ...]:
+        return self._item_keys.get(item_id, ())
+
+    def find_anchors(self, board: Sequence) -> Dict[str, int]:
+        anchors = {}
+        for ref in self._locations:
+            index = find_location_index(board, ref)
+            if index is not None:
+                anchors[ref] = index
+        return anchors
+
+    def check_tracked(self, player: Player, tracker: VictoryTracker) -> bool:
+        return all(requirement.check(player, tracker) for requirement in self.requirements)
+
+    def check_victory(self, player: Player) -> bool:
+        return all(requirement.scan(player) for requirement in self.requirements)
+
+    def _progress(self, met: List[bool], fractions: List[float]) -> Dict[str, Any]:
+        """
+        Progrès à partir de l'état de chaque prédicat
+
+        score compte aussi les prédicats en partie accomplis (lieux déjà
+        maudits...) : il varie avant qu'un objectif soit atteint.
+        """
+        return {
+            "requirements": [
+                {"type": requirement.kind, "met": done} for requirement, done in zip(self.requirements, met)
+            ],
+            "objectives_completed": sum(met),
+            "objectives_total": len(met),
+            "percentage": (sum(met) / len(met)) * 100 if met else 0,
+            "score": sum(fractions) / len(fractions) if fractions else 0.0
+        }
+
+    def progress_tracked(self, player: Player, tracker: VictoryTracker) -> Dict[str, Any]:
+        return self._progress([requirement.check(player, tracker) for requirement in self.requirements],
+                              [requirement.fraction(player, tracker) for requirement in self.requirements])
+
+    def get_progress(self, player: Player) -> Dict[str, Any]:
+        return self._progress([requirement.scan(player) for requirement in self.requirements],
+                              [requirement.fraction(player) for requirement in self.requirements])
+
+
+# === Compilation ===
+
+def compile_victory_condition(condition_data: dict, definitions: Iterable[CardDefinition]) -> DeclarativeVictory:
+    """Compile un bloc victory_condition en condition de victoire"""
+    aliases = AliasTable(definitions, condition_data.get("aliases"))
+    requirements: List[Requirement] = []
+    item_keys: Dict[str, Tuple[str, ...]] = {}
+    locations: List[str] = []
+
+    def track_items(ref: str) -> Tuple[str, FrozenSet[str]]:
+        key = f"item:{ref}"
+        item_ids = aliases.resolve(ref)
+        for item_id in item_ids:
+            if key not in item_keys.get(item_id, ()):
+                item_keys[item_id] = item_keys.get(item_id, ()) + (key,)
+        return key, item_ids
+
+    for data in condition_data.get("requirements", []):
+        kind = data.get("type")
+        if kind == "item_at_location":
+            key, item_ids = track_items(data["item"])
+            requirements.append(ItemAtLocation(key, data["location"], item_ids))
+            locations.append(data["location"])
+        elif kind == "item_at_all_locations":
+            key, item_ids = track_items(data.get("item_type") or data["item"])
+            requirements.append(ItemAtAllLocations(key, item_ids))
+        elif kind == "hero_defeated":
+            requirements.append(HeroDefeated(aliases.resolve(data["hero"])))
+        elif kind == "hero_defeated_at_location":
+            requirements.append(HeroDefeatedAtLocation(data["location"], aliases.resolve(data["hero"])))
+            locations.append(data["location"])
+        else:
+            raise ValueError(f"Type de condition de victoire inconnu: {kind}")
+
+    if not requirements:
+        raise ValueError("Condition de victoire sans prérequis")
+
+    return DeclarativeVictory(condition_data.get("description", ""), requirements, item_keys, locations)
+
+
+def load_victory_rules(card_manager, villains_path: str = "data/villains") -> Dict[VillainType, DeclarativeVictory]:
+    """Compile les conditions de victoire de tous les méchants décrits dans les données"""
+    rules: Dict[VillainType, DeclarativeVictory] = {}
+    if not os.path.isdir(villains_path):
+        return rules
+
+    for filename in sorted(os.listdir(villains_path)):
+        if not filename.endswith(".json"):
+            continue
+
+        filepath = os.path.join(villains_path, filename)
+        try:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                villain = json.load(f)["villain"]
+
+            condition_data = villain.get("victory_condition")
+            if not condition_data or not condition_data.get("requirements"):
+                continue
+
+            name = villain["id"]
+            definitions = card_manager.load_villain_cards(name) + card_manager.load_fate_cards(name)
+            rules[VillainType(name)] = compile_victory_condition(condition_data, definitions)
+
+        except (json.JSONDecodeError, KeyError, ValueError) as e:
+            print(f"Erreur lors du chargement de la condition de victoire depuis {filepath}: {e}")
+
+    return rules
+
+
+def register_victory_rules(victory_manager: VictoryManager, card_manager,
+                           villains_path: str = "data/villains") -> int:
+    """Remplace les conditions codées en dur par celles des données, retourne leur nombre"""
+    rules = load_victory_rules(card_manager, villains_path)
+    for villain_type, condition in rules.items():
+        victory_manager.register_custom_victory(villain_type, condition)
+    return len(rules)
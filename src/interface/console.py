@@ -13,6 +13,8 @@ from ..cards.card_manager import CardManager
 from ..board.board_manager import BoardManager
 from ..core.turn_manager import TurnManager
 from ..core.victory_conditions import VictoryManager
+from ..core.victory_rules import register_victory_rules
+from ..cards.effects import EffectContext, resolve_effects
 
 
 class ConsoleInterface:
@@ -27,6 +29,8 @@ class ConsoleInterface:
         self.board_manager = BoardManager()
         self.turn_manager = TurnManager()
         self.victory_manager = VictoryManager()
+        # Mêmes conditions de victoire que le moteur : celles de data/villains
+        register_victory_rules(self.victory_manager, self.card_manager)
     
     def clear_screen(self) -> None:
         """Efface l'écran de la console"""
@@ -248,9 +252,9 @@ Le premier joueur à accomplir son objectif gagne!
             
             # Crée les decks
             from ..cards.deck import Deck
-            player.villain_deck = Deck(villain_cards)
+            player.villain_deck = Deck(villain_cards, self.game.derive_rng(player.id, "villain_deck"))
             player.villain_deck.shuffle()
-            player.fate_deck = Deck(fate_cards)
+            player.fate_deck = Deck(fate_cards, self.game.derive_rng(player.id, "fate_deck"))
             player.fate_deck.shuffle()
             
             # Charge le plateau
@@ -450,9 +454,9 @@ Le premier joueur à accomplir son objectif gagne!
             
             # Crée les decks
             from ..cards.deck import Deck
-            player.villain_deck = Deck(villain_cards)
+            player.villain_deck = Deck(villain_cards, self.game.derive_rng(player.id, "villain_deck"))
             player.villain_deck.shuffle()
-            player.fate_deck = Deck(fate_cards)
+            player.fate_deck = Deck(fate_cards, self.game.derive_rng(player.id, "fate_deck"))
             player.fate_deck.shuffle()
             
             # Charge le plateau
@@ -574,6 +578,11 @@ Le premier joueur à accomplir son objectif gagne!
         """Gère le tour complet d'un joueur de manière interactive"""
         print(f"\n🎮 C'est le tour de {player.name} !")
         
+        # Effets permanents des cartes en jeu
+        result = self.turn_manager.start_turn(player)
+        for effect, op in (result.data.get("effects", []) if result else []):
+            print(f"  🌟 {effect.description}: {op.describe()}")
+        
         # Phase 1: DÉPLACEMENT (obligatoire)
         self._handle_move_phase(player)
         
@@ -748,44 +757,16 @@ Le premier joueur à accomplir son objectif gagne!
     
     def _apply_card_effects(self, player: Player, card) -> None:
         """Applique les effets d'une carte jouée"""
-        for effect in getattr(card, 'effects', []):
-            description = effect.get('description', '')
-            trigger = effect.get('trigger', 'play')
-            
-            if trigger == 'play':
-                print(f"  🌟 Effet: {description}")
-                
-                # Exemples d'effets simples
-                if 'gagne' in description.lower() and 'pouvoir' in description.lower():
-                    # Extrait le nombre de pouvoirs à gagner
-                    words = description.split()
-                    for i, word in enumerate(words):
-                        if word.isdigit():
-                            power_gain = int(word)
-                            player.gain_power(power_gain)
-                            print(f"    💰 +{power_gain} pouvoir!")
-                            break
-                
-                elif 'pioche' in description.lower():
-                    # Pioche des cartes
-                    cards_to_draw = 1
-                    words = description.split()
-                    for word in words:
-                        if word.isdigit():
-                            cards_to_draw = int(word)
-                            break
-                    
-                    for _ in range(cards_to_draw):
-                        card = player.draw_card()
-                        if card:
-                            player.hand.append(card)
-                    print(f"    🃏 +{cards_to_draw} carte(s) piochée(s)!")
+        # Les opérations sont compilées au chargement : aucune analyse de texte ici
+        for effect, op in resolve_effects(card, "play", EffectContext(player, card, player.get_current_location())):
+            print(f"  🌟 Effet: {effect.description}")
+            print(f"    ✨ {op.describe()}")
         
         # Place la carte sur le plateau (alliés et objets)
         current_location = player.get_current_location()
         if current_location and hasattr(card, 'type'):
             if card.type in ['ally', 'item']:
-                current_location.items_present.append(card.id)
+                current_location.add_item(card.id)
                 print(f"    📍 {card.name} placé(e) à {current_location.name}")
     
     def _handle_discard_action(self, player: Player) -> bool:
@@ -857,7 +838,9 @@ Le premier joueur à accomplir son objectif gagne!
         print("⚠️ Système de combat simplifié - les héros sont automatiquement vaincus!")
         
         # Supprime le premier héros (système simplifié)
-        removed_hero = location.heroes_present.pop(0)
+        removed_hero = location.heroes_present[0]
+        location.remove_hero(removed_hero)
+        player.record_defeat(removed_hero, location.id)
         print(f"✅ {removed_hero} a été vaincu!")
         
         # Récompense de base
@@ -904,7 +887,7 @@ Le premier joueur à accomplir son objectif gagne!
         # Place un héros sur le plateau de l'adversaire (simplifié)
         if target_opponent.board_locations:
             random_location = target_opponent.board_locations[0]  # Simplifié
-            random_location.heroes_present.append(selected_card.id)
+            random_location.add_hero(selected_card.id)
             print(f"🔮 {selected_card.name} placé(e) chez {target_opponent.name} à {random_location.name}!")
         
         # Défausse les autres cartes
@@ -1043,6 +1026,9 @@ Le premier joueur à accomplir son objectif gagne!
             card = playable_cards[card_index]
             result = self.turn_manager.perform_action(player, ActionType.PLAY_CARD, card_id=card.id)
             print(f"{'✅' if result else '❌'} {result.message}")
+            if result:
+                for effect, op in result.data.get("effects", []):
+                    print(f"  🌟 {effect.description}: {op.describe()}")
     
     def _handle_discard_action(self, player: Player) -> None:
         """Gère l'action de défausser des cartes"""
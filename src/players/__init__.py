@@ -1,3 +1,4 @@
 """Init file pour le module players"""
 
+from .hand import PlayerHand
 from .player import Player
\ No newline at end of file
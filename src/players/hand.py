@@ -0,0 +1,128 @@
+"""
+Classe PlayerHand - Main d'un joueur indexée par identifiant de carte
+"""
+
+from typing import Dict, Iterable, Iterator, List, Optional
+from ..cards.card import Card
+
+
+class PlayerHand:
+    """
+    Main d'un joueur : garde l'ordre des cartes et un index id -> carte synchronisé
+
+    La recherche par identifiant, l'appartenance et le retrait sont en O(1).
+    Plusieurs exemplaires d'une même carte (même id) peuvent coexister : la
+    recherche par id renvoie le plus ancien exemplaire encore en main.
+    """
+
+    __slots__ = ("_cards", "_by_id")
+
+    def __init__(self, cards: Iterable[Card] = ()):
+        """Initialise la main avec des cartes optionnelles"""
+        self._cards: Dict[int, Card] = {}  # id(carte) -> carte, dans l'ordre de la main
+        self._by_id: Dict[str, Dict[int, Card]] = {}  # card.id -> exemplaires, dans l'ordre
+        for card in cards:
+            self.append(card)
+
+    # === Modification ===
+
+    def append(self, card: Card) -> None:
+        """Ajoute une carte à la fin de la main"""
+        key = id(card)
+        if key in self._cards:
+            raise ValueError(f"La carte {card.id} est déjà dans la main")
+        self._cards[key] = card
+        self._by_id.setdefault(card.id, {})[key] = card
+
+    def extend(self, cards: Iterable[Card]) -> None:
+        """Ajoute plusieurs cartes à la fin de la main"""
+        for card in cards:
+            self.append(card)
+
+    def remove(self, card: Card) -> None:
+        """Retire une carte (ValueError si absente, comme list.remove)"""
+        key = id(card)
+        if key not in self._cards:
+            raise ValueError(f"La carte {card.id} n'est pas dans la main")
+        del self._cards[key]
+        copies = self._by_id[card.id]
+        del copies[key]
+        if not copies:
+            del self._by_id[card.id]
+
+    def remove_by_id(self, card_id: str) -> Optional[Card]:
+        """Retire et retourne un exemplaire de la carte, ou None"""
+        card = self.get(card_id)
+        if card is not None:
+            self.remove(card)
+        return card
+
+    def pop(self, index: int = -1) -> Card:
+        """Retire et retourne la carte à la position donnée"""
+        card = self[index]
+        self.remove(card)
+        return card
+
+    def clear(self) -> None:
+        """Vide la main"""
+        self._cards.clear()
+        self._by_id.clear()
+    
+    def copy(self) -> "PlayerHand":
+        """Copie indépendante de la main (les cartes sont partagées)"""
+        hand = PlayerHand()
+        hand._cards = dict(self._cards)
+        hand._by_id = {card_id: dict(copies) for card_id, copies in self._by_id.items()}
+        return hand
+
+    # === Consultation ===
+
+    def get(self, card_id: str) -> Optional[Card]:
+        """Retourne un exemplaire de la carte d'identifiant card_id, ou None"""
+        copies = self._by_id.get(card_id)
+        if not copies:
+            return None
+        return next(iter(copies.values()))
+
+    def has_id(self, card_id: str) -> bool:
+        """Vérifie si une carte de cet identifiant est en main"""
+        return card_id in self._by_id
+
+    def index(self, card: Card) -> int:
+        """Retourne la position d'une carte dans la main"""
+        for i, other in enumerate(self._cards.values()):
+            if other is card:
+                return i
+        raise ValueError(f"La carte {card.id} n'est pas dans la main")
+
+    def to_list(self) -> List[Card]:
+        """Retourne les cartes dans l'ordre de la main"""
+        return list(self._cards.values())
+
+    def __contains__(self, card: Card) -> bool:
+        """Permet d'utiliser 'carte in main'"""
+        return id(card) in self._cards
+
+    def __getitem__(self, index):
+        """Accès par position (ou tranche), comme une liste"""
+        return self.to_list()[index]
+
+    def __iter__(self) -> Iterator[Card]:
+        """Permet d'itérer sur la main dans l'ordre"""
+        return iter(self._cards.values())
+
+    def __len__(self) -> int:
+        """Permet d'utiliser len(main)"""
+        return len(self._cards)
+
+    def __bool__(self) -> bool:
+        """Vrai si la main contient au moins une carte"""
+        return bool(self._cards)
+
+    def __str__(self) -> str:
+        """Représentation textuelle de la main"""
+        return f"Main({len(self._cards)} cartes)"
+
+    def __repr__(self) -> str:
+        """Représentation pour le debug"""
+        return f"PlayerHand({[card.id for card in self._cards.values()]})"
@@ -2,13 +2,40 @@
 Classe Player - Représente un joueur dans Disney Villainous
 """
 
+import copy
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, NamedTuple, Optional, Any, Tuple
 from ..cards.card import Card
+from ..cards.deck import Deck
+from .hand import PlayerHand
+from ..board.board import clone_board, restore_board, snapshot_board
 from ..board.location import Location
 from ..core.enums import VillainType, TurnPhase
 
 
+class PlayerSnapshot(NamedTuple):
+    """État mutable d'un joueur figé (les cartes sont partagées, pas copiées)"""
+    power: int
+    current_location: int
+    turn_phase: TurnPhase
+    actions_remaining: int
+    has_won: bool
+    hand: Tuple[Card, ...]
+    villain_deck: Tuple[Card, ...]
+    villain_rng: Any
+    fate_deck: Tuple[Card, ...]
+    fate_rng: Any
+    discard_pile: Tuple[Card, ...]
+    fate_discard: Tuple[Card, ...]
+    allies_in_play: Tuple[Card, ...]
+    items_in_play: Tuple[Card, ...]
+    conditions_in_play: Tuple[Card, ...]
+    passive_cards: Tuple[Card, ...]
+    defeated_heroes: Tuple[Tuple[str, Tuple[str, ...]], ...]
+    victory_progress: Tuple[Tuple[str, Any], ...]
+    board: Tuple
+
+
 @dataclass
 class Player:
     """
@@ -22,9 +49,9 @@ class Player:
     power: int = 0
     
     # Cartes
-    hand: List[Card] = field(default_factory=list)
-    villain_deck: List[Card] = field(default_factory=list)
-    fate_deck: List[Card] = field(default_factory=list)
+    hand: PlayerHand = field(default_factory=PlayerHand)
+    villain_deck: Deck = field(default_factory=Deck)
+    fate_deck: Deck = field(default_factory=Deck)
     discard_pile: List[Card] = field(default_factory=list)
     fate_discard: List[Card] = field(default_factory=list)
     
@@ -37,6 +64,12 @@ class Player:
     items_in_play: List[Card] = field(default_factory=list)
     conditions_in_play: List[Card] = field(default_factory=list)
     
+    # Héros vaincus : id du héros -> ids des lieux où il a été vaincu
+    defeated_heroes: Dict[str, List[str]] = field(default_factory=dict)
+    
+    # Index des cartes en jeu ayant des effets permanents (résolus en début de tour)
+    passive_cards: List[Card] = field(default_factory=list, repr=False)
+    
     # État du jeu
     has_won: bool = False
     turn_phase: TurnPhase = TurnPhase.MOVE
@@ -46,6 +79,9 @@ class Player:
     victory_condition: str = ""
     victory_progress: Dict[str, Any] = field(default_factory=dict)
     
+    # Compteurs de progrès tenus à jour par le plateau (voir VictoryTracker)
+    victory_tracker: Optional[Any] = field(default=None, repr=False, compare=False)
+    
     def __post_init__(self):
         """Initialisation après création"""
         if len(self.board_locations) == 0:
@@ -66,10 +102,7 @@ class Player:
         if deck.is_empty():
             # Mélange la défausse dans le deck
             if discard:
-                for card in discard:
-                    deck.add_card(card)
-                discard.clear()
-                deck.shuffle()
+                deck.refill_from(discard)
             else:
                 return None  # Plus de cartes disponibles
         
@@ -97,18 +130,53 @@ class Player:
         self.hand.remove(card)
         
         # Place la carte selon son type
-        if card.is_ally():
-            self.allies_in_play.append(card)
-        elif card.is_item():
-            self.items_in_play.append(card)
-        elif card.card_type.value == "condition":
-            self.conditions_in_play.append(card)
+        zone = self._get_play_zone(card)
+        if zone is not None:
+            zone.append(card)
+            if card.has_passive_effects():
+                self.passive_cards.append(card)
+            
+            # Objets et conditions sont posés sur le lieu où ils sont joués
+            location = self.get_current_location()
+            if location and zone is not self.allies_in_play:
+                location.add_item(card.id)
         else:
             # Effet immédiat, va à la défausse
             self.discard_pile.append(card)
         
         return True
     
+    def _get_play_zone(self, card: Card) -> Optional[List[Card]]:
+        """Retourne la zone où une carte reste en jeu (None pour les effets immédiats)"""
+        if card.is_ally():
+            return self.allies_in_play
+        if card.is_item():
+            return self.items_in_play
+        if card.card_type.value == "condition":
+            return self.conditions_in_play
+        return None
+    
+    def remove_from_play(self, card: Card) -> bool:
+        """Retire une carte en jeu et la place dans la défausse"""
+        zone = self._get_play_zone(card)
+        if zone is None or card not in zone:
+            return False
+        
+        zone.remove(card)
+        if card in self.passive_cards:
+            self.passive_cards.remove(card)
+        if zone is not self.allies_in_play:
+            for location in self.board_locations:
+                if card.id in location.items_present:
+                    location.remove_item(card.id)
+                    break
+        self.discard_pile.append(card)
+        return True
+    
+    def record_defeat(self, hero_id: str, location_id: str) -> None:
+        """Enregistre un héros vaincu et le lieu de sa défaite"""
+        self.defeated_heroes.setdefault(hero_id, []).append(location_id)
+    
     def discard_card(self, card: Card) -> bool:
         """Défausse une carte de la main"""
         if card in self.hand:
@@ -143,7 +211,8 @@ class Player:
         """Vérifie si le déplacement est possible"""
         return (0 <= position <= 3 and 
                 position != self.current_location and
-                position < len(self.board_locations))
+                position < len(self.board_locations) and
+                not self.board_locations[position].locked)
     
     # === Gestion des ressources ===
     
@@ -191,6 +260,76 @@ class Player:
                 total += ally.strength
         return total
     
+    # === Copie d'état ===
+    
+    def snapshot(self) -> PlayerSnapshot:
+        """Fige l'état mutable du joueur"""
+        villain_rng = self.villain_deck.rng
+        fate_rng = self.fate_deck.rng
+        return PlayerSnapshot(
+            self.power, self.current_location, self.turn_phase, self.actions_remaining, self.has_won,
+            tuple(self.hand),
+            tuple(self.villain_deck.cards), villain_rng.getstate() if villain_rng else None,
+            tuple(self.fate_deck.cards), fate_rng.getstate() if fate_rng else None,
+            tuple(self.discard_pile), tuple(self.fate_discard),
+            tuple(self.allies_in_play), tuple(self.items_in_play), tuple(self.conditions_in_play),
+            tuple(self.passive_cards),
+            tuple((hero_id, tuple(locations)) for hero_id, locations in self.defeated_heroes.items()),
+            tuple(self.victory_progress.items()),
+            snapshot_board(self.board_locations)
+        )
+    
+    def restore(self, snapshot: PlayerSnapshot) -> None:
+        """Remet le joueur dans un état figé par snapshot()"""
+        self.power = snapshot.power
+        self.current_location = snapshot.current_location
+        self.turn_phase = snapshot.turn_phase
+        self.actions_remaining = snapshot.actions_remaining
+        self.has_won = snapshot.has_won
+        
+        self.hand = PlayerHand(snapshot.hand)
+        self.villain_deck.cards.clear()
+        self.villain_deck.cards.extend(snapshot.villain_deck)
+        if snapshot.villain_rng is not None:
+            self.villain_deck.rng.setstate(snapshot.villain_rng)
+        self.fate_deck.cards.clear()
+        self.fate_deck.cards.extend(snapshot.fate_deck)
+        if snapshot.fate_rng is not None:
+            self.fate_deck.rng.setstate(snapshot.fate_rng)
+        
+        self.discard_pile[:] = snapshot.discard_pile
+        self.fate_discard[:] = snapshot.fate_discard
+        self.allies_in_play[:] = snapshot.allies_in_play
+        self.items_in_play[:] = snapshot.items_in_play
+        self.conditions_in_play[:] = snapshot.conditions_in_play
+        self.passive_cards[:] = snapshot.passive_cards
+        self.defeated_heroes = {hero_id: list(locations) for hero_id, locations in snapshot.defeated_heroes}
+        self.victory_progress = dict(snapshot.victory_progress)
+        
+        # Le plateau est remis en place sans prévenir les observateurs : suivi à reconstruire
+        restore_board(self.board_locations, snapshot.board)
+        if self.victory_tracker is not None:
+            self.victory_tracker.detach()
+            self.victory_tracker = None
+    
+    def clone(self) -> "Player":
+        """Copie indépendante du joueur ; cartes, modèles de lieux et actions sont partagés"""
+        player = copy.copy(self)
+        player.hand = self.hand.copy()
+        player.villain_deck = self.villain_deck.copy()
+        player.fate_deck = self.fate_deck.copy()
+        player.discard_pile = list(self.discard_pile)
+        player.fate_discard = list(self.fate_discard)
+        player.board_locations = clone_board(self.board_locations)
+        player.allies_in_play = list(self.allies_in_play)
+        player.items_in_play = list(self.items_in_play)
+        player.conditions_in_play = list(self.conditions_in_play)
+        player.passive_cards = list(self.passive_cards)
+        player.defeated_heroes = {hero_id: list(locations) for hero_id, locations in self.defeated_heroes.items()}
+        player.victory_progress = dict(self.victory_progress)
+        player.victory_tracker = None
+        return player
+    
     def __str__(self) -> str:
         """Représentation textuelle du joueur"""
         location_name = ""
@@ -0,0 +1,6 @@
+"""Init file pour le module server"""
+
+from .session_store import SessionStore, SessionRow
+from .game_server import GameServer, GameClient, LatencyTracker, percentiles
+from .web_server import WebServer, StaticFiles
+from .sharding import ShardRouter, HashRing
@@ -0,0 +1,37 @@
+"""
+Lance le serveur de parties
+
+Exemple: python -m src.server --port 8765 --sessions parties.db
+"""
+
+import argparse
+import asyncio
+from ..simulation.engine import HeadlessEngine
+from .game_server import GameServer
+from .session_store import SessionStore
+
+
+def main() -> None:
+    """Point d'entrée du serveur"""
+    parser = argparse.ArgumentParser(description="Serveur de parties Disney Villainous")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--max-turns", type=int, default=200, help="Limite de tours avant match nul")
+    parser.add_argument("--sessions", default=None, help="Base SQLite où enregistrer les parties")
+    args = parser.parse_args()
+
+    engine = HeadlessEngine(log_events=False)
+    store = SessionStore(args.sessions, engine) if args.sessions else None
+    server = GameServer(engine, args.max_turns, store)
+    print(f"🎲 Serveur de parties sur {args.host}:{args.port}")
+    try:
+        asyncio.run(server.serve_forever(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if store:
+            store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,466 @@
+"""
+Serveur de parties asyncio - Des milliers de parties dans une seule boucle d'événements
+
+Protocole : une requête JSON par ligne, une réponse JSON par ligne, avec l'"id"
+de la requête. Une connexion peut envoyer plusieurs requêtes sans attendre les
+réponses ; elles sont traitées dans l'ordre.
+
+    {"op": "create", "villains": ["maleficent", "jafar"], "seed": 1}
+    {"op": "state", "game_id": "game_5f0c2a9e1b3d", "full": false}
+    {"op": "moves", "game_id": "game_5f0c2a9e1b3d"}
+    {"op": "play", "game_id": "game_5f0c2a9e1b3d", "player_id": "player_1", "move": {"kind": "move", "params": {"position": 2}}}
+    {"op": "sync", "game_id": "game_5f0c2a9e1b3d", "version": 12}
+    {"op": "subscribe", "game_id": "game_5f0c2a9e1b3d", "version": 12}
+    {"op": "close", "game_id": "game_5f0c2a9e1b3d"}
+    {"op": "export", "game_id": "game_5f0c2a9e1b3d"}
+    {"op": "import", "state": {...}, "max_turns": 200, "version": 12}
+    {"op": "games"}
+    {"op": "stats"}
+
+Les coups passent par le TurnManager du moteur (HeadlessEngine.apply_move).
+Chaque partie a son propre verrou : les coups d'une partie sont appliqués un à
+un, ceux de parties différentes ne s'attendent jamais.
+
+sync renvoie les deltas d'état depuis la version connue du client (voir
+state_diff), ou l'état complet s'il est trop en retard. Une connexion abonnée
+à une partie reçoit ensuite, sans requête, une ligne {"event": "delta", ...}
+après chaque coup. export renvoie l'état complet sérialisé par StateCodec
+(JSON), que import recharge dans un autre processus (voir sharding).
+
+Usage: python -m src.server --port 8765
+"""
+
+import asyncio
+import contextvars
+import itertools
+import json
+import secrets
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Iterable, Optional, Sequence, Set
+from ..core.enums import GameState
+from ..core.game import Game
+from ..core.move_generator import Move
+from ..simulation.engine import HeadlessEngine
+from .state_diff import ChangeRecorder, StateTracker
+
+
+# Échantillons de latence gardés par opération
+LATENCY_SAMPLES = 100_000
+
+# Au-delà de ce volume en attente d'envoi, un abonné trop lent est désabonné (il devra resynchroniser)
+MAX_PUSH_BUFFER = 1 << 20
+
+# Connexion de la requête en cours de traitement (une tâche par connexion)
+_connection: contextvars.ContextVar = contextvars.ContextVar("connection", default=None)
+
+
+def percentiles(samples: Sequence[float], points: Iterable[float] = (50, 90, 99)) -> Dict[str, float]:
+    """Percentiles par rang le plus proche, plus le maximum"""
+    if not samples:
+        return {}
+    ordered = sorted(samples)
+    result = {}
+    for point in points:
+        rank = max(0, min(len(ordered) - 1, int(round(point / 100 * len(ordered))) - 1))
+        result[f"p{point:g}"] = ordered[rank]
+    result["max"] = ordered[-1]
+    return result
+
+
+class LatencyTracker:
+    """Derniers temps de traitement par opération, en millisecondes"""
+
+    def __init__(self, size: int = LATENCY_SAMPLES):
+        self.size = size
+        self.samples: Dict[str, Deque[float]] = {}
+        self.counts: Dict[str, int] = {}
+
+    def add(self, op: str, milliseconds: float) -> None:
+        """Enregistre une durée"""
+        samples = self.samples.get(op)
+        if samples is None:
+            samples = self.samples[op] = deque(maxlen=self.size)
+            self.counts[op] = 0
+        samples.append(milliseconds)
+        self.counts[op] += 1
+
+    def report(self) -> Dict[str, Dict[str, float]]:
+        """Nombre d'appels et percentiles de chaque opération"""
+        return {
+            op: dict(count=self.counts[op], **percentiles(samples))
+            for op, samples in sorted(self.samples.items())
+        }
+
+
+class GameSession:
+    """Partie hébergée avec son verrou (game vaut None si la partie est gardée par un SessionStore)"""
+
+    __slots__ = ("game_id", "game", "lock", "max_turns", "tracker", "subscribers")
+
+    def __init__(self, game_id: str, game: Optional[Game], max_turns: int):
+        self.game_id = game_id
+        self.game = game
+        self.lock = asyncio.Lock()
+        self.max_turns = max_turns
+        self.tracker: Optional[StateTracker] = None  # Créé au premier sync
+        self.subscribers: Set[asyncio.StreamWriter] = set()
+
+
+class GameServer:
+    """
+    Héberge des parties et applique les coups reçus des clients
+    """
+
+    def __init__(self, engine: Optional[HeadlessEngine] = None, max_turns: int = 200, store=None):
+        """
+        engine charge les données une fois pour toutes les parties
+
+        Avec store (SessionStore), les parties ne sont pas gardées par le serveur :
+        elles sont lues dans le magasin (cache LRU) et y sont remises après
+        chaque coup. Les parties du magasin restent jouables après un redémarrage.
+        """
+        self.engine = engine or HeadlessEngine(log_events=False)
+        self.max_turns = max_turns
+        self.store = store
+        self.sessions: Dict[str, GameSession] = {}
+        self.latency = LatencyTracker()
+        self._server: Optional[asyncio.AbstractServer] = None
+        # Joueurs touchés par un coup : seuls leurs champs sont relus pour le delta
+        self._recorder = ChangeRecorder()
+        self.engine.turn_manager.add_listener(self._recorder)
+        self.operations: Dict[str, Callable[[dict], Awaitable[dict]]] = {
+            "create": self.create,
+            "state": self.state,
+            "moves": self.moves,
+            "play": self.play,
+            "sync": self.sync,
+            "subscribe": self.subscribe,
+            "unsubscribe": self.unsubscribe,
+            "close": self.close_game,
+            "export": self.export,
+            "import": self.import_game,
+            "games": self.list_games,
+            "stats": self.stats,
+        }
+
+    # === Réseau ===
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8765) -> asyncio.AbstractServer:
+        """Ouvre le port d'écoute (port 0 : choisi par le système)"""
+        self._server = await asyncio.start_server(self.handle_client, host, port, limit=1 << 20)
+        return self._server
+
+    @property
+    def port(self) -> int:
+        """Port effectivement ouvert"""
+        return self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self, host: str = "127.0.0.1", port: int = 8765) -> None:
+        """Sert jusqu'à l'annulation"""
+        server = await self.start(host, port)
+        async with server:
+            await server.serve_forever()
+
+    async def stop(self) -> None:
+        """Ferme le port d'écoute"""
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Traite les requêtes d'une connexion, une ligne à la fois"""
+        _connection.set(writer)
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                response = await self.handle_line(line)
+                writer.write(json.dumps(response, separators=(",", ":")).encode("utf-8") + b"\n")
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            for session in self.sessions.values():
+                session.subscribers.discard(writer)
+            writer.close()
+
+    async def handle_line(self, line: bytes) -> Dict[str, Any]:
+        """Décode une requête puis l'exécute"""
+        try:
+            request = json.loads(line)
+        except ValueError:
+            return {"ok": False, "error": "JSON invalide"}
+        return await self.handle_request(request)
+
+    async def handle_request(self, request: Any) -> Dict[str, Any]:
+        """Exécute une requête décodée et mesure sa durée"""
+        start = time.perf_counter()
+        if not isinstance(request, dict):
+            return {"ok": False, "error": "Requête invalide"}
+
+        op = request.get("op")
+        handler = self.operations.get(op) if isinstance(op, str) else None
+        if handler is None:
+            response = {"ok": False, "error": f"Opération inconnue : {op}"}
+        else:
+            try:
+                response = await handler(request)
+                response["ok"] = True
+            except (KeyError, ValueError, TypeError) as exc:
+                response = {"ok": False, "error": f"{type(exc).__name__}: {exc}"}
+            except Exception as exc:
+                # Une requête qui fait échouer le moteur ne doit pas couper la connexion
+                response = {"ok": False, "error": f"Erreur interne ({type(exc).__name__}: {exc})"}
+            self.latency.add(op, (time.perf_counter() - start) * 1000)
+
+        if "id" in request:
+            response["id"] = request["id"]
+        return response
+
+    # === Opérations ===
+
+    def _session(self, request: dict) -> GameSession:
+        """Session désignée par game_id (retrouvée dans le magasin après un redémarrage)"""
+        game_id = request["game_id"]
+        session = self.sessions.get(game_id)
+        if session is None:
+            if self.store is None or self.store.get(game_id) is None:
+                raise KeyError(f"Partie inconnue : {game_id}")
+            session = self.sessions[game_id] = GameSession(game_id, None, self.max_turns)
+        return session
+
+    def _game(self, session: GameSession) -> Game:
+        """Partie d'une session"""
+        if session.game is not None:
+            return session.game
+        game = self.store.get(session.game_id)
+        if game is None:
+            raise KeyError(f"Partie inconnue : {session.game_id}")
+        return game
+
+    async def create(self, request: dict) -> dict:
+        """Crée une partie et démarre le premier tour"""
+        villains = request.get("villains") or ["maleficent", "jafar"]
+        # Unique aussi d'un démarrage à l'autre ; un routeur de shards impose le sien
+        game_id = request.get("game_id") or f"game_{secrets.token_hex(6)}"
+        if game_id in self.sessions:
+            raise ValueError(f"Partie déjà hébergée : {game_id}")
+        game = self.engine.build_game(villains, game_id=game_id, seed=request.get("seed"))
+        session = GameSession(game_id, game if self.store is None else None,
+                              int(request.get("max_turns", self.max_turns)))
+        self.engine.begin_turn(game, session.max_turns)
+        self.sessions[game_id] = session
+        if self.store is not None:
+            self.store.put(game)
+        return {
+            "game_id": game_id,
+            "seed": game.seed,
+            "players": [{"id": p.id, "villain": p.villain_type.value} for p in game.players],
+            "current_player": game.get_current_player().id,
+        }
+
+    async def state(self, request: dict) -> dict:
+        """État de la partie"""
+        game = self._game(self._session(request))
+        return {"game": game.get_game_state(full=bool(request.get("full")))}
+
+    async def moves(self, request: dict) -> dict:
+        """Coups légaux du joueur courant"""
+        game = self._game(self._session(request))
+        if game.state != GameState.IN_PROGRESS:
+            return {"player_id": None, "moves": []}
+        return {
+            "player_id": game.get_current_player().id,
+            "moves": [move.to_dict() for move in self.engine.move_generator.legal_moves(game)],
+        }
+
+    async def play(self, request: dict) -> dict:
+        """
+        Applique le coup d'un joueur ; refusé si ce n'est pas son tour
+
+        Un coup absent des coups légaux est une erreur : la partie n'est pas
+        modifiée et le joueur garde la main.
+        """
+        session = self._session(request)
+        move = Move.from_dict(request["move"])
+        async with session.lock:
+            game = self._game(session)
+            if game.state != GameState.IN_PROGRESS:
+                return {"accepted": False, "reason": "Partie terminée"}
+            if not game.is_player_turn(request["player_id"]):
+                return {"accepted": False, "reason": "Ce n'est pas le tour de ce joueur"}
+            if move not in self.engine.move_generator.legal_moves(game):
+                raise ValueError(f"Coup illégal : {move}")
+
+            player_id = request["player_id"]
+            self._recorder.start()
+            try:
+                accepted = self.engine.apply_move(game, move, session.max_turns, end_turn_on_refusal=False)
+            finally:
+                touched = self._recorder.stop()
+            if self.store is not None:
+                self.store.put(game)
+            if session.tracker is not None:
+                # Le joueur dont le tour commence a pu changer sans que les écouteurs le voient
+                current = game.get_current_player()
+                touched.update((player_id, current.id) if current else (player_id,))
+                ops = session.tracker.update(game, touched if accepted else None)
+                if ops and session.subscribers:
+                    self._push(session, {"event": "delta", "game_id": session.game_id,
+                                         "version": session.tracker.version, "ops": ops})
+            current = game.get_current_player()
+            response = {
+                "accepted": accepted,
+                "state": game.state.value,
+                "turn": game.turn_number,
+                "current_player": current.id if current else None,
+                "winner": game.winner.id if game.winner else None,
+            }
+            if "since" in request:
+                # Version déjà à jour (ou suivi créé sur l'état actuel) : pas de nouvelle lecture
+                response["sync"] = self._tracker(session, game).changes_since(game, request["since"], refresh=False)
+            return response
+
+    def _tracker(self, session: GameSession, game: Game) -> StateTracker:
+        """Suivi des versions de la partie, créé à la première demande"""
+        if session.tracker is None:
+            session.tracker = StateTracker(game)
+        return session.tracker
+
+    def _push(self, session: GameSession, message: dict) -> None:
+        """Envoie un message aux abonnés sans attendre ; les abonnés saturés sont retirés"""
+        data = json.dumps(message, separators=(",", ":")).encode("utf-8") + b"\n"
+        for writer in list(session.subscribers):
+            if writer.is_closing() or writer.transport.get_write_buffer_size() > MAX_PUSH_BUFFER:
+                session.subscribers.discard(writer)
+                continue
+            writer.write(data)
+
+    async def sync(self, request: dict) -> dict:
+        """Deltas depuis la version du client, ou état complet"""
+        session = self._session(request)
+        async with session.lock:
+            game = self._game(session)
+            return self._tracker(session, game).changes_since(game, request.get("version"))
+
+    async def subscribe(self, request: dict) -> dict:
+        """Abonne la connexion aux deltas de la partie ; renvoie de quoi se mettre à jour"""
+        session = self._session(request)
+        async with session.lock:
+            game = self._game(session)
+            changes = self._tracker(session, game).changes_since(game, request.get("version"))
+            writer = _connection.get()
+            if writer is not None:
+                session.subscribers.add(writer)
+            return changes
+
+    async def unsubscribe(self, request: dict) -> dict:
+        """Désabonne la connexion"""
+        self._session(request).subscribers.discard(_connection.get())
+        return {"game_id": request["game_id"]}
+
+    async def close_game(self, request: dict) -> dict:
+        """Retire une partie du serveur"""
+        session = self._session(request)
+        async with session.lock:
+            self.sessions.pop(session.game_id, None)
+            if self.store is not None:
+                self.store.delete(session.game_id)
+        return {"game_id": session.game_id}
+
+    async def export(self, request: dict) -> dict:
+        """État complet de la partie (StateCodec.to_json), avec de quoi la réimporter ailleurs"""
+        session = self._session(request)
+        async with session.lock:
+            return {
+                "state": self.engine.state_codec.to_json(self._game(session)),
+                "max_turns": session.max_turns,
+                "version": session.tracker.version if session.tracker else None,
+            }
+
+    async def import_game(self, request: dict) -> dict:
+        """Héberge une partie exportée (reconstruite depuis sa graine puis restaurée)"""
+        game = self.engine.state_codec.load(request["state"], self.engine)
+        if game.id in self.sessions:
+            raise ValueError(f"Partie déjà hébergée : {game.id}")
+        session = GameSession(game.id, game if self.store is None else None,
+                              int(request.get("max_turns") or self.max_turns))
+        if request.get("version") is not None:
+            # Même numérotation qu'avant l'export : les clients n'ont rien à resynchroniser
+            session.tracker = StateTracker(game)
+            session.tracker.version = int(request["version"])
+        self.sessions[game.id] = session
+        if self.store is not None:
+            self.store.put(game)
+        return {"game_id": game.id}
+
+    async def list_games(self, request: dict) -> dict:
+        """Ids des parties hébergées"""
+        return {"games": list(self.sessions)}
+
+    async def stats(self, request: dict) -> dict:
+        """Parties hébergées et latences par opération (ms)"""
+        return {"games": len(self.sessions), "latency_ms": self.latency.report()}
+
+    def __str__(self) -> str:
+        """Représentation textuelle du serveur"""
+        return f"GameServer({len(self.sessions)} parties)"
+
+
+class GameClient:
+    """
+    Client asyncio du protocole, pour les tests et le générateur de charge
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+        self.events: Deque[dict] = deque()  # Messages poussés par le serveur (abonnements)
+        self.received = 0  # Octets reçus
+        self._ids = itertools.count(1)
+
+    @classmethod
+    async def connect(cls, host: str = "127.0.0.1", port: int = 8765) -> "GameClient":
+        """Ouvre une connexion"""
+        reader, writer = await asyncio.open_connection(host, port, limit=1 << 20)
+        return cls(reader, writer)
+
+    async def _read(self) -> dict:
+        """Lit un message"""
+        line = await self.reader.readline()
+        if not line:
+            raise ConnectionError("Connexion fermée par le serveur")
+        self.received += len(line)
+        return json.loads(line)
+
+    async def request(self, op: str, **fields) -> dict:
+        """Envoie une requête et attend sa réponse (les messages poussés entre-temps vont dans events)"""
+        fields["op"] = op
+        fields["id"] = request_id = next(self._ids)
+        self.writer.write(json.dumps(fields, separators=(",", ":")).encode("utf-8") + b"\n")
+        await self.writer.drain()
+        while True:
+            message = await self._read()
+            if "event" in message:
+                self.events.append(message)
+            elif message.get("id") == request_id:
+                return message
+
+    async def next_event(self) -> dict:
+        """Prochain message poussé par le serveur"""
+        if self.events:
+            return self.events.popleft()
+        while True:
+            message = await self._read()
+            if "event" in message:
+                return message
+
+    async def close(self) -> None:
+        """Ferme la connexion"""
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except ConnectionError:
+            pass
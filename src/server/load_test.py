@@ -0,0 +1,132 @@
+"""
+Générateur de charge - Des clients jouent des coups légaux au hasard et mesurent la latence
+
+Sans --host, un serveur est démarré dans le même processus sur un port libre
+(avec --shards N, un ShardRouter et ses N processus de travail).
+Chaque coup demande aussi les changements d'état depuis la dernière version
+connue du client (sauf --no-sync) : la taille des deltas est comparée à celle
+des états complets.
+
+Usage: python -m src.server.load_test --clients 50 --games 1000 --actions 20000 [--shards 4]
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from typing import Dict, List, Optional
+from .game_server import GameClient, GameServer, percentiles
+from .sharding import ShardRouter
+
+
+async def run_client(host: str, port: int, games: int, actions: int, rng: random.Random,
+                     villains: List[str], latencies: List[float], sizes: Dict[str, List[int]],
+                     sync: bool = True) -> int:
+    """Crée des parties puis y joue tour à tour ; retourne le nombre de coups joués"""
+    client = await GameClient.connect(host, port)
+    try:
+        game_ids = []
+        for _ in range(games):
+            response = await client.request("create", villains=villains, seed=rng.getrandbits(32))
+            game_ids.append(response["game_id"])
+
+        versions: Dict[str, int] = {}
+        played = 0
+        while played < actions and game_ids:
+            game_id = game_ids[played % len(game_ids)]
+            legal = await client.request("moves", game_id=game_id)
+            if not legal["moves"]:
+                # Partie terminée : remplacée par une nouvelle
+                await client.request("close", game_id=game_id)
+                response = await client.request("create", villains=villains, seed=rng.getrandbits(32))
+                game_ids[game_ids.index(game_id)] = response["game_id"]
+                continue
+
+            fields = {"since": versions.get(game_id)} if sync else {}
+            start = time.perf_counter()
+            response = await client.request("play", game_id=game_id, player_id=legal["player_id"],
+                                            move=rng.choice(legal["moves"]), **fields)
+            latencies.append((time.perf_counter() - start) * 1000)
+            played += 1
+            if sync:
+                changes = response["sync"]
+                versions[game_id] = changes["version"]
+                sizes["full" if "full" in changes else "delta"].append(len(json.dumps(changes)))
+        return played
+    finally:
+        await client.close()
+
+
+async def run_load(host: Optional[str], port: int, clients: int, games: int, actions: int,
+                   seed: int = 0, villains: Optional[List[str]] = None, sync: bool = True,
+                   shards: int = 0) -> Dict:
+    """Lance les clients en parallèle ; retourne les mesures côté client et côté serveur"""
+    villains = villains or ["maleficent", "jafar"]
+    server = None
+    if host is None:
+        server = ShardRouter(shards) if shards else GameServer()
+        await server.start("127.0.0.1", 0)
+        host, port = "127.0.0.1", server.port
+
+    rng = random.Random(seed)
+    latencies: List[float] = []
+    sizes: Dict[str, List[int]] = {"delta": [], "full": []}
+    games_per_client = max(1, games // clients)
+    actions_per_client = max(1, actions // clients)
+    start = time.perf_counter()
+    played = await asyncio.gather(*(
+        run_client(host, port, games_per_client, actions_per_client, random.Random(rng.getrandbits(64)),
+                   villains, latencies, sizes, sync)
+        for _ in range(clients)
+    ))
+    elapsed = time.perf_counter() - start
+
+    stats_client = await GameClient.connect(host, port)
+    server_stats = await stats_client.request("stats")
+    await stats_client.close()
+    if server:
+        await server.stop()
+
+    return {
+        "actions": sum(played),
+        "elapsed": elapsed,
+        "actions_per_second": sum(played) / elapsed if elapsed > 0 else 0.0,
+        "client_latency_ms": percentiles(latencies),
+        "sync_bytes": {kind: (sum(values) / len(values) if values else 0.0) for kind, values in sizes.items()},
+        "server": server_stats,
+    }
+
+
+def main() -> None:
+    """Point d'entrée du générateur de charge"""
+    parser = argparse.ArgumentParser(description="Charge sur le serveur de parties")
+    parser.add_argument("--host", default=None, help="Serveur à charger (défaut : serveur local intégré)")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--clients", type=int, default=50, help="Connexions simultanées")
+    parser.add_argument("--games", type=int, default=1000, help="Parties créées au total")
+    parser.add_argument("--actions", type=int, default=20000, help="Coups joués au total")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-sync", action="store_true", help="Ne demande pas les deltas d'état")
+    parser.add_argument("--shards", type=int, default=0, help="Serveur intégré réparti sur N processus")
+    args = parser.parse_args()
+
+    result = asyncio.run(run_load(args.host, args.port, args.clients, args.games, args.actions, args.seed,
+                                  sync=not args.no_sync, shards=args.shards))
+
+    print(f"{result['actions']} coups en {result['elapsed']:.2f}s - {result['actions_per_second']:.0f} coups/s")
+    print("Latence client (ms) : " + ", ".join(f"{k} {v:.2f}" for k, v in result["client_latency_ms"].items()))
+    if not args.no_sync:
+        print(f"Synchronisation : {result['sync_bytes']['delta']:.0f} octets par delta, "
+              f"{result['sync_bytes']['full']:.0f} par état complet")
+    print(f"Serveur : {result['server']['games']} parties hébergées")
+    for op, stats in result["server"]["latency_ms"].items():
+        values = ", ".join(f"{k} {v:.3f}" for k, v in stats.items() if k != "count")
+        print(f"  {op:7} {stats['count']:7d} appels - {values}")
+    for shard in result["server"].get("shards", ()):
+        print(f"  {shard['worker']} : {shard['games']} parties, {shard['requests']} requêtes "
+              f"en {shard['frames']} trames")
+
+
+if __name__ == "__main__":
+    main()
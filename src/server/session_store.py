@@ -0,0 +1,324 @@
+"""
+Sessions de jeu - Parties persistées dans SQLite, parties actives gardées en mémoire
+
+Les parties chaudes restent dans un cache LRU : get() les rend sans toucher au
+disque. Quand le cache déborde, la moins récemment utilisée quitte la mémoire
+et sera reconstruite depuis SQLite au prochain get().
+
+put() ne fait que copier la partie (Game.clone(), sans sérialisation) dans le
+fil de l'appelant : un fil d'écriture regroupe les copies en attente, ne garde
+que la dernière de chaque partie, les sérialise et les écrit dans une seule
+transaction toutes les flush_interval secondes (ou dès batch_size parties).
+Une transaction qui échoue est remise en file et l'erreur est relevée par flush().
+
+Une ligne de la table games contient l'état lisible (Game.get_game_state(full=True),
+en JSON) pour les requêtes et l'interface web, et l'instantané binaire
+(persistence.dump_snapshot) qui permet de reconstruire la partie à l'identique.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
+from ..core.enums import VillainType
+from ..core.game import Game
+from ..simulation.persistence import dump_snapshot, load_snapshot
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id TEXT PRIMARY KEY,
+    seed TEXT NOT NULL,
+    villains TEXT NOT NULL,
+    state TEXT NOT NULL,
+    turn_number INTEGER NOT NULL,
+    updated REAL NOT NULL,
+    game_state TEXT NOT NULL,
+    snapshot BLOB NOT NULL
+)
+"""
+
+
+class SessionRow(NamedTuple):
+    """Ligne de la table games, prête à écrire"""
+    id: str
+    seed: str
+    villains: str
+    state: str
+    turn_number: int
+    updated: float
+    game_state: str
+    snapshot: bytes
+
+    @classmethod
+    def from_game(cls, game: Game) -> "SessionRow":
+        """Fige l'état d'une partie"""
+        return cls(
+            game.id, str(game.seed), ",".join(p.villain_type.value for p in game.players),
+            game.state.value, game.turn_number, time.time(),
+            json.dumps(game.get_game_state(full=True), separators=(",", ":")),
+            dump_snapshot(game)
+        )
+
+
+class SessionStore:
+    """
+    Magasin de parties SQLite avec cache LRU et écriture différée par lots
+    """
+
+    def __init__(self, path: str, engine, cache_size: int = 256, batch_size: int = 256,
+                 flush_interval: float = 0.05):
+        """
+        Ouvre (ou crée) la base
+
+        engine (HeadlessEngine) reconstruit les parties relues depuis leur graine.
+        """
+        self.path = path
+        self.engine = engine
+        self.cache_size = max(1, cache_size)
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+
+        self._cache: "OrderedDict[str, Game]" = OrderedDict()
+        # Copie de partie à sérialiser, ligne déjà prête (après un échec) ou None (suppression)
+        self._pending: Dict[str, Union[Game, SessionRow, None]] = {}
+        self._condition = threading.Condition()
+        # Lot pris par le fil d'écriture, encore visible pour get() jusqu'à la validation
+        self._in_flight: Dict[str, Union[Game, SessionRow, None]] = {}
+        self._closed = False
+        self.writes = 0         # Lignes écrites
+        self.transactions = 0   # Transactions validées
+        self.failures = 0       # Lots ou parties dont l'écriture a échoué
+        self.lost = 0           # Écritures abandonnées (partie illisible, échec à la fermeture)
+        self.last_error: Optional[BaseException] = None
+        self.hits = 0
+        self.misses = 0
+
+        self._reader = sqlite3.connect(path, check_same_thread=False)
+        self._reader_lock = threading.Lock()
+        self._reader.execute("PRAGMA journal_mode=WAL")
+        self._reader.execute(SCHEMA)
+        self._reader.commit()
+
+        self._writer = threading.Thread(target=self._write_loop, name="session-store-writer", daemon=True)
+        self._writer.start()
+
+    # === Lecture ===
+
+    def get(self, game_id: str) -> Optional[Game]:
+        """Partie par id : depuis le cache, sinon reconstruite depuis la base"""
+        game = self._cache.get(game_id)
+        if game is not None:
+            self._cache.move_to_end(game_id)
+            self.hits += 1
+            return game
+
+        self.misses += 1
+        pending, row = self._queued(game_id)
+        if pending and row is None:
+            return None  # Suppression en attente
+        if isinstance(row, Game):
+            # Copie en attente d'écriture : le fil d'écriture la lit, on en rend une autre
+            game = row.clone()
+            self._remember(game)
+            return game
+        if row is None:
+            row = self._select(game_id)
+            if row is None:
+                return None
+
+        game = self._rebuild(row)
+        self._remember(game)
+        return game
+
+    def _queued(self, game_id: str) -> Tuple[bool, Union[Game, SessionRow, None]]:
+        """Écriture en attente ou en cours pour une partie : (trouvée, copie, ligne ou None)"""
+        with self._condition:
+            for queue in (self._pending, self._in_flight):
+                if game_id in queue:
+                    return True, queue[game_id]
+        return False, None
+
+    def _select(self, game_id: str) -> Optional[SessionRow]:
+        """Lit une ligne dans la base"""
+        with self._reader_lock:
+            row = self._reader.execute("SELECT * FROM games WHERE id = ?", (game_id,)).fetchone()
+        return SessionRow(*row) if row else None
+
+    def _rebuild(self, row: SessionRow) -> Game:
+        """Reconstruit une partie depuis sa graine puis restaure son état"""
+        villains = [VillainType(name) for name in row.villains.split(",") if name]
+        game = self.engine.build_game(villains, game_id=row.id, seed=int(row.seed))
+        game.restore(load_snapshot(row.snapshot, game, self.engine.card_manager)["snapshot"])
+        return game
+
+    def game_state(self, game_id: str) -> Optional[Dict[str, Any]]:
+        """État lisible d'une partie, sans la charger en mémoire si elle n'y est pas"""
+        game = self._cache.get(game_id)
+        if game is not None:
+            return game.get_game_state(full=True)
+        pending, row = self._queued(game_id)
+        if pending and row is None:
+            return None
+        if isinstance(row, Game):
+            return row.get_game_state(full=True)
+        if row is None:
+            row = self._select(game_id)
+        return json.loads(row.game_state) if row else None
+
+    def list_games(self, state: Optional[str] = None) -> List[str]:
+        """Ids des parties enregistrées (écritures en attente comprises), filtrées par état"""
+        self.flush()
+        with self._reader_lock:
+            if state is None:
+                rows = self._reader.execute("SELECT id FROM games ORDER BY id").fetchall()
+            else:
+                rows = self._reader.execute("SELECT id FROM games WHERE state = ? ORDER BY id", (state,)).fetchall()
+        return [row[0] for row in rows]
+
+    # === Écriture ===
+
+    def put(self, game: Game) -> None:
+        """Enregistre l'état actuel d'une partie (écrit plus tard, par lot)"""
+        self._remember(game)
+        self._enqueue(game.id, game.clone())
+
+    def delete(self, game_id: str) -> None:
+        """Oublie une partie"""
+        self._cache.pop(game_id, None)
+        self._enqueue(game_id, None)
+
+    def _remember(self, game: Game) -> None:
+        """Place une partie en tête du cache ; la plus ancienne sort de la mémoire"""
+        self._cache[game.id] = game
+        self._cache.move_to_end(game.id)
+        while len(self._cache) > self.cache_size:
+            _, evicted = self._cache.popitem(last=False)
+            # Son dernier état doit être sur disque avant qu'elle quitte la mémoire
+            self._enqueue(evicted.id, evicted.clone())
+
+    def _enqueue(self, game_id: str, row: Union[Game, SessionRow, None]) -> None:
+        """Remplace l'écriture en attente de la partie"""
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("SessionStore fermé")
+            first = not self._pending
+            self._pending[game_id] = row
+            # Réveille le fil d'écriture : il écrit au plus tard flush_interval plus tard
+            if first or len(self._pending) >= self.batch_size:
+                self._condition.notify_all()
+
+    def _write_loop(self) -> None:
+        """Fil d'écriture : une transaction par lot d'états en attente"""
+        connection = sqlite3.connect(self.path)
+        try:
+            while True:
+                with self._condition:
+                    self._condition.wait_for(lambda: self._pending or self._closed)
+                    if not self._pending and self._closed:
+                        return
+                    # Laisse les mises à jour s'accumuler (et se fusionner) avant d'écrire
+                    if len(self._pending) < self.batch_size and not self._closed:
+                        self._condition.wait(self.flush_interval)
+                    batch, self._pending = self._pending, {}
+                    self._in_flight = batch
+
+                rows = self._serialize(batch)
+                upserts = [row for row in rows.values() if row is not None]
+                deletes = [(game_id,) for game_id, row in rows.items() if row is None]
+                try:
+                    with connection:
+                        if upserts:
+                            connection.executemany(
+                                "INSERT OR REPLACE INTO games VALUES (?, ?, ?, ?, ?, ?, ?, ?)", upserts
+                            )
+                        if deletes:
+                            connection.executemany("DELETE FROM games WHERE id = ?", deletes)
+                except Exception as exc:
+                    with self._condition:
+                        self._failed(exc)
+                        if self._closed:
+                            self.lost += len(rows)
+                        else:
+                            # Remise en file, sauf si un état plus récent est arrivé entre-temps
+                            for game_id, row in rows.items():
+                                self._pending.setdefault(game_id, row)
+                        self._in_flight = {}
+                        self._condition.notify_all()
+                        if not self._closed:
+                            self._condition.wait(self.flush_interval)  # Pas de nouvel essai immédiat
+                    continue
+
+                with self._condition:
+                    self.writes += len(rows)
+                    self.transactions += 1
+                    self._in_flight = {}
+                    self._condition.notify_all()
+        finally:
+            connection.close()
+            with self._condition:
+                self._condition.notify_all()  # flush() ne doit pas attendre un fil arrêté
+
+    def _serialize(self, batch: Dict[str, Union[Game, SessionRow, None]]) -> Dict[str, Optional[SessionRow]]:
+        """Lignes d'un lot ; une partie impossible à sérialiser est abandonnée"""
+        rows = {}
+        for game_id, item in batch.items():
+            if not isinstance(item, Game):
+                rows[game_id] = item
+                continue
+            try:
+                rows[game_id] = SessionRow.from_game(item)
+            except Exception as exc:
+                with self._condition:
+                    self._failed(exc)
+                    self.lost += 1
+        return rows
+
+    def _failed(self, error: BaseException) -> None:
+        """Note un échec d'écriture (appelé sous self._condition)"""
+        self.failures += 1
+        self.last_error = error
+
+    def flush(self) -> None:
+        """Attend que toutes les écritures en attente soient validées (RuntimeError si l'une échoue)"""
+        with self._condition:
+            failures = self.failures
+            self._condition.notify_all()
+            self._condition.wait_for(lambda: (not self._pending and not self._in_flight)
+                                     or self.failures != failures or not self._writer.is_alive())
+            if self.failures != failures:
+                raise RuntimeError(f"Écriture des parties impossible : {self.last_error}") from self.last_error
+            if self._pending or self._in_flight:
+                raise RuntimeError("Fil d'écriture arrêté")
+
+    def save_all(self) -> None:
+        """Enregistre l'état de toutes les parties en mémoire et attend l'écriture"""
+        for game in list(self._cache.values()):
+            self._enqueue(game.id, game.clone())
+        self.flush()
+
+    def close(self) -> None:
+        """Enregistre les parties en mémoire, vide la file et ferme la base"""
+        if self._closed:
+            return
+        try:
+            self.save_all()
+        finally:
+            # Dernier essai pour ce qui reste en file, puis abandon : la fermeture ne bloque pas
+            with self._condition:
+                self._closed = True
+                self._condition.notify_all()
+            self._writer.join()
+            self._reader.close()
+            self._cache.clear()
+
+    def __len__(self) -> int:
+        """Nombre de parties en mémoire"""
+        return len(self._cache)
+
+    def __str__(self) -> str:
+        """Représentation textuelle du magasin"""
+        return (f"SessionStore({self.path}, {len(self._cache)}/{self.cache_size} en mémoire, "
+                f"{self.writes} écritures en {self.transactions} transactions)")
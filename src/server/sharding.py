@@ -0,0 +1,564 @@
+"""
+Hébergement réparti - Les parties partagées entre plusieurs processus par leur id
+
+Un seul processus Python n'utilise qu'un cœur (GIL). Le ShardRouter lance N
+processus de travail, chacun avec son propre GameServer, et parle aux clients
+le même protocole que le GameServer (une requête JSON par ligne) : chaque
+requête est transmise au processus propriétaire de la partie.
+
+Le propriétaire d'une partie est choisi par hachage cohérent de son id
+(HashRing : blake2b, plusieurs points par processus). Ajouter un processus
+(add_worker) ne déplace que les parties dont le nouveau venu devient
+propriétaire, environ 1/N d'entre elles : elles sont exportées de l'ancien
+processus (StateCodec) et importées dans le nouveau, pendant que les requêtes
+qui les visent attendent la fin de leur déplacement. Les autres parties
+continuent d'être servies.
+
+Routeur et processus échangent des trames (longueur sur 4 octets puis lignes
+JSON séparées par des sauts de ligne) sur une paire de sockets locales. Les
+requêtes reçues pendant un même passage de la boucle sont regroupées en une
+trame par processus ; le processus répond par une trame dans le même ordre.
+
+create reçoit son id du routeur (la partie naît chez son propriétaire), stats
+et games interrogent tous les processus. subscribe n'est pas disponible : les
+clients demandent les deltas avec sync ou le champ since de play.
+
+Usage: python -m src.server.sharding --workers 4 --port 8765
+"""
+
+import argparse
+import asyncio
+import bisect
+import hashlib
+import json
+import multiprocessing
+import secrets
+import socket
+import struct
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Set
+from .game_server import LatencyTracker
+
+
+# Points de chaque processus sur l'anneau : plus il y en a, plus le partage est régulier
+RING_REPLICAS = 128
+
+# Opérations qui supposent une connexion permanente avec le processus propriétaire
+ROUTER_EXCLUDED_OPS = ("subscribe", "unsubscribe")
+
+# Parties déplacées par trame lors d'un rééquilibrage
+MIGRATION_BATCH = 64
+
+_FRAME = struct.Struct(">I")
+
+
+class HashRing:
+    """
+    Anneau de hachage cohérent : id de partie -> nom de processus
+    """
+
+    def __init__(self, nodes: Iterable[str] = (), replicas: int = RING_REPLICAS):
+        self.replicas = replicas
+        self.nodes: List[str] = []
+        self._points: List[int] = []
+        self._owners: List[str] = []
+        for node in nodes:
+            self.add(node)
+
+    @staticmethod
+    def hash(key: str) -> int:
+        """Position d'une clé sur l'anneau (crc32 répartit mal des clés presque identiques)"""
+        return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "big")
+
+    def add(self, node: str) -> None:
+        """Ajoute un processus (ses replicas points)"""
+        if node in self.nodes:
+            raise ValueError(f"Processus déjà présent : {node}")
+        self.nodes.append(node)
+        for i in range(self.replicas):
+            point = self.hash(f"{node}#{i}")
+            index = bisect.bisect(self._points, point)
+            self._points.insert(index, point)
+            self._owners.insert(index, node)
+
+    def copy(self) -> "HashRing":
+        """Copie indépendante"""
+        ring = HashRing(replicas=self.replicas)
+        ring.nodes = list(self.nodes)
+        ring._points = list(self._points)
+        ring._owners = list(self._owners)
+        return ring
+
+    def owner(self, key: str) -> str:
+        """Processus propriétaire : premier point de l'anneau après le hachage de la clé"""
+        if not self._points:
+            raise LookupError("Anneau vide")
+        index = bisect.bisect(self._points, self.hash(key))
+        return self._owners[index % len(self._owners)]
+
+    def __len__(self) -> int:
+        """Nombre de processus"""
+        return len(self.nodes)
+
+
+# === Processus de travail ===
+
+def _recv_exact(sock: socket.socket, size: int) -> Optional[bytes]:
+    """Lit exactement size octets (None si la socket est fermée)"""
+    chunks = []
+    while size:
+        chunk = sock.recv(min(size, 1 << 20))
+        if not chunk:
+            return None
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def _send_frame(sock: socket.socket, payload: bytes) -> None:
+    """Écrit une trame"""
+    sock.sendall(_FRAME.pack(len(payload)) + payload)
+
+
+def _worker_main(sock: socket.socket, max_turns: int) -> None:
+    """Boucle d'un processus de travail : une trame de requêtes, une trame de réponses"""
+    from ..simulation.engine import HeadlessEngine
+    from .game_server import GameServer
+
+    server = GameServer(HeadlessEngine(log_events=False), max_turns)
+    loop = asyncio.new_event_loop()
+
+    async def answer(line: bytes) -> bytes:
+        # Une requête qui échoue donne une réponse d'erreur, jamais l'arrêt du processus
+        try:
+            return json.dumps(await server.handle_line(line), separators=(",", ":")).encode("utf-8")
+        except Exception as exc:
+            return json.dumps({"ok": False, "error": f"Erreur interne ({type(exc).__name__}: {exc})"},
+                              separators=(",", ":")).encode("utf-8")
+
+    async def handle(lines: List[bytes]) -> bytes:
+        return b"\n".join([await answer(line) for line in lines])
+
+    _send_frame(sock, b"ready")
+    try:
+        while True:
+            header = _recv_exact(sock, _FRAME.size)
+            if header is None:
+                break
+            payload = _recv_exact(sock, _FRAME.unpack(header)[0])
+            if payload is None:
+                break
+            _send_frame(sock, loop.run_until_complete(handle(payload.split(b"\n"))))
+    except (ConnectionError, KeyboardInterrupt):
+        pass
+    finally:
+        loop.close()
+        sock.close()
+
+
+class WorkerChannel:
+    """
+    Côté routeur d'un processus de travail : envoi groupé et réponses dans l'ordre
+    """
+
+    def __init__(self, name: str, process, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.name = name
+        self.process = process
+        self.reader = reader
+        self.writer = writer
+        self._batch: List[bytes] = []
+        self._futures: List[asyncio.Future] = []
+        self._in_flight: Deque[List[asyncio.Future]] = deque()
+        self._reader_task: Optional[asyncio.Task] = None
+        self.requests = 0
+        self.frames = 0
+        self.closing = False
+        self.on_exit: Optional[Callable[["WorkerChannel"], None]] = None  # Appelé si le processus s'arrête
+
+    @classmethod
+    async def spawn(cls, name: str, max_turns: int) -> "WorkerChannel":
+        """Démarre un processus et attend qu'il ait chargé le moteur"""
+        front, back = socket.socketpair()
+        # spawn : même comportement sous Windows, rien d'hérité de la boucle du routeur
+        process = multiprocessing.get_context("spawn").Process(
+            target=_worker_main, args=(back, max_turns), name=name, daemon=True
+        )
+        process.start()
+        back.close()
+        reader, writer = await asyncio.open_connection(sock=front, limit=1 << 24)
+        channel = cls(name, process, reader, writer)
+        if await channel._read_frame() != b"ready":
+            raise ConnectionError(f"Processus {name} non démarré")
+        channel._reader_task = asyncio.get_running_loop().create_task(channel._read_loop())
+        return channel
+
+    async def _read_frame(self) -> bytes:
+        """Lit une trame"""
+        header = await self.reader.readexactly(_FRAME.size)
+        return await self.reader.readexactly(_FRAME.unpack(header)[0])
+
+    def submit(self, line: bytes) -> asyncio.Future:
+        """Ajoute une requête à la prochaine trame ; le futur reçoit la ligne de réponse"""
+        future = asyncio.get_running_loop().create_future()
+        if self._reader_task is not None and self._reader_task.done():
+            future.set_exception(ConnectionError(f"Processus {self.name} arrêté"))
+            return future
+        if not self._batch:
+            asyncio.get_running_loop().call_soon(self._flush)
+        self._batch.append(line)
+        self._futures.append(future)
+        return future
+
+    async def request(self, op: str, **fields) -> Dict[str, Any]:
+        """Requête du routeur lui-même, décodée"""
+        fields["op"] = op
+        return json.loads(await self.submit(json.dumps(fields, separators=(",", ":")).encode("utf-8")))
+
+    def _flush(self) -> None:
+        """Envoie les requêtes accumulées en une trame"""
+        batch, futures = self._batch, self._futures
+        self._batch, self._futures = [], []
+        payload = b"\n".join(batch)
+        self.writer.write(_FRAME.pack(len(payload)) + payload)
+        self._in_flight.append(futures)
+        self.requests += len(batch)
+        self.frames += 1
+
+    async def _read_loop(self) -> None:
+        """Distribue les réponses aux requêtes, trame par trame"""
+        try:
+            while True:
+                lines = (await self._read_frame()).split(b"\n")
+                for future, line in zip(self._in_flight.popleft(), lines):
+                    if not future.done():
+                        future.set_result(line)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            error = ConnectionError(f"Processus {self.name} arrêté")
+            for futures in list(self._in_flight) + [self._futures]:
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(error)
+            self._in_flight.clear()
+            if not self.closing and self.on_exit is not None:
+                self.on_exit(self)
+
+    async def close(self) -> None:
+        """Ferme la socket ; le processus s'arrête en voyant la fin de flux"""
+        self.closing = True
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except ConnectionError:
+            pass
+        if self._reader_task is not None:
+            await self._reader_task
+        await asyncio.get_running_loop().run_in_executor(None, self.process.join, 5)
+        if self.process.is_alive():
+            self.process.terminate()
+
+
+# === Routeur ===
+
+class ShardRouter:
+    """
+    Frontal qui répartit les parties entre des processus de travail
+    """
+
+    def __init__(self, workers: int = 2, max_turns: int = 200, replicas: int = RING_REPLICAS):
+        """workers processus au démarrage ; d'autres peuvent être ajoutés ensuite (add_worker)"""
+        self.initial_workers = max(1, workers)
+        self.max_turns = max_turns
+        self.ring = HashRing(replicas=replicas)
+        self.channels: Dict[str, WorkerChannel] = {}
+        self.latency = LatencyTracker()
+        self.moved = 0  # Parties déplacées par les rééquilibrages
+        self.restarts = 0  # Processus redémarrés après un arrêt inattendu
+        self.incidents: List[str] = []
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._names = 0
+        self._restarting: Dict[str, asyncio.Task] = {}
+        # Parties restées chez leur ancien propriétaire après un déplacement raté
+        self._pinned: Dict[str, str] = {}
+        # Rééquilibrage en cours : anneau précédent et parties déjà déplacées
+        self._previous_ring: Optional[HashRing] = None
+        self._migrated: Set[str] = set()
+        self._migration = asyncio.Condition()
+        self._rebalance_lock = asyncio.Lock()
+
+    # === Processus ===
+
+    async def _spawn(self, name: Optional[str] = None) -> WorkerChannel:
+        """Nouveau processus de travail, nommé dans l'ordre de création"""
+        if name is None:
+            name = f"shard-{self._names}"
+            self._names += 1
+        channel = await WorkerChannel.spawn(name, self.max_turns)
+        channel.on_exit = self._worker_exited
+        return channel
+
+    def _worker_exited(self, channel: WorkerChannel) -> None:
+        """Processus arrêté sans qu'on le lui demande : signalé puis remplacé"""
+        if self.channels.get(channel.name) is not channel or channel.name in self._restarting:
+            return
+        self.incidents.append(f"{channel.name} arrêté (code {channel.process.exitcode}) : "
+                              f"ses parties sont perdues, processus redémarré")
+        self._restarting[channel.name] = asyncio.get_running_loop().create_task(self._restart(channel.name))
+
+    async def _restart(self, name: str) -> None:
+        """Remplace un processus arrêté par un processus vide de même nom (même place sur l'anneau)"""
+        try:
+            channel = await self._spawn(name)
+            if name in self.channels:
+                self.channels[name] = channel
+                self.restarts += 1
+            else:
+                await channel.close()  # Routeur arrêté entre-temps
+        finally:
+            self._restarting.pop(name, None)
+
+    async def start_workers(self) -> None:
+        """Démarre les processus initiaux (en parallèle)"""
+        channels = await asyncio.gather(*(self._spawn() for _ in range(self.initial_workers)))
+        for channel in channels:
+            self.channels[channel.name] = channel
+            self.ring.add(channel.name)
+
+    async def add_worker(self) -> int:
+        """
+        Ajoute un processus et lui confie les parties qui lui reviennent
+
+        Retourne le nombre de parties déplacées. Seules les requêtes visant une
+        partie en cours de déplacement attendent.
+        """
+        async with self._rebalance_lock:
+            channel = await self._spawn()
+            previous = self.ring
+            ring = previous.copy()
+            ring.add(channel.name)
+
+            # Bascule : les nouvelles parties vont déjà au bon processus, celles qui
+            # changent de propriétaire attendent d'avoir été déplacées
+            self.channels[channel.name] = channel
+            self._previous_ring, self._migrated = previous, set()
+            self.ring = ring
+            moved = 0
+            leaving: Dict[str, List[str]] = {}
+            try:
+                listings = await asyncio.gather(*(self.channels[name].request("games") for name in previous.nodes))
+                for name, listing in zip(previous.nodes, listings):
+                    leaving[name] = [game_id for game_id in listing.get("games", ())
+                                     if game_id not in self._pinned and ring.owner(game_id) == channel.name]
+                for name, game_ids in leaving.items():
+                    for start in range(0, len(game_ids), MIGRATION_BATCH):
+                        moved += await self._migrate(self.channels[name], channel,
+                                                     game_ids[start:start + MIGRATION_BATCH])
+            except BaseException:
+                # Tout ce qui n'a pas été déplacé reste servi par son ancien propriétaire
+                for name, game_ids in leaving.items():
+                    for game_id in game_ids:
+                        if game_id not in self._migrated:
+                            self._pinned[game_id] = name
+                self.moved += moved
+                raise
+            finally:
+                async with self._migration:
+                    self._previous_ring = None
+                    self._migrated = set()
+                    self._migration.notify_all()
+            self.moved += moved
+            return moved
+
+    async def _migrate(self, source: WorkerChannel, target: WorkerChannel, game_ids: List[str]) -> int:
+        """
+        Exporte des parties de source et les importe dans target
+
+        Une partie n'est fermée chez source qu'une fois son import confirmé ;
+        sinon elle y reste et l'erreur est levée après le lot. Retourne le
+        nombre de parties déplacées.
+        """
+        exports = await asyncio.gather(*(source.request("export", game_id=game_id) for game_id in game_ids))
+        imports = []
+        failures = []
+        for game_id, exported in zip(game_ids, exports):
+            if not exported.pop("ok", False):
+                failures.append(f"{game_id} (export : {exported.get('error')})")
+                imports.append(None)
+                continue
+            imports.append(target.request("import", **exported))
+        results = await asyncio.gather(*(task for task in imports if task is not None))
+
+        done = []
+        replies = iter(results)
+        for game_id, task in zip(game_ids, imports):
+            if task is None:
+                continue
+            imported = next(replies)
+            if imported.get("ok"):
+                done.append(game_id)
+            else:
+                failures.append(f"{game_id} (import : {imported.get('error')})")
+        closed = await asyncio.gather(*(source.request("close", game_id=game_id) for game_id in done))
+        for game_id, reply in zip(done, closed):
+            if not reply.get("ok"):
+                failures.append(f"{game_id} (fermeture : {reply.get('error')})")
+
+        async with self._migration:
+            self._migrated.update(done)
+            self._migration.notify_all()
+        if failures:
+            raise RuntimeError("Déplacement impossible : " + ", ".join(failures))
+        return len(done)
+
+    async def _owner(self, game_id: str) -> WorkerChannel:
+        """Processus propriétaire, une fois la partie arrivée chez lui si elle est en déplacement"""
+        pinned = self._pinned.get(game_id)
+        if pinned is not None:
+            return self.channels[pinned]
+        previous = self._previous_ring
+        if previous is not None and previous.owner(game_id) != self.ring.owner(game_id):
+            async with self._migration:
+                await self._migration.wait_for(
+                    lambda: self._previous_ring is None or game_id in self._migrated
+                )
+        return self.channels[self.ring.owner(game_id)]
+
+    # === Réseau ===
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8765) -> asyncio.AbstractServer:
+        """Démarre les processus puis ouvre le port d'écoute (port 0 : choisi par le système)"""
+        if not self.channels:
+            await self.start_workers()
+        self._server = await asyncio.start_server(self.handle_client, host, port, limit=1 << 20)
+        return self._server
+
+    @property
+    def port(self) -> int:
+        """Port effectivement ouvert"""
+        return self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self, host: str = "127.0.0.1", port: int = 8765) -> None:
+        """Sert jusqu'à l'annulation"""
+        server = await self.start(host, port)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            await self.stop()
+
+    async def stop(self) -> None:
+        """Ferme le port d'écoute et arrête les processus"""
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        channels, self.channels = list(self.channels.values()), {}
+        await asyncio.gather(*(channel.close() for channel in channels))
+        await asyncio.gather(*self._restarting.values(), return_exceptions=True)
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Transmet les requêtes d'une connexion, une ligne à la fois, dans l'ordre"""
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                writer.write(await self.route(line.rstrip(b"\r\n")) + b"\n")
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def route(self, line: bytes) -> bytes:
+        """Réponse (ligne JSON) à une requête, obtenue du processus propriétaire"""
+        start = time.perf_counter()
+        try:
+            request = json.loads(line)
+        except ValueError:
+            return self._error(None, "JSON invalide")
+        if not isinstance(request, dict):
+            return self._error(None, "Requête invalide")
+
+        op = request.get("op")
+        try:
+            if op in ROUTER_EXCLUDED_OPS:
+                return self._error(request, f"Opération indisponible en mode réparti : {op}")
+            if op == "create":
+                # L'id est tiré ici pour que la partie naisse chez son propriétaire
+                request["game_id"] = game_id = f"game_{secrets.token_hex(6)}"
+                channel = await self._owner(game_id)
+                response = await channel.submit(json.dumps(request, separators=(",", ":")).encode("utf-8"))
+            elif op in ("stats", "games"):
+                response = json.dumps(await self._gather(request), separators=(",", ":")).encode("utf-8")
+            elif isinstance(request.get("game_id"), str):
+                channel = await self._owner(request["game_id"])
+                response = await channel.submit(line)
+                if op == "close":
+                    self._pinned.pop(request["game_id"], None)
+            else:
+                # Requête incomplète : le GameServer d'un processus produit l'erreur
+                response = await next(iter(self.channels.values())).submit(line)
+        except ConnectionError as exc:
+            return self._error(request, str(exc))
+        self.latency.add(op if isinstance(op, str) else "?", (time.perf_counter() - start) * 1000)
+        return response
+
+    async def _gather(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Opérations qui concernent tous les processus : stats et liste des parties"""
+        names = list(self.channels)
+        replies = await asyncio.gather(*(self.channels[name].request(request["op"]) for name in names))
+        if request["op"] == "games":
+            response = {"games": [game_id for reply in replies for game_id in reply.get("games", ())]}
+        else:
+            response = {
+                "games": sum(reply.get("games", 0) for reply in replies),
+                "latency_ms": self.latency.report(),
+                "shards": [
+                    {"worker": name, "games": reply.get("games", 0), "requests": self.channels[name].requests,
+                     "frames": self.channels[name].frames, "latency_ms": reply.get("latency_ms", {})}
+                    for name, reply in zip(names, replies)
+                ],
+                "moved": self.moved,
+                "restarts": self.restarts,
+                "incidents": self.incidents[-20:],
+            }
+        response["ok"] = True
+        if "id" in request:
+            response["id"] = request["id"]
+        return response
+
+    @staticmethod
+    def _error(request: Optional[Dict[str, Any]], message: str) -> bytes:
+        """Ligne de réponse d'erreur"""
+        response = {"ok": False, "error": message}
+        if request is not None and "id" in request:
+            response["id"] = request["id"]
+        return json.dumps(response, separators=(",", ":")).encode("utf-8")
+
+    def __str__(self) -> str:
+        """Représentation textuelle du routeur"""
+        return f"ShardRouter({len(self.channels)} processus, {self.moved} parties déplacées)"
+
+
+def main() -> None:
+    """Point d'entrée du serveur réparti"""
+    parser = argparse.ArgumentParser(description="Serveur de parties réparti sur plusieurs processus")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=multiprocessing.cpu_count(), help="Processus de travail")
+    parser.add_argument("--max-turns", type=int, default=200, help="Limite de tours avant match nul")
+    args = parser.parse_args()
+
+    router = ShardRouter(args.workers, args.max_turns)
+    print(f"🎲 Serveur réparti ({args.workers} processus) sur {args.host}:{args.port}")
+    try:
+        asyncio.run(router.serve_forever(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
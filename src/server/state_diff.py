@@ -0,0 +1,226 @@
+"""
+Différences d'état - Versions successives d'une partie transmises comme des deltas
+
+L'état suivi est celui de Game.get_game_state(full=True). Après chaque coup,
+update() compare les champs qui peuvent changer (compteurs, zones, plateau)
+avec leur valeur précédente et produit la liste des opérations qui mènent de
+l'une à l'autre ; la version de la partie augmente de 1 si quelque chose a changé.
+
+Sans autre information, update() relit tout l'état suivi. Si l'appelant
+connaît les joueurs touchés par le coup (ChangeRecorder, écouteur du
+TurnManager), seuls leurs champs et ceux de la partie sont relus.
+
+Opérations (listes JSON, chemin = clés et index dans l'état complet) :
+
+    ["set", chemin, valeur]                             champ remplacé (pouvoir, tour...)
+    ["splice", chemin, début, nombre, [ids]]            liste modifiée (pioche, héros posé...)
+    ["move", chemin_source, index, chemin_cible, index, id]
+                                                        carte passée d'une zone à une autre
+
+Un client qui connaît la version v reçoit les opérations des versions
+suivantes ; s'il est trop en retard (historique dépassé) ou ne connaît rien,
+il reçoit l'état complet.
+"""
+
+from collections import deque
+from typing import Any, Collection, Deque, Dict, Hashable, List, Optional, Set, Tuple
+from ..core.enums import ActionType
+from ..core.game import Game
+from ..players.player import Player
+
+
+# Zones de get_game_state(full=True), dans l'ordre
+ZONE_NAMES = ("hand", "villain_deck", "fate_deck", "discard", "fate_discard", "allies", "items", "conditions")
+
+Path = Tuple[Hashable, ...]
+
+
+def capture(game: Game, players: Optional[Collection[str]] = None) -> Dict[Path, Any]:
+    """
+    Champs modifiables de l'état complet, par chemin ; les listes sont des tuples
+
+    players (ids) limite la lecture aux joueurs indiqués ; les champs de la
+    partie sont toujours lus.
+    """
+    fields: Dict[Path, Any] = {
+        ("state",): game.state.value,
+        ("turn_number",): game.turn_number,
+        ("current_player",): game.current_player_index,
+        ("winner",): game.winner.id if game.winner else None,
+    }
+    for i, p in enumerate(game.players):
+        if players is not None and p.id not in players:
+            continue
+        fields["players", i, "power"] = p.power
+        fields["players", i, "hand_size"] = len(p.hand)
+        fields["players", i, "location"] = p.current_location
+        fields["players", i, "has_won"] = p.has_won
+        fields["players", i, "turn_phase"] = p.turn_phase.value
+        fields["players", i, "actions_remaining"] = p.actions_remaining
+        zones = (p.hand, p.villain_deck.cards, p.fate_deck.cards, p.discard_pile, p.fate_discard,
+                 p.allies_in_play, p.items_in_play, p.conditions_in_play)
+        for name, cards in zip(ZONE_NAMES, zones):
+            fields["players", i, "zones", name] = tuple(card.id for card in cards)
+        for k, location in enumerate(p.board_locations):
+            fields["players", i, "board", k, "heroes"] = tuple(location.heroes_present)
+            fields["players", i, "board", k, "items"] = tuple(location.items_present)
+            fields["players", i, "board", k, "locked"] = location.locked
+    return fields
+
+
+def _splice(old: tuple, new: tuple) -> Tuple[int, int, tuple]:
+    """Plus petite modification (début, nombre supprimé, insérés) entre deux tuples"""
+    prefix = 0
+    limit = min(len(old), len(new))
+    while prefix < limit and old[prefix] == new[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < limit - prefix and old[-1 - suffix] == new[-1 - suffix]:
+        suffix += 1
+    return prefix, len(old) - prefix - suffix, new[prefix:len(new) - suffix]
+
+
+def diff(old: Dict[Path, Any], new: Dict[Path, Any]) -> List[list]:
+    """Opérations qui transforment old en new (mêmes chemins)"""
+    ops: List[list] = []
+    removed: Dict[Tuple[Any, str], Tuple[Path, int]] = {}  # (joueur, carte) -> zone et index retirés
+    added: Dict[Tuple[Any, str], Tuple[Path, int]] = {}
+    splices: Dict[Path, list] = {}
+
+    for path, value in new.items():
+        previous = old.get(path)
+        if previous == value:
+            continue
+        if isinstance(value, tuple) and isinstance(previous, tuple):
+            start, count, inserted = _splice(previous, value)
+            op = ["splice", list(path), start, count, list(inserted)]
+            splices[path] = op
+            if path[2] == "zones":
+                # Candidats au déplacement d'une seule carte entre deux zones du même joueur
+                if count == 1 and not inserted:
+                    removed.setdefault((path[1], previous[start]), (path, start))
+                elif count == 0 and len(inserted) == 1:
+                    added.setdefault((path[1], inserted[0]), (path, start))
+            ops.append(op)
+        else:
+            ops.append(["set", list(path), list(value) if isinstance(value, tuple) else value])
+
+    for key, (source, index) in removed.items():
+        target = added.get(key)
+        if target is None or target[0] == source:
+            continue
+        ops.remove(splices[source])
+        ops.remove(splices[target[0]])
+        ops.append(["move", list(source), index, list(target[0]), target[1], key[1]])
+    return ops
+
+
+def _resolve(state: Dict[str, Any], path: List[Hashable]) -> Tuple[Any, Hashable]:
+    """Conteneur et clé désignés par un chemin"""
+    container = state
+    for key in path[:-1]:
+        container = container[key]
+    return container, path[-1]
+
+
+def apply_delta(state: Dict[str, Any], ops: List[list]) -> Dict[str, Any]:
+    """Applique des opérations à un état complet (modifié sur place et retourné)"""
+    for op in ops:
+        kind = op[0]
+        if kind == "set":
+            container, key = _resolve(state, op[1])
+            container[key] = op[2]
+        elif kind == "splice":
+            container, key = _resolve(state, op[1])
+            start, count = op[2], op[3]
+            container[key][start:start + count] = op[4]
+        elif kind == "move":
+            container, key = _resolve(state, op[1])
+            del container[key][op[2]]
+            container, key = _resolve(state, op[3])
+            container[key].insert(op[4], op[5])
+        else:
+            raise ValueError(f"Opération de delta inconnue : {kind}")
+    return state
+
+
+class ChangeRecorder:
+    """
+    Écouteur du TurnManager : joueurs touchés par les coups joués pendant un enregistrement
+
+    Le joueur qui agit et la cible d'un Destin sont notés ; l'appelant ajoute
+    le joueur dont le tour commence (start_turn ne prévient pas les écouteurs).
+    """
+
+    def __init__(self):
+        self.players: Optional[Set[str]] = None  # None : pas d'enregistrement en cours
+
+    def __call__(self, player: Player, kind: str, action_type: Optional[ActionType], kwargs: Dict[str, Any]) -> None:
+        if self.players is None:
+            return
+        self.players.add(player.id)
+        target = kwargs.get("target_player")
+        if target is not None:
+            self.players.add(getattr(target, "id", target))
+
+    def start(self) -> None:
+        """Commence un enregistrement"""
+        self.players = set()
+
+    def stop(self) -> Set[str]:
+        """Termine l'enregistrement ; retourne les ids des joueurs touchés"""
+        players, self.players = self.players or set(), None
+        return players
+
+
+class StateTracker:
+    """
+    Version et historique des deltas d'une partie
+    """
+
+    def __init__(self, game: Game, history: int = 256):
+        """Version 0 = état actuel ; history versions sont gardées pour les retardataires"""
+        self.version = 0
+        self._fields = capture(game)
+        self._history: Deque[Tuple[int, List[list]]] = deque(maxlen=history)
+
+    def update(self, game: Game, players: Optional[Collection[str]] = None) -> List[list]:
+        """
+        Compare la partie à la dernière version ; crée une version si elle a changé
+
+        players : ids des seuls joueurs modifiés depuis la dernière version
+        (None : tous les joueurs sont relus).
+        """
+        fields = capture(game, players)
+        ops = diff(self._fields, fields)
+        if ops:
+            self.version += 1
+            self._history.append((self.version, ops))
+            self._fields.update(fields)
+        return ops
+
+    def changes_since(self, game: Game, version: Optional[int], refresh: bool = True) -> Dict[str, Any]:
+        """
+        Ce qu'un client à la version donnée doit recevoir
+
+        {"version": v, "ops": [...]} si l'historique couvre l'écart, sinon
+        {"version": v, "full": état complet}. refresh=False si la version
+        vient d'être mise à jour par update().
+        """
+        if refresh:
+            self.update(game)
+        if version == self.version:
+            return {"version": self.version, "ops": []}
+        oldest = self._history[0][0] if self._history else self.version + 1
+        if version is None or version > self.version or version < oldest - 1:
+            return {"version": self.version, "full": game.get_game_state(full=True)}
+
+        ops: List[list] = []
+        for number, delta in self._history:
+            if number > version:
+                ops.extend(delta)
+        return {"version": self.version, "ops": ops}
+
+    def __str__(self) -> str:
+        """Représentation textuelle du suivi"""
+        return f"StateTracker(version {self.version}, {len(self._history)} deltas en mémoire)"
@@ -0,0 +1,400 @@
+"""
+Serveur web local - Fichiers de web/ et API JSON du moteur sur un seul port
+
+Remplace python -m http.server pour l'interface web :
+
+- une connexion par fil (ThreadingHTTPServer), connexions persistantes HTTP/1.1 ;
+- tous les fichiers sont lus en mémoire au démarrage, avec leur ETag (empreinte
+  du contenu) et leur Last-Modified ; If-None-Match / If-Modified-Since
+  renvoient 304 sans corps ;
+- les fichiers texte sont compressés (gzip) une fois pour toutes, servis aux
+  clients qui annoncent Accept-Encoding: gzip ;
+- un fichier modifié sur disque est relu à la requête suivante (check_changes).
+
+L'API passe par le GameServer (mêmes opérations que le protocole TCP, voir
+game_server) ; ses coroutines tournent dans une boucle asyncio dédiée :
+
+    POST /api/<op>     corps JSON : champs de la requête (game_id, move...)
+    GET  /api/<op>     champs dans la chaîne de requête (?game_id=...&full=1),
+                       pour les seules lectures (HTTP_READ_OPS) ; les autres
+                       opérations répondent 405 et demandent POST
+
+    POST /api/create   {"villains": ["maleficent", "jafar"], "seed": 1}
+    GET  /api/moves?game_id=game_5f0c2a9e1b3d
+    POST /api/play     {"game_id": ..., "player_id": "player_1", "move": {...}, "since": 12}
+    GET  /api/sync?game_id=game_5f0c2a9e1b3d&version=12
+
+Les abonnements (subscribe) n'ont pas de sens sans connexion permanente : un
+client web interroge sync avec sa version pour recevoir les deltas.
+
+Usage: python -m src.server.web_server --port 8000 [--root web]
+"""
+
+import argparse
+import asyncio
+import email.utils
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import stat
+import threading
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+from urllib.parse import parse_qsl, unquote, urlsplit
+from .game_server import GameServer
+
+
+WEB_ROOT = os.path.join(os.path.dirname(__file__), "..", "..", "web")
+
+# Types compressés ; en dessous de GZIP_MIN_SIZE octets, la compression ne vaut pas l'en-tête
+COMPRESSIBLE = ("text/", "application/javascript", "application/json", "image/svg+xml")
+GZIP_MIN_SIZE = 512
+
+# Opérations du GameServer refusées en HTTP (elles supposent une connexion permanente)
+HTTP_EXCLUDED_OPS = ("subscribe", "unsubscribe")
+
+# Opérations sans effet, seules accessibles en GET (un lien ou un préchargement ne modifie rien)
+HTTP_READ_OPS = ("state", "moves", "sync", "games", "stats")
+
+MAX_BODY = 1 << 20
+
+
+class StaticFile(NamedTuple):
+    """Fichier servi depuis la mémoire"""
+    body: bytes
+    gzip: Optional[bytes]   # Variante compressée, None si elle ne gagne rien
+    etag: str
+    last_modified: str
+    mtime: float
+    size: int
+    content_type: str
+
+
+def _load_file(path: str) -> StaticFile:
+    """Lit un fichier et prépare ses en-têtes et sa variante compressée"""
+    info = os.stat(path)
+    with open(path, "rb") as f:
+        body = f.read()
+    content_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+    if content_type.startswith("text/") or content_type == "application/javascript":
+        content_type += "; charset=utf-8"
+
+    compressed = None
+    if len(body) >= GZIP_MIN_SIZE and content_type.startswith(COMPRESSIBLE):
+        compressed = gzip.compress(body, compresslevel=9, mtime=0)
+        if len(compressed) >= len(body) * 0.9:
+            compressed = None
+
+    return StaticFile(
+        body, compressed,
+        '"' + hashlib.blake2b(body, digest_size=12).hexdigest() + '"',
+        email.utils.formatdate(info.st_mtime, usegmt=True),
+        info.st_mtime, info.st_size, content_type
+    )
+
+
+class StaticFiles:
+    """
+    Cache en mémoire des fichiers d'un dossier, chargés au démarrage
+    """
+
+    def __init__(self, root: str, check_changes: bool = True):
+        """check_changes : compare date et taille à chaque requête et relit le fichier modifié"""
+        self.root = os.path.realpath(root)
+        self.check_changes = check_changes
+        self.files: Dict[str, StaticFile] = {}
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self) -> None:
+        """(Re)lit tout le dossier"""
+        files = {}
+        for directory, subdirectories, names in os.walk(self.root):
+            subdirectories[:] = [d for d in subdirectories if not d.startswith(".")]
+            for name in names:
+                if name.startswith("."):
+                    continue
+                path = os.path.join(directory, name)
+                key = os.path.relpath(path, self.root).replace(os.sep, "/")
+                files[key] = _load_file(path)
+        self.files = files
+
+    def get(self, url_path: str) -> Optional[StaticFile]:
+        """Fichier désigné par un chemin d'URL (dossier : son index.html)"""
+        key = unquote(url_path).lstrip("/")
+        if key == "" or key.endswith("/"):
+            key += "index.html"
+        entry = self.files.get(key)
+        if not self.check_changes:
+            return entry
+
+        # Fichier ajouté, modifié ou supprimé depuis le chargement ; rien hors du dossier
+        path = os.path.realpath(os.path.join(self.root, *key.split("/")))
+        if not path.startswith(self.root + os.sep):
+            return None
+        try:
+            info = os.stat(path)
+        except OSError:
+            info = None
+        if info is None or not stat.S_ISREG(info.st_mode):
+            if entry is not None:
+                with self._lock:
+                    self.files.pop(key, None)
+            return None
+        if entry is not None and info.st_mtime == entry.mtime and info.st_size == entry.size:
+            return entry
+        entry = _load_file(path)
+        with self._lock:
+            self.files[key] = entry
+        return entry
+
+    def __len__(self) -> int:
+        """Nombre de fichiers en mémoire"""
+        return len(self.files)
+
+
+def accepts_gzip(header: Optional[str]) -> bool:
+    """Accept-Encoding autorise gzip (q différent de 0)"""
+    for part in (header or "").split(","):
+        name, _, params = part.strip().partition(";")
+        if name.strip().lower() in ("gzip", "*"):
+            quality = params.strip()
+            if not quality.startswith("q="):
+                return True
+            try:
+                return float(quality[2:]) > 0
+            except ValueError:
+                return False
+    return False
+
+
+def not_modified(entry: StaticFile, if_none_match: Optional[str], if_modified_since: Optional[str]) -> bool:
+    """Requête conditionnelle satisfaite par la version en cache du client"""
+    if if_none_match is not None:
+        tags = [tag.strip() for tag in if_none_match.split(",")]
+        return "*" in tags or entry.etag in tags or "W/" + entry.etag in tags
+    if if_modified_since is not None:
+        try:
+            since = email.utils.parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+        return int(entry.mtime) <= since
+    return False
+
+
+def _query_value(value: str) -> Any:
+    """Valeur de chaîne de requête : nombre ou booléen JSON si elle en est un, sinon texte"""
+    try:
+        return json.loads(value)
+    except ValueError:
+        return value
+
+
+class WebRequestHandler(BaseHTTPRequestHandler):
+    """Requêtes HTTP : /api/<op> vers le GameServer, le reste depuis le cache de fichiers"""
+
+    protocol_version = "HTTP/1.1"
+    server_version = "VillainousWeb/1.0"
+    server: "WebServer"
+
+    def do_GET(self) -> None:
+        path, _, query = self.path.partition("?")
+        if path.startswith("/api/"):
+            op = path[len("/api/"):]
+            if op not in HTTP_READ_OPS and op not in HTTP_EXCLUDED_OPS:
+                self._json(HTTPStatus.METHOD_NOT_ALLOWED, {"ok": False, "error": f"{op} demande POST"},
+                           [("Allow", "POST")])
+                return
+            fields = {name: _query_value(value) for name, value in parse_qsl(query)}
+            self._api(op, fields)
+        else:
+            self._static(path, head=False)
+
+    def do_HEAD(self) -> None:
+        self._static(self.path.partition("?")[0], head=True)
+
+    def do_POST(self) -> None:
+        path = urlsplit(self.path).path
+        if not path.startswith("/api/"):
+            self._json(HTTPStatus.METHOD_NOT_ALLOWED, {"ok": False, "error": "POST réservé à /api/"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            length = -1
+        if length < 0:
+            self._json(HTTPStatus.BAD_REQUEST, {"ok": False, "error": "Content-Length invalide"})
+            self.close_connection = True
+            return
+        if length > MAX_BODY:
+            self._json(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {"ok": False, "error": "Requête trop grande"})
+            self.close_connection = True
+            return
+        try:
+            fields = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            self._json(HTTPStatus.BAD_REQUEST, {"ok": False, "error": "JSON invalide"})
+            return
+        if not isinstance(fields, dict):
+            self._json(HTTPStatus.BAD_REQUEST, {"ok": False, "error": "Requête invalide"})
+            return
+        self._api(path[len("/api/"):], fields)
+
+    # === Fichiers ===
+
+    def _static(self, path: str, head: bool) -> None:
+        """Sert un fichier du cache, compressé et conditionnel si possible"""
+        entry = self.server.static.get(path)
+        if entry is None:
+            self._json(HTTPStatus.NOT_FOUND, {"ok": False, "error": f"Introuvable : {path}"})
+            return
+
+        headers = [("ETag", entry.etag), ("Last-Modified", entry.last_modified),
+                   ("Cache-Control", "no-cache")]
+        if entry.gzip is not None:
+            headers.append(("Vary", "Accept-Encoding"))
+        if not_modified(entry, self.headers.get("If-None-Match"), self.headers.get("If-Modified-Since")):
+            self._send(HTTPStatus.NOT_MODIFIED, headers, b"", head=True)
+            return
+
+        body = entry.body
+        if entry.gzip is not None and accepts_gzip(self.headers.get("Accept-Encoding")):
+            body = entry.gzip
+            headers.append(("Content-Encoding", "gzip"))
+        headers.append(("Content-Type", entry.content_type))
+        self._send(HTTPStatus.OK, headers, body, head)
+
+    # === API ===
+
+    def _api(self, op: str, fields: Dict[str, Any]) -> None:
+        """Exécute une opération du GameServer"""
+        if op in HTTP_EXCLUDED_OPS:
+            self._json(HTTPStatus.BAD_REQUEST, {"ok": False, "error": f"Opération indisponible en HTTP : {op}"})
+            return
+        fields["op"] = op
+        try:
+            response = self.server.call(fields)
+        except TimeoutError:
+            self._json(HTTPStatus.INTERNAL_SERVER_ERROR, {"ok": False, "error": f"Délai dépassé : {op}"})
+            return
+        except Exception as exc:
+            self._json(HTTPStatus.INTERNAL_SERVER_ERROR,
+                       {"ok": False, "error": f"Erreur interne ({type(exc).__name__}: {exc})"})
+            return
+        status = HTTPStatus.OK if response.get("ok") else HTTPStatus.BAD_REQUEST
+        self._json(status, response)
+
+    def _json(self, status: HTTPStatus, content: Dict[str, Any], extra_headers=()) -> None:
+        """Réponse JSON, compressée si elle est grande et que le client l'accepte"""
+        body = json.dumps(content, separators=(",", ":")).encode("utf-8")
+        headers = [("Content-Type", "application/json; charset=utf-8"), ("Cache-Control", "no-store")]
+        headers.extend(extra_headers)
+        if len(body) >= GZIP_MIN_SIZE and accepts_gzip(self.headers.get("Accept-Encoding")):
+            body = gzip.compress(body, compresslevel=5)
+            headers.append(("Content-Encoding", "gzip"))
+        self._send(status, headers, body, head=False)
+
+    def _send(self, status: HTTPStatus, headers, body: bytes, head: bool) -> None:
+        """Écrit le statut, les en-têtes et (sauf HEAD ou 304) le corps"""
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        if status != HTTPStatus.NOT_MODIFIED:
+            self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if not head:
+            self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+
+class WebServer(ThreadingHTTPServer):
+    """
+    Serveur HTTP de l'interface web et de l'API du moteur
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int] = ("127.0.0.1", 8000), root: str = WEB_ROOT,
+                 games: Optional[GameServer] = None, check_changes: bool = True, quiet: bool = False):
+        """
+        root : dossier servi (web/ par défaut), chargé en mémoire tout de suite ;
+        games : GameServer qui héberge les parties (créé au besoin)
+        """
+        self.static = StaticFiles(root, check_changes)
+        self.games = games or GameServer()
+        self.quiet = quiet
+        # Boucle asyncio du GameServer : les fils HTTP y soumettent les requêtes
+        self.loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(target=self.loop.run_forever, name="web-api-loop", daemon=True)
+        self._loop_thread.start()
+        super().__init__(address, WebRequestHandler)
+
+    @property
+    def port(self) -> int:
+        """Port effectivement ouvert"""
+        return self.server_address[1]
+
+    def call(self, request: Dict[str, Any], timeout: float = 30.0) -> Dict[str, Any]:
+        """Exécute une requête du GameServer depuis un fil HTTP"""
+        future = asyncio.run_coroutine_threadsafe(self.games.handle_request(request), self.loop)
+        try:
+            return future.result(timeout)
+        except TimeoutError:
+            future.cancel()  # La requête abandonnée ne doit pas continuer dans la boucle
+            raise
+
+    def start(self) -> threading.Thread:
+        """Sert dans un fil en arrière-plan (tests, intégration)"""
+        thread = threading.Thread(target=self.serve_forever, name="web-server", daemon=True)
+        thread.start()
+        return thread
+
+    def server_close(self) -> None:
+        """Ferme le port puis arrête la boucle de l'API"""
+        super().server_close()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._loop_thread.join()
+        self.loop.close()
+
+    def __str__(self) -> str:
+        """Représentation textuelle du serveur"""
+        return f"WebServer({self.static.root}, {len(self.static)} fichiers, port {self.port})"
+
+
+def main() -> None:
+    """Point d'entrée du serveur web"""
+    parser = argparse.ArgumentParser(description="Serveur web local de Disney Villainous")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--root", default=WEB_ROOT, help="Dossier servi")
+    parser.add_argument("--max-turns", type=int, default=200, help="Limite de tours avant match nul")
+    parser.add_argument("--sessions", default=None, help="Base SQLite où enregistrer les parties")
+    parser.add_argument("--quiet", action="store_true", help="Ne pas journaliser les requêtes")
+    args = parser.parse_args()
+
+    from ..simulation.engine import HeadlessEngine
+    from .session_store import SessionStore
+
+    engine = HeadlessEngine(log_events=False)
+    store = SessionStore(args.sessions, engine) if args.sessions else None
+    server = WebServer((args.host, args.port), args.root, GameServer(engine, args.max_turns, store),
+                       quiet=args.quiet)
+    print(f"🌐 Interface web sur http://{args.host}:{server.port} ({len(server.static)} fichiers en mémoire)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if store:
+            store.close()
+
+
+if __name__ == "__main__":
+    main()
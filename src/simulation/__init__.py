@@ -0,0 +1,9 @@
+"""Init file pour le module simulation"""
+
+from .policies import Policy, RandomPolicy, GreedyPolicy, create_policy
+from .engine import HeadlessEngine, GameResult, GameTask
+from .batch import BatchSimulator, SimulationReport
+from .mcts import MCTSPolicy, SearchStats
+from .replay import Replay, ReplayCodec, ReplayRecorder, ReplayPlayer, ReplayWriter, ReplayError, iter_replays
+from .persistence import GameStore, GameJournal
+from .state_codec import StateCodec, StateHeader
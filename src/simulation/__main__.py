@@ -0,0 +1,64 @@
+"""
+Lance une simulation par lots depuis la ligne de commande
+
+Exemple: python -m src.simulation --games 10000 --villains maleficent jafar --policies greedy random
+         python -m src.simulation --games 100000 --replays parties.vra
+"""
+
+import argparse
+from ..core.enums import VillainType
+from .batch import BatchSimulator
+from .engine import HeadlessEngine
+from .policies import POLICIES
+from .replay import ReplayWriter
+
+
+def main() -> None:
+    """Point d'entrée de la simulation"""
+    parser = argparse.ArgumentParser(description="Simulation de parties Disney Villainous sans interface")
+    parser.add_argument("--games", type=int, default=1000, help="Nombre de parties à jouer")
+    parser.add_argument("--villains", nargs="+", default=["maleficent", "jafar"],
+                        choices=[villain.value for villain in VillainType], help="Méchants de chaque partie")
+    parser.add_argument("--policies", nargs="+", default=["random"], choices=sorted(POLICIES),
+                        help="Politique de chaque joueur (réutilisées en boucle)")
+    parser.add_argument("--workers", type=int, default=None, help="Nombre de processus (0 = sans pool)")
+    parser.add_argument("--chunk-size", type=int, default=16, help="Parties envoyées par paquet à un processus")
+    parser.add_argument("--max-turns", type=int, default=200, help="Limite de tours avant match nul")
+    parser.add_argument("--seed", type=int, default=0, help="Graine de la première partie")
+    parser.add_argument("--verbose", action="store_true", help="Affiche chaque partie terminée")
+    parser.add_argument("--log-events", action="store_true", help="Garde le journal d'événements des parties")
+    parser.add_argument("--replays", default=None, help="Archive où écrire le replay de chaque partie")
+    args = parser.parse_args()
+
+    simulator = BatchSimulator(
+        villains=args.villains,
+        policies=args.policies,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        max_turns=args.max_turns,
+        seed=args.seed,
+        log_events=args.log_events,
+        record=args.replays is not None
+    )
+
+    print(f"🎲 {simulator} - {args.games} parties")
+    archive = open(args.replays, "wb") if args.replays else None
+    writer = ReplayWriter(archive, HeadlessEngine(log_events=False).replay_codec) if archive else None
+    try:
+        for result in simulator.run(args.games):
+            if writer:
+                writer.write(result.replay)
+            if args.verbose:
+                winner = result.winner_villain or "aucun"
+                print(f"  Partie {result.game_index}: vainqueur {winner} en {result.turns} tours")
+    finally:
+        if archive:
+            archive.close()
+
+    print(simulator.report)
+    if writer:
+        print(f"Replays : {writer.count} parties dans {args.replays}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""
+Simulation par lots - Répartit des milliers de parties sur un pool de processus
+"""
+
+import os
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Sequence
+from ..core.catalog import Catalog
+from ..core.rng import derive_seed
+from .engine import DEFAULT_DATA_ROOT, GameResult, GameTask, HeadlessEngine
+
+
+# Moteur propre à chaque processus de travail, créé par _init_worker
+_worker_engine: Optional[HeadlessEngine] = None
+
+
+def _init_worker(data_root: str, log_events: bool) -> None:
+    """Charge les données une seule fois par processus de travail"""
+    global _worker_engine
+    _worker_engine = HeadlessEngine(data_root, log_events)
+
+
+def _run_chunk(tasks: List[GameTask]) -> List[GameResult]:
+    """Simule un paquet de parties dans un processus de travail"""
+    return [_worker_engine.run_task(task) for task in tasks]
+
+
+@dataclass
+class SimulationReport:
+    """Statistiques agrégées d'une simulation par lots"""
+    games: int = 0
+    draws: int = 0
+    total_turns: int = 0
+    elapsed: float = 0.0
+    workers: int = 1
+    wins: Counter = field(default_factory=Counter)
+
+    def add(self, result: GameResult) -> None:
+        """Intègre le résultat d'une partie"""
+        self.games += 1
+        self.total_turns += result.turns
+        if result.is_draw:
+            self.draws += 1
+        else:
+            self.wins[result.winner_villain] += 1
+
+    @property
+    def games_per_second(self) -> float:
+        """Débit total en parties par seconde"""
+        return self.games / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def games_per_second_per_core(self) -> float:
+        """Débit en parties par seconde et par processus"""
+        return self.games_per_second / max(1, self.workers)
+
+    @property
+    def average_turns(self) -> float:
+        """Nombre moyen de tours par partie"""
+        return self.total_turns / self.games if self.games else 0.0
+
+    def win_rates(self) -> Dict[str, float]:
+        """Taux de victoire par méchant"""
+        if not self.games:
+            return {}
+        return {villain: wins / self.games for villain, wins in self.wins.items()}
+
+    def __str__(self) -> str:
+        """Résumé lisible de la simulation"""
+        lines = [
+            f"Parties: {self.games} ({self.draws} sans vainqueur) - {self.average_turns:.1f} tours en moyenne",
+            f"Durée: {self.elapsed:.2f}s - {self.games_per_second:.1f} parties/s "
+            f"({self.games_per_second_per_core:.1f} parties/s/cœur sur {self.workers} processus)",
+        ]
+        for villain, rate in sorted(self.win_rates().items()):
+            lines.append(f"  {villain}: {rate * 100:.1f}% de victoires")
+        return "\n".join(lines)
+
+
+class BatchSimulator:
+    """
+    Joue N parties en parallèle et renvoie les résultats au fil de l'eau
+    """
+
+    def __init__(self, villains: Sequence[str] = ("maleficent", "jafar"),
+                 policies: Sequence[str] = ("random",), workers: Optional[int] = None,
+                 chunk_size: int = 16, max_turns: int = 200, seed: int = 0,
+                 data_root: str = DEFAULT_DATA_ROOT, log_events: bool = False,
+                 record: bool = False):
+        """
+        Configure la simulation
+
+        workers=None utilise tous les cœurs, workers=0 joue dans le processus courant.
+        Chaque partie reçoit une graine dérivée de seed : le lot entier est rejouable.
+        Le journal d'événements des parties est désactivé sauf si log_events.
+        Avec record, chaque GameResult porte le replay encodé de sa partie.
+        """
+        self.villains = list(villains)
+        self.policies = list(policies)
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.chunk_size = max(1, chunk_size)
+        self.max_turns = max_turns
+        self.seed = seed
+        self.data_root = data_root
+        self.log_events = log_events
+        self.record = record
+        self.report = SimulationReport()
+
+    def make_tasks(self, n_games: int) -> List[GameTask]:
+        """Crée les descriptions des parties à jouer"""
+        return [
+            GameTask(
+                game_index=i,
+                seed=derive_seed(self.seed, "game", i),
+                villains=self.villains,
+                policies=self.policies,
+                max_turns=self.max_turns,
+                record=self.record
+            )
+            for i in range(n_games)
+        ]
+
+    def run(self, n_games: int) -> Iterator[GameResult]:
+        """Joue n_games parties et renvoie chaque résultat dès qu'il est disponible"""
+        tasks = self.make_tasks(n_games)
+        self.report = SimulationReport(workers=max(1, self.workers))
+        start = time.perf_counter()
+
+        try:
+            if self.workers == 0:
+                engine = HeadlessEngine(self.data_root, self.log_events)
+                for task in tasks:
+                    result = engine.run_task(task)
+                    self.report.add(result)
+                    yield result
+                return
+
+            # Compile le catalogue une fois ici plutôt que dans chaque processus au démarrage
+            Catalog(self.data_root).load()
+            chunks = [tasks[i:i + self.chunk_size] for i in range(0, len(tasks), self.chunk_size)]
+            with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                     initargs=(self.data_root, self.log_events)) as executor:
+                futures = [executor.submit(_run_chunk, chunk) for chunk in chunks]
+                for future in as_completed(futures):
+                    for result in future.result():
+                        self.report.add(result)
+                        yield result
+        finally:
+            self.report.elapsed = time.perf_counter() - start
+
+    def run_all(self, n_games: int) -> SimulationReport:
+        """Joue toutes les parties et retourne uniquement le rapport"""
+        for _ in self.run(n_games):
+            pass
+        return self.report
+
+    def __str__(self) -> str:
+        """Représentation textuelle du simulateur"""
+        return f"BatchSimulator({' vs '.join(self.villains)}, {self.workers} processus)"
@@ -0,0 +1,215 @@
+"""
+Encodage vectoriel des états de partie - Tableaux NumPy pour l'entraînement de modèles
+
+Un état est écrit directement dans une ligne d'un tableau float32 préalloué.
+encode_batch() remplit des milliers d'états dans un seul tableau contigu : les
+valeurs scalaires sont écrites en place et tous les compteurs de cartes du lot
+sont cumulés par un unique np.add.at, sans tableau intermédiaire par état.
+
+Disposition (version ENCODING_VERSION), V = taille du vocabulaire de cartes + 1
+(la dernière case compte les cartes inconnues du vocabulaire) :
+
+    global.turn                 [1]      numéro du tour
+    global.players              [1]      nombre de joueurs
+    p{k}.present                [1]      1 si le bloc du joueur k est occupé
+    p{k}.power                  [1]      pouvoir
+    p{k}.actions_remaining      [1]      actions restantes
+    p{k}.phase                  [4]      phase du tour, one-hot (ordre de TurnPhase)
+    p{k}.position               [4]      lieu actuel, one-hot
+    p{k}.locked                 [4]      lieux verrouillés
+    p{k}.hand ... p{k}.conditions [V]    histogrammes par zone (voir ZONES)
+    p{k}.heroes                 [4, V]   héros présents par lieu
+    p{k}.board_items            [4, V]   objets et conditions posés par lieu
+
+Le bloc p0 est toujours le joueur courant, puis les adversaires dans l'ordre du
+tour ; les blocs au-delà du nombre de joueurs restent à zéro.
+"""
+
+import hashlib
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+import numpy as np
+from ..core.enums import TurnPhase
+from ..core.game import Game
+
+
+# Version de la disposition : à incrémenter dès qu'un champ change
+ENCODING_VERSION = 1
+
+# Zones de cartes d'un joueur encodées en histogrammes, dans l'ordre de la disposition
+ZONES = ("hand", "villain_deck", "discard", "fate_deck", "fate_discard", "allies", "items", "conditions")
+
+PHASES = tuple(TurnPhase)
+BOARD_SIZE = 4
+
+
+@dataclass
+class EncodingLayout:
+    """
+    Disposition des champs dans un vecteur d'état : nom -> (décalage, forme)
+    """
+    vocabulary: Tuple[str, ...]
+    max_players: int = 2
+    version: int = ENCODING_VERSION
+    fields: Dict[str, Tuple[int, Tuple[int, ...]]] = field(default_factory=dict)
+    size: int = 0
+
+    def __post_init__(self):
+        """Calcule les décalages de tous les champs"""
+        width = len(self.vocabulary) + 1
+        self._add("global.turn", (1,))
+        self._add("global.players", (1,))
+        for k in range(self.max_players):
+            self._add(f"p{k}.present", (1,))
+            self._add(f"p{k}.power", (1,))
+            self._add(f"p{k}.actions_remaining", (1,))
+            self._add(f"p{k}.phase", (len(PHASES),))
+            self._add(f"p{k}.position", (BOARD_SIZE,))
+            self._add(f"p{k}.locked", (BOARD_SIZE,))
+            for zone in ZONES:
+                self._add(f"p{k}.{zone}", (width,))
+            self._add(f"p{k}.heroes", (BOARD_SIZE, width))
+            self._add(f"p{k}.board_items", (BOARD_SIZE, width))
+
+    def _add(self, name: str, shape: Tuple[int, ...]) -> None:
+        """Ajoute un champ à la fin du vecteur"""
+        self.fields[name] = (self.size, shape)
+        self.size += int(np.prod(shape))
+
+    @property
+    def width(self) -> int:
+        """Largeur d'un histogramme de cartes (vocabulaire + inconnues)"""
+        return len(self.vocabulary) + 1
+
+    def offset(self, name: str) -> int:
+        """Décalage d'un champ"""
+        return self.fields[name][0]
+
+    def view(self, states: np.ndarray, name: str) -> np.ndarray:
+        """Vue d'un champ sur un tableau d'états (n, size) ou un état (size,)"""
+        offset, shape = self.fields[name]
+        length = int(np.prod(shape))
+        return states[..., offset:offset + length].reshape(states.shape[:-1] + shape)
+
+    def signature(self) -> str:
+        """Empreinte de la disposition (version, joueurs et vocabulaire) à stocker avec un modèle"""
+        text = f"{self.version}|{self.max_players}|" + ",".join(self.vocabulary)
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+    def describe(self) -> List[Tuple[str, int, Tuple[int, ...]]]:
+        """Liste (nom, décalage, forme) de tous les champs"""
+        return [(name, offset, shape) for name, (offset, shape) in self.fields.items()]
+
+
+class StateEncoder:
+    """
+    Encode des parties dans des tableaux NumPy selon une EncodingLayout
+    """
+
+    def __init__(self, card_ids: Iterable[str], max_players: int = 2, dtype=np.float32):
+        """Construit la disposition à partir du vocabulaire de cartes (ordre conservé)"""
+        self.layout = EncodingLayout(tuple(card_ids), max_players)
+        self.dtype = dtype
+        self.card_index: Dict[str, int] = {card_id: i for i, card_id in enumerate(self.layout.vocabulary)}
+        self.unknown = len(self.layout.vocabulary)
+
+        layout = self.layout
+        self._player_offsets = [
+            {name: layout.offset(f"p{k}.{name}")
+             for name in ("present", "power", "actions_remaining", "phase", "position", "locked",
+                          "heroes", "board_items") + ZONES}
+            for k in range(max_players)
+        ]
+        self._phase_index = {phase: i for i, phase in enumerate(PHASES)}
+
+    @classmethod
+    def from_card_manager(cls, card_manager, max_players: int = 2) -> "StateEncoder":
+        """Encodeur dont le vocabulaire est le catalogue de cartes, dans l'ordre des index"""
+        definitions = sorted(card_manager.cards_cache.values(), key=lambda d: d.index)
+        return cls([d.id for d in definitions], max_players)
+
+    @property
+    def size(self) -> int:
+        """Taille d'un vecteur d'état"""
+        return self.layout.size
+
+    def allocate(self, count: int) -> np.ndarray:
+        """Tableau contigu pour count états"""
+        return np.zeros((count, self.layout.size), dtype=self.dtype)
+
+    def encode(self, game: Game, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Encode une partie dans un vecteur (size,)"""
+        if out is None:
+            out = np.zeros(self.layout.size, dtype=self.dtype)
+        self.encode_batch([game], out.reshape(1, -1))
+        return out
+
+    def encode_batch(self, games: Sequence[Game], out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Encode un lot de parties dans un tableau (n, size) contigu
+
+        out doit être C-contigu ; seules ses len(games) premières lignes sont écrites.
+        """
+        count = len(games)
+        if out is None:
+            out = self.allocate(count)
+        elif not out.flags.c_contiguous or out.shape[-1] != self.layout.size or len(out) < count:
+            raise ValueError("Tableau de sortie incompatible avec la disposition")
+
+        out[:count] = 0
+        flat = out.reshape(-1)
+        increments: List[int] = []  # Cases à incrémenter de 1, pour tout le lot
+        size = self.layout.size
+        for row, game in enumerate(games):
+            self._encode_game(game, row * size, flat, increments)
+
+        if increments:
+            np.add.at(flat, np.asarray(increments, dtype=np.int64), 1)
+        return out
+
+    def _encode_game(self, game: Game, base: int, flat: np.ndarray, increments: List[int]) -> None:
+        """Écrit les scalaires d'une partie et collecte ses compteurs de cartes"""
+        layout = self.layout
+        players = game.players
+        flat[base + layout.offset("global.turn")] = game.turn_number
+        flat[base + layout.offset("global.players")] = len(players)
+
+        card_index = self.card_index
+        unknown = self.unknown
+        width = layout.width
+        start = game.current_player_index
+
+        for k in range(min(len(players), layout.max_players)):
+            player = players[(start + k) % len(players)]
+            offsets = self._player_offsets[k]
+
+            flat[base + offsets["present"]] = 1
+            flat[base + offsets["power"]] = player.power
+            flat[base + offsets["actions_remaining"]] = player.actions_remaining
+            flat[base + offsets["phase"] + self._phase_index[player.turn_phase]] = 1
+            if 0 <= player.current_location < BOARD_SIZE:
+                flat[base + offsets["position"] + player.current_location] = 1
+
+            zones = (player.hand, player.villain_deck.cards, player.discard_pile, player.fate_deck.cards,
+                     player.fate_discard, player.allies_in_play, player.items_in_play,
+                     player.conditions_in_play)
+            for zone_name, cards in zip(ZONES, zones):
+                offset = base + offsets[zone_name]
+                increments.extend(offset + card_index.get(card.id, unknown) for card in cards)
+
+            heroes = base + offsets["heroes"]
+            board_items = base + offsets["board_items"]
+            locked = base + offsets["locked"]
+            for index, location in enumerate(player.board_locations[:BOARD_SIZE]):
+                if location.locked:
+                    flat[locked + index] = 1
+                row = index * width
+                increments.extend(heroes + row + card_index.get(hero_id, unknown)
+                                  for hero_id in location.heroes_present)
+                increments.extend(board_items + row + card_index.get(item_id, unknown)
+                                  for item_id in location.items_present)
+
+    def __str__(self) -> str:
+        """Représentation textuelle de l'encodeur"""
+        return (f"StateEncoder(v{self.layout.version}, {len(self.layout.vocabulary)} cartes, "
+                f"{self.layout.max_players} joueurs, {self.layout.size} valeurs)")
@@ -0,0 +1,282 @@
+"""
+Moteur de simulation sans interface - Joue des parties complètes sans console
+"""
+
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Union
+from ..core.game import Game
+from ..core.enums import GameState, TurnPhase, VillainType
+from ..core.turn_manager import TurnManager
+from ..core.move_generator import END_TURN, Move, MoveGenerator
+from ..core.victory_conditions import VictoryManager
+from ..cards.card_manager import CardManager
+from ..cards.deck import Deck
+from ..board.board_manager import BoardManager
+from ..core.catalog import load_catalog
+from ..core.victory_rules import register_victory_rules
+from ..players.player import Player
+from .policies import Policy, create_policy
+from .replay import ReplayCodec, ReplayRecorder
+from .state_codec import StateCodec
+
+
+# Dossier des données du jeu, indépendant du répertoire courant
+DEFAULT_DATA_ROOT = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "..", "data"))
+
+# Nombre maximum d'actions refusées avant de forcer la fin du tour
+MAX_FAILED_ACTIONS = 3
+
+
+@dataclass
+class GameResult:
+    """Résultat d'une partie simulée"""
+    game_index: int
+    seed: int
+    villains: List[str]
+    winner_id: Optional[str]
+    winner_villain: Optional[str]
+    turns: int
+    duration: float = 0.0
+    replay: Optional[bytes] = None  # Replay encodé si la tâche demandait l'enregistrement
+
+    @property
+    def is_draw(self) -> bool:
+        """Vrai si la partie s'est terminée sans vainqueur"""
+        return self.winner_id is None
+
+
+@dataclass
+class GameTask:
+    """Description d'une partie à simuler"""
+    game_index: int
+    seed: int
+    villains: List[str]
+    policies: List[str] = field(default_factory=list)
+    max_turns: int = 200
+    record: bool = False
+
+
+class HeadlessEngine:
+    """
+    Construit et joue des parties sans interface à partir des gestionnaires du jeu
+    """
+
+    def __init__(self, data_root: str = DEFAULT_DATA_ROOT, log_events: bool = True):
+        """
+        Initialise les gestionnaires partagés par toutes les parties du processus
+
+        log_events=False crée des parties sans journal d'événements (simulation de masse).
+        """
+        self.log_events = log_events
+        self.card_manager = CardManager(os.path.join(data_root, "cards"))
+        self.board_manager = BoardManager(os.path.join(data_root, "boards"))
+        # Un seul fichier binaire à lire au lieu de tous les JSON
+        load_catalog(self.card_manager, self.board_manager, data_root)
+        self.turn_manager = TurnManager()
+        self.move_generator = MoveGenerator(self.turn_manager)
+        self.victory_manager = VictoryManager()
+        # Conditions de victoire décrites dans data/villains
+        register_victory_rules(self.victory_manager, self.card_manager, os.path.join(data_root, "villains"))
+        self._replay_codec: Optional[ReplayCodec] = None
+        self._state_codec: Optional[StateCodec] = None
+
+    @property
+    def replay_codec(self) -> ReplayCodec:
+        """Codec de replays dont le vocabulaire est le catalogue chargé"""
+        if self._replay_codec is None:
+            self._replay_codec = ReplayCodec.from_card_manager(self.card_manager)
+        return self._replay_codec
+
+    @property
+    def state_codec(self) -> StateCodec:
+        """Codec d'états complets dont le vocabulaire est le catalogue chargé"""
+        if self._state_codec is None:
+            self._state_codec = StateCodec.from_card_manager(self.card_manager)
+        return self._state_codec
+
+    # === Construction des parties ===
+
+    def build_game(self, villains: Sequence[Union[str, VillainType]], game_id: str = "sim",
+                   seed: Optional[int] = None) -> Game:
+        """Crée une partie prête à jouer avec decks et plateaux, rejouable depuis sa graine"""
+        game = Game(id=game_id, seed=seed, log_capacity=1024 if self.log_events else 0)
+
+        for i, villain in enumerate(villains):
+            villain_type = villain if isinstance(villain, VillainType) else VillainType(villain)
+            if not game.add_player(f"IA {i + 1}", villain_type):
+                raise ValueError(f"Impossible d'ajouter le méchant {villain_type.value}")
+
+        for player in game.players:
+            self._setup_player(game, player)
+
+        if not game.start_game():
+            raise ValueError("Impossible de démarrer la partie simulée")
+
+        return game
+
+    def _setup_player(self, game: Game, player: Player) -> None:
+        """Prépare les decks et le plateau d'un joueur"""
+        villain_name = player.villain_type.value
+        villain_rng = game.derive_rng(player.id, "villain_deck")
+        fate_rng = game.derive_rng(player.id, "fate_deck")
+
+        villain_deck = self.card_manager.create_villain_deck(villain_name, villain_rng)
+        fate_deck = self.card_manager.create_fate_deck(villain_name, fate_rng)
+        if villain_deck.is_empty():
+            # Pas de données pour ce méchant : cartes d'exemple
+            villain_cards, fate_cards = self.card_manager.create_sample_cards(villain_name)
+            villain_deck = Deck(villain_cards, villain_rng)
+            villain_deck.shuffle()
+            fate_deck = Deck(fate_cards, fate_rng)
+            fate_deck.shuffle()
+
+        player.villain_deck = villain_deck
+        player.fate_deck = fate_deck
+
+        # Modèle partagé, état propre à la partie : aucune copie
+        board = self.board_manager.load_villain_board(villain_name)
+        if board:
+            player.board_locations = board
+        else:
+            player.board_locations = self.board_manager.create_villain_specific_board(player.villain_type)
+
+    # === Déroulement ===
+
+    def play_game(self, game: Game, policies: Dict[str, Policy], max_turns: int = 200,
+                  resume: bool = False) -> Optional[Player]:
+        """
+        Joue une partie jusqu'à la victoire ou la limite de tours
+
+        Avec resume, le tour courant est déjà démarré (partie reprise par un GameStore).
+        """
+        observers = list(policies.values())
+        started = resume and game.state == GameState.IN_PROGRESS
+        while started or self.begin_turn(game, max_turns):
+            started = False
+            player = game.get_current_player()
+            self.play_turn(game, player, policies[player.id], observers)
+            self.finish_turn(game)
+
+        return game.winner
+
+    def begin_turn(self, game: Game, max_turns: int = 200) -> bool:
+        """
+        Démarre le tour du joueur courant, ou termine la partie
+
+        Un méchant gagne s'il commence son tour avec son objectif accompli.
+        Retourne False si la partie est terminée.
+        """
+        if game.state != GameState.IN_PROGRESS:
+            return False
+
+        player = game.get_current_player()
+        if not player:
+            return False
+
+        if self.victory_manager.check_victory(player):
+            game.end_game(player)
+            return False
+
+        if game.turn_number > max_turns:
+            game.end_game(None)
+            return False
+
+        self.turn_manager.start_turn(player)
+        return True
+
+    def finish_turn(self, game: Game) -> None:
+        """Termine le tour du joueur courant (signalé aux écouteurs du TurnManager) et passe au suivant"""
+        player = game.get_current_player()
+        if player:
+            self.turn_manager.end_turn(player)
+        game.next_turn()
+
+    def play_turn(self, game: Game, player: Player, policy: Policy, observers: Sequence[Policy] = ()) -> None:
+        """
+        Joue le tour d'un joueur déjà démarré : déplacement puis actions
+
+        Chaque coup joué (déplacement, action réussie, fin de tour choisie ou
+        forcée après trop de refus) est signalé aux observateurs, pour les
+        politiques qui gardent un arbre de recherche.
+        """
+        positions = self.turn_manager.get_valid_move_positions(player)
+        if positions:
+            position = policy.choose_position(game, player, positions)
+            if self.turn_manager.move_player(player, position):
+                self._notify(observers, game, player, Move.position(position))
+
+        failures = 0
+        while player.turn_phase == TurnPhase.ACTIONS and player.actions_remaining > 0:
+            available_actions = self.turn_manager.get_available_actions(player)
+            choice = policy.choose_action(game, player, available_actions)
+            if choice is None:
+                self._notify(observers, game, player, END_TURN)
+                break
+
+            action_type, kwargs = choice
+            if self.turn_manager.perform_action(player, action_type, **kwargs):
+                self._notify(observers, game, player, Move.action(action_type, kwargs))
+            else:
+                failures += 1
+                if failures >= MAX_FAILED_ACTIONS:
+                    self._notify(observers, game, player, END_TURN)
+                    break
+
+        player.turn_phase = TurnPhase.END
+
+    def apply_move(self, game: Game, move: Move, max_turns: int = 200, end_turn_on_refusal: bool = True) -> bool:
+        """
+        Joue un coup du joueur courant et enchaîne sur le tour suivant si le tour est fini
+
+        Pour les simulations (end_turn_on_refusal), un coup refusé termine le
+        tour, comme une fin de tour choisie ; sinon le joueur garde la main.
+        Retourne True si le coup a été accepté.
+        """
+        player = game.get_current_player()
+        accepted = bool(self.move_generator.apply(game, move, player))
+        if (not accepted and end_turn_on_refusal) or \
+                (player.turn_phase == TurnPhase.ACTIONS and player.actions_remaining <= 0):
+            player.turn_phase = TurnPhase.END
+
+        if player.turn_phase == TurnPhase.END:
+            self.finish_turn(game)
+            self.begin_turn(game, max_turns)
+        return accepted
+
+    @staticmethod
+    def _notify(observers: Sequence[Policy], game: Game, player: Player, move: Move) -> None:
+        """Signale un coup joué aux politiques"""
+        for observer in observers:
+            observer.observe(game, player, move)
+
+    def run_task(self, task: GameTask) -> GameResult:
+        """Simule une partie décrite par une tâche"""
+        start = time.perf_counter()
+
+        game = self.build_game(task.villains, game_id=f"sim_{task.game_index}", seed=task.seed)
+        policy_names = task.policies or ["random"] * len(game.players)
+        policies = {
+            player.id: create_policy(policy_names[i % len(policy_names)], game.derive_rng(player.id, "policy"))
+            for i, player in enumerate(game.players)
+        }
+
+        recorder = ReplayRecorder(game, self.turn_manager, task.max_turns) if task.record else None
+        winner = self.play_game(game, policies, task.max_turns)
+        replay = self.replay_codec.encode(recorder.finish()) if recorder else None
+
+        return GameResult(
+            game_index=task.game_index,
+            seed=task.seed,
+            villains=[p.villain_type.value for p in game.players],
+            winner_id=winner.id if winner else None,
+            winner_villain=winner.villain_type.value if winner else None,
+            turns=game.turn_number,
+            duration=time.perf_counter() - start,
+            replay=replay
+        )
+
+    def __str__(self) -> str:
+        """Représentation textuelle du moteur"""
+        return f"HeadlessEngine({self.card_manager}, {self.board_manager})"
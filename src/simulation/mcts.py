@@ -0,0 +1,316 @@
+"""
+Recherche arborescente Monte-Carlo - Adversaire IA construit sur TurnManager
+
+L'arbre est « en boucle ouverte » : un nœud est la suite des coups joués depuis
+la racine, pas un état. À chaque itération, la partie de travail est remise
+dans l'état de la décision par Game.restore(), les paquets cachés sont
+remélangés (déterminisation), puis les coups légaux donnés par le
+MoveGenerator du moteur sont rejoués avec le TurnManager.
+"""
+
+import math
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+from ..core.enums import ActionType, GameState
+from ..core.game import Game
+from ..core.move_generator import Move
+from ..players.player import Player
+from .policies import POLICIES, ActionChoice, Policy
+
+
+def legal_moves(engine, game: Game) -> Tuple[Move, ...]:
+    """Coups légaux du joueur courant"""
+    return engine.move_generator.legal_moves(game)
+
+
+# Poids de l'estimation d'une partie non terminée : progrès, pouvoir, cartes en jeu
+PROGRESS_WEIGHT = 0.6
+POWER_WEIGHT = 0.2
+BOARD_WEIGHT = 0.2
+POWER_CAP = 10
+BOARD_CAP = 6
+
+
+def victory_ratio(progress: Dict[str, Any]) -> float:
+    """Progrès vers la victoire entre 0 et 1, partiel si la condition le détaille"""
+    if "score" in progress:
+        return progress["score"]
+    if "percentage" in progress:
+        return progress["percentage"] / 100
+    if progress.get("objectives_total"):
+        return progress["objectives_completed"] / progress["objectives_total"]
+    return 0.0
+
+
+def heuristic(engine, player: Player) -> float:
+    """Estimation entre 0 et 1 de la position d'un joueur"""
+    progress = victory_ratio(engine.victory_manager.get_victory_progress(player))
+    in_play = len(player.allies_in_play) + len(player.items_in_play) + len(player.conditions_in_play)
+    return (PROGRESS_WEIGHT * progress
+            + POWER_WEIGHT * min(player.power, POWER_CAP) / POWER_CAP
+            + BOARD_WEIGHT * min(in_play, BOARD_CAP) / BOARD_CAP)
+
+
+class Node:
+    """Nœud de l'arbre : statistiques d'un coup joué depuis son parent"""
+
+    __slots__ = ("parent", "player_index", "children", "visits", "value")
+
+    def __init__(self, parent: Optional["Node"] = None, player_index: int = -1):
+        self.parent = parent
+        self.player_index = player_index  # Joueur qui a joué le coup menant à ce nœud
+        self.children: Dict[Move, "Node"] = {}
+        self.visits = 0
+        self.value = 0.0
+
+    def uct(self, parent_visits: int, exploration: float) -> float:
+        """Score UCT du nœud vu depuis son parent"""
+        if self.visits == 0:
+            return math.inf
+        return self.value / self.visits + exploration * math.sqrt(math.log(parent_visits) / self.visits)
+
+
+@dataclass
+class SearchStats:
+    """Statistiques cumulées des recherches d'une politique MCTS"""
+    decisions: int = 0
+    iterations: int = 0
+    nodes: int = 0
+    elapsed: float = 0.0
+    reused: int = 0  # Décisions commencées sur un sous-arbre conservé
+
+    @property
+    def nodes_per_second(self) -> float:
+        """Nœuds créés par seconde de recherche"""
+        return self.nodes / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def iterations_per_decision(self) -> float:
+        """Itérations moyennes par décision"""
+        return self.iterations / self.decisions if self.decisions else 0.0
+
+    def __str__(self) -> str:
+        return (f"{self.decisions} décisions, {self.iterations_per_decision:.0f} itérations/décision, "
+                f"{self.nodes_per_second:,.0f} nœuds/s")
+
+
+class MCTSPolicy(Policy):
+    """
+    Politique MCTS (UCT) : simule des parties aléatoires depuis chaque décision
+
+    iterations borne le nombre de simulations par décision et time_budget leur
+    durée en secondes (None = sans limite de temps). Les simulations s'arrêtent
+    après rollout_turns tours et sont alors notées par heuristic (voir evaluate).
+    Avec workers > 0, les itérations sont réparties sur un pool de processus
+    (parallélisation à la racine) et l'arbre n'est pas conservé.
+    """
+
+    name = "mcts"
+
+    def __init__(self, rng: Optional[random.Random] = None, engine=None, iterations: int = 200,
+                 time_budget: Optional[float] = None, rollout_turns: int = 4,
+                 exploration: float = 1.4, workers: int = 0, reuse_tree: bool = True):
+        """Initialise la politique, le moteur est créé au premier besoin"""
+        super().__init__(rng)
+        self.engine = engine
+        self.iterations = iterations
+        self.time_budget = time_budget
+        self.rollout_turns = rollout_turns
+        self.exploration = exploration
+        self.workers = workers
+        self.reuse_tree = reuse_tree
+        self.stats = SearchStats()
+        self._root: Optional[Node] = None
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    # === Interface Policy ===
+
+    def choose_position(self, game: Game, player: Player, positions: List[int]) -> int:
+        """Choisit le déplacement le plus visité"""
+        move = self.search(game)
+        if move.kind != "move" or move.get("position") not in positions:
+            return self.rng.choice(positions)
+        return move.get("position")
+
+    def choose_action(self, game: Game, player: Player,
+                      available_actions: List[ActionType]) -> Optional[ActionChoice]:
+        """Choisit l'action la plus visitée, ou None pour finir le tour"""
+        move = self.search(game)
+        if move.kind != "action":
+            return None
+        return move.action_type, move.kwargs(game)
+
+    def observe(self, game: Game, player: Player, move: Move) -> None:
+        """Descend dans le sous-arbre du coup joué pour le réutiliser"""
+        if self._root is not None:
+            self._root = self._root.children.get(move)
+            if self._root is not None:
+                self._root.parent = None
+
+    # === Recherche ===
+
+    def _get_engine(self):
+        """Moteur utilisé pour rejouer les coups"""
+        if self.engine is None:
+            from .engine import HeadlessEngine
+            self.engine = HeadlessEngine(log_events=False)
+        return self.engine
+
+    def search(self, game: Game) -> Move:
+        """Cherche le meilleur coup du joueur courant"""
+        moves = legal_moves(self._get_engine(), game)
+        if len(moves) == 1:
+            return moves[0]
+
+        if self.workers > 0:
+            visits = self._search_parallel(game)
+        else:
+            if self._root is None or not self.reuse_tree:
+                self._root = Node()
+            else:
+                self.stats.reused += 1
+            self.run_iterations(game, self._root, self.iterations, self.time_budget)
+            visits = {key: child.visits for key, child in self._root.children.items()}
+
+        self.stats.decisions += 1
+        return max(moves, key=lambda move: (visits.get(move, 0), self.rng.random()))
+
+    def run_iterations(self, game: Game, root: Node, iterations: int,
+                       time_budget: Optional[float] = None) -> int:
+        """Effectue des itérations de recherche sur une copie de la partie, retourne leur nombre"""
+        engine = self._get_engine()
+        work = game.clone()
+        work.events.enabled = False  # Les parties simulées ne sont pas journalisées
+        snapshot = work.snapshot()
+        deadline = None if time_budget is None else time.perf_counter() + time_budget
+        start = time.perf_counter()
+
+        done = 0
+        while done < iterations and (deadline is None or time.perf_counter() < deadline):
+            if done:
+                work.restore(snapshot)
+            self._determinize(work)
+            self._iterate(engine, work, root)
+            done += 1
+
+        self.stats.iterations += done
+        self.stats.elapsed += time.perf_counter() - start
+        return done
+
+    def _determinize(self, game: Game) -> None:
+        """Tire un ordre possible pour les paquets cachés et de nouveaux aléas"""
+        for player in game.players:
+            for deck in (player.villain_deck, player.fate_deck):
+                if deck.rng is not None:
+                    deck.rng.seed(self.rng.getrandbits(64))
+                deck.shuffle()
+        game.rng.seed(self.rng.getrandbits(64))
+
+    def _iterate(self, engine, game: Game, root: Node) -> None:
+        """Sélection, expansion, simulation puis rétropropagation"""
+        root_turn = game.turn_number
+        node = root
+        path = [root]
+
+        # Sélection parmi les coups légaux de cet échantillon, puis expansion d'un coup
+        while game.state == GameState.IN_PROGRESS:
+            moves = legal_moves(engine, game)
+            untried = [move for move in moves if move not in node.children]
+            player_index = game.current_player_index
+
+            if untried:
+                move = self.rng.choice(untried)
+                node.children[move] = Node(node, player_index)
+                node = node.children[move]
+                self.stats.nodes += 1
+                engine.apply_move(game, move)
+                path.append(node)
+                break
+
+            parent_visits = max(node.visits, 1)
+            move = max(moves, key=lambda m: node.children[m].uct(parent_visits, self.exploration))
+            node = node.children[move]
+            engine.apply_move(game, move)
+            path.append(node)
+
+        # Simulation aléatoire sur un horizon limité
+        horizon = root_turn + self.rollout_turns
+        while game.state == GameState.IN_PROGRESS and game.turn_number <= horizon:
+            engine.apply_move(game, self.rng.choice(legal_moves(engine, game)))
+
+        rewards = self.evaluate(engine, game)
+        root.visits += 1
+        for node in path[1:]:
+            node.visits += 1
+            node.value += rewards[node.player_index]
+
+    @staticmethod
+    def evaluate(engine, game: Game) -> List[float]:
+        """
+        Récompense de chaque joueur : 1 pour le vainqueur, 0 pour les autres
+
+        Une simulation arrêtée avant la fin est notée par l'écart entre
+        l'estimation du joueur (progrès vers la victoire, pouvoir, cartes en
+        jeu) et la meilleure de ses adversaires : entre 0.1 et 0.9, au-dessus
+        de 0.5 quand il mène.
+        """
+        if game.state == GameState.FINISHED:
+            return [1.0 if player is game.winner else 0.0 for player in game.players]
+        scores = [heuristic(engine, player) for player in game.players]
+        return [0.5 + 0.4 * (score - max(scores[:index] + scores[index + 1:], default=0.0))
+                for index, score in enumerate(scores)]
+
+    # === Parallélisation ===
+
+    def _search_parallel(self, game: Game) -> Dict[Move, int]:
+        """Répartit les itérations sur le pool et additionne les visites des coups racine"""
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+
+        share = max(1, self.iterations // self.workers)
+        config = (share, self.time_budget, self.rollout_turns, self.exploration)
+        tasks = [(game.clone(), self.rng.getrandbits(64), config) for _ in range(self.workers)]
+
+        visits: Dict[Move, int] = {}
+        for children, iterations, nodes, elapsed in self._pool.map(_search_worker, tasks):
+            for key, count in children.items():
+                visits[key] = visits.get(key, 0) + count
+            self.stats.iterations += iterations
+            self.stats.nodes += nodes
+            self.stats.elapsed += elapsed / self.workers  # Temps réel, pas temps cumulé
+        return visits
+
+    def close(self) -> None:
+        """Arrête le pool de processus"""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __str__(self) -> str:
+        return f"Policy({self.name}, {self.iterations} itérations, {self.stats})"
+
+
+# Moteur propre à chaque processus du pool, construit au premier appel
+_worker_engine = None
+
+
+def _search_worker(task: Tuple[Game, int, Tuple[Any, ...]]) -> Tuple[Dict[Move, int], int, int, float]:
+    """Recherche indépendante dans un processus, retourne les visites des coups racine"""
+    global _worker_engine
+    if _worker_engine is None:
+        from .engine import HeadlessEngine
+        _worker_engine = HeadlessEngine(log_events=False)
+
+    game, seed, (iterations, time_budget, rollout_turns, exploration) = task
+    policy = MCTSPolicy(random.Random(seed), _worker_engine, rollout_turns=rollout_turns,
+                        exploration=exploration)
+    root = Node()
+    policy.run_iterations(game, root, iterations, time_budget)
+    children = {key: child.visits for key, child in root.children.items()}
+    return children, policy.stats.iterations, policy.stats.nodes, policy.stats.elapsed
+
+
+POLICIES[MCTSPolicy.name] = MCTSPolicy
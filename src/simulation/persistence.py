@@ -0,0 +1,467 @@
+"""
+Persistance des parties - Journal des coups sur disque et instantanés compactés
+
+Chaque coup accepté d'une partie suivie est ajouté à son journal (même codage
+que les replays). Tous les snapshot_every coups, l'état complet est écrit dans
+un instantané et le journal est compacté : il ne garde que les coups suivants.
+Après un arrêt brutal, recover() recharge le dernier instantané et ne rejoue
+que la fin du journal.
+
+Les écritures sont regroupées : les coups restent en mémoire jusqu'à
+flush_every coups par partie ou au plus flush_interval secondes (un fil du
+GameStore écrit les tampons des parties restées inactives), et les fichiers
+ne sont synchronisés (fsync) qu'une fois par sync_interval secondes pour
+l'ensemble des parties.
+
+Le GameStore s'abonne une seule fois au TurnManager et retrouve le journal
+d'un coup par son joueur : le coût d'un coup ne dépend pas du nombre de
+parties suivies.
+
+Fichiers d'une partie dans le dossier du GameStore :
+
+    <id>.journal    b"VRJ" + version, empreinte du vocabulaire (4 octets), nombre de
+                    coups compactés, id de la partie, en-tête de replay (graine,
+                    méchants, max_turns), puis chaque coup précédé de sa longueur
+    <id>.snapshot   b"VRS" + version, puis pickle de l'état (Game.snapshot()) ; les
+                    cartes y sont désignées par (id, exemplaire) et retrouvées dans
+                    la partie reconstruite depuis la graine
+"""
+
+import io
+import os
+import pickle
+import threading
+import time
+from typing import BinaryIO, Dict, List, Optional, Tuple
+from ..cards.card import Card
+from ..core.enums import GameState
+from ..core.game import Game, GameSnapshot
+from .replay import (Replay, ReplayCodec, ReplayError, ReplayPlayer, ReplayRecorder,
+                     read_varint, write_varint)
+
+
+PERSISTENCE_VERSION = 1
+JOURNAL_MAGIC = b"VRJ"
+SNAPSHOT_MAGIC = b"VRS"
+
+
+def _player_cards(game: Game) -> Dict[Tuple[str, int], Card]:
+    """Exemplaires de cartes de la partie, par (id, numéro d'exemplaire)"""
+    cards = {}
+    for player in game.players:
+        for zone in (player.villain_deck.cards, player.fate_deck.cards, player.hand, player.discard_pile,
+                     player.fate_discard, player.allies_in_play, player.items_in_play,
+                     player.conditions_in_play, player.passive_cards):
+            for card in zone:
+                cards.setdefault((card.id, card.copy_id), card)
+    return cards
+
+
+def _card_ref(card_id: str, copy_id: int) -> Card:
+    """Référence de carte dans un instantané (résolue par _SnapshotUnpickler)"""
+    raise ReplayError("Référence de carte lue hors d'un instantané")
+
+
+class _SnapshotPickler(pickle.Pickler):
+    """Pickler qui remplace les cartes par leur référence (réduction native, sans appel par objet)"""
+
+    dispatch_table = {Card: lambda card: (_card_ref, (card.id, card.copy_id))}
+
+
+class _SnapshotUnpickler(pickle.Unpickler):
+    """Unpickler qui retrouve les cartes dans une partie reconstruite"""
+
+    def __init__(self, stream: BinaryIO, cards: Dict[Tuple[str, int], Card], card_manager):
+        super().__init__(stream)
+        self.cards = cards
+        self.card_manager = card_manager
+
+    def find_class(self, module: str, name: str):
+        if module == __name__ and name == "_card_ref":
+            return self._resolve_card
+        return super().find_class(module, name)
+
+    def _resolve_card(self, card_id: str, copy_id: int) -> Card:
+        card = self.cards.get((card_id, copy_id))
+        if card is None:
+            definition = self.card_manager.get_card_by_id(card_id)
+            if definition is None:
+                raise ReplayError(f"Carte {card_id} introuvable pour l'instantané")
+            card = Card(definition, copy_id)
+            self.cards[(card_id, copy_id)] = card
+        return card
+
+
+def dump_snapshot(game: Game, **extra) -> bytes:
+    """État d'une partie (Game.snapshot()) en octets, cartes désignées par référence"""
+    buffer = io.BytesIO()
+    buffer.write(SNAPSHOT_MAGIC + bytes([PERSISTENCE_VERSION]))
+    data = {"game_id": game.id, "seed": game.seed, "snapshot": game.snapshot()}
+    data.update(extra)
+    _SnapshotPickler(buffer, protocol=pickle.HIGHEST_PROTOCOL).dump(data)
+    return buffer.getvalue()
+
+
+def load_snapshot(data: bytes, game: Game, card_manager) -> dict:
+    """
+    Relit un état écrit par dump_snapshot
+
+    game est la partie reconstruite depuis la même graine : ses cartes sont
+    réutilisées. Retourne le dictionnaire écrit (clé "snapshot" : GameSnapshot).
+    """
+    if data[:4] != SNAPSHOT_MAGIC + bytes([PERSISTENCE_VERSION]):
+        raise ReplayError("Instantané illisible")
+    stream = io.BytesIO(data)
+    stream.seek(4)
+    content = _SnapshotUnpickler(stream, _player_cards(game), card_manager).load()
+    if not isinstance(content.get("snapshot"), GameSnapshot):
+        raise ReplayError("Instantané illisible")
+    return content
+
+
+class GameJournal(ReplayRecorder):
+    """
+    Écouteur qui ajoute les coups d'une partie à son journal sur disque
+    """
+
+    def __init__(self, store: "GameStore", game: Game, max_turns: int = 200,
+                 moves: int = 0, snapshot_moves: int = 0):
+        """Reprend un journal existant (moves coups déjà écrits) ou en commence un"""
+        super().__init__(game, store.engine.turn_manager, max_turns, listen=False)
+        self.store = store
+        self.moves = moves                    # Coups écrits depuis le début de la partie
+        self.snapshot_moves = snapshot_moves  # Coups couverts par le dernier instantané
+        self._pending = bytearray()
+        self._pending_count = 0
+        self.path = store.journal_path(game.id)
+        if not os.path.exists(self.path):
+            self._write_journal(snapshot_moves)
+        self._file = open(self.path, "ab")
+        self.dirty = False  # Données écrites depuis le dernier fsync
+
+    def record(self, move) -> None:
+        """Met le coup en tampon ; écrit le tampon ou un instantané selon la cadence"""
+        data = bytearray()
+        self.store.codec.write_move(data, move)
+        with self.store.lock:
+            write_varint(self._pending, len(data))
+            self._pending.extend(data)
+            self._pending_count += 1
+            self.moves += 1
+
+            # Juste après un déplacement, l'état est celui que la relecture reproduit
+            if move.kind == "move" and self.moves - self.snapshot_moves >= self.store.snapshot_every:
+                self.checkpoint()
+            elif self._pending_count >= self.store.flush_every:
+                self.flush()
+                self.store.maybe_sync()
+
+    def flush(self) -> None:
+        """Écrit les coups en tampon dans le fichier (sans fsync)"""
+        with self.store.lock:
+            if self._pending:
+                self._file.write(self._pending)
+                self._file.flush()
+                self._pending.clear()
+                self._pending_count = 0
+                self.dirty = True
+
+    def sync(self) -> None:
+        """Force l'écriture du fichier sur le disque"""
+        with self.store.lock:
+            self.flush()
+            if self.dirty:
+                os.fsync(self._file.fileno())
+                self.dirty = False
+
+    def checkpoint(self) -> None:
+        """Écrit un instantané de l'état puis compacte le journal"""
+        with self.store.lock:
+            self.flush()
+            self.store.write_snapshot(self.game, self.moves)
+            self._file.close()
+            self._write_journal(self.moves)
+            self._file = open(self.path, "ab")
+            self.snapshot_moves = self.moves
+            self.dirty = False
+
+    def _write_journal(self, base: int) -> None:
+        """Remplace le journal par un journal vide commençant après base coups"""
+        header = bytearray(JOURNAL_MAGIC)
+        header.append(PERSISTENCE_VERSION)
+        header.extend(self.store.codec.fingerprint.to_bytes(4, "little"))
+        write_varint(header, base)
+        game_id = self.game.id.encode("utf-8")
+        write_varint(header, len(game_id))
+        header.extend(game_id)
+        replay = self.store.codec.encode(Replay(self.game.seed, self.villains, self.replay.max_turns))
+        write_varint(header, len(replay))
+        header.extend(replay)
+        self.store.write_atomic(self.path, bytes(header))
+
+    def close(self) -> None:
+        """Synchronise et arrête l'enregistrement"""
+        with self.store.lock:
+            self.sync()
+            self.store.forget(self)
+            self._file.close()
+
+
+class GameStore:
+    """
+    Dossier de parties persistées : journaux, instantanés et reprise après arrêt
+    """
+
+    def __init__(self, directory: str, engine, snapshot_every: int = 256, flush_every: int = 32,
+                 sync_interval: Optional[float] = 1.0, flush_interval: Optional[float] = 0.5):
+        """
+        Ouvre (ou crée) le dossier
+
+        sync_interval=0 synchronise à chaque écriture, None seulement sur sync()/close().
+        flush_interval : délai maximal avant l'écriture des coups en tampon d'une
+        partie inactive (None : seulement tous les flush_every coups).
+        """
+        self.directory = directory
+        self.engine = engine
+        self.codec: ReplayCodec = engine.replay_codec
+        self.snapshot_every = max(1, snapshot_every)
+        self.flush_every = max(1, flush_every)
+        self.sync_interval = sync_interval
+        self.flush_interval = flush_interval
+        self.journals: Dict[str, GameJournal] = {}
+        self._last_sync = time.monotonic()
+        os.makedirs(directory, exist_ok=True)
+
+        # Un seul écouteur pour toutes les parties : journal retrouvé par joueur
+        self.lock = threading.RLock()
+        self._by_player: Dict[int, GameJournal] = {}
+        self.turn_manager = engine.turn_manager  # Abonné tant qu'une partie est suivie
+
+        self._stopped = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        if flush_interval is not None:
+            self._flusher = threading.Thread(target=self._flush_loop, name="game-store-flush", daemon=True)
+            self._flusher.start()
+
+    def _dispatch(self, player, kind: str, action_type, kwargs: Dict) -> None:
+        """Écouteur du TurnManager : transmet le coup au journal de la partie du joueur"""
+        journal = self._by_player.get(id(player))
+        if journal is not None:
+            journal(player, kind, action_type, kwargs)
+
+    def _register(self, journal: GameJournal) -> GameJournal:
+        """Suit les coups des joueurs d'une partie"""
+        with self.lock:
+            if not self._by_player:
+                self.turn_manager.add_listener(self._dispatch)
+            self.journals[journal.game.id] = journal
+            for player in journal.game.players:
+                self._by_player[id(player)] = journal
+        return journal
+
+    def forget(self, journal: GameJournal) -> None:
+        """Ne transmet plus les coups d'une partie à son journal"""
+        for player in journal.game.players:
+            if self._by_player.get(id(player)) is journal:
+                del self._by_player[id(player)]
+        if not self._by_player:
+            self.turn_manager.remove_listener(self._dispatch)
+
+    def _flush_loop(self) -> None:
+        """Fil d'écriture : tampons des parties inactives écrits toutes les flush_interval secondes"""
+        while not self._stopped.wait(max(self.flush_interval, 0.001)):
+            with self.lock:
+                self.flush()
+                self.maybe_sync()
+
+    # === Fichiers ===
+
+    def journal_path(self, game_id: str) -> str:
+        """Chemin du journal d'une partie"""
+        return os.path.join(self.directory, f"{self._safe_id(game_id)}.journal")
+
+    def snapshot_path(self, game_id: str) -> str:
+        """Chemin de l'instantané d'une partie"""
+        return os.path.join(self.directory, f"{self._safe_id(game_id)}.snapshot")
+
+    @staticmethod
+    def _safe_id(game_id: str) -> str:
+        """Refuse les id qui sortiraient du dossier"""
+        if not game_id or os.sep in game_id or "/" in game_id or game_id.startswith("."):
+            raise ValueError(f"Id de partie invalide pour la persistance : {game_id!r}")
+        return game_id
+
+    def write_atomic(self, path: str, data: bytes) -> None:
+        """Écrit un fichier complet de façon atomique et durable"""
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+        self._sync_directory()
+
+    def _sync_directory(self) -> None:
+        """Rend durable un renommage dans le dossier (sans effet sous Windows)"""
+        try:
+            fd = os.open(self.directory, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+    def write_snapshot(self, game: Game, moves: int) -> None:
+        """Écrit l'instantané d'une partie après moves coups"""
+        self.write_atomic(self.snapshot_path(game.id), dump_snapshot(game, moves=moves))
+
+    # === Suivi des parties ===
+
+    def track(self, game: Game, max_turns: int = 200) -> GameJournal:
+        """Commence à persister une partie qui vient d'être construite (aucun coup joué)"""
+        if game.id in self.journals:
+            raise ValueError(f"La partie {game.id} est déjà suivie")
+        for path in (self.journal_path(game.id), self.snapshot_path(game.id)):
+            if os.path.exists(path):
+                os.remove(path)
+        return self._register(GameJournal(self, game, max_turns))
+
+    def checkpoint(self, game_id: str) -> None:
+        """Force un instantané d'une partie entre deux coups"""
+        self.journals[game_id].checkpoint()
+
+    def finish(self, game_id: str, keep: bool = False) -> None:
+        """Arrête de suivre une partie ; ses fichiers sont supprimés sauf si keep"""
+        with self.lock:
+            journal = self.journals.pop(game_id)
+            journal.close()
+        if not keep:
+            for path in (journal.path, self.snapshot_path(game_id)):
+                if os.path.exists(path):
+                    os.remove(path)
+
+    def flush(self) -> None:
+        """Écrit les coups en tampon de toutes les parties (sans fsync)"""
+        with self.lock:
+            for journal in self.journals.values():
+                journal.flush()
+
+    def sync(self) -> None:
+        """Écrit et synchronise toutes les parties"""
+        with self.lock:
+            for journal in self.journals.values():
+                journal.sync()
+            self._last_sync = time.monotonic()
+
+    def maybe_sync(self) -> None:
+        """Synchronise si sync_interval est écoulé depuis la dernière fois"""
+        if self.sync_interval is not None and time.monotonic() - self._last_sync >= self.sync_interval:
+            with self.lock:
+                for journal in self.journals.values():
+                    if journal.dirty:
+                        journal.sync()
+                self._last_sync = time.monotonic()
+
+    def close(self) -> None:
+        """Synchronise et arrête de suivre toutes les parties (fichiers conservés)"""
+        self._stopped.set()
+        if self._flusher is not None:
+            self._flusher.join()
+        with self.lock:
+            for journal in self.journals.values():
+                journal.close()
+            self.journals.clear()
+
+    # === Reprise ===
+
+    def game_ids(self) -> List[str]:
+        """Parties présentes dans le dossier"""
+        return sorted(name[:-len(".journal")] for name in os.listdir(self.directory) if name.endswith(".journal"))
+
+    def recover_all(self) -> Dict[str, Game]:
+        """Reprend toutes les parties du dossier"""
+        return {game_id: self.recover(game_id) for game_id in self.game_ids()}
+
+    def recover(self, game_id: str, track: bool = True) -> Game:
+        """
+        Reconstruit une partie : dernier instantané puis coups suivants du journal
+
+        La partie est rendue au point où elle attend son prochain coup (tour
+        démarré). Avec track, elle continue d'être persistée.
+        """
+        base, header, records, valid_size = self._read_journal(game_id)
+        replay = self.codec.decode(header)
+        engine = self.engine
+        game = engine.build_game(replay.villains, game_id=game_id, seed=replay.seed)
+
+        snapshot_moves = 0
+        snapshot_path = self.snapshot_path(game_id)
+        if os.path.exists(snapshot_path):
+            data = self._read_snapshot(snapshot_path, game)
+            if data["seed"] != replay.seed:
+                raise ReplayError(f"L'instantané de {game_id} ne correspond pas à son journal")
+            game.restore(data["snapshot"])
+            snapshot_moves = data["moves"]
+        else:
+            engine.begin_turn(game, replay.max_turns)
+        if snapshot_moves < base:
+            raise ReplayError(f"Journal de {game_id} compacté sans instantané")
+
+        # Coups du journal déjà couverts par l'instantané : ignorés
+        replay.moves = records[snapshot_moves - base:]
+        for _ in ReplayPlayer(engine).steps(game, replay):
+            pass
+
+        if valid_size is not None:
+            # Dernier enregistrement incomplet (arrêt pendant une écriture) : retiré
+            with open(self.journal_path(game_id), "r+b") as f:
+                f.truncate(valid_size)
+
+        if track and game.state == GameState.IN_PROGRESS:
+            self._register(GameJournal(self, game, replay.max_turns,
+                                       moves=base + len(records), snapshot_moves=snapshot_moves))
+        return game
+
+    def _read_journal(self, game_id: str) -> Tuple[int, bytes, list, Optional[int]]:
+        """Lit un journal : (coups compactés, en-tête de replay, coups, taille valide si fin tronquée)"""
+        with open(self.journal_path(game_id), "rb") as f:
+            data = f.read()
+        if data[:3] != JOURNAL_MAGIC or len(data) < 8 or data[3] != PERSISTENCE_VERSION:
+            raise ReplayError(f"Journal de {game_id} illisible")
+        if int.from_bytes(data[4:8], "little") != self.codec.fingerprint:
+            raise ReplayError("Vocabulaire de cartes différent de celui du journal")
+
+        base, pos = read_varint(data, 8)
+        length, pos = read_varint(data, pos)
+        pos += length  # Id de la partie, déjà connu
+        length, pos = read_varint(data, pos)
+        header = data[pos:pos + length]
+        pos += length
+
+        records = []
+        while pos < len(data):
+            start = pos
+            try:
+                length, pos = read_varint(data, pos)
+                if pos + length > len(data):
+                    raise ReplayError("Coup tronqué")
+                move, end = self.codec.read_move(data, pos)
+            except ReplayError:
+                return base, header, records, start
+            if end != pos + length:
+                raise ReplayError(f"Coup {base + len(records)} du journal de {game_id} illisible")
+            records.append(move)
+            pos = end
+        return base, header, records, None
+
+    def _read_snapshot(self, path: str, game: Game) -> dict:
+        """Lit un instantané ; ses cartes sont prises dans la partie reconstruite"""
+        with open(path, "rb") as f:
+            return load_snapshot(f.read(), game, self.engine.card_manager)
+
+    def __str__(self) -> str:
+        """Représentation textuelle du magasin"""
+        return f"GameStore({self.directory}, {len(self.journals)} parties suivies)"
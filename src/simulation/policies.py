@@ -0,0 +1,130 @@
+"""
+Politiques de jeu automatiques pour les simulations sans interface
+"""
+
+import random
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Tuple
+from ..core.enums import ActionType
+from ..core.game import Game
+from ..core.move_generator import Move, MoveGenerator
+from ..players.player import Player
+
+
+# Un choix d'action : le type d'action et les paramètres passés à TurnManager.perform_action
+ActionChoice = Tuple[ActionType, Dict[str, Any]]
+
+
+# Générateur de coups partagé par les politiques du processus
+MOVE_GENERATOR = MoveGenerator()
+
+
+def action_candidates(game: Game, player: Player, action_type: ActionType) -> List[Dict[str, Any]]:
+    """Retourne les jeux de paramètres légaux pour une action donnée"""
+    return [move.kwargs(game) for move in MOVE_GENERATOR.action_moves(game, player, action_type)]
+
+
+class Policy(ABC):
+    """
+    Politique de base : décide des déplacements et des actions d'un joueur
+    """
+
+    name = "base"
+
+    def __init__(self, rng: Optional[random.Random] = None):
+        """Initialise la politique avec son propre générateur aléatoire"""
+        self.rng = rng or random.Random()
+
+    def choose_position(self, game: Game, player: Player, positions: List[int]) -> int:
+        """Choisit le lieu de destination parmi les positions valides"""
+        return self.rng.choice(positions)
+
+    @abstractmethod
+    def choose_action(self, game: Game, player: Player,
+                      available_actions: List[ActionType]) -> Optional[ActionChoice]:
+        """Choisit la prochaine action, ou None pour terminer le tour"""
+        pass
+
+    def observe(self, game: Game, player: Player, move: Move) -> None:
+        """Coup joué par un joueur (déplacement, action réussie ou fin de tour choisie)"""
+
+    def __str__(self) -> str:
+        return f"Policy({self.name})"
+
+
+class RandomPolicy(Policy):
+    """
+    Politique aléatoire uniforme sur toutes les actions paramétrées possibles
+    """
+
+    name = "random"
+
+    def choose_action(self, game: Game, player: Player,
+                      available_actions: List[ActionType]) -> Optional[ActionChoice]:
+        """Tire une action au hasard parmi les coups légaux"""
+        choices = [move for move in MOVE_GENERATOR.legal_moves(game, player) if move.kind == "action"]
+        if not choices:
+            return None
+        move = self.rng.choice(choices)
+        return move.action_type, move.kwargs(game)
+
+
+class GreedyPolicy(Policy):
+    """
+    Politique gloutonne : joue la carte la plus chère possible, sinon gagne du pouvoir
+    """
+
+    name = "greedy"
+
+    # Ordre de préférence des actions quand aucune carte n'est jouable
+    PRIORITIES = [
+        ActionType.PLAY_CARD,
+        ActionType.VANQUISH,
+        ActionType.GAIN_POWER,
+        ActionType.FATE,
+        ActionType.ACTIVATE,
+    ]
+
+    def choose_position(self, game: Game, player: Player, positions: List[int]) -> int:
+        """Se déplace vers le lieu qui rapporte le plus de pouvoir"""
+        def power_gain(position: int) -> int:
+            action = player.board_locations[position].get_action_by_type(ActionType.GAIN_POWER)
+            return action.value if action and action.value else 0
+
+        best = max(power_gain(pos) for pos in positions)
+        return self.rng.choice([pos for pos in positions if power_gain(pos) == best])
+
+    def choose_action(self, game: Game, player: Player,
+                      available_actions: List[ActionType]) -> Optional[ActionChoice]:
+        """Choisit l'action prioritaire disponible"""
+        for action_type in self.PRIORITIES:
+            if action_type not in available_actions:
+                continue
+
+            candidates = action_candidates(game, player, action_type)
+            if not candidates:
+                continue
+
+            if action_type == ActionType.PLAY_CARD:
+                candidates.sort(key=lambda kwargs: player.hand.get(kwargs["card_id"]).cost, reverse=True)
+                return action_type, candidates[0]
+
+            return action_type, self.rng.choice(candidates)
+
+        return None
+
+
+# Registre des politiques disponibles par nom
+POLICIES: Dict[str, type] = {
+    RandomPolicy.name: RandomPolicy,
+    GreedyPolicy.name: GreedyPolicy,
+}
+
+
+def create_policy(name: str, rng: Optional[random.Random] = None) -> Policy:
+    """Crée une politique à partir de son nom"""
+    try:
+        policy_class = POLICIES[name]
+    except KeyError:
+        raise ValueError(f"Politique inconnue: {name} (disponibles: {', '.join(POLICIES)})")
+    return policy_class(rng)
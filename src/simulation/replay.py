@@ -0,0 +1,520 @@
+"""
+Replays binaires - Une partie enregistrée comme sa graine et la suite de ses coups
+
+Les coups acceptés par TurnManager.move_player / perform_action / end_turn sont
+captés par un écouteur et rejoués à l'identique depuis la graine : tout le
+hasard de la partie en dérive, les politiques ne sont pas nécessaires.
+
+Format (version REPLAY_VERSION), entiers en varint LEB128 :
+
+    en-tête   b"VRP" + version + drapeaux, graine (zigzag), max_turns, nombre de
+              joueurs, méchants (index dans VillainType), vainqueur (index + 1,
+              0 = aucun), tours joués, nombre de coups
+    coups     code : 0 = fin de tour, 1..4 = déplacement vers la position code - 1,
+              5 + 2 × index de l'action (ordre de ActionType) puis les valeurs des
+              paramètres habituels (ACTION_PARAMS) ; code impair : nombre de
+              paramètres puis, pour chacun, son code (PARAMS) et sa valeur
+
+Une carte est désignée par son index dans le vocabulaire du codec + 1 (0 : id
+en clair suivi de sa longueur), un joueur cible par sa place dans la partie.
+La fin de tour qui suit la dernière action possible est implicite. Les coups
+sont compressés par zlib (drapeau FLAG_COMPRESSED). Une partie de 60 tours
+tient en 400 à 500 octets, une partie de 200 tours en 1 à 1,5 Ko : c'est plus
+que les quelques centaines d'octets visées, mais les choix d'une politique
+aléatoire pèsent à eux seuls près de 600 octets sur 200 tours, et coder les
+coups par leur rang parmi les coups légaux obligerait à rejouer la partie
+pour lire un replay.
+
+Une archive enchaîne les replays précédés de leur longueur, derrière un
+en-tête portant l'empreinte du vocabulaire : elle se lit en flux, un replay à
+la fois, quel que soit le nombre de parties.
+"""
+
+import zlib
+from dataclasses import dataclass, field
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
+from ..core.enums import ActionType, GameState, TurnPhase, VillainType
+from ..core.game import Game
+from ..core.move_generator import END_TURN, Move
+from ..players.player import Player
+
+
+REPLAY_VERSION = 1
+REPLAY_MAGIC = b"VRP"
+ARCHIVE_MAGIC = b"VRA"
+
+ACTIONS = tuple(ActionType)
+VILLAINS = tuple(VillainType)
+BOARD_SIZE = 4
+ACTION_BASE = 1 + BOARD_SIZE
+
+# Paramètres de perform_action : nom -> (code, genre de valeur)
+PARAMS: Dict[str, Tuple[int, str]] = {
+    "card_id": (0, "card"),
+    "card_ids": (1, "cards"),
+    "target_id": (2, "card"),
+    "hero_id": (3, "card"),
+    "item_id": (4, "card"),
+    "target_player": (5, "int"),
+    "target_location": (6, "int"),
+    "fate_location": (7, "int"),
+}
+PARAM_NAMES = {code: name for name, (code, _) in PARAMS.items()}
+
+# Paramètres habituels de chaque action (ceux du MoveGenerator), triés par nom
+ACTION_PARAMS: Dict[ActionType, Tuple[str, ...]] = {
+    ActionType.GAIN_POWER: (),
+    ActionType.PLAY_CARD: ("card_id",),
+    ActionType.ACTIVATE: ("target_id",),
+    ActionType.DISCARD: ("card_ids",),
+    ActionType.VANQUISH: ("hero_id",),
+    ActionType.FATE: ("target_player",),
+    ActionType.MOVE_ITEM: ("item_id", "target_location"),
+    ActionType.MOVE_HERO: ("hero_id", "target_location"),
+}
+
+FLAG_COMPRESSED = 1
+
+
+class ReplayError(Exception):
+    """Replay illisible ou qui ne se rejoue pas à l'identique"""
+
+
+# === Varints ===
+
+def write_varint(buffer: bytearray, value: int) -> None:
+    """Ajoute un entier positif en LEB128 (7 bits par octet)"""
+    if value < 0:
+        raise ValueError(f"Varint négatif : {value}")
+    while value > 0x7F:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    """Lit un varint à la position pos ; retourne (valeur, position suivante)"""
+    value = shift = 0
+    try:
+        while True:
+            byte = data[pos]
+            pos += 1
+            value |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return value, pos
+            shift += 7
+    except IndexError:
+        raise ReplayError("Varint tronqué") from None
+
+
+def zigzag(value: int) -> int:
+    """Entier signé -> positif (0, -1, 1, -2... -> 0, 1, 2, 3...)"""
+    return value * 2 if value >= 0 else -value * 2 - 1
+
+
+def unzigzag(value: int) -> int:
+    """Inverse de zigzag"""
+    return value // 2 if value % 2 == 0 else -(value + 1) // 2
+
+
+# === Replay ===
+
+@dataclass
+class Replay:
+    """
+    Partie enregistrée : graine, méchants et coups
+
+    Les coups sont des Move dont le joueur cible est désigné par sa place dans
+    game.players : le replay ne dépend d'aucune instance de partie.
+    """
+    seed: int
+    villains: List[VillainType]
+    max_turns: int = 200
+    moves: List[Move] = field(default_factory=list)
+    winner: Optional[int] = None  # Place du vainqueur dans game.players
+    turns: int = 0
+
+    def __len__(self) -> int:
+        return len(self.moves)
+
+    def __str__(self) -> str:
+        """Représentation textuelle du replay"""
+        villains = " vs ".join(villain.value for villain in self.villains)
+        winner = "aucun" if self.winner is None else self.villains[self.winner].value
+        return f"Replay({villains}, graine {self.seed}, {len(self.moves)} coups, {self.turns} tours, vainqueur {winner})"
+
+
+class ReplayCodec:
+    """
+    Encode et décode des replays avec un vocabulaire de cartes fixe
+    """
+
+    def __init__(self, card_ids: Iterable[str] = (), compress: bool = True):
+        """
+        Le vocabulaire (ordre conservé) doit être le même à l'écriture et à la lecture
+
+        Avec compress, la liste des coups est compressée (zlib) quand elle y gagne.
+        """
+        self.vocabulary: Tuple[str, ...] = tuple(card_ids)
+        self.card_index: Dict[str, int] = {card_id: i for i, card_id in enumerate(self.vocabulary)}
+        self.fingerprint = zlib.crc32(",".join(self.vocabulary).encode("utf-8"))
+        self.compress = compress
+
+    @classmethod
+    def from_card_manager(cls, card_manager, compress: bool = True) -> "ReplayCodec":
+        """Codec dont le vocabulaire est le catalogue de cartes, dans l'ordre des index"""
+        definitions = sorted(card_manager.cards_cache.values(), key=lambda d: d.index)
+        return cls((d.id for d in definitions), compress)
+
+    # === Écriture ===
+
+    def encode(self, replay: Replay) -> bytes:
+        """Replay -> octets"""
+        body = bytearray()
+        for move in replay.moves:
+            self.write_move(body, move)
+        flags = 0
+        if self.compress:
+            packed = zlib.compress(bytes(body), 9)
+            if len(packed) < len(body):
+                body, flags = packed, FLAG_COMPRESSED
+
+        buffer = bytearray(REPLAY_MAGIC)
+        buffer.append(REPLAY_VERSION)
+        buffer.append(flags)
+        write_varint(buffer, zigzag(replay.seed))
+        write_varint(buffer, replay.max_turns)
+        write_varint(buffer, len(replay.villains))
+        for villain in replay.villains:
+            write_varint(buffer, VILLAINS.index(villain))
+        write_varint(buffer, 0 if replay.winner is None else replay.winner + 1)
+        write_varint(buffer, replay.turns)
+        write_varint(buffer, len(replay.moves))
+        buffer.extend(body)
+        return bytes(buffer)
+
+    def write_move(self, buffer: bytearray, move: Move) -> None:
+        """Ajoute un coup à un tampon"""
+        if move.kind == "end":
+            buffer.append(0)
+            return
+        if move.kind == "move":
+            position = move.get("position")
+            if not 0 <= position < BOARD_SIZE:
+                raise ValueError(f"Position hors du plateau : {position}")
+            buffer.append(1 + position)
+            return
+
+        index = ACTIONS.index(move.action_type)
+        names = tuple(name for name, _ in move.params)
+        if names == ACTION_PARAMS[move.action_type]:
+            # Paramètres habituels : les valeurs seules, dans l'ordre connu
+            write_varint(buffer, ACTION_BASE + 2 * index)
+            for name, value in move.params:
+                self._write_value(buffer, name, value)
+            return
+
+        write_varint(buffer, ACTION_BASE + 2 * index + 1)
+        write_varint(buffer, len(move.params))
+        for name, value in move.params:
+            if name not in PARAMS:
+                raise ValueError(f"Paramètre inconnu du format de replay : {name}")
+            buffer.append(PARAMS[name][0])
+            self._write_value(buffer, name, value)
+
+    def _write_value(self, buffer: bytearray, name: str, value) -> None:
+        """Ajoute la valeur d'un paramètre selon son genre"""
+        kind = PARAMS[name][1]
+        if kind == "card":
+            self._write_card(buffer, value)
+        elif kind == "cards":
+            write_varint(buffer, len(value))
+            for card_id in value:
+                self._write_card(buffer, card_id)
+        else:
+            write_varint(buffer, value)
+
+    def _write_card(self, buffer: bytearray, card_id: str) -> None:
+        """Ajoute un id de carte : index + 1, ou 0 suivi de l'id en clair"""
+        index = self.card_index.get(card_id)
+        if index is not None:
+            write_varint(buffer, index + 1)
+            return
+        raw = card_id.encode("utf-8")
+        buffer.append(0)
+        write_varint(buffer, len(raw))
+        buffer.extend(raw)
+
+    # === Lecture ===
+
+    def decode(self, data: bytes) -> Replay:
+        """Octets -> Replay"""
+        if data[:3] != REPLAY_MAGIC:
+            raise ReplayError("Ce n'est pas un replay")
+        if len(data) < 5 or data[3] != REPLAY_VERSION:
+            raise ReplayError(f"Version de replay non prise en charge : {data[3:4]!r}")
+
+        flags = data[4]
+        pos = 5
+        seed, pos = read_varint(data, pos)
+        max_turns, pos = read_varint(data, pos)
+        count, pos = read_varint(data, pos)
+        villains = []
+        for _ in range(count):
+            index, pos = read_varint(data, pos)
+            if index >= len(VILLAINS):
+                raise ReplayError(f"Méchant inconnu : {index}")
+            villains.append(VILLAINS[index])
+        winner, pos = read_varint(data, pos)
+        turns, pos = read_varint(data, pos)
+        count, pos = read_varint(data, pos)
+
+        body = data[pos:]
+        if flags & FLAG_COMPRESSED:
+            try:
+                body = zlib.decompress(body)
+            except zlib.error as exc:
+                raise ReplayError(f"Coups compressés illisibles : {exc}") from None
+
+        moves = []
+        pos = 0
+        for _ in range(count):
+            move, pos = self.read_move(body, pos)
+            moves.append(move)
+        if pos != len(body):
+            raise ReplayError(f"{len(body) - pos} octets en trop après le dernier coup")
+
+        return Replay(unzigzag(seed), villains, max_turns, moves, winner - 1 if winner else None, turns)
+
+    def read_move(self, data: bytes, pos: int) -> Tuple[Move, int]:
+        """Lit un coup à la position pos ; retourne (coup, position suivante)"""
+        code, pos = read_varint(data, pos)
+        if code == 0:
+            return END_TURN, pos
+        if code < ACTION_BASE:
+            return Move.position(code - 1), pos
+        index, generic = divmod(code - ACTION_BASE, 2)
+        if index >= len(ACTIONS):
+            raise ReplayError(f"Code de coup inconnu : {code}")
+
+        action_type = ACTIONS[index]
+        params = []
+        if not generic:
+            for name in ACTION_PARAMS[action_type]:
+                value, pos = self._read_value(data, pos, name)
+                params.append((name, value))
+            return Move("action", action_type, tuple(params)), pos
+
+        count, pos = read_varint(data, pos)
+        for _ in range(count):
+            param, pos = read_varint(data, pos)
+            if param not in PARAM_NAMES:
+                raise ReplayError(f"Code de paramètre inconnu : {param}")
+            value, pos = self._read_value(data, pos, PARAM_NAMES[param])
+            params.append((PARAM_NAMES[param], value))
+        return Move("action", action_type, tuple(params)), pos
+
+    def _read_value(self, data: bytes, pos: int, name: str):
+        """Lit la valeur d'un paramètre selon son genre"""
+        kind = PARAMS[name][1]
+        if kind == "card":
+            return self._read_card(data, pos)
+        if kind == "cards":
+            length, pos = read_varint(data, pos)
+            cards = []
+            for _ in range(length):
+                card_id, pos = self._read_card(data, pos)
+                cards.append(card_id)
+            return tuple(cards), pos
+        return read_varint(data, pos)
+
+    def _read_card(self, data: bytes, pos: int) -> Tuple[str, int]:
+        """Lit un id de carte"""
+        index, pos = read_varint(data, pos)
+        if index:
+            if index > len(self.vocabulary):
+                raise ReplayError(f"Carte {index - 1} absente du vocabulaire")
+            return self.vocabulary[index - 1], pos
+        length, pos = read_varint(data, pos)
+        return data[pos:pos + length].decode("utf-8"), pos + length
+
+
+# === Enregistrement ===
+
+class ReplayRecorder:
+    """
+    Écouteur du TurnManager qui enregistre les coups des joueurs d'une partie
+
+    Les coups des autres parties jouées avec le même TurnManager (copies de
+    recherche MCTS, parties voisines) sont ignorés.
+    """
+
+    def __init__(self, game: Game, turn_manager, max_turns: int = 200, listen: bool = True):
+        """
+        Commence l'enregistrement (à créer avant le premier coup)
+
+        Sans listen, l'enregistreur ne s'abonne pas : un répartiteur (GameStore)
+        l'appelle pour les coups de ses joueurs.
+        """
+        self.game = game
+        self.turn_manager = turn_manager
+        self.villains = [player.villain_type for player in game.players]
+        self.replay = Replay(game.seed, self.villains, max_turns)
+        self._players = {id(player): index for index, player in enumerate(game.players)}
+        self._turn_exhausted = False
+        if listen:
+            turn_manager.add_listener(self)
+
+    def __call__(self, player: Player, kind: str, action_type: Optional[ActionType], kwargs: Dict) -> None:
+        """Enregistre un coup accepté"""
+        if id(player) not in self._players:
+            return
+        if kind == "end":
+            # Implicite si la dernière action a épuisé le tour
+            if not self._turn_exhausted:
+                self.record(END_TURN)
+            self._turn_exhausted = False
+        elif kind == "move":
+            self._turn_exhausted = False
+            self.record(Move.position(kwargs["position"]))
+        else:
+            move = Move.action(action_type, kwargs)
+            if move.get("target_player") is not None:
+                target = self.game.get_player_by_id(move.get("target_player"))
+                move = move._replace(params=tuple(
+                    (name, self._players[id(target)] if name == "target_player" else value)
+                    for name, value in move.params
+                ))
+            self._turn_exhausted = player.actions_remaining <= 0
+            self.record(move)
+
+    def record(self, move: Move) -> None:
+        """Ajoute un coup au replay (à étendre pour l'écrire ailleurs)"""
+        self.replay.moves.append(move)
+
+    def finish(self) -> Replay:
+        """Arrête l'enregistrement et complète le résultat de la partie"""
+        self.turn_manager.remove_listener(self)
+        winner = self.game.winner
+        self.replay.winner = self._players[id(winner)] if winner is not None else None
+        self.replay.turns = self.game.turn_number
+        return self.replay
+
+
+# === Relecture ===
+
+class ReplayPlayer:
+    """
+    Rejoue un replay avec un HeadlessEngine chargé des mêmes données
+    """
+
+    def __init__(self, engine):
+        """Le moteur fournit la construction des parties et le TurnManager"""
+        self.engine = engine
+
+    def play(self, replay: Replay, game_id: str = "replay", verify: bool = True) -> Game:
+        """
+        Reconstruit la partie depuis la graine et rejoue tous les coups
+
+        Un coup refusé lève ReplayError. Avec verify, le vainqueur et le nombre
+        de tours doivent correspondre à ceux enregistrés.
+        """
+        game = self.start(replay, game_id)
+        for _ in self.steps(game, replay):
+            pass
+        if verify:
+            winner = game.players.index(game.winner) if game.winner is not None else None
+            if (winner, game.turn_number) != (replay.winner, replay.turns):
+                raise ReplayError(f"Résultat différent : vainqueur {winner} en {game.turn_number} tours, "
+                                  f"attendu {replay.winner} en {replay.turns}")
+        return game
+
+    def start(self, replay: Replay, game_id: str = "replay") -> Game:
+        """Reconstruit la partie depuis la graine et démarre le premier tour"""
+        game = self.engine.build_game(replay.villains, game_id=game_id, seed=replay.seed)
+        self.engine.begin_turn(game, replay.max_turns)
+        return game
+
+    def steps(self, game: Game, replay: Replay) -> Iterator[Move]:
+        """Rejoue les coups un par un sur une partie démarrée ; produit chaque coup après l'avoir appliqué"""
+        engine = self.engine
+        for number, move in enumerate(replay.moves):
+            if game.state != GameState.IN_PROGRESS:
+                raise ReplayError(f"Coup {number} ({move}) après la fin de la partie")
+            player = game.get_current_player()
+            if move.kind == "end":
+                player.turn_phase = TurnPhase.END
+            else:
+                if move.get("target_player") is not None:
+                    target = game.players[move.get("target_player")]
+                    move = move._replace(params=tuple(
+                        (name, target.id if name == "target_player" else value) for name, value in move.params
+                    ))
+                if not engine.move_generator.apply(game, move, player):
+                    raise ReplayError(f"Coup {number} ({move}) refusé au tour {game.turn_number}")
+                if player.turn_phase == TurnPhase.ACTIONS and player.actions_remaining <= 0:
+                    player.turn_phase = TurnPhase.END
+
+            # Fin de tour enregistrée, ou implicite après la dernière action possible
+            if player.turn_phase == TurnPhase.END:
+                engine.finish_turn(game)
+                engine.begin_turn(game, replay.max_turns)
+            yield move
+
+
+# === Archives ===
+
+class ReplayWriter:
+    """
+    Écrit des replays à la suite dans un flux binaire, chacun précédé de sa longueur
+    """
+
+    def __init__(self, stream: BinaryIO, codec: ReplayCodec):
+        """Écrit l'en-tête de l'archive (version et empreinte du vocabulaire)"""
+        self.stream = stream
+        self.codec = codec
+        self.count = 0
+        header = bytearray(ARCHIVE_MAGIC)
+        header.append(REPLAY_VERSION)
+        header.extend(codec.fingerprint.to_bytes(4, "little"))
+        stream.write(header)
+
+    def write(self, replay) -> int:
+        """Ajoute un replay (objet Replay ou déjà encodé) ; retourne sa taille en octets"""
+        data = replay if isinstance(replay, (bytes, bytearray)) else self.codec.encode(replay)
+        prefix = bytearray()
+        write_varint(prefix, len(data))
+        self.stream.write(prefix)
+        self.stream.write(data)
+        self.count += 1
+        return len(data)
+
+
+def iter_replays(stream: BinaryIO, codec: ReplayCodec, raw: bool = False) -> Iterator:
+    """
+    Lit une archive en flux : un replay décodé (ou ses octets si raw) à la fois
+    """
+    header = stream.read(8)
+    if header[:3] != ARCHIVE_MAGIC or len(header) < 8:
+        raise ReplayError("Ce n'est pas une archive de replays")
+    if header[3] != REPLAY_VERSION:
+        raise ReplayError(f"Version d'archive non prise en charge : {header[3]}")
+    if int.from_bytes(header[4:8], "little") != codec.fingerprint:
+        raise ReplayError("Vocabulaire de cartes différent de celui de l'archive")
+
+    while True:
+        length = shift = 0
+        while True:
+            byte = stream.read(1)
+            if not byte:
+                if shift:
+                    raise ReplayError("Archive tronquée")
+                return
+            length |= (byte[0] & 0x7F) << shift
+            if byte[0] < 0x80:
+                break
+            shift += 7
+        data = stream.read(length)
+        if len(data) != length:
+            raise ReplayError("Archive tronquée")
+        yield data if raw else codec.decode(data)
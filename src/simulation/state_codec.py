@@ -0,0 +1,505 @@
+"""
+Sérialisation d'état - État complet d'une partie en JSON compact ou en binaire
+
+Contrairement à Game.get_game_state(), qui résume (taille de la main...), le
+codec écrit tout ce que Game.snapshot() fige : ordre des pioches, défausses,
+cartes en jeu, héros et objets des lieux, progression, et l'état des
+générateurs. L'état relu se restaure dans une partie reconstruite depuis la
+même graine et les mêmes méchants (load, restore) : sauvegarde, envoi sur le
+réseau ou bifurcation d'une partie.
+
+Les chaînes sont internées : index dans le vocabulaire du codec (le catalogue
+de cartes), sinon dans la table de chaînes propre à l'état, numérotée à la
+suite. Une carte est une paire (index de son id, numéro d'exemplaire). Aucun
+dictionnaire n'est construit par carte ni par lieu.
+
+JSON (pour web/) : listes positionnelles
+
+    {"v": version, "catalog": empreinte, "id": id, "seed": graine (texte),
+     "strings": [...], "game": [état, tour, joueur courant, vainqueur, taille du journal],
+     "rng": générateur | null,
+     "players": [[méchant, pouvoir, lieu, phase, actions restantes, victoire,
+                  zones (ZONE_NAMES, chacune [id, exemplaire, id, exemplaire...]),
+                  plateau [[héros], [objets], verrouillé]...,
+                  héros vaincus [[héros, [lieux]]...], progression [[clé, valeur]...],
+                  [générateur méchant, générateur destin]]...]}
+
+Binaire (stockage, IPC) :
+
+    b"VST" + version, empreinte (4 octets), drapeaux, id, graine (zigzag),
+    table de chaînes, puis tous les entiers de l'état (mêmes champs que le JSON,
+    listes précédées de leur longueur) dans un tableau à largeur fixe de 1, 2
+    ou 4 octets, puis les générateurs
+
+Un générateur (random.Random) est écrit comme ses 625 mots de 32 bits, plus
+la valeur gaussienne en attente ; en JSON, ces octets sont en base64. Ils
+font l'essentiel de la taille (2,5 Ko chacun) : sans générateurs (rng=False),
+un état tient en quelques centaines d'octets mais la partie restaurée garde
+l'aléatoire qu'elle avait.
+"""
+
+import base64
+import json
+import struct
+import sys
+import zlib
+from array import array
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+from ..cards.card import Card, CardDefinition
+from ..core.enums import GameState, TurnPhase, VillainType
+from ..core.game import Game, GameSnapshot
+from ..players.player import PlayerSnapshot
+from .replay import ReplayError, read_varint, unzigzag, write_varint, zigzag
+
+
+STATE_VERSION = 1
+STATE_MAGIC = b"VST"
+FLAG_RNG = 1
+
+GAME_STATES = tuple(GameState)
+PHASES = tuple(TurnPhase)
+VILLAINS = tuple(VillainType)
+
+# Zones d'un joueur, dans l'ordre d'écriture
+ZONE_NAMES = ("hand", "villain_deck", "fate_deck", "discard", "fate_discard",
+              "allies", "items", "conditions", "passive")
+
+RNG_WORDS = 625  # Mots d'état d'un Mersenne Twister (+ position)
+_WIDTHS = {1: "B", 2: "H", 4: "I"}
+
+
+class StateHeader(NamedTuple):
+    """Ce qu'il faut pour reconstruire la partie avant d'y restaurer l'état"""
+    game_id: str
+    seed: int
+    villains: Tuple[VillainType, ...]
+
+
+def _player_zones(player) -> tuple:
+    """Zones d'un joueur dans l'ordre de ZONE_NAMES"""
+    return (player.hand, player.villain_deck.cards, player.fate_deck.cards, player.discard_pile,
+            player.fate_discard, player.allies_in_play, player.items_in_play,
+            player.conditions_in_play, player.passive_cards)
+
+
+def pack_rng(state: Any) -> bytes:
+    """État de random.Random -> octets (drapeau gaussien, 625 mots, gaussienne)"""
+    version, words, gauss = state
+    if version != 3 or len(words) != RNG_WORDS:
+        raise ReplayError("État de générateur non pris en charge")
+    packed = array("I", words)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    if gauss is None:
+        return b"\x00" + packed.tobytes()
+    return b"\x01" + packed.tobytes() + struct.pack("<d", gauss)
+
+
+def unpack_rng(data: bytes, pos: int = 0) -> Tuple[Any, int]:
+    """Inverse de pack_rng ; retourne (état, position suivante)"""
+    end = pos + 1 + RNG_WORDS * 4
+    if len(data) < end:
+        raise ReplayError("Générateur tronqué")
+    words = array("I")
+    words.frombytes(data[pos + 1:end])
+    if sys.byteorder == "big":
+        words.byteswap()
+    gauss = None
+    if data[pos]:
+        if len(data) < end + 8:
+            raise ReplayError("Générateur tronqué")
+        gauss = struct.unpack_from("<d", data, end)[0]
+        end += 8
+    return (3, tuple(words), gauss), end
+
+
+class StateCodec:
+    """
+    Encode et décode l'état complet des parties avec un vocabulaire fixe
+    """
+
+    def __init__(self, definitions: Iterable[CardDefinition] = (), rng: bool = True):
+        """
+        Le vocabulaire (ids des définitions, ordre conservé) doit être le même à
+        l'écriture et à la lecture ; rng=False n'écrit pas les générateurs
+        """
+        self.definitions: Tuple[CardDefinition, ...] = tuple(definitions)
+        self.vocabulary: Tuple[str, ...] = tuple(d.id for d in self.definitions)
+        self.index: Dict[str, int] = {card_id: i for i, card_id in enumerate(self.vocabulary)}
+        self.fingerprint = zlib.crc32(",".join(self.vocabulary).encode("utf-8"))
+        self.rng = rng
+        # Exemplaires du catalogue, partagés par tous les états décodés
+        self._cards: Dict[Tuple[int, int], Card] = {}
+
+    @classmethod
+    def from_card_manager(cls, card_manager, rng: bool = True) -> "StateCodec":
+        """Codec dont le vocabulaire est le catalogue de cartes, dans l'ordre des index"""
+        return cls(sorted(card_manager.cards_cache.values(), key=lambda d: d.index), rng)
+
+    # === Internement ===
+
+    def _interner(self) -> Tuple[List[str], Any]:
+        """Table de chaînes d'un état et fonction qui y interne une chaîne"""
+        index = self.index
+        strings: List[str] = []
+        local: Dict[str, int] = {}
+        base = len(self.vocabulary)
+
+        def intern(value: str) -> int:
+            code = index.get(value)
+            if code is None:
+                code = local.get(value)
+                if code is None:
+                    code = local[value] = base + len(strings)
+                    strings.append(value)
+            return code
+        return strings, intern
+
+    def _resolver(self, strings: List[str], game: Optional[Game]) -> Tuple[Tuple[str, ...], Any]:
+        """Chaînes par index et fonction qui retrouve un exemplaire de carte"""
+        names = self.vocabulary + tuple(strings)
+        definitions = self.definitions
+        cache = self._cards
+        game_cards: Dict[Tuple[str, int], Card] = {}
+
+        def card(code: int, copy_id: int) -> Card:
+            found = cache.get((code, copy_id))
+            if found is not None:
+                return found
+            if code < len(definitions):
+                found = cache[(code, copy_id)] = Card(definitions[code], copy_id)
+                return found
+            # Carte hors catalogue (cartes d'exemple) : celle de la partie cible
+            if not game_cards and game is not None:
+                for player in game.players:
+                    for zone in _player_zones(player):
+                        for c in zone:
+                            game_cards.setdefault((c.id, c.copy_id), c)
+            try:
+                return game_cards[(names[code], copy_id)]
+            except (KeyError, IndexError):
+                raise ReplayError(f"Carte {code}#{copy_id} introuvable pour l'état") from None
+        return names, card
+
+    # === Binaire ===
+
+    def encode(self, game: Game) -> bytes:
+        """État complet de la partie en octets"""
+        strings, intern = self._interner()
+        ints: List[int] = []
+        put = ints.append
+        extend = ints.extend
+
+        winner = 0
+        if game.winner is not None:
+            winner = 1 + next(i for i, p in enumerate(game.players) if p is game.winner)
+        extend((GAME_STATES.index(game.state), game.turn_number, game.current_player_index, winner,
+                game.events.total, len(game.players)))
+        rngs = [game.rng]
+
+        for player in game.players:
+            extend((VILLAINS.index(player.villain_type), zigzag(player.power), player.current_location,
+                    PHASES.index(player.turn_phase), player.actions_remaining, int(player.has_won)))
+            for zone in _player_zones(player):
+                put(len(zone))
+                for card in zone:
+                    put(intern(card.id))
+                    put(card.copy_id)
+            put(len(player.board_locations))
+            for location in player.board_locations:
+                heroes, items = location.heroes_present, location.items_present
+                put(len(heroes))
+                extend(map(intern, heroes))
+                put(len(items))
+                extend(map(intern, items))
+                put(int(location.locked))
+            put(len(player.defeated_heroes))
+            for hero_id, locations in player.defeated_heroes.items():
+                put(intern(hero_id))
+                put(len(locations))
+                extend(map(intern, locations))
+            if player.victory_progress:
+                # Valeurs libres : une chaîne JSON dans la table
+                put(1 + intern(json.dumps(list(player.victory_progress.items()), separators=(",", ":"))))
+            else:
+                put(0)
+            rngs.append(player.villain_deck.rng)
+            rngs.append(player.fate_deck.rng)
+
+        buffer = bytearray(STATE_MAGIC)
+        buffer.append(STATE_VERSION)
+        buffer += struct.pack("<I", self.fingerprint)
+        buffer.append(FLAG_RNG if self.rng else 0)
+        raw = game.id.encode("utf-8")
+        write_varint(buffer, len(raw))
+        buffer += raw
+        write_varint(buffer, zigzag(game.seed))
+        write_varint(buffer, len(strings))
+        for value in strings:
+            raw = value.encode("utf-8")
+            write_varint(buffer, len(raw))
+            buffer += raw
+
+        largest = max(ints)
+        width = 1 if largest < 0x100 else 2 if largest < 0x10000 else 4
+        packed = array(_WIDTHS[width], ints)
+        if width > 1 and sys.byteorder == "big":
+            packed.byteswap()
+        write_varint(buffer, len(ints))
+        buffer.append(width)
+        buffer += packed.tobytes()
+
+        if self.rng:
+            for rng in rngs:
+                if rng is None:
+                    buffer.append(0xFF)
+                else:
+                    buffer += pack_rng(rng.getstate())
+        return bytes(buffer)
+
+    def header(self, data: bytes) -> StateHeader:
+        """Id, graine et méchants d'un état binaire, sans décoder le reste"""
+        return self._decode(data, None, header_only=True)
+
+    def decode(self, data: bytes, game: Optional[Game] = None) -> Tuple[StateHeader, GameSnapshot]:
+        """
+        Relit un état binaire
+
+        game (facultative) fournit les cartes hors catalogue ; le GameSnapshot
+        retourné se restaure dans toute partie de mêmes graine et méchants.
+        """
+        return self._decode(data, game)
+
+    def _decode(self, data: bytes, game: Optional[Game], header_only: bool = False):
+        """Lecture de l'en-tête puis, sauf header_only, de l'état"""
+        if data[:4] != STATE_MAGIC + bytes([STATE_VERSION]):
+            raise ReplayError("État illisible (version ou format inconnu)")
+        if len(data) < 9 or struct.unpack_from("<I", data, 4)[0] != self.fingerprint:
+            raise ReplayError("Vocabulaire de cartes différent de celui de l'état")
+        flags = data[8]
+        size, pos = read_varint(data, 9)
+        game_id = data[pos:pos + size].decode("utf-8")
+        seed, pos = read_varint(data, pos + size)
+        seed = unzigzag(seed)
+        count, pos = read_varint(data, pos)
+        strings = []
+        for _ in range(count):
+            size, pos = read_varint(data, pos)
+            strings.append(data[pos:pos + size].decode("utf-8"))
+            pos += size
+
+        count, pos = read_varint(data, pos)
+        width = data[pos] if pos < len(data) else 0
+        if width not in _WIDTHS:
+            raise ReplayError("Largeur d'entiers inconnue")
+        end = pos + 1 + count * width
+        if end > len(data):
+            raise ReplayError("État tronqué")
+        packed = array(_WIDTHS[width])
+        packed.frombytes(data[pos + 1:end])
+        if width > 1 and sys.byteorder == "big":
+            packed.byteswap()
+        ints = packed.tolist()
+        pos = end
+
+        names, card = self._resolver(strings, game)
+        try:
+            n_players = ints[5]
+            villains = []
+            cursor = 6
+            players = []
+            for _ in range(n_players):
+                villain, power, location, phase, actions, has_won = ints[cursor:cursor + 6]
+                villains.append(VILLAINS[villain])
+                cursor += 6
+                if header_only:
+                    cursor = self._skip_player(ints, cursor)
+                    continue
+                zones = []
+                for _ in ZONE_NAMES:
+                    count = ints[cursor]
+                    refs = ints[cursor + 1:cursor + 1 + 2 * count]
+                    zones.append(tuple(map(card, refs[::2], refs[1::2])))
+                    cursor += 1 + 2 * count
+                board = []
+                for _ in range(ints[cursor]):
+                    cursor += 1
+                    count = ints[cursor]
+                    heroes = tuple(names[i] for i in ints[cursor + 1:cursor + 1 + count])
+                    cursor += 1 + count
+                    count = ints[cursor]
+                    items = tuple(names[i] for i in ints[cursor + 1:cursor + 1 + count])
+                    cursor += 1 + count
+                    board.append((heroes, items, bool(ints[cursor])))
+                cursor += 1
+                defeated = []
+                for _ in range(ints[cursor]):
+                    hero, count = ints[cursor + 1], ints[cursor + 2]
+                    defeated.append((names[hero], tuple(names[i] for i in ints[cursor + 3:cursor + 3 + count])))
+                    cursor += 2 + count
+                cursor += 1
+                progress = ()
+                if ints[cursor]:
+                    progress = tuple(tuple(pair) for pair in json.loads(names[ints[cursor] - 1]))
+                cursor += 1
+                players.append([power, location, phase, actions, has_won, zones, board, defeated, progress])
+        except IndexError:
+            raise ReplayError("État tronqué") from None
+
+        header = StateHeader(game_id, seed, tuple(villains))
+        if header_only:
+            return header
+
+        rngs: List[Any] = []
+        if flags & FLAG_RNG:
+            for _ in range(1 + 2 * n_players):
+                if pos < len(data) and data[pos] == 0xFF:
+                    rngs.append(None)
+                    pos += 1
+                else:
+                    state, pos = unpack_rng(data, pos)
+                    rngs.append(state)
+        else:
+            rngs = [None] * (1 + 2 * n_players)
+        if pos != len(data):
+            raise ReplayError("Octets en trop à la fin de l'état")
+
+        snapshots = tuple(
+            self._player_snapshot(unzigzag(power), location, PHASES[phase], actions, bool(has_won), zones,
+                                  rngs[1 + 2 * i], rngs[2 + 2 * i], board, defeated, progress)
+            for i, (power, location, phase, actions, has_won, zones, board, defeated, progress)
+            in enumerate(players)
+        )
+        state, turn, current, winner, log_size = ints[:5]
+        return header, GameSnapshot(current, turn, GAME_STATES[state], winner - 1 if winner else None,
+                                    rngs[0], log_size, snapshots)
+
+    @staticmethod
+    def _skip_player(ints: List[int], cursor: int) -> int:
+        """Position qui suit les zones, le plateau et la progression d'un joueur"""
+        for _ in ZONE_NAMES:
+            cursor += 1 + 2 * ints[cursor]
+        for _ in range(ints[cursor]):
+            cursor += 1
+            cursor += 1 + ints[cursor]
+            cursor += 1 + ints[cursor]
+        cursor += 1
+        for _ in range(ints[cursor]):
+            cursor += 2 + ints[cursor + 2]
+        return cursor + 2
+
+    @staticmethod
+    def _player_snapshot(power, location, phase, actions, has_won, zones, villain_rng, fate_rng,
+                         board, defeated, progress) -> PlayerSnapshot:
+        """Assemble l'instantané d'un joueur à partir des champs décodés"""
+        hand, villain_deck, fate_deck, discard, fate_discard, allies, items, conditions, passive = zones
+        return PlayerSnapshot(
+            power, location, phase, actions, has_won, hand,
+            villain_deck, villain_rng, fate_deck, fate_rng,
+            discard, fate_discard, allies, items, conditions, passive,
+            tuple(defeated), tuple(progress), tuple(board)
+        )
+
+    # === JSON ===
+
+    def to_json(self, game: Game) -> Dict[str, Any]:
+        """État complet de la partie en objets JSON (listes positionnelles)"""
+        strings, intern = self._interner()
+        rng = self.rng
+
+        def cards(zone) -> List[int]:
+            flat = []
+            put = flat.append
+            for card in zone:
+                put(intern(card.id))
+                put(card.copy_id)
+            return flat
+
+        def random_state(generator) -> Optional[str]:
+            if not rng or generator is None:
+                return None
+            return base64.b64encode(pack_rng(generator.getstate())).decode("ascii")
+
+        players = []
+        for player in game.players:
+            players.append([
+                player.villain_type.value, player.power, player.current_location,
+                player.turn_phase.value, player.actions_remaining, player.has_won,
+                [cards(zone) for zone in _player_zones(player)],
+                [[[intern(h) for h in location.heroes_present], [intern(i) for i in location.items_present],
+                  location.locked] for location in player.board_locations],
+                [[intern(hero_id), [intern(l) for l in locations]]
+                 for hero_id, locations in player.defeated_heroes.items()],
+                [[key, value] for key, value in player.victory_progress.items()],
+                [random_state(player.villain_deck.rng), random_state(player.fate_deck.rng)],
+            ])
+
+        winner = None
+        if game.winner is not None:
+            winner = next(i for i, p in enumerate(game.players) if p is game.winner)
+        return {
+            "v": STATE_VERSION, "catalog": self.fingerprint, "id": game.id,
+            # Graine sur 64 bits : en texte, au-delà des entiers exacts de JavaScript
+            "seed": str(game.seed),
+            "strings": strings,
+            "game": [game.state.value, game.turn_number, game.current_player_index, winner, game.events.total],
+            "rng": random_state(game.rng),
+            "players": players,
+        }
+
+    def from_json(self, data: Dict[str, Any], game: Optional[Game] = None) -> Tuple[StateHeader, GameSnapshot]:
+        """Relit un état écrit par to_json (voir decode)"""
+        if data.get("v") != STATE_VERSION:
+            raise ReplayError("État illisible (version ou format inconnu)")
+        if data.get("catalog") != self.fingerprint:
+            raise ReplayError("Vocabulaire de cartes différent de celui de l'état")
+        names, card = self._resolver(data["strings"], game)
+
+        def random_state(text: Optional[str]) -> Any:
+            return None if text is None else unpack_rng(base64.b64decode(text))[0]
+
+        try:
+            villains = []
+            snapshots = []
+            for (villain, power, location, phase, actions, has_won, zones, board, defeated, progress,
+                 (villain_rng, fate_rng)) in data["players"]:
+                villains.append(VillainType(villain))
+                snapshots.append(self._player_snapshot(
+                    power, location, TurnPhase(phase), actions, has_won,
+                    [tuple(map(card, refs[::2], refs[1::2])) for refs in zones],
+                    random_state(villain_rng), random_state(fate_rng),
+                    [(tuple(names[i] for i in heroes), tuple(names[i] for i in items), locked)
+                     for heroes, items, locked in board],
+                    [(names[hero], tuple(names[i] for i in locations)) for hero, locations in defeated],
+                    [tuple(pair) for pair in progress]
+                ))
+            state, turn, current, winner, log_size = data["game"]
+            header = StateHeader(data["id"], int(data["seed"]), tuple(villains))
+            snapshot = GameSnapshot(current, turn, GameState(state), winner, random_state(data["rng"]),
+                                    log_size, tuple(snapshots))
+        except (KeyError, IndexError, TypeError, ValueError) as error:
+            raise ReplayError(f"État JSON illisible : {error}") from None
+        return header, snapshot
+
+    # === Restauration ===
+
+    def restore(self, game: Game, data) -> StateHeader:
+        """Restaure un état (octets ou JSON) dans une partie de mêmes graine et méchants"""
+        header, snapshot = self.decode(data, game) if isinstance(data, (bytes, bytearray)) \
+            else self.from_json(data, game)
+        if header.seed != game.seed or header.villains != tuple(p.villain_type for p in game.players):
+            raise ReplayError("L'état ne correspond pas à cette partie (graine ou méchants)")
+        game.restore(snapshot)
+        return header
+
+    def load(self, data, engine) -> Game:
+        """Reconstruit la partie depuis sa graine (HeadlessEngine) puis y restaure l'état"""
+        header = self.header(data) if isinstance(data, (bytes, bytearray)) \
+            else StateHeader(data["id"], int(data["seed"]), tuple(VillainType(p[0]) for p in data["players"]))
+        game = engine.build_game(header.villains, game_id=header.game_id, seed=header.seed)
+        self.restore(game, data)
+        return game
+
+    def __str__(self) -> str:
+        """Représentation textuelle du codec"""
+        return f"StateCodec({len(self.vocabulary)} cartes, générateurs {'inclus' if self.rng else 'exclus'})"
@@ -0,0 +1,372 @@
+"""
+Environnement vectoriel - K parties indépendantes avancées au même pas pour l'apprentissage par renforcement
+
+reset(seeds) et step(actions) travaillent sur des tableaux NumPy préalloués :
+observations (StateEncoder), récompenses, fins de partie et masques des
+actions légales sont réécrits en place à chaque pas, en un seul encode_batch
+pour les K parties. Une partie terminée est aussitôt remplacée par une
+nouvelle ; l'observation renvoyée pour elle est celle de la nouvelle partie.
+
+L'agent joue toujours le joueur courant de chaque partie (auto-jeu) : les
+observations sont encodées de son point de vue et la récompense d'un pas va au
+joueur qui vient d'agir (+1 s'il gagne, -1 si un adversaire gagne, 0 sinon).
+Une victoire étant constatée au début du tour du vainqueur, elle tombe le plus
+souvent au dernier pas du perdant ; infos donne le vainqueur de chaque partie finie.
+
+ShardedVectorEnv répartit les parties sur des sous-processus qui écrivent
+directement dans des tableaux en mémoire partagée.
+"""
+
+import multiprocessing
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from ..core.enums import ActionType, GameState
+from ..core.game import Game
+from ..core.rng import derive_seed
+from ..core.move_generator import END_TURN, Move
+from ..players.player import Player
+from .encoding import BOARD_SIZE, StateEncoder
+from .engine import DEFAULT_DATA_ROOT, HeadlessEngine
+
+
+# Actions dont le paramètre est une carte (ou un héros) du vocabulaire
+CARD_ACTIONS = (
+    (ActionType.PLAY_CARD, "card_id"),
+    (ActionType.ACTIVATE, "target_id"),
+    (ActionType.DISCARD, "card_ids"),
+    (ActionType.VANQUISH, "hero_id"),
+)
+
+# Actions dont les paramètres sont un objet ou un héros et un lieu cible
+PLACEMENT_ACTIONS = (
+    (ActionType.MOVE_ITEM, "item_id"),
+    (ActionType.MOVE_HERO, "hero_id"),
+)
+
+
+class ActionSpace:
+    """
+    Espace d'actions discret de taille fixe
+
+    Disposition : déplacements [4], fin de tour [1], gain de pouvoir [1], puis
+    une case par carte du vocabulaire pour play_card, activate, discard et
+    vanquish, une case par adversaire (dans l'ordre du tour) pour fate, et
+    une case par (carte, lieu) pour move_item et move_hero. Les cartes hors
+    vocabulaire partagent la dernière case de chaque bloc.
+    """
+
+    def __init__(self, encoder: StateEncoder):
+        """Calcule les blocs à partir du vocabulaire de l'encodeur"""
+        self.encoder = encoder
+        width = encoder.layout.width
+        self.offsets: Dict[Any, int] = {}
+        self.size = 0
+
+        self._add("move", BOARD_SIZE)
+        self._add("end", 1)
+        self._add(ActionType.GAIN_POWER, 1)
+        for action_type, _ in CARD_ACTIONS:
+            self._add(action_type, width)
+        self._add(ActionType.FATE, encoder.layout.max_players - 1)
+        for action_type, _ in PLACEMENT_ACTIONS:
+            self._add(action_type, width * BOARD_SIZE)
+
+        self._card_params = dict(CARD_ACTIONS)
+        self._placement_params = dict(PLACEMENT_ACTIONS)
+
+    def _add(self, name: Any, length: int) -> None:
+        """Ajoute un bloc à la fin de l'espace"""
+        self.offsets[name] = self.size
+        self.size += length
+
+    def index(self, move: Move, game: Game, player: Player) -> int:
+        """Case d'un coup, ou -1 s'il n'est pas représentable (adversaire au-delà de max_players)"""
+        if move.kind == "move":
+            return self.offsets["move"] + move.get("position")
+        if move.kind == "end":
+            return self.offsets["end"]
+
+        action_type = move.action_type
+        offset = self.offsets[action_type]
+        card_index = self.encoder.card_index
+        unknown = self.encoder.unknown
+
+        if action_type == ActionType.GAIN_POWER:
+            return offset
+        if action_type in self._card_params:
+            value = move.get(self._card_params[action_type])
+            if isinstance(value, tuple):
+                value = value[0]
+            return offset + card_index.get(value, unknown)
+        if action_type == ActionType.FATE:
+            players = game.players
+            target = next(i for i, p in enumerate(players) if p.id == move.get("target_player"))
+            relative = (target - game.current_player_index) % len(players) - 1
+            return offset + relative if relative < self.encoder.layout.max_players - 1 else -1
+        if action_type in self._placement_params:
+            value = card_index.get(move.get(self._placement_params[action_type]), unknown)
+            return offset + value * BOARD_SIZE + move.get("target_location")
+        return -1
+
+
+class VectorEnv:
+    """
+    K parties jouées en parallèle dans le processus courant
+
+    Les tableaux observations, rewards, dones et masks sont réutilisés d'un pas
+    à l'autre : les copier pour les conserver. Des tableaux externes (mémoire
+    partagée) peuvent être fournis par buffers.
+    """
+
+    def __init__(self, num_envs: int, villains: Sequence[str] = ("maleficent", "jafar"),
+                 max_turns: int = 200, engine: Optional[HeadlessEngine] = None,
+                 buffers: Optional[Dict[str, np.ndarray]] = None):
+        """Initialise les K emplacements de parties et les tableaux de sortie"""
+        self.num_envs = num_envs
+        self.villains = list(villains)
+        self.max_turns = max_turns
+        self.engine = engine or HeadlessEngine(log_events=False)
+        self.encoder = StateEncoder.from_card_manager(self.engine.card_manager, max_players=len(self.villains))
+        self.action_space = ActionSpace(self.encoder)
+
+        buffers = buffers or allocate_buffers(num_envs, self.encoder.size, self.action_space.size)
+        self.observations: np.ndarray = buffers["observations"]
+        self.masks: np.ndarray = buffers["masks"]
+        self.rewards: np.ndarray = buffers["rewards"]
+        self.dones: np.ndarray = buffers["dones"]
+
+        self.games: List[Optional[Game]] = [None] * num_envs
+        self._moves: List[Dict[int, Move]] = [{} for _ in range(num_envs)]
+        self.episodes = 0
+        self.steps = 0
+
+    # === API ===
+
+    def reset(self, seeds: Optional[Sequence[int]] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Démarre K nouvelles parties, retourne (observations, masques)"""
+        seeds = list(seeds) if seeds is not None else list(range(self.num_envs))
+        if len(seeds) != self.num_envs:
+            raise ValueError(f"{self.num_envs} graines attendues, {len(seeds)} reçues")
+
+        for index, seed in enumerate(seeds):
+            self._new_game(index, seed)
+
+        self.rewards[:] = 0
+        self.dones[:] = False
+        self._refresh()
+        return self.observations, self.masks
+
+    def step(self, actions: Sequence[int]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, List[dict]]:
+        """
+        Joue une action par partie, retourne (observations, récompenses, fins, masques, infos)
+
+        Une action absente du masque termine le tour. infos ne contient des
+        entrées (vainqueur, tours) que pour les parties terminées à ce pas.
+        """
+        infos: List[dict] = [{} for _ in range(self.num_envs)]
+        engine = self.engine
+
+        for index, game in enumerate(self.games):
+            player = game.get_current_player()
+            move = self._moves[index].get(int(actions[index]), END_TURN)
+            engine.apply_move(game, move, self.max_turns)
+
+            done = game.state != GameState.IN_PROGRESS
+            self.dones[index] = done
+            if not done:
+                self.rewards[index] = 0.0
+                continue
+
+            winner = game.winner
+            self.rewards[index] = 0.0 if winner is None else (1.0 if winner is player else -1.0)
+            infos[index] = {"winner": winner.villain_type.value if winner else None,
+                            "turns": game.turn_number, "seed": game.seed}
+            self.episodes += 1
+            self._new_game(index, derive_seed(game.seed, "reset"))  # Suite de graines propre à l'emplacement
+
+        self.steps += self.num_envs
+        self._refresh()
+        return self.observations, self.rewards, self.dones, self.masks, infos
+
+    # === Interne ===
+
+    def _new_game(self, index: int, seed: int) -> None:
+        """Remplace la partie d'un emplacement"""
+        game = self.engine.build_game(self.villains, game_id=f"env_{index}", seed=seed)
+        self.engine.begin_turn(game, self.max_turns)
+        self.games[index] = game
+
+    def _refresh(self) -> None:
+        """Réencode toutes les observations et les masques d'actions légales"""
+        self.encoder.encode_batch(self.games, self.observations)
+        self.masks[:] = False
+        generator = self.engine.move_generator
+        space = self.action_space
+
+        for index, game in enumerate(self.games):
+            player = game.get_current_player()
+            lookup = {}
+            for move in generator.legal_moves(game, player):
+                slot = space.index(move, game, player)
+                if slot >= 0 and slot not in lookup:
+                    lookup[slot] = move
+            self._moves[index] = lookup
+            self.masks[index, list(lookup)] = True
+
+    def close(self) -> None:
+        """Rien à libérer pour l'environnement local"""
+
+    def __str__(self) -> str:
+        """Représentation textuelle de l'environnement"""
+        return (f"VectorEnv({self.num_envs} parties, {' vs '.join(self.villains)}, "
+                f"obs {self.encoder.size}, actions {self.action_space.size})")
+
+
+def allocate_buffers(num_envs: int, observation_size: int, action_size: int,
+                     allocator=None) -> Dict[str, np.ndarray]:
+    """Tableaux de sortie d'un environnement ; allocator(shape, dtype) permet la mémoire partagée"""
+    allocator = allocator or (lambda shape, dtype: np.zeros(shape, dtype=dtype))
+    return {
+        "observations": allocator((num_envs, observation_size), np.float32),
+        "masks": allocator((num_envs, action_size), np.bool_),
+        "rewards": allocator((num_envs,), np.float32),
+        "dones": allocator((num_envs,), np.bool_),
+        "actions": allocator((num_envs,), np.int64),
+    }
+
+
+# === Sous-processus en mémoire partagée ===
+
+def _attach(names: Dict[str, Tuple[str, tuple, str]]) -> Tuple[List[shared_memory.SharedMemory], Dict[str, np.ndarray]]:
+    """Ouvre les segments de mémoire partagée et crée les vues NumPy"""
+    segments, arrays = [], {}
+    for key, (name, shape, dtype) in names.items():
+        segment = shared_memory.SharedMemory(name=name)
+        segments.append(segment)
+        arrays[key] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=segment.buf)
+    return segments, arrays
+
+
+def _shard_worker(conn, names, start: int, stop: int, villains: List[str], max_turns: int, data_root: str) -> None:
+    """Boucle d'un sous-processus : fait avancer les parties [start, stop) à chaque commande"""
+    segments, arrays = _attach(names)
+    views = {key: array[start:stop] for key, array in arrays.items()}
+    engine = HeadlessEngine(data_root, log_events=False)
+    env = VectorEnv(stop - start, villains, max_turns, engine, buffers=views)
+    try:
+        while True:
+            command, payload = conn.recv()
+            if command == "reset":
+                env.reset(payload)
+                conn.send(None)
+            elif command == "step":
+                _, _, _, _, infos = env.step(views["actions"])
+                conn.send([(start + i, info) for i, info in enumerate(infos) if info])
+            else:
+                break
+    finally:
+        views.clear()
+        arrays.clear()
+        del env
+        for segment in segments:
+            segment.close()
+        conn.close()
+
+
+class ShardedVectorEnv:
+    """
+    Environnement vectoriel réparti sur des sous-processus
+
+    Chaque sous-processus fait avancer sa tranche de parties et écrit ses
+    sorties dans des tableaux en mémoire partagée : seules les commandes et les
+    infos des parties terminées passent par les tubes.
+    """
+
+    def __init__(self, num_envs: int, num_shards: int = 2, villains: Sequence[str] = ("maleficent", "jafar"),
+                 max_turns: int = 200, data_root: str = DEFAULT_DATA_ROOT):
+        """Crée la mémoire partagée et démarre les sous-processus"""
+        self.num_envs = num_envs
+        self.num_shards = max(1, min(num_shards, num_envs))
+
+        # Dimensions calculées une fois dans le processus principal
+        probe = VectorEnv(1, villains, max_turns, HeadlessEngine(data_root, log_events=False))
+        self.encoder = probe.encoder
+        self.action_space = probe.action_space
+
+        self._segments: List[shared_memory.SharedMemory] = []
+        specs: List[Tuple[str, tuple, str]] = []
+
+        def shared(shape, dtype):
+            dtype = np.dtype(dtype)
+            segment = shared_memory.SharedMemory(create=True, size=max(1, int(np.prod(shape)) * dtype.itemsize))
+            self._segments.append(segment)
+            specs.append((segment.name, shape, dtype.str))
+            array = np.ndarray(shape, dtype=dtype, buffer=segment.buf)
+            array[...] = 0
+            return array
+
+        arrays = allocate_buffers(num_envs, self.encoder.size, self.action_space.size, allocator=shared)
+        names = dict(zip(arrays, specs))
+        self.observations = arrays["observations"]
+        self.masks = arrays["masks"]
+        self.rewards = arrays["rewards"]
+        self.dones = arrays["dones"]
+        self.actions = arrays["actions"]
+
+        bounds = np.linspace(0, num_envs, self.num_shards + 1).astype(int)
+        self._bounds = list(zip(bounds[:-1], bounds[1:]))
+        context = multiprocessing.get_context()
+        self._conns = []
+        self._processes = []
+        for start, stop in self._bounds:
+            parent, child = context.Pipe()
+            process = context.Process(target=_shard_worker, daemon=True,
+                                      args=(child, names, int(start), int(stop), list(villains), max_turns,
+                                            data_root))
+            process.start()
+            child.close()
+            self._conns.append(parent)
+            self._processes.append(process)
+
+    def reset(self, seeds: Optional[Sequence[int]] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Démarre de nouvelles parties dans tous les sous-processus"""
+        seeds = list(seeds) if seeds is not None else list(range(self.num_envs))
+        for conn, (start, stop) in zip(self._conns, self._bounds):
+            conn.send(("reset", seeds[start:stop]))
+        for conn in self._conns:
+            conn.recv()
+        return self.observations, self.masks
+
+    def step(self, actions: Sequence[int]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, List[dict]]:
+        """Même contrat que VectorEnv.step, les sous-processus avancent en parallèle"""
+        self.actions[:] = actions
+        for conn in self._conns:
+            conn.send(("step", None))
+
+        infos: List[dict] = [{} for _ in range(self.num_envs)]
+        for conn in self._conns:
+            for index, info in conn.recv():
+                infos[index] = info
+        return self.observations, self.rewards, self.dones, self.masks, infos
+
+    def close(self) -> None:
+        """Arrête les sous-processus et libère la mémoire partagée"""
+        for conn in self._conns:
+            try:
+                conn.send(("close", None))
+            except (BrokenPipeError, OSError):
+                pass
+        for process in self._processes:
+            process.join(timeout=5)
+        self._conns, self._processes = [], []
+
+        self.observations = self.masks = self.rewards = self.dones = self.actions = None
+        for segment in self._segments:
+            segment.close()
+            segment.unlink()
+        self._segments = []
+
+    def __str__(self) -> str:
+        """Représentation textuelle de l'environnement"""
+        return f"ShardedVectorEnv({self.num_envs} parties sur {self.num_shards} processus)"
@@ -0,0 +1,59 @@
+"""
+Tests des plateaux : modèles partagés et état par partie
+"""
+
+import sys
+import os
+
+# Ajoute le répertoire src au path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core.enums import ActionType
+from src.board.board_manager import BoardManager
+
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'boards')
+
+
+def test_board_template_instances():
+    """Test que chaque partie a son propre état sur un modèle commun"""
+    print("\n🧪 Test: Plateaux par partie")
+
+    board_manager = BoardManager(DATA_PATH)
+    board_a = board_manager.load_villain_board("maleficent")
+    board_b = board_manager.load_villain_board("maleficent")
+
+    assert len(board_a) == 4 and [loc.position for loc in board_a] == [0, 1, 2, 3]
+    assert board_a[0].template is board_b[0].template
+    assert board_a[0].actions is board_b[0].actions
+
+    board_a[1].add_hero("prince_philip")
+    board_a[1].add_item("sceptre")
+    board_a[2].locked = True
+
+    assert board_a[1].has_heroes() and board_a[1].items_present == ["sceptre"]
+    assert not board_b[1].has_heroes() and not board_b[1].items_present
+    assert board_a[2].locked and not board_b[2].locked
+
+    # Les actions bloquées par les héros suivent l'état de la partie
+    blocked = [a for a in board_a[1].actions if a.blocked_by_heroes]
+    if blocked:
+        assert blocked[0] not in board_a[1].get_available_actions()
+        assert blocked[0] in board_b[1].get_available_actions()
+
+    assert board_manager.validate_board(board_a) == []
+    assert board_a[0].get_action_by_type(ActionType.GAIN_POWER) is not None
+    print("✅ États indépendants, modèle partagé")
+
+
+def test_board_state_copy():
+    """Test la copie indépendante d'un état de plateau"""
+    from src.board.board import BoardState
+
+    state = BoardState()
+    state.heroes[0].append("hero")
+    state.locks[3] = 1
+
+    copy = state.copy()
+    copy.heroes[0].clear()
+    assert state.heroes[0] == ["hero"] and copy.locks[3] == 1
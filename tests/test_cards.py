@@ -0,0 +1,155 @@
+"""
+Tests des cartes et des paquets
+"""
+
+import sys
+import os
+import random
+
+# Ajoute le répertoire src au path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core.enums import CardType
+from src.cards.card import Card
+from src.cards.deck import Deck, DiscardPile
+
+
+def make_cards(count):
+    """Crée des cartes factices"""
+    return [Card(id=f"card_{i}", name=f"Carte {i}", card_type=CardType.ALLY, cost=i,
+                 description="", effects=[]) for i in range(count)]
+
+
+def test_deck_order():
+    """Test l'ordre de pioche et les ajouts aux deux extrémités"""
+    cards = make_cards(5)
+    deck = Deck(cards)
+
+    assert [c.id for c in deck.peek_top(2)] == ["card_0", "card_1"]
+    assert deck.draw_card() is cards[0]
+
+    deck.add_to_top(cards[0])
+    deck.add_to_bottom(make_cards(6)[5])
+    assert [c.id for c in deck] == ["card_0", "card_1", "card_2", "card_3", "card_4", "card_5"]
+    assert len(deck) == 6
+    assert deck.peek_top(10)[-1].id == "card_5"
+
+
+def test_refill_from_discard():
+    """Test le remélange de la défausse dans le deck"""
+    deck = Deck([], random.Random(3))
+    discard = DiscardPile()
+    for card in make_cards(4):
+        discard.add_card(card)
+
+    assert discard.peek_top_card().id == "card_3"
+
+    deck.refill_from(discard)
+    assert len(deck) == 4 and len(discard) == 0
+    assert sorted(c.id for c in deck) == ["card_0", "card_1", "card_2", "card_3"]
+
+
+def test_player_hand_index():
+    """Test l'index id -> carte de la main d'un joueur"""
+    from src.players.hand import PlayerHand
+
+    cards = make_cards(3)
+    duplicate = Card(id="card_1", name="Carte 1 bis", card_type=CardType.ALLY, cost=1,
+                     description="", effects=[])
+    hand = PlayerHand(cards + [duplicate])
+
+    assert len(hand) == 4 and hand.has_id("card_2")
+    assert hand.get("card_1") is cards[1]
+
+    hand.remove(cards[1])
+    assert hand.get("card_1") is duplicate
+    assert cards[1] not in hand and duplicate in hand
+    assert [c.id for c in hand] == ["card_0", "card_2", "card_1"]
+
+    assert hand.remove_by_id("card_1") is duplicate
+    assert not hand.has_id("card_1")
+    assert hand[0] is cards[0] and hand.index(cards[2]) == 1
+
+
+def test_effect_compilation():
+    """Test la compilation des effets au chargement et leur exécution"""
+    from src.cards.card import CardEffect
+    from src.cards.card_manager import CardManager
+    from src.cards.effects import GainPower, OpSequence, EffectContext, NOOP, compile_effect, resolve_effects
+    from src.players.player import Player
+    from src.core.enums import VillainType
+
+    assert isinstance(compile_effect(CardEffect("Gagne 2 pouvoirs", "play")), GainPower)
+    assert compile_effect(CardEffect("Pioche une carte quand joué", "play")).count == 1
+    assert compile_effect(CardEffect("Le méchant perd 2 pouvoirs", "play")).amount == -2
+    assert compile_effect(CardEffect("Aladdin gagne +2 force", "passive")) is NOOP
+    combo = compile_effect(CardEffect("Pioche 2 cartes et gagne 1 pouvoir", "play"))
+    assert isinstance(combo, OpSequence) and len(combo.ops) == 2
+    assert compile_effect(CardEffect("Effet spécial", "play", parameters={"draw_cards": 3})).count == 3
+
+    card_manager = CardManager(os.path.join(os.path.dirname(__file__), '..', 'data', 'cards'))
+    cards = card_manager.load_villain_cards("jafar")
+    assert all(effect.op is not None for card in cards for effect in card.effects)
+
+    player = Player(id="p1", name="Test", villain_type=VillainType.JAFAR)
+    card = Card(id="c", name="C", card_type=CardType.EFFECT, cost=0, description="",
+                effects=[CardEffect("Gagne 3 pouvoirs", "play")])
+    applied = resolve_effects(card, "play", EffectContext(player, card))
+    assert player.power == 3 and len(applied) == 1
+
+
+def test_passive_effects_index():
+    """Test l'index des effets par trigger et la résolution des effets permanents"""
+    from src.cards.card import CardEffect
+    from src.cards.effects import resolve_passive_effects
+    from src.players.player import Player
+    from src.core.enums import VillainType
+
+    item = Card(id="item", name="Sceptre", card_type=CardType.ITEM, cost=0, description="",
+                effects=[CardEffect("Gagne 1 pouvoir par tour", "passive"),
+                         CardEffect("Pioche une carte", "activate")])
+    ally = Card(id="ally", name="Sbire", card_type=CardType.ALLY, cost=0, description="", effects=[])
+
+    assert [e.trigger for e in item.get_effects_by_trigger("passive")] == ["passive"]
+    assert item.get_effects_by_trigger("discard") == ()
+    assert set(item.effects_by_trigger) == {"passive", "activate"}
+
+    player = Player(id="p1", name="Test", villain_type=VillainType.MALEFICENT)
+    player.hand.extend([item, ally])
+    player.play_card(item)
+    player.play_card(ally)
+    assert player.passive_cards == [item]
+
+    resolve_passive_effects(player)
+    assert player.power == 1
+
+    assert player.remove_from_play(item)
+    assert player.passive_cards == [] and player.discard_pile == [item]
+
+
+def test_card_definitions_are_shared():
+    """Test le partage des définitions entre les exemplaires de plusieurs parties"""
+    import pickle
+    from src.cards.card import CardDefinition
+    from src.cards.card_manager import CardManager
+
+    card_manager = CardManager(os.path.join(os.path.dirname(__file__), '..', 'data', 'cards'))
+    deck_a = card_manager.create_villain_deck("jafar", random.Random(1))
+    deck_b = card_manager.create_villain_deck("jafar", random.Random(2))
+
+    card = deck_a.draw_card()
+    twin = deck_b.find_card(card.id)
+    assert card is not twin and card.definition is twin.definition
+    assert card_manager.get_card_by_id(card.id) is card.definition
+    assert card.definition.index >= 0 and card.uid.startswith(card.id)
+    assert not hasattr(card, "__dict__")
+
+    try:
+        card.definition.cost = 99
+        assert False, "La définition devrait être immuable"
+    except AttributeError:
+        pass
+
+    copy = pickle.loads(pickle.dumps(card.definition))
+    assert isinstance(copy, CardDefinition) and copy.name == card.name
+    assert copy.effects_by_trigger.keys() == card.definition.effects_by_trigger.keys()
@@ -0,0 +1,80 @@
+"""
+Tests de l'encodage vectoriel des états
+"""
+
+import sys
+import os
+import pytest
+
+# Ajoute le répertoire src au path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+np = pytest.importorskip("numpy")
+
+from src.core.enums import TurnPhase
+from src.simulation import HeadlessEngine
+from src.simulation.encoding import ENCODING_VERSION, StateEncoder
+
+
+def test_encode_batch_matches_game_state():
+    """Test les champs encodés et l'encodage par lot dans un tableau préalloué"""
+    engine = HeadlessEngine()
+    encoder = StateEncoder.from_card_manager(engine.card_manager)
+    games = [engine.build_game(["maleficent", "jafar"], seed=seed) for seed in range(3)]
+    game = games[0]
+    player = game.get_current_player()
+    player.power = 5
+    player.board_locations[2].add_hero(player.fate_deck.cards[0].id)
+
+    out = encoder.allocate(4)
+    out[3] = -1
+    encoder.encode_batch(games, out)
+    layout = encoder.layout
+    state = out[0]
+
+    assert layout.version == ENCODING_VERSION and len(layout.signature()) == 16
+    assert layout.view(state, "p0.power")[0] == 5
+    assert layout.view(state, "p0.phase")[list(TurnPhase).index(player.turn_phase)] == 1
+    assert layout.view(state, "p0.hand").sum() == len(player.hand)
+    assert layout.view(state, "p0.villain_deck").sum() == len(player.villain_deck)
+    assert layout.view(state, "p0.heroes")[2].sum() == 1
+    assert layout.view(out, "p1.present")[:3].ravel().tolist() == [1, 1, 1]
+    assert (out[3] == -1).all()  # Les lignes au-delà du lot ne sont pas touchées
+
+    assert np.array_equal(encoder.encode(game), state)
+    print(f"✅ {encoder}")
+
+
+def test_vector_env_steps_in_lockstep():
+    """Test reset/step, les masques d'actions légales et la remise à zéro automatique"""
+    from src.simulation.vector_env import ShardedVectorEnv, VectorEnv
+
+    env = VectorEnv(4, max_turns=3)
+    observations, masks = env.reset(seeds=[10, 11, 12, 13])
+    assert observations.shape == (4, env.encoder.size) and masks.shape == (4, env.action_space.size)
+    assert masks.any(axis=1).all()
+
+    rng = np.random.default_rng(0)
+    finished = 0
+    for _ in range(200):
+        actions = [rng.choice(np.flatnonzero(mask)) for mask in masks]
+        observations, rewards, dones, masks, infos = env.step(actions)
+        finished += int(dones.sum())
+        assert all(info for info, done in zip(infos, dones) if done)
+    assert finished > 0 and env.episodes == finished
+    assert all(game.state.value == "in_progress" for game in env.games)
+
+    sharded = ShardedVectorEnv(4, num_shards=2, max_turns=3)
+    try:
+        observations, masks = sharded.reset(seeds=[10, 11, 12, 13])
+        local = VectorEnv(4, max_turns=3)
+        local_observations, local_masks = local.reset(seeds=[10, 11, 12, 13])
+        assert np.array_equal(observations, local_observations) and np.array_equal(masks, local_masks)
+
+        actions = [np.flatnonzero(mask)[0] for mask in masks]
+        sharded.step(actions)
+        local.step(actions)
+        assert np.array_equal(sharded.observations, local.observations)
+    finally:
+        sharded.close()
+    print(f"✅ {env} - {finished} parties terminées")
@@ -224,6 +224,38 @@ def test_complete_turn():
     return True
 
 
+def test_event_log_ring_buffer():
+    """Test le journal d'événements borné, formaté à la lecture et désactivable"""
+    from src.core.event_log import EventCode, EventLog
+
+    game = Game(id="log_test", log_capacity=3)
+    game.add_player("Alice", VillainType.MALEFICENT)
+    game.add_player("Bob", VillainType.JAFAR)
+    total = game.events.total
+    game.start_game()
+    game.log_action("Message libre")
+
+    assert len(game.events) == 3 and game.events.total == total + 2
+    assert game.action_log[-2:] == ["Tour 1: La partie commence !", "Tour 1: Message libre"]
+    assert game.events.recent(1)[0].code == EventCode.MESSAGE
+
+    snapshot = game.snapshot()
+    game.end_game()
+    assert game.action_log[-1] == "Tour 1: Partie terminée sans vainqueur"
+    game.restore(snapshot)
+    assert game.action_log[-1] == "Tour 1: Message libre"
+
+    quiet = Game(id="quiet", log_capacity=0)
+    quiet.add_player("Alice", VillainType.MALEFICENT)
+    assert quiet.events.total == 0 and quiet.action_log == []
+
+    log = EventLog(2)
+    for turn in range(5):
+        log.record(EventCode.TURN_STARTED, turn, "Alice")
+    assert [event.turn for event in log] == [3, 4] and log.total == 5
+    print(f"✅ {game.events}")
+
+
 def run_all_tests():
     """Lance tous les tests"""
     print("🎯 TESTS DISNEY VILLAINOUS")
@@ -0,0 +1,382 @@
+"""
+Tests de l'hébergement des parties
+"""
+
+import sys
+import os
+
+# Ajoute le répertoire src au path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.simulation import HeadlessEngine
+from src.server import SessionStore
+
+
+def test_session_store_lru_and_write_behind(tmp_path):
+    """Test le cache LRU, la fusion des écritures et la reconstruction depuis SQLite"""
+    print("\n🧪 Test: Sessions SQLite")
+
+    engine = HeadlessEngine(log_events=False)
+    path = str(tmp_path / "sessions.db")
+    store = SessionStore(path, engine, cache_size=2, flush_interval=0.01)
+
+    games = [engine.build_game(["maleficent", "jafar"], game_id=f"partie_{i}", seed=i) for i in range(4)]
+    for game in games:
+        engine.begin_turn(game)
+        for _ in range(5):
+            store.put(game)  # Mises à jour fusionnées avant l'écriture
+    assert len(store) == 2
+    store.flush()
+    assert store.writes < 4 * 5
+
+    # Partie sortie du cache : reconstruite depuis la base à l'identique
+    original = games[0]
+    loaded = store.get(original.id)
+    assert loaded is not original
+    assert loaded.get_game_state(full=True) == original.get_game_state(full=True)
+    assert loaded.players[0].villain_deck.rng.getstate() == original.players[0].villain_deck.rng.getstate()
+    assert store.get(original.id) is loaded and store.hits == 1
+
+    store.delete(games[1].id)
+    assert store.get(games[1].id) is None
+    store.close()
+
+    reopened = SessionStore(path, engine)
+    assert reopened.list_games() == ["partie_0", "partie_2", "partie_3"]
+    assert reopened.game_state("partie_3")["players"][1]["zones"]["hand"] == \
+        [card.id for card in games[3].players[1].hand]
+    reopened.close()
+    print(f"✅ {store}")
+
+
+def test_session_store_writes_without_flush_and_serves_in_flight_batch(tmp_path):
+    """Test l'écriture périodique sans flush() et la lecture d'un lot en cours d'écriture"""
+    import sqlite3
+    import threading
+    import time
+
+    engine = HeadlessEngine(log_events=False)
+    path = str(tmp_path / "sessions.db")
+    store = SessionStore(path, engine, cache_size=1, flush_interval=0.01)
+    first = engine.build_game(["maleficent", "jafar"], game_id="a", seed=1)
+    second = engine.build_game(["maleficent", "jafar"], game_id="b", seed=2)
+
+    # Moins de batch_size parties : écrites quand même après flush_interval
+    store.put(first)
+    with sqlite3.connect(path) as other:
+        for _ in range(200):
+            if other.execute("SELECT COUNT(*) FROM games").fetchone()[0]:
+                break
+            time.sleep(0.01)
+        assert other.execute("SELECT id FROM games").fetchall() == [("a",)]
+
+    # Lot bloqué avant sa validation : get() doit rendre le nouvel état, pas la ligne en base
+    release = threading.Event()
+    serialize = store._serialize
+
+    def slow_serialize(batch):
+        release.wait(5)
+        return serialize(batch)
+    store._serialize = slow_serialize
+    engine.begin_turn(first)
+    store.put(first)
+    store.put(second)  # Fait sortir first du cache
+    for _ in range(200):
+        if "a" in store._in_flight:
+            break
+        time.sleep(0.01)
+    assert "a" in store._in_flight and not store._pending
+    loaded = store.get("a")
+    assert loaded is not first and loaded.get_game_state(full=True) == first.get_game_state(full=True)
+    assert store.game_state("a") == first.get_game_state(full=True)
+    release.set()
+    store.close()
+
+
+def test_session_store_survives_write_errors(tmp_path):
+    """Test qu'une transaction en échec est remise en file et relevée par flush()"""
+    import sqlite3
+    from src.server.session_store import SCHEMA
+
+    engine = HeadlessEngine(log_events=False)
+    path = str(tmp_path / "sessions.db")
+    store = SessionStore(path, engine, flush_interval=0.01)
+    game = engine.build_game(["maleficent", "jafar"], game_id="partie", seed=1)
+
+    # Table supprimée par une autre connexion : l'écriture échoue
+    other = sqlite3.connect(path)
+    other.execute("DROP TABLE games")
+    other.commit()
+    store.put(game)
+    try:
+        store.flush()
+        raise AssertionError("flush() doit relever l'échec")
+    except RuntimeError:
+        pass
+    assert store.failures >= 1 and isinstance(store.last_error, sqlite3.OperationalError)
+
+    # Table recréée : la partie remise en file est écrite au prochain essai
+    other.execute(SCHEMA)
+    other.commit()
+    other.close()
+    store.flush()
+    assert store.list_games() == ["partie"] and store.lost == 0
+    store.close()
+
+
+def test_game_server_routes_moves():
+    """Test le serveur asyncio : création, coups légaux, tour des joueurs et latences"""
+    print("\n🧪 Test: Serveur de parties")
+    import asyncio
+    from src.server import GameClient, GameServer
+    from src.server.load_test import run_load
+
+    async def scenario():
+        server = GameServer(HeadlessEngine(log_events=False), max_turns=20)
+        await server.start("127.0.0.1", 0)
+        client = await GameClient.connect("127.0.0.1", server.port)
+
+        created = await client.request("create", villains=["maleficent", "jafar"], seed=3)
+        game_id = created["game_id"]
+        legal = await client.request("moves", game_id=game_id)
+        other = next(p["id"] for p in created["players"] if p["id"] != legal["player_id"])
+
+        refused = await client.request("play", game_id=game_id, player_id=other, move=legal["moves"][0])
+        played = await client.request("play", game_id=game_id, player_id=legal["player_id"], move=legal["moves"][0])
+        unknown = await client.request("state", game_id="absente")
+        # Coup illégal ou mal formé : erreur, la partie et le tour ne changent pas
+        illegal = await client.request("play", game_id=game_id, player_id=legal["player_id"],
+                                       move={"kind": "move", "params": {"position": 9}})
+        malformed = [await client.request("play", game_id=game_id, player_id=legal["player_id"], move=move)
+                     for move in ("oops", {"kind": "move", "params": [1]}, {"kind": "action", "action": []})]
+        after = await client.request("moves", game_id=game_id)
+        assert not illegal["ok"] and not any(response["ok"] for response in malformed)
+        assert after["player_id"] == legal["player_id"]
+        state = await client.request("state", game_id=game_id, full=True)
+        await client.close()
+        await server.stop()
+
+        assert created["ok"] and not refused["accepted"] and played["accepted"]
+        assert not unknown["ok"] and "absente" in unknown["error"]
+        assert state["game"]["players"][0]["zones"]["hand"]
+        assert server.latency.report()["play"]["count"] == 6
+
+        return await run_load(None, 0, clients=4, games=8, actions=200, seed=1)
+
+    result = asyncio.run(scenario())
+    assert result["actions"] == 200 and "p99" in result["client_latency_ms"]
+    print(f"✅ {result['actions_per_second']:.0f} coups/s, p99 {result['client_latency_ms']['p99']:.2f} ms")
+
+
+def test_state_deltas_rebuild_full_state():
+    """Test que les deltas appliqués à une copie redonnent l'état complet, avec repli sur l'état complet"""
+    print("\n🧪 Test: Deltas d'état")
+    import random
+    from src.core.enums import GameState
+    from src.server.state_diff import ChangeRecorder, StateTracker, apply_delta
+
+    engine = HeadlessEngine(log_events=False)
+    game = engine.build_game(["maleficent", "jafar"], seed=4)
+    engine.begin_turn(game)
+    tracker = StateTracker(game, history=4)
+    client = tracker.changes_since(game, None)["full"]
+    version = tracker.version
+    rng = random.Random(4)
+    kinds = set()
+    # Suivi partiel : seuls les joueurs signalés par le TurnManager sont relus
+    recorder = ChangeRecorder()
+    engine.turn_manager.add_listener(recorder)
+    partial = StateTracker(game, history=4)
+
+    while game.state == GameState.IN_PROGRESS and game.turn_number <= 15:
+        player = game.get_current_player()
+        recorder.start()
+        engine.apply_move(game, rng.choice(engine.move_generator.legal_moves(game)))
+        touched = recorder.stop() | {player.id, game.get_current_player().id}
+        assert partial.update(game, touched) == tracker.update(game)
+        changes = tracker.changes_since(game, version, refresh=False)
+        assert "full" not in changes
+        apply_delta(client, changes["ops"])
+        kinds.update(op[0] for op in changes["ops"])
+        version = changes["version"]
+        assert client == game.get_game_state(full=True)
+
+    assert {"set", "move"} <= kinds
+    assert "full" in tracker.changes_since(game, 0)  # Trop ancien pour l'historique
+    print(f"✅ {tracker}, opérations {sorted(kinds)}")
+
+
+def test_web_server_caches_files_and_exposes_engine(tmp_path):
+    """Test le serveur web : gzip, 304 par ETag, fichier modifié relu, API du moteur"""
+    print("\n🧪 Test: Serveur web")
+    import json
+    import urllib.error
+    import urllib.request
+    from src.server import GameServer, WebServer
+
+    (tmp_path / "index.html").write_text("<html>" + "Villainous " * 200 + "</html>", encoding="utf-8")
+    server = WebServer(("127.0.0.1", 0), str(tmp_path), GameServer(HeadlessEngine(log_events=False)), quiet=True)
+    server.start()
+    base = f"http://127.0.0.1:{server.port}"
+
+    def get(path, data=None, **headers):
+        body = json.dumps(data).encode("utf-8") if data is not None else None
+        try:
+            with urllib.request.urlopen(urllib.request.Request(base + path, body, headers)) as response:
+                return response.status, response.headers, response.read()
+        except urllib.error.HTTPError as error:
+            return error.code, error.headers, error.read()
+
+    try:
+        status, headers, body = get("/", **{"Accept-Encoding": "gzip"})
+        assert status == 200 and headers["Content-Encoding"] == "gzip" and len(body) < 200
+        etag = headers["ETag"]
+        assert get("/index.html", **{"If-None-Match": etag})[0] == 304
+
+        (tmp_path / "index.html").write_text("<html>modifié</html>", encoding="utf-8")
+        os.utime(tmp_path / "index.html", (1, 1))
+        status, headers, body = get("/index.html", **{"If-None-Match": etag})
+        assert status == 200 and headers["ETag"] != etag and "modifié" in body.decode("utf-8")
+        assert get("/../secret")[0] == 404
+
+        created = json.loads(get("/api/create", {"villains": ["maleficent", "jafar"], "seed": 4})[2])
+        game_id = created["game_id"]
+        moves = json.loads(get(f"/api/moves?game_id={game_id}")[2])
+        played = json.loads(get("/api/play", {"game_id": game_id, "player_id": moves["player_id"],
+                                              "move": moves["moves"][0]})[2])
+        assert played["ok"] and played["accepted"]
+        exported = json.loads(get("/api/export", {"game_id": game_id})[2])["state"]
+        assert exported["id"] == game_id
+        assert get(f"/api/sync?game_id={game_id}&version=0")[0] == 200
+
+        # Les opérations qui modifient ou exportent une partie demandent POST
+        for path in ("/api/create", f"/api/play?game_id={game_id}", f"/api/close?game_id={game_id}",
+                     f"/api/export?game_id={game_id}"):
+            status, headers, _ = get(path)
+            assert status == 405 and headers["Allow"] == "POST", path
+        assert json.loads(get(f"/api/state?game_id={game_id}")[2])["ok"]
+        assert get("/api/subscribe", {"game_id": game_id})[0] == 400
+
+        # Longueur invalide refusée sans lire le corps, exception du moteur en 500
+        import http.client
+        for length in ("-1", "abc"):
+            connection = http.client.HTTPConnection("127.0.0.1", server.port, timeout=5)
+            connection.putrequest("POST", "/api/games")
+            connection.putheader("Content-Length", length)
+            connection.endheaders()
+            assert connection.getresponse().status == 400
+            connection.close()
+
+        async def broken(request):
+            raise RuntimeError("panne")
+        server.games.handle_request = broken
+        status, _, body = get("/api/games", {})
+        assert status == 500 and "panne" in json.loads(body)["error"]
+    finally:
+        server.shutdown()
+        server.server_close()
+    print(f"✅ Fichiers et API servis sur le port {server.port}")
+
+
+def test_shard_router_rebalances_games():
+    """Test le mode réparti : parties routées par id, ajout d'un processus sans perte d'état"""
+    print("\n🧪 Test: Parties réparties entre processus")
+    import asyncio
+    from src.server import GameClient, ShardRouter
+
+    async def scenario():
+        router = ShardRouter(workers=2, max_turns=50)
+        await router.start("127.0.0.1", 0)
+        client = await GameClient.connect("127.0.0.1", router.port)
+        try:
+            games = [(await client.request("create", seed=seed))["game_id"] for seed in range(24)]
+            for game_id in games:
+                legal = await client.request("moves", game_id=game_id)
+                await client.request("play", game_id=game_id, player_id=legal["player_id"],
+                                     move=legal["moves"][0], since=None)
+            before = {g: (await client.request("state", game_id=g, full=True))["game"] for g in games}
+            stats = await client.request("stats")
+            assert stats["games"] == 24 and all(shard["games"] for shard in stats["shards"])
+
+            # Déplacement pendant que d'autres connexions envoient des requêtes
+            others = [await GameClient.connect("127.0.0.1", router.port) for _ in range(4)]
+            states = asyncio.gather(*(other.request("state", game_id=g) for other, g in zip(others, games)))
+            moved = await router.add_worker()
+            assert all(response["ok"] for response in await states)
+            for other in others:
+                await other.close()
+            after = {g: (await client.request("state", game_id=g, full=True))["game"] for g in games}
+            stats = await client.request("stats")
+            legal = await client.request("moves", game_id=games[0])
+            played = await client.request("play", game_id=games[0], player_id=legal["player_id"],
+                                          move=legal["moves"][0])
+            return moved, before, after, stats, played
+        finally:
+            await client.close()
+            await router.stop()
+
+    moved, before, after, stats, played = asyncio.run(scenario())
+    assert 0 < moved < 24 and after == before
+    assert stats["games"] == 24 and len(stats["shards"]) == 3 and stats["shards"][2]["games"] == moved
+    assert played["accepted"]
+    print(f"✅ {moved} parties sur 24 déplacées vers le nouveau processus")
+
+
+def test_shard_router_survives_failures():
+    """Test le mode réparti : requête fautive, import refusé et processus arrêté"""
+    print("\n🧪 Test: Pannes en mode réparti")
+    import asyncio
+    from src.server import GameClient, ShardRouter
+
+    async def scenario():
+        router = ShardRouter(workers=1, max_turns=50)
+        await router.start("127.0.0.1", 0)
+        client = await GameClient.connect("127.0.0.1", router.port)
+        try:
+            games = [(await client.request("create", seed=seed))["game_id"] for seed in range(12)]
+            legal = await client.request("moves", game_id=games[0])
+            bad = await client.request("play", game_id=games[0], player_id=legal["player_id"], move="oops")
+            alive = await client.request("state", game_id=games[0])
+
+            # Le nouveau processus refuse les imports : les parties restent chez leur propriétaire
+            spawn = router._spawn
+
+            async def refusing_spawn(name=None):
+                channel = await spawn(name)
+                request = channel.request
+
+                async def refuse_import(op, **fields):
+                    if op == "import":
+                        return {"ok": False, "error": "refusé"}
+                    return await request(op, **fields)
+                channel.request = refuse_import
+                return channel
+            router._spawn = refusing_spawn
+            try:
+                await router.add_worker()
+                raise AssertionError("Le déplacement raté doit lever une erreur")
+            except RuntimeError:
+                pass
+            router._spawn = spawn
+            kept = [await client.request("state", game_id=g) for g in games]
+            stats = await client.request("stats")
+
+            # Processus tué : signalé puis remplacé
+            router.channels["shard-0"].process.kill()
+            for _ in range(100):
+                await asyncio.sleep(0.05)
+                if router.restarts:
+                    break
+            created = await client.request("create", seed=99)
+            after = await client.request("stats")
+            return bad, alive, kept, stats, created, after
+        finally:
+            await client.close()
+            await router.stop()
+
+    bad, alive, kept, stats, created, after = asyncio.run(scenario())
+    assert not bad["ok"] and alive["ok"]
+    assert all(response["ok"] for response in kept) and stats["moved"] == 0
+    assert stats["shards"][0]["games"] == 12 and stats["shards"][1]["games"] == 0
+    assert created["ok"] and after["restarts"] == 1 and after["incidents"]
+    print("✅ Erreurs renvoyées, parties conservées, processus redémarré")
@@ -0,0 +1,377 @@
+"""
+Tests de la simulation sans interface
+"""
+
+import sys
+import os
+
+# Ajoute le répertoire src au path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core.enums import ActionType, GameState, TurnPhase, VillainType
+from src.simulation import BatchSimulator, HeadlessEngine, GameTask
+
+
+def test_headless_game():
+    """Test une partie complète sans console"""
+    print("\n🧪 Test: Partie sans interface")
+
+    engine = HeadlessEngine()
+    result = engine.run_task(GameTask(game_index=0, seed=1, villains=["maleficent", "jafar"],
+                                      policies=["greedy", "random"], max_turns=20))
+
+    print(f"✅ Vainqueur: {result.winner_villain} en {result.turns} tours")
+    assert sorted(result.villains) == ["jafar", "maleficent"]
+    assert 1 <= result.turns <= 21
+
+
+def test_build_game_boards_are_independent():
+    """Test que deux parties ne partagent pas leurs plateaux"""
+    engine = HeadlessEngine()
+    game_a = engine.build_game([VillainType.MALEFICENT, VillainType.JAFAR])
+    game_b = engine.build_game([VillainType.MALEFICENT, VillainType.JAFAR])
+
+    assert game_a.state == GameState.IN_PROGRESS
+    location_a = game_a.players[0].board_locations[0]
+    location_b = game_b.players[0].board_locations[0]
+    location_a.add_hero("hero_test")
+    assert "hero_test" not in location_b.heroes_present
+
+
+def test_batch_simulation_in_process():
+    """Test la simulation par lots sans pool de processus"""
+    simulator = BatchSimulator(villains=["maleficent", "jafar"], workers=0, max_turns=10)
+    results = list(simulator.run(5))
+
+    assert len(results) == 5
+    assert simulator.report.games == 5
+    print(f"✅ {simulator.report}")
+
+
+def test_batch_simulation_process_pool():
+    """Test la répartition des parties sur un pool de processus"""
+    simulator = BatchSimulator(villains=["captain_hook", "jafar"], workers=2, chunk_size=3, max_turns=10)
+    indices = sorted(result.game_index for result in simulator.run(8))
+
+    assert indices == list(range(8))
+    assert simulator.report.games_per_second > 0
+
+
+def test_seeded_game_replays_identically():
+    """Test qu'une partie se rejoue à l'identique depuis sa graine"""
+    from src.simulation import create_policy
+
+    def play(seed):
+        engine = HeadlessEngine()
+        game = engine.build_game(["maleficent", "jafar"], seed=seed)
+        policies = {p.id: create_policy("random", game.derive_rng(p.id, "policy")) for p in game.players}
+        engine.play_game(game, policies, max_turns=15)
+        return (
+            [(p.power, p.current_location, [c.id for c in p.hand], [c.id for c in p.villain_deck])
+             for p in game.players],
+            list(game.action_log)
+        )
+
+    assert play(1234) == play(1234)
+    assert play(1234) != play(4321)
+
+
+def test_catalog_cache_invalidation(tmp_path):
+    """Test la recompilation du catalogue binaire quand une source change"""
+    import shutil
+    from src.core.catalog import Catalog
+    from src.simulation.engine import DEFAULT_DATA_ROOT
+    from src.cards.card_manager import CardManager
+    from src.board.board_manager import BoardManager
+
+    data_root = tmp_path / "data"
+    shutil.copytree(DEFAULT_DATA_ROOT, data_root, ignore=shutil.ignore_patterns(".cache"))
+    catalog = Catalog(str(data_root))
+
+    card_manager, board_manager = CardManager(), BoardManager()
+    catalog.install(card_manager, board_manager)
+    assert catalog.rebuilt and os.path.exists(catalog.cache_path)
+    jafar = card_manager.load_villain_cards("jafar")
+    assert jafar and all(e.op is not None for d in jafar for e in d.effects)
+    assert len(board_manager.load_villain_board("jafar")) == 4
+
+    catalog.load()
+    assert not catalog.rebuilt
+
+    # Même contenu, date modifiée : l'empreinte évite la recompilation
+    source = data_root / "cards" / "jafar_villain.json"
+    os.utime(source, ns=(0, 0))
+    catalog.load()
+    assert not catalog.rebuilt and catalog.refreshed == 1
+    catalog.load()
+    assert not catalog.rebuilt and catalog.refreshed == 0  # Nouvelle date enregistrée
+
+    source.write_text(source.read_text(encoding="utf-8").replace('"cost": 1', '"cost": 7', 1), encoding="utf-8")
+    catalog.load()
+    assert catalog.rebuilt
+
+
+def test_snapshot_restore_and_clone():
+    """Test qu'une partie restaurée ou clonée se rejoue à l'identique"""
+    from src.simulation import create_policy
+
+    engine = HeadlessEngine()
+
+    def state(game):
+        return (
+            game.turn_number, game.current_player_index, game.state,
+            [(p.power, p.current_location, [c.uid for c in p.hand], [c.uid for c in p.villain_deck],
+              [c.uid for c in p.discard_pile],
+              [(tuple(l.heroes_present), tuple(l.items_present)) for l in p.board_locations],
+              sorted((hero_id, tuple(places)) for hero_id, places in p.defeated_heroes.items()))
+             for p in game.players]
+        )
+
+    def play_on(game, turns):
+        policies = {p.id: create_policy("random", game.derive_rng(p.id, "policy")) for p in game.players}
+        engine.play_game(game, policies, max_turns=turns)
+        return state(game), game.winner.id if game.winner else None
+
+    game = engine.build_game(["captain_hook", "jafar"], seed=99)
+    play_on(game, 8)
+    game.state = GameState.IN_PROGRESS  # Reprend après la limite de tours
+    before = state(game)
+    snapshot = game.snapshot()
+    clone = game.clone()
+
+    first = play_on(game, 40)
+    assert state(clone) == before
+
+    game.restore(snapshot)
+    assert state(game) == before
+    assert play_on(game, 40) == first
+    assert play_on(clone, 40) == first
+
+
+def test_mcts_policy_plays_legal_moves():
+    """Test l'adversaire MCTS : coups légaux, réutilisation de l'arbre et statistiques"""
+    import random
+    from src.simulation import MCTSPolicy, create_policy
+    from src.simulation.mcts import legal_moves
+
+    engine = HeadlessEngine()
+    game = engine.build_game(["maleficent", "jafar"], seed=5)
+    mcts = MCTSPolicy(random.Random(1), engine, iterations=20, rollout_turns=2)
+    policies = {game.players[0].id: mcts,
+                game.players[1].id: create_policy("random", random.Random(2))}
+
+    engine.begin_turn(game)
+    snapshot = game.snapshot()
+    move = mcts.search(game)
+    assert move in legal_moves(engine, game)
+    assert game.snapshot() == snapshot  # La recherche travaille sur une copie
+
+    engine.play_game(game, policies, max_turns=4)
+    assert mcts.stats.decisions > 0 and mcts.stats.nodes > 0
+    assert mcts.stats.reused > 0 and mcts.stats.nodes_per_second > 0
+    print(f"✅ {mcts}")
+
+
+def test_move_generator_moves_are_legal():
+    """Test que chaque coup listé est accepté par le TurnManager, et le cache par état"""
+    import random
+    from src.core.move_generator import END_TURN, Move, MoveGenerator
+
+    engine = HeadlessEngine()
+    game = engine.build_game(["maleficent", "jafar"], seed=11)
+    generator = MoveGenerator(engine.turn_manager)
+    rng = random.Random(3)
+    checked = 0
+
+    engine.begin_turn(game)
+    while game.state == GameState.IN_PROGRESS and game.turn_number <= 12:
+        moves = generator.legal_moves(game)
+        assert moves and len(set(moves)) == len(moves)
+        for move in moves:
+            if move is END_TURN:
+                continue
+            trial = game.clone()
+            assert generator.apply(trial, move), f"Coup refusé: {move}"
+            checked += 1
+
+        snapshot = game.snapshot()
+        move = rng.choice(moves)
+        player = game.get_current_player()
+        generator.apply(game, move)
+        if player.turn_phase != TurnPhase.ACTIONS or player.actions_remaining <= 0:
+            player.turn_phase = TurnPhase.END
+            game.next_turn()
+            engine.begin_turn(game)
+        elif move.kind == "action":
+            # Même contenu après restore : la liste vient du cache
+            hits = generator.hits
+            after = game.snapshot()
+            game.restore(snapshot)
+            assert generator.legal_moves(game) is moves and generator.hits == hits + 1
+            game.restore(after)
+
+    assert checked > 0
+    assert Move.action(ActionType.FATE, {"target_player": game.players[0]}).get("target_player") == game.players[0].id
+    print(f"✅ {checked} coups vérifiés - {generator}")
+
+
+def test_replay_round_trip():
+    """Test qu'un replay binaire se relit en flux et rejoue la partie à l'identique"""
+    print("\n🧪 Test: Replays binaires")
+    import io
+    from src.core.move_generator import Move
+    from src.simulation import ReplayCodec, ReplayPlayer, ReplayWriter, iter_replays
+
+    engine = HeadlessEngine(log_events=False)
+    results = [
+        engine.run_task(GameTask(game_index=i, seed=100 + i, villains=["maleficent", "jafar"],
+                                 policies=["greedy", "random"], max_turns=30, record=True))
+        for i in range(3)
+    ]
+
+    stream = io.BytesIO()
+    writer = ReplayWriter(stream, engine.replay_codec)
+    for result in results:
+        writer.write(result.replay)
+    stream.seek(0)
+
+    player = ReplayPlayer(engine)
+    replays = list(iter_replays(stream, engine.replay_codec))
+    for result, replay in zip(results, replays):
+        game = player.play(replay)
+        assert replay.seed == result.seed and game.turn_number == result.turns
+        assert (game.winner.id if game.winner else None) == result.winner_id
+        assert engine.replay_codec.encode(replay) == result.replay
+    assert len(replays) == 3
+
+    # Carte hors vocabulaire et paramètres inhabituels : forme générique
+    replay = replays[0]
+    replay.moves.append(Move.action(ActionType.DISCARD, {"card_ids": ["inconnue", "autre"], "fate_location": 2}))
+    codec = ReplayCodec(engine.replay_codec.vocabulary, compress=False)
+    assert codec.decode(codec.encode(replay)).moves == replay.moves
+
+    # Octet de méchant corrompu : erreur de format, pas IndexError
+    from src.simulation.replay import ReplayError, write_varint, zigzag
+    header = bytearray()
+    write_varint(header, zigzag(replay.seed))
+    write_varint(header, replay.max_turns)
+    corrupt = bytearray(codec.encode(replay))
+    corrupt[5 + len(header) + 1] = 0x7f
+    try:
+        codec.decode(bytes(corrupt))
+        raise AssertionError("decode() doit refuser un méchant inconnu")
+    except ReplayError:
+        pass
+    print(f"✅ {len(replays)} parties rejouées - {max(len(r.replay) for r in results)} octets au plus")
+
+
+def test_game_store_recovers_after_crash(tmp_path):
+    """Test la reprise d'une partie : instantané puis fin du journal, enregistrement tronqué ignoré"""
+    print("\n🧪 Test: Persistance des parties")
+    import random
+    from src.simulation.persistence import GameStore
+
+    def state(game):
+        return (game.turn_number, game.current_player_index, game.rng.getstate(), [
+            (p.power, p.current_location, p.turn_phase, p.actions_remaining,
+             [c.id for c in p.hand], [c.id for c in p.villain_deck.cards], [c.id for c in p.discard_pile],
+             [(tuple(l.heroes_present), tuple(l.items_present)) for l in p.board_locations])
+            for p in game.players
+        ])
+
+    engine = HeadlessEngine(log_events=False)
+    store = GameStore(str(tmp_path), engine, snapshot_every=20, flush_every=4, sync_interval=None)
+    game = engine.build_game(["maleficent", "jafar"], game_id="partie", seed=7)
+    store.track(game)
+    engine.begin_turn(game)
+    rng = random.Random(0)
+    for _ in range(150):
+        if game.state == GameState.IN_PROGRESS:
+            engine.apply_move(game, rng.choice(engine.move_generator.legal_moves(game)))
+    store.sync()
+    assert (tmp_path / "partie.snapshot").exists()
+
+    # Arrêt pendant une écriture : dernier coup incomplet
+    with open(tmp_path / "partie.journal", "ab") as f:
+        f.write(b"\x05")
+
+    recovered = GameStore(str(tmp_path), engine).recover("partie")
+    assert recovered is not game and state(recovered) == state(game)
+    print(f"✅ Partie reprise au tour {recovered.turn_number}")
+
+
+def test_game_store_flushes_idle_games(tmp_path):
+    """Test l'écriture des coups d'une partie inactive et l'écouteur unique du GameStore"""
+    import time
+    from src.simulation.persistence import GameStore
+
+    engine = HeadlessEngine(log_events=False)
+    listeners = len(engine.turn_manager.listeners)
+    store = GameStore(str(tmp_path), engine, flush_every=1000, sync_interval=0, flush_interval=0.01)
+    games = [engine.build_game(["maleficent", "jafar"], game_id=f"partie_{i}", seed=i) for i in range(5)]
+    for game in games:
+        store.track(game)
+    assert len(engine.turn_manager.listeners) == listeners + 1
+
+    game = games[0]
+    engine.begin_turn(game)
+    for _ in range(3):
+        engine.apply_move(game, engine.move_generator.legal_moves(game)[0])
+    for _ in range(200):
+        if not store.journals[game.id]._pending:
+            break
+        time.sleep(0.01)
+
+    # Sans sync() ni close() : les coups sont déjà sur disque
+    recovered = GameStore(str(tmp_path), engine, flush_interval=None).recover(game.id, track=False)
+    assert recovered.get_game_state(full=True) == game.get_game_state(full=True)
+    store.close()
+    assert len(engine.turn_manager.listeners) == listeners
+
+
+def test_state_codec_round_trip():
+    """Test l'état complet en binaire et en JSON : la partie relue continue à l'identique"""
+    print("\n🧪 Test: Sérialisation d'état")
+    import json
+    import random
+
+    engine = HeadlessEngine(log_events=False)
+    game = engine.build_game(["maleficent", "jafar"], game_id="partie", seed=3)
+    engine.begin_turn(game)
+    rng = random.Random(1)
+    for _ in range(60):
+        if game.state == GameState.IN_PROGRESS:
+            engine.apply_move(game, rng.choice(engine.move_generator.legal_moves(game)))
+
+    codec = engine.state_codec
+    data = codec.encode(game)
+    assert codec.header(data) == (game.id, game.seed, (VillainType.MALEFICENT, VillainType.JAFAR))
+    for payload in (data, json.loads(json.dumps(codec.to_json(game)))):
+        copy = codec.load(payload, engine)
+        assert copy.get_game_state(full=True) == game.get_game_state(full=True)
+        # Mêmes générateurs : la suite de la partie est identique
+        original = game.clone()
+        for target in (original, copy):
+            choices = random.Random(2)
+            for _ in range(30):
+                if target.state == GameState.IN_PROGRESS:
+                    engine.apply_move(target, choices.choice(engine.move_generator.legal_moves(target)))
+        assert copy.get_game_state(full=True) == original.get_game_state(full=True)
+    print(f"✅ État de {len(data)} octets relu en binaire et en JSON")
+
+
+def test_fate_location_is_validated_before_drawing():
+    """Test qu'un lieu du Destin invalide est refusé sans piocher de carte"""
+    engine = HeadlessEngine(log_events=False)
+    game = engine.build_game(["maleficent", "jafar"], seed=2)
+    player, target = game.players
+    location = player.get_current_location()
+    remaining = target.fate_deck.size()
+
+    for position in (True, "1", 1.0, -1, len(target.board_locations)):
+        result = engine.turn_manager._handle_fate(player, location, target_player=target, fate_location=position)
+        assert not result.success, position
+    assert target.fate_deck.size() == remaining
+
+    result = engine.turn_manager._handle_fate(player, location, target_player=target, fate_location=1)
+    assert result.success and target.fate_deck.size() < remaining
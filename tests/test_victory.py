@@ -0,0 +1,109 @@
+"""
+Tests des conditions de victoire : suivi incrémental contre parcours complet
+"""
+
+import sys
+import os
+import random
+
+# Ajoute le répertoire src au path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.core.enums import VillainType
+from src.core.victory_conditions import VictoryManager
+from src.board.board_manager import BoardManager
+from src.players.player import Player
+
+
+OBJECT_IDS = ["maleficent_curse_1", "maleficent_curse_2", "magic_lamp", "trident", "crown_of_atlantica",
+              "severed_head", "aladdin", "peter_pan", "prince_philip", "ally"]
+
+
+def test_incremental_matches_full_scan():
+    """Test que les compteurs suivent exactement le parcours complet"""
+    print("\n🧪 Test: Suivi incrémental des victoires")
+
+    rng = random.Random(7)
+    board_manager = BoardManager(os.path.join(os.path.dirname(__file__), '..', 'data', 'boards'))
+    victory_manager = VictoryManager(incremental=True, verify=True)
+
+    for villain_type in VillainType:
+        player = Player(id="p1", name="Test", villain_type=villain_type)
+        player.board_locations = board_manager.create_villain_specific_board(villain_type)
+
+        for _ in range(300):
+            location = rng.choice(player.board_locations)
+            object_id = rng.choice(OBJECT_IDS)
+            operation = rng.choice([location.add_item, location.remove_item,
+                                    location.add_hero, location.remove_hero])
+            operation(object_id)
+
+            # verify=True lève une erreur à la moindre divergence
+            victory_manager.check_victory(player)
+            victory_manager.get_victory_progress(player)
+
+    print("✅ Compteurs cohérents pour tous les méchants")
+
+
+def test_tracker_follows_board_replacement():
+    """Test la reconstruction du suivi quand le plateau du joueur change"""
+    board_manager = BoardManager(os.path.join(os.path.dirname(__file__), '..', 'data', 'boards'))
+    victory_manager = VictoryManager()
+
+    player = Player(id="p1", name="Test", villain_type=VillainType.MALEFICENT)
+    player.board_locations = board_manager.load_villain_board("maleficent")
+    for location in player.board_locations:
+        location.add_item(f"maleficent_curse_{location.position}")
+    assert victory_manager.check_victory(player)
+
+    player.board_locations = board_manager.load_villain_board("maleficent")
+    assert not victory_manager.check_victory(player)
+    assert victory_manager.get_victory_progress(player)["cursed_locations"] == 0
+
+
+def test_declarative_victory_rules():
+    """Test les conditions compilées depuis data/villains"""
+    from src.cards.card_manager import CardManager
+    from src.core.victory_rules import DeclarativeVictory, register_victory_rules, slugify
+
+    data_root = os.path.join(os.path.dirname(__file__), '..', 'data')
+    card_manager = CardManager(os.path.join(data_root, 'cards'))
+    board_manager = BoardManager(os.path.join(data_root, 'boards'))
+    victory_manager = VictoryManager(verify=True)
+
+    assert slugify("Peter Pan") == "peter_pan" and slugify("Génie") == "genie"
+    assert register_victory_rules(victory_manager, card_manager, os.path.join(data_root, 'villains')) == 3
+    assert isinstance(victory_manager.victory_conditions[VillainType.JAFAR], DeclarativeVictory)
+
+    # Jafar : Lampe Magique à la Caverne aux Merveilles et Aladdin vaincu
+    jafar = Player(id="p1", name="Jafar", villain_type=VillainType.JAFAR)
+    jafar.board_locations = board_manager.load_villain_board("jafar")
+    cave = jafar.board_locations[2]
+    cave.add_item("jafar_item_1")
+    assert not victory_manager.check_victory(jafar)
+    jafar.record_defeat("jafar_hero_1", jafar.board_locations[0].id)
+    assert victory_manager.check_victory(jafar)
+    assert victory_manager.get_victory_progress(jafar)["objectives_completed"] == 2
+
+    # Crochet : la victoire exige d'avoir vaincu Peter Pan au Jolly Roger
+    hook = Player(id="p2", name="Crochet", villain_type=VillainType.CAPTAIN_HOOK)
+    hook.board_locations = board_manager.load_villain_board("captain_hook")
+    assert not victory_manager.check_victory(hook)
+    hook.record_defeat("hook_hero_1", hook.board_locations[1].id)
+    assert not victory_manager.check_victory(hook)
+    hook.record_defeat("hook_hero_1", "hook_jolly_roger")
+    assert victory_manager.check_victory(hook)
+
+    # Maléfique : seules les vraies Malédictions comptent, pas Green Fire
+    maleficent = Player(id="p3", name="Maléfique", villain_type=VillainType.MALEFICENT)
+    maleficent.board_locations = board_manager.load_villain_board("maleficent")
+    for location in maleficent.board_locations:
+        location.add_item("maleficent_condition_1")
+    assert not victory_manager.check_victory(maleficent)
+    curses = ["maleficent_item_1", "maleficent_curse_1", "maleficent_curse_2", "maleficent_curse_3"]
+    assert victory_manager.get_victory_progress(maleficent)["score"] == 0
+    for count, (location, curse) in enumerate(zip(maleficent.board_locations, curses), 1):
+        location.add_item(curse)
+        # Progrès partiel : un lieu maudit de plus, sans objectif encore atteint
+        assert victory_manager.get_victory_progress(maleficent)["score"] == count / 4
+    assert victory_manager.check_victory(maleficent)
@@ -0,0 +1,101 @@
+// Client de l'API du moteur Python (src/server/web_server.py)
+// Les règles sont appliquées par le serveur : le client envoie les coups et suit l'état par deltas.
+
+class EngineAPI {
+    constructor(baseUrl = '') {
+        this.baseUrl = baseUrl;
+        this.gameId = null;
+        this.version = null;  // Version de l'état connue (voir sync)
+        this.state = null;    // État complet, tenu à jour par les deltas
+    }
+
+    // === REQUÊTES ===
+
+    async call(op, fields = {}) {
+        const response = await fetch(`${this.baseUrl}/api/${op}`, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify(fields)
+        });
+        const result = await response.json();
+        if (!result.ok) {
+            throw new Error(result.error || `Échec de ${op}`);
+        }
+        return result;
+    }
+
+    // === PARTIE ===
+
+    async createGame(villains, seed = null) {
+        const result = await this.call('create', seed === null ? { villains } : { villains, seed });
+        this.gameId = result.game_id;
+        this.version = null;
+        await this.sync();
+        return result;
+    }
+
+    async legalMoves() {
+        return this.call('moves', { game_id: this.gameId });
+    }
+
+    async isLegal(playerId, move) {
+        // Coup du joueur courant présent dans les coups légaux (mêmes champs que Move.to_dict)
+        const legal = await this.legalMoves();
+        if (legal.player_id !== playerId) {
+            return false;
+        }
+        const params = JSON.stringify(move.params || {});
+        return legal.moves.some(candidate => candidate.kind === move.kind &&
+            (candidate.action || null) === (move.action || null) &&
+            JSON.stringify(candidate.params) === params);
+    }
+
+    async play(playerId, move) {
+        const result = await this.call('play', {
+            game_id: this.gameId, player_id: playerId, move, since: this.version
+        });
+        this.applySync(result.sync);
+        return result;
+    }
+
+    async sync() {
+        this.applySync(await this.call('sync', { game_id: this.gameId, version: this.version }));
+        return this.state;
+    }
+
+    async exportState() {
+        return (await this.call('export', { game_id: this.gameId })).state;
+    }
+
+    // === DELTAS (même format que src/server/state_diff.py) ===
+
+    applySync(sync) {
+        if (!sync) return;
+        if (sync.full) {
+            this.state = sync.full;
+        } else {
+            sync.ops.forEach(op => this.applyOp(op));
+        }
+        this.version = sync.version;
+    }
+
+    applyOp(op) {
+        const resolve = path => {
+            let container = this.state;
+            path.slice(0, -1).forEach(key => { container = container[key]; });
+            return [container, path[path.length - 1]];
+        };
+        if (op[0] === 'set') {
+            const [container, key] = resolve(op[1]);
+            container[key] = op[2];
+        } else if (op[0] === 'splice') {
+            const [container, key] = resolve(op[1]);
+            container[key].splice(op[2], op[3], ...op[4]);
+        } else if (op[0] === 'move') {
+            const [source, sourceKey] = resolve(op[1]);
+            source[sourceKey].splice(op[2], 1);
+            const [target, targetKey] = resolve(op[3]);
+            target[targetKey].splice(op[4], 0, op[5]);
+        }
+    }
+}
@@ -15,6 +15,7 @@ class GameManager {
         };
         
         this.gameSettings = GAME_CONFIG;
+        this.engine = null; // EngineAPI quand le serveur Python répond (voir connectEngine)
     }
     
     // === INITIALISATION ===
@@ -37,6 +38,9 @@ class GameManager {
             // Démarrer le premier tour
             this.startGame();
             
+            // Partie miroir sur le serveur : il valide les déplacements
+            this.connectEngine();
+            
             showNotification('Nouvelle partie commencée !', 'success');
             this.logAction('=== NOUVELLE PARTIE COMMENCÉE ===');
             
@@ -206,11 +210,65 @@ class GameManager {
         
         // Mettre à jour les statistiques
         player.gameStats.turnsTaken++;
+        this.endEngineTurn(player);
         
         // Passer au joueur suivant
         this.nextPlayer();
     }
     
+    // === MOTEUR PYTHON ===
+    
+    async connectEngine() {
+        // Sans serveur (fichier ouvert directement), les règles locales restent seules
+        this.engine = null;
+        if (typeof EngineAPI === 'undefined') {
+            return;
+        }
+        const engine = new EngineAPI();
+        try {
+            const created = await engine.createGame(this.players.map(player => player.villain.id));
+            this.players.forEach((player, index) => {
+                player.engineId = created.players[index].id;
+            });
+            this.engine = engine;
+            this.logAction('Règles validées par le moteur du serveur');
+        } catch (error) {
+            console.warn('Moteur indisponible, règles locales :', error.message);
+        }
+    }
+    
+    async validateMove(player, targetLocation) {
+        // Le moteur fait autorité : le déplacement doit figurer dans ses coups légaux
+        if (!this.engine) {
+            return uiManager.canMoveToLocation(player, targetLocation);
+        }
+        const move = { kind: 'move', params: { position: targetLocation } };
+        try {
+            if (!await this.engine.isLegal(player.engineId, move)) {
+                return false;
+            }
+            const result = await this.engine.play(player.engineId, move);
+            return result.accepted;
+        } catch (error) {
+            console.warn('Déplacement refusé par le moteur :', error.message);
+            return false;
+        }
+    }
+    
+    async endEngineTurn(player) {
+        // Fin de tour transmise au moteur pour garder les deux parties au même joueur
+        if (!this.engine) {
+            return;
+        }
+        try {
+            if (await this.engine.isLegal(player.engineId, { kind: 'end', params: {} })) {
+                await this.engine.play(player.engineId, { kind: 'end', params: {} });
+            }
+        } catch (error) {
+            console.warn('Fin de tour refusée par le moteur :', error.message);
+        }
+    }
+    
     canEndTurn(player) {
         // Le joueur peut terminer son tour s'il a utilisé toutes ses actions
         // ou s'il choisit de passer
@@ -421,8 +421,9 @@ class UIManager {
                locationIndex === 0 || locationIndex === player.villain.board.length - 1;
     }
     
-    movePlayer(player, newLocation) {
-        if (!this.canMoveToLocation(player, newLocation)) {
+    async movePlayer(player, newLocation) {
+        // Validé par le moteur du serveur s'il est joignable, sinon par les règles locales
+        if (!await gameManager.validateMove(player, newLocation)) {
             showNotification('Déplacement impossible !', 'warning');
             return;
         }
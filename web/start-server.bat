@@ -5,10 +5,11 @@ echo Ouvrez votre navigateur a l'adresse : http://localhost:8000
 echo Pour arreter le serveur, appuyez sur Ctrl+C
 echo.
 
-cd /d "%~dp0"
-python -m http.server 8000 2>nul || (
+rem Serveur du projet : fichiers en cache, gzip, ETag et API du moteur (src/server/web_server.py)
+cd /d "%~dp0.."
+python -m src.server.web_server --port 8000 || (
     echo Python non trouve, tentative avec Python 3...
-    python3 -m http.server 8000 2>nul || (
+    python3 -m src.server.web_server --port 8000 || (
         echo.
         echo ERREUR: Python non installe
         echo Veuillez installer Python ou utiliser integrated.html